@@ -0,0 +1,205 @@
+"""Throughput and memory of the Prefect and Airflow deployment finders against local stand-ins.
+
+Starts the stand-in servers from `mock_backends.py` with synthetic deployments and measures:
+
+- full fetch: `get_deployments()`
+- selective refetch: `get_deployments(deployments_to_fetch=[...])` for one deployment
+- paging: listing every deployment page by page, with `AirflowDagClient.list_dags` for Airflow
+  and `read_deployments(limit=..., offset=...)` for Prefect
+- memory: peak bytes allocated by one full fetch, measured with tracemalloc
+
+The servers can add latency per request, cap the page size like Airflow's `maximum_page_limit`
+and Prefect's default limit do, and answer a fraction of requests with errors. Failed calls are
+counted and excluded from the timings.
+
+Run with:
+
+    python benchmarks/deployment_finders.py [--sizes 1000 10000 100000] [--latency-ms 5]
+        [--page-limit 100] [--error-rate 0.01]
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from mock_backends import DEFAULT_PAGE_LIMITS, BackendConfig, running_backend
+
+from acme_portal_sdk.airflow.dag_client import AirflowDagClient
+from acme_portal_sdk.airflow.deployment_finder import AirflowDeploymentFinder
+
+
+def measure(
+    repeat: int, function: Callable[[], Any]
+) -> Tuple[Optional[float], int, Any]:
+    """Return the best time of the successful calls, the number of failed calls and a result."""
+    timings = []
+    failures = 0
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        try:
+            # The finders print a line per deployment
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = function()
+        except Exception:
+            failures += 1
+            continue
+        timings.append(time.perf_counter() - started)
+    return (min(timings) if timings else None), failures, result
+
+
+def peak_memory(function: Callable[[], Any]) -> Optional[int]:
+    """Return the peak bytes allocated by one call, None if the call failed."""
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            function()
+        return tracemalloc.get_traced_memory()[1]
+    except Exception:
+        return None
+    finally:
+        tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def prefect_paths(
+    url: str, page_size: int
+) -> Iterator[Tuple[Any, Callable[[], List[Any]]]]:
+    """Create a Prefect finder for the stand-in and a function listing all deployments by page."""
+    from prefect.client.orchestration import get_client
+    from prefect.settings import PREFECT_API_URL, temporary_settings
+
+    from acme_portal_sdk.prefect.deployment_finder import PrefectDeploymentFinder
+
+    # Prefect logs every HTTP request at INFO level
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    def list_pages() -> List[Any]:
+        client = get_client(sync_client=True)
+        deployments: List[Any] = []
+        while True:
+            page = client.read_deployments(limit=page_size, offset=len(deployments))
+            deployments.extend(page)
+            if len(page) < page_size:
+                return deployments
+
+    # The finder builds deployment URLs from the environment variable
+    os.environ["PREFECT_API_URL"] = url
+    with temporary_settings(updates={PREFECT_API_URL: url}):
+        with contextlib.redirect_stdout(io.StringIO()):
+            finder = PrefectDeploymentFinder()
+        yield finder, list_pages
+
+
+@contextlib.contextmanager
+def airflow_paths(
+    url: str, page_size: int
+) -> Iterator[Tuple[Any, Callable[[], List[Any]]]]:
+    """Create an Airflow finder for the stand-in and a function listing all DAGs by page."""
+    # Construction verifies the connection and may hit an injected error, so retry
+    for _ in range(10):
+        with contextlib.redirect_stdout(io.StringIO()):
+            finder = AirflowDeploymentFinder(airflow_url=url)
+        if finder.credentials_verified:
+            break
+    client = AirflowDagClient(url, page_limit=page_size)
+    yield finder, lambda: list(client.list_dags().values())
+
+
+def format_rate(seconds: Optional[float], items: int) -> str:
+    if seconds is None:
+        return f"{'failed':>12} {'':>12}"
+    return f"{seconds * 1000:>9,.1f} ms {items / seconds:>9,.0f}/s"
+
+
+def run(backend: str, size: int, args: argparse.Namespace) -> None:
+    config = BackendConfig(
+        deployments=size,
+        latency=args.latency_ms / 1000,
+        page_limit=args.page_limit,
+        error_rate=args.error_rate,
+    )
+    paths = prefect_paths if backend == "prefect" else airflow_paths
+    with (
+        running_backend(backend, config) as url,
+        paths(url, args.page_size) as (
+            finder,
+            list_pages,
+        ),
+    ):
+        seconds, failures, deployments = measure(args.repeat, finder.get_deployments)
+        deployments = deployments or []
+        print(
+            f"  {'full fetch':<20} {format_rate(seconds, len(deployments))}"
+            f"  {len(deployments):>7,} of {size:,}  failed {failures}/{args.repeat}"
+        )
+
+        if deployments:
+            target = deployments[len(deployments) // 2 : len(deployments) // 2 + 1]
+            seconds, failures, selected = measure(
+                args.repeat, lambda: finder.get_deployments(deployments_to_fetch=target)
+            )
+            print(
+                f"  {'selective refetch':<20} {format_rate(seconds, len(selected or []))}"
+                f"  {len(selected or []):>7,} of {size:,}  failed {failures}/{args.repeat}"
+            )
+
+        seconds, failures, listed = measure(args.repeat, list_pages)
+        listed = listed or []
+        pages = -(-len(listed) // args.page_size) if listed else 0
+        print(
+            f"  {'paging':<20} {format_rate(seconds, len(listed))}"
+            f"  {len(listed):>7,} of {size:,}  failed {failures}/{args.repeat}"
+            f"  {pages:,} pages of {args.page_size}"
+        )
+
+        peak = peak_memory(finder.get_deployments)
+        if peak is None:
+            print(f"  {'peak memory':<20} failed")
+        else:
+            per_deployment = peak / len(deployments) if deployments else 0
+            print(
+                f"  {'peak memory':<20} {peak / (1024 * 1024):>9,.1f} MB"
+                f" {per_deployment:>9,.0f} B/deployment"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backends", nargs="+", default=["prefect", "airflow"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--page-limit",
+        type=int,
+        default=None,
+        help="Server page size cap, 0 for no cap, Prefect's default of 200 and none for Airflow"
+        " if omitted",
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=100, help="Page size for paging"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for backend in args.backends:
+        page_limit = (
+            DEFAULT_PAGE_LIMITS[backend] if args.page_limit is None else args.page_limit
+        )
+        for size in args.sizes:
+            print(
+                f"{backend} deployment finder, {size:,} deployments, "
+                f"latency {args.latency_ms:g} ms, page limit {page_limit or 'none'}, "
+                f"error rate {args.error_rate:g}"
+            )
+            run(backend, size, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Memory used per DeploymentDetails record for large result sets.
+
+Builds deployments from JSON decoded API payloads, as the finders do, and reports the bytes
+allocated per record for plain records, records with interned strings and CompactDeploymentDetails
+with interned strings, once after building the records and once after converting each of them
+with `to_dict`, which makes CPython create the `__dict__` of records without `__slots__`.
+
+Run with:
+
+    python benchmarks/memory.py [--sizes 10000 100000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from acme_portal_sdk.compact import CompactDeploymentDetails, StringInterner
+from acme_portal_sdk.deployment_finder import DeploymentDetails
+
+
+def api_payload(count: int) -> List[dict]:
+    """Deployments as decoded from an API response, with a separate string object per value."""
+    deployments = []
+    for i in range(count):
+        flow = f"flow-{i % 500}"
+        env = ("dev", "staging", "prod")[i % 3]
+        commit = f"{i % 50:040x}"
+        deployments.append(
+            {
+                "name": f"project--main--{flow}--{env}",
+                "tags": [
+                    "PROJECT_NAME=project",
+                    "BRANCH_NAME=main",
+                    f"COMMIT_HASH={commit}",
+                    "PACKAGE_VERSION=1.2.3",
+                ],
+                "id": f"{i:08d}-0000-0000-0000-000000000000",
+                "created": "2025-01-01T00:00:00Z",
+                "updated": "2025-01-02T00:00:00Z",
+                "flow_id": f"{i % 500:08d}-0000-0000-0000-000000000000",
+            }
+        )
+    return json.loads(json.dumps(deployments))
+
+
+def build(payload: List[dict], details_class: type, intern: Callable) -> list:
+    records = []
+    for deployment in payload:
+        project, branch, flow, env = deployment["name"].split("--")
+        tags = deployment["tags"]
+        records.append(
+            details_class(
+                name=deployment["name"],
+                project_name=intern(project),
+                branch=intern(branch),
+                flow_name=intern(flow.replace("-", "_")),
+                env=intern(env),
+                commit_hash=intern(tags[2].split("=")[1]),
+                package_version=intern(tags[3].split("=")[1]),
+                tags=[intern(tag) for tag in tags],
+                id=deployment["id"],
+                created_at=deployment["created"],
+                updated_at=deployment["updated"],
+                flow_id=deployment["flow_id"],
+                url=f"https://prefect.example.com/deployments/deployment/{deployment['id']}",
+            )
+        )
+    return records
+
+
+def measure(count: int, details_class: type, interned: bool) -> Tuple[float, float]:
+    payload = api_payload(count)
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    intern = StringInterner() if interned else (lambda value: value)
+    records = build(payload, details_class, intern)
+    # Drop the payload strings that records do not reference
+    del payload
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    for record in records:
+        record.to_dict()
+    gc.collect()
+    used_after_to_dict = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    assert len(records) == count
+    return used / count, used_after_to_dict / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    variants = [
+        ("DeploymentDetails", DeploymentDetails, False),
+        ("DeploymentDetails, interned", DeploymentDetails, True),
+        ("CompactDeploymentDetails, interned", CompactDeploymentDetails, True),
+    ]
+    for count in args.sizes:
+        print(f"{count:,} deployments")
+        plain = None
+        for label, details_class, interned in variants:
+            per_record, after_to_dict = measure(count, details_class, interned)
+            plain = plain or per_record
+            print(
+                f"  {label:<36} {per_record:>8,.0f} bytes/record  {per_record / plain:>5.0%}"
+                f"  {after_to_dict:>8,.0f} after to_dict"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
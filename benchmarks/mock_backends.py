@@ -0,0 +1,239 @@
+"""Local stand-in servers for the Prefect deployments API and the Airflow DAGs API.
+
+The servers serve synthetic deployments from memory, so deployment finders can be measured
+without a Prefect or Airflow installation. Each server runs in its own process, so serving
+requests does not compete with the measured client for the interpreter lock.
+
+Used by the benchmarks in this directory, for example:
+
+    with running_backend("airflow", BackendConfig(deployments=10000)) as url:
+        AirflowDeploymentFinder(airflow_url=url).get_deployments()
+"""
+
+import json
+import multiprocessing
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+ENVS = ("dev", "staging", "prod")
+FLOWS_PER_PROJECT = 500
+
+# Page size cap of each server when BackendConfig.page_limit is None, Prefect's default limit
+DEFAULT_PAGE_LIMITS = {"prefect": 200, "airflow": 0}
+
+
+@dataclass
+class BackendConfig:
+    """Behaviour of a stand-in server.
+
+    Attributes:
+        deployments: Number of synthetic deployments served
+        latency: Seconds to wait before answering each request
+        page_limit: Maximum number of deployments per response, 0 for no limit, None for the
+            server's default in DEFAULT_PAGE_LIMITS. Also used when a request does not ask for a
+            limit.
+        error_rate: Fraction of listing requests answered with `error_status`
+        error_status: HTTP status of injected errors
+        seed: Seed for error injection, so runs are repeatable
+    """
+
+    deployments: int = 1000
+    latency: float = 0.0
+    page_limit: Optional[int] = None
+    error_rate: float = 0.0
+    error_status: int = 500
+    seed: int = 0
+
+
+def synthetic_deployment(index: int) -> Dict[str, Any]:
+    """Describe one deployment, named and tagged like the SDK's deployers do."""
+    project = f"project-{index // (FLOWS_PER_PROJECT * len(ENVS))}"
+    flow = f"flow-{(index // len(ENVS)) % FLOWS_PER_PROJECT}"
+    env = ENVS[index % len(ENVS)]
+    return {
+        "name": f"{project}--main--{flow}--{env}",
+        "tags": [
+            f"PROJECT_NAME={project}",
+            "BRANCH_NAME=main",
+            f"COMMIT_HASH={index % 97:040x}",
+            f"PACKAGE_VERSION=1.{index % 7}.0",
+        ],
+        "id": str(uuid.UUID(int=index + 1)),
+        "flow_id": str(uuid.UUID(int=(index // len(ENVS)) + 1, version=4)),
+        "updated": f"2024-01-{index % 28 + 1:02d}T12:00:00+00:00",
+    }
+
+
+def prefect_deployment(index: int) -> Dict[str, Any]:
+    """Synthetic deployment in the format of `POST /api/deployments/filter`."""
+    deployment = synthetic_deployment(index)
+    return {
+        "id": deployment["id"],
+        "created": "2024-01-01T00:00:00+00:00",
+        "updated": deployment["updated"],
+        "name": deployment["name"],
+        "flow_id": deployment["flow_id"],
+        "tags": deployment["tags"],
+        "paused": False,
+        "work_pool_name": "default",
+        "work_queue_name": "default",
+        "parameters": {},
+        "job_variables": {},
+    }
+
+
+def airflow_dag(index: int) -> Dict[str, Any]:
+    """Synthetic deployment in the format of `GET /api/v1/dags`."""
+    deployment = synthetic_deployment(index)
+    return {
+        "dag_id": deployment["name"],
+        "tags": deployment["tags"],
+        "is_active": True,
+        "is_paused": index % 5 == 0,
+        "schedule_interval": {"__type": "CronExpression", "value": "0 * * * *"},
+        "max_active_runs": 1,
+        "fileloc": f"/opt/airflow/dags/{deployment['name']}.py",
+        "owners": ["airflow"],
+        "last_parsed_time": deployment["updated"],
+    }
+
+
+class _Backend:
+    """Serves pages of synthetic items and injects latency and errors."""
+
+    def __init__(
+        self, config: BackendConfig, items: List[Dict[str, Any]], page_limit: int
+    ):
+        self.config = config
+        self.items = items
+        self.page_limit = page_limit
+        self.random = random.Random(config.seed)
+        # Requests are handled in threads of their own, and Random is not thread-safe
+        self._lock = threading.Lock()
+
+    def page(
+        self, items: List[Dict[str, Any]], offset: int, limit: Any
+    ) -> List[Dict[str, Any]]:
+        """Return one page of the items, capped at the server's page limit."""
+        limit = int(limit) if limit else 0
+        if self.page_limit and (not limit or limit > self.page_limit):
+            limit = self.page_limit
+        end = offset + limit if limit else len(items)
+        return items[offset:end]
+
+    def fail(self) -> bool:
+        """Wait for the configured latency and decide whether to inject an error."""
+        if self.config.latency:
+            time.sleep(self.config.latency)
+        with self._lock:
+            return self.random.random() < self.config.error_rate
+
+
+def _make_handler(kind: str, backend: _Backend):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, payload: Any) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if (
+                kind != "prefect"
+                or urlparse(self.path).path != "/api/deployments/filter"
+            ):
+                self._send(404, {"detail": "Not Found"})
+            elif backend.fail():
+                self._send(backend.config.error_status, {"detail": "Injected error"})
+            else:
+                deployments = backend.items
+                # Only the `deployments.name.any_` filter is supported
+                names = ((request.get("deployments") or {}).get("name") or {}).get(
+                    "any_"
+                )
+                if names is not None:
+                    wanted = set(names)
+                    deployments = [
+                        item for item in deployments if item["name"] in wanted
+                    ]
+                self._send(
+                    200,
+                    backend.page(
+                        deployments, request.get("offset") or 0, request.get("limit")
+                    ),
+                )
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if kind != "airflow" or url.path != "/api/v1/dags":
+                self._send(404, {"detail": "Not Found"})
+                return
+            if backend.fail():
+                self._send(backend.config.error_status, {"detail": "Injected error"})
+                return
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            dags = backend.items
+            pattern = query.get("dag_id_pattern")
+            if pattern:
+                dags = [dag for dag in dags if pattern in dag["dag_id"]]
+            page = backend.page(dags, int(query.get("offset", 0)), query.get("limit"))
+            self._send(200, {"dags": page, "total_entries": len(dags)})
+
+    return Handler
+
+
+def _serve(kind: str, config: BackendConfig, ready) -> None:
+    build = prefect_deployment if kind == "prefect" else airflow_dag
+    page_limit = (
+        DEFAULT_PAGE_LIMITS[kind] if config.page_limit is None else config.page_limit
+    )
+    backend = _Backend(
+        config, [build(index) for index in range(config.deployments)], page_limit
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(kind, backend))
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+@contextmanager
+def running_backend(kind: str, config: BackendConfig) -> Iterator[str]:
+    """
+    Run a stand-in server in a separate process.
+
+    Args:
+        kind: "prefect" or "airflow"
+        config: Served deployments, latency, page limit and error injection
+
+    Yields:
+        Base URL of the server. For Prefect it is the API URL, ending in `/api`.
+    """
+    if kind not in ("prefect", "airflow"):
+        raise ValueError(f"Unknown backend {kind!r}, use 'prefect' or 'airflow'")
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=_serve, args=(kind, config, ready), daemon=True
+    )
+    process.start()
+    try:
+        port = ready.get(timeout=120)
+        url = f"http://127.0.0.1:{port}"
+        yield f"{url}/api" if kind == "prefect" else url
+    finally:
+        process.terminate()
+        process.join()
@@ -0,0 +1,108 @@
+"""Per-row cost of parsing deployment names and tags.
+
+Compares the previous hand-written parsing of the Prefect deployment finder, which splits the name
+and scans the tags once per extracted key with substring matching, with DeploymentNameCodec, which
+decodes the name and parses all tags in one pass.
+
+Run with:
+
+    python benchmarks/naming.py [--rows 100000]
+"""
+
+import argparse
+import time
+from typing import Callable, List, Tuple
+
+from acme_portal_sdk.naming import DEFAULT_NAME_CODEC
+
+
+def make_rows(count: int) -> List[Tuple[str, List[str]]]:
+    return [
+        (
+            f"project--main--flow-{i % 500}--{('dev', 'staging', 'prod')[i % 3]}",
+            [
+                "PROJECT_NAME=project",
+                "BRANCH_NAME=main",
+                f"COMMIT_HASH={i % 50:040x}",
+                "PACKAGE_VERSION=1.2.3",
+                f"DEPLOY_FINGERPRINT={i:016x}",
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def parse_split(rows: List[Tuple[str, List[str]]]) -> list:
+    result = []
+    for name, tags in rows:
+        parts = name.split("--")
+        if len(parts) < 4:
+            continue
+        commit_hash = next(
+            (tag.split("=")[1] for tag in tags if "COMMIT_HASH" in tag), ""
+        )
+        package_version = next(
+            (tag.split("=")[1] for tag in tags if "PACKAGE_VERSION" in tag), ""
+        )
+        result.append(
+            (
+                parts[0],
+                parts[1],
+                parts[-2].replace("-", "_"),
+                parts[-1],
+                commit_hash,
+                package_version,
+            )
+        )
+    return result
+
+
+def parse_codec(rows: List[Tuple[str, List[str]]]) -> list:
+    codec = DEFAULT_NAME_CODEC
+    result = []
+    for name, tags in rows:
+        decoded = codec.decode(name)
+        if decoded is None:
+            continue
+        tag_values = codec.parse_tags(tags)
+        result.append(
+            (
+                decoded.project_name,
+                decoded.branch,
+                decoded.flow_name,
+                decoded.env,
+                tag_values.get(codec.commit_hash_tag, ""),
+                tag_values.get(codec.package_version_tag, ""),
+            )
+        )
+    return result
+
+
+def best_of(repeat: int, function: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    assert parse_split(rows) == parse_codec(rows)
+    print(f"Name and tag parsing, {args.rows:,} rows")
+    for label, function in (
+        ("split + per-key tag scan", parse_split),
+        ("DeploymentNameCodec", parse_codec),
+    ):
+        seconds = best_of(args.repeat, lambda: function(rows))
+        print(f"  {label:<28} {seconds / args.rows * 1e9:>8,.0f} ns/row")
+
+
+if __name__ == "__main__":
+    main()
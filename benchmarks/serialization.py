@@ -0,0 +1,131 @@
+"""Round-trip throughput of FlowDetails/DeploymentDetails serialization.
+
+Compares the `to_dict`/`from_dict` methods with the previous `dataclasses.asdict` path, and the
+JSON encoders available in the environment.
+
+Run with:
+
+    python benchmarks/serialization.py [--records 20000] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from dataclasses import asdict
+from typing import Callable, List
+
+from acme_portal_sdk import serialization
+from acme_portal_sdk.deployment_finder import DeploymentDetails
+from acme_portal_sdk.flow_finder import FlowDetails
+
+
+def make_deployments(count: int) -> List[DeploymentDetails]:
+    return [
+        DeploymentDetails(
+            name=f"project--main--flow-{i % 500}--{env}",
+            project_name="project",
+            branch="main",
+            flow_name=f"flow_{i % 500}",
+            env=env,
+            commit_hash="0123456789abcdef0123456789abcdef01234567",
+            package_version="1.2.3",
+            tags=[
+                "PROJECT_NAME=project",
+                "BRANCH_NAME=main",
+                "COMMIT_HASH=0123456789abcdef0123456789abcdef01234567",
+                "PACKAGE_VERSION=1.2.3",
+            ],
+            id=f"deployment-{i}",
+            created_at="2025-01-01T00:00:00Z",
+            updated_at="2025-01-02T00:00:00Z",
+            flow_id=f"flow-{i % 500}",
+            url=f"https://prefect.example.com/deployments/deployment/{i}",
+            child_attributes={"work_pool": "pool", "schedule": "0 12 * * *"},
+        )
+        for i, env in ((i, ("dev", "staging", "prod")[i % 3]) for i in range(count))
+    ]
+
+
+def make_flows(count: int) -> List[FlowDetails]:
+    return [
+        FlowDetails(
+            name=f"flow_{i}",
+            original_name=f"flow-{i}",
+            description="Flow description",
+            id=f"id-{i}",
+            source_path=f"/project/src/flows/group_{i % 20}/flow_{i}.py",
+            source_relative=f"flows/group_{i % 20}/flow_{i}.py",
+            line_number=10,
+            grouping=["flows", f"group_{i % 20}"],
+            child_attributes={
+                "obj_name": f"flow_{i}",
+                "module": f"flows.group_{i % 20}.flow_{i}",
+                "import_path": f"flows.group_{i % 20}.flow_{i}",
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def best_of(repeat: int, function: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def report(label: str, count: int, seconds: float, baseline: float) -> None:
+    print(
+        f"  {label:<28} {count / seconds:>12,.0f} records/s"
+        f"  {baseline / seconds:>5.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for cls, records in (
+        (DeploymentDetails, make_deployments(args.records)),
+        (FlowDetails, make_flows(args.records)),
+    ):
+        print(f"{cls.__name__} round trip, {args.records:,} records")
+        baseline = best_of(
+            args.repeat, lambda: [cls(**asdict(record)) for record in records]
+        )
+        report("asdict + cls(**data)", args.records, baseline, baseline)
+        fast = best_of(
+            args.repeat, lambda: [cls.from_dict(record.to_dict()) for record in records]
+        )
+        report("to_dict + from_dict", args.records, fast, baseline)
+
+        data = [record.to_dict() for record in records]
+        stdlib = best_of(args.repeat, lambda: json.dumps(data))
+        report("json.dumps", args.records, stdlib, stdlib)
+        encoder = (
+            "orjson"
+            if serialization.orjson is not None
+            else "json (orjson not installed)"
+        )
+        report(
+            f"dumps [{encoder}]",
+            args.records,
+            best_of(args.repeat, lambda: serialization.dumps(data)),
+            stdlib,
+        )
+        if serialization.msgpack is not None:
+            report(
+                "packb [msgpack]",
+                args.records,
+                best_of(args.repeat, lambda: serialization.packb(data)),
+                stdlib,
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
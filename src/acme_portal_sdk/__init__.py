@@ -11,8 +11,10 @@ from .deployment_promote import PromoteWorkflow  # noqa: F401
 from .flow_deploy import DeployWorkflow  # noqa: F401
 from .flow_deploy import DeployInfo, DeployInfoPrep, FlowDeployer  # noqa: F401
 from .flow_finder import FlowDetails, FlowFinder  # noqa: F401
+from .tracing import configure_from_env
 
 load_dotenv()
+configure_from_env()
 
 PROTOCOL_VERSION = 1
 
@@ -1,12 +1,24 @@
 import argparse
+import contextlib
 import sys
 import importlib.util
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from acme_portal_sdk.async_api import ASYNC_BASE_CLASSES, to_sync
 from acme_portal_sdk.flow_finder import FlowFinder
 from acme_portal_sdk.deployment_finder import DeploymentFinder
 from acme_portal_sdk.flow_deploy import DeployWorkflow
 from acme_portal_sdk.deployment_promote import PromoteWorkflow
+from acme_portal_sdk.portal_snapshot import OK, take_portal_snapshot
+from acme_portal_sdk.profiling import (
+    check_budgets,
+    format_report,
+    load_budgets,
+    profile_read_paths,
+)
+from acme_portal_sdk.serialization import dumps
+
+SDK_DIR = Path(".acme_portal_sdk")
 
 
 def parse_args():
@@ -23,9 +35,75 @@ def parse_args():
         "check-config", help="Check project configuration for the SDK"
     )
 
+    # Add subcommand for profiling the read paths of the configured objects
+    profile_parser = subparsers.add_parser(
+        "profile",
+        help="Measure latency, memory and hot functions of find_flows and get_deployments",
+    )
+    profile_parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Number of timed calls per read path, the first one is reported as cold",
+    )
+    profile_parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of hot functions to report per read path",
+    )
+    profile_parser.add_argument(
+        "--budgets",
+        help="JSON file with limits per read path, the command fails if any is exceeded",
+    )
+    profile_parser.add_argument(
+        "--json", action="store_true", help="Print the measurements as JSON"
+    )
+
+    # Add subcommand for reading flows and deployments in one call
+    snapshot_parser = subparsers.add_parser(
+        "snapshot",
+        help="Find flows and deployments concurrently and print them with their join as JSON",
+    )
+    snapshot_parser.add_argument(
+        "--flow-deadline", type=float, help="Seconds to wait for the flows"
+    )
+    snapshot_parser.add_argument(
+        "--deployment-deadline", type=float, help="Seconds to wait for the deployments"
+    )
+
     return parser.parse_args()
 
 
+def load_sdk_object(
+    file_name: str, base_class: type, sdk_dir: Path = SDK_DIR
+) -> Optional[Any]:
+    """
+    Load the object configured in a file of the `.acme_portal_sdk` directory.
+
+    Args:
+        file_name: File name, e.g. `flow_finder.py`
+        base_class: Class the configured object must be an instance of
+        sdk_dir: Directory with the SDK configuration
+
+    Returns:
+        The first instance of `base_class` or of its async variant defined in the file, or None
+        if there is none. Instances of the async variant are adapted with `to_sync`.
+    """
+    spec = importlib.util.spec_from_file_location("module.name", sdk_dir / file_name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    classes = (base_class, ASYNC_BASE_CLASSES.get(base_class, base_class))
+    return next(
+        (
+            to_sync(value)
+            for value in module.__dict__.values()
+            if isinstance(value, classes)
+        ),
+        None,
+    )
+
+
 def check_project_configuration() -> Tuple[bool, List[str]]:
     """
     Checks if the project is configured correctly to use the SDK.
@@ -40,7 +118,7 @@ def check_project_configuration() -> Tuple[bool, List[str]]:
         "flow_deploy.py": DeployWorkflow,
         "deployment_promote.py": PromoteWorkflow,
     }
-    sdk_dir = Path(".acme_portal_sdk")
+    sdk_dir = SDK_DIR
     messages = []
     configuration_complete = True
 
@@ -52,16 +130,7 @@ def check_project_configuration() -> Tuple[bool, List[str]]:
         else:
             # Check for an instance of the expected base class in the file
             try:
-                spec = importlib.util.spec_from_file_location("module.name", file_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                # Check for an instance of the expected base class
-                expected_instance_found = any(
-                    isinstance(value, base_class) for value in module.__dict__.values()
-                )
-
-                if not expected_instance_found:
+                if load_sdk_object(file_name, base_class, sdk_dir) is None:
                     messages.append(
                         f"❌ No instance of a class inheriting from {base_class.__name__} found in {file_name}"
                     )
@@ -80,6 +149,93 @@ def check_project_configuration() -> Tuple[bool, List[str]]:
     return configuration_complete, messages
 
 
+def load_finders() -> Dict[type, Optional[Any]]:
+    """
+    Load the configured flow and deployment finders, reporting problems on stderr.
+
+    Returns:
+        FlowFinder and DeploymentFinder mapped to the configured instance, or None if it could
+        not be loaded
+    """
+    finders: Dict[type, Optional[Any]] = {}
+    # Keep output of the configured objects, like credential checks, out of the report
+    with contextlib.redirect_stdout(sys.stderr):
+        for file_name, base_class in (
+            ("flow_finder.py", FlowFinder),
+            ("deployment_finder.py", DeploymentFinder),
+        ):
+            try:
+                finders[base_class] = load_sdk_object(file_name, base_class)
+                if finders[base_class] is None:
+                    print(
+                        f"❌ No instance of {base_class.__name__} found in {file_name}"
+                    )
+            except Exception as e:
+                finders[base_class] = None
+                print(f"❌ Error loading {file_name}: {e}")
+    return finders
+
+
+def snapshot_project(args) -> bool:
+    """
+    Print flows, deployments and their join for the configured finders as one JSON payload.
+
+    Args:
+        args: Parsed `snapshot` command arguments
+
+    Returns:
+        True if at least one of flows and deployments was read
+    """
+    finders = load_finders()
+    # The finders report progress on stdout, which carries the payload
+    with contextlib.redirect_stdout(sys.stderr):
+        snapshot = take_portal_snapshot(
+            finders[FlowFinder],
+            finders[DeploymentFinder],
+            flow_deadline=args.flow_deadline,
+            deployment_deadline=args.deployment_deadline,
+        )
+    print(snapshot.to_json(), flush=True)
+    return any(snapshot.parts[name].status == OK for name in ("flows", "deployments"))
+
+
+def profile_project(args) -> bool:
+    """
+    Profile the read paths of the configured flow and deployment finders and print a report.
+
+    Args:
+        args: Parsed `profile` command arguments
+
+    Returns:
+        True if every budget is met, or no budgets file was given
+    """
+    budgets = load_budgets(args.budgets) if args.budgets else {}
+    finders = load_finders()
+    profiles = profile_read_paths(
+        finders[FlowFinder], finders[DeploymentFinder], runs=args.runs, top=args.top
+    )
+    violations = check_budgets(profiles, budgets)
+
+    if args.json:
+        print(
+            dumps(
+                {
+                    "profiles": [profile.to_dict() for profile in profiles],
+                    "budget_violations": violations,
+                }
+            )
+        )
+    else:
+        print(format_report(profiles))
+        if budgets:
+            print()
+            for violation in violations:
+                print(f"❌ {violation}")
+            if not violations:
+                print("✅ All budgets met.")
+    return not violations
+
+
 def main_logic(args):
     if args.command == "check-config":
         configuration_complete, messages = check_project_configuration()
@@ -88,6 +244,12 @@ def main_logic(args):
         if not configuration_complete:
             print("Please fix the above issues before proceeding.")
             sys.exit(1)
+    elif args.command == "profile":
+        if not profile_project(args):
+            sys.exit(1)
+    elif args.command == "snapshot":
+        if not snapshot_project(args):
+            sys.exit(1)
 
 
 def main():
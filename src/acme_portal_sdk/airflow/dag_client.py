@@ -0,0 +1,192 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urljoin
+
+import requests
+
+from acme_portal_sdk.deploy_executor import DEFAULT_MAX_PARALLEL
+from acme_portal_sdk.tracing import span
+
+DEFAULT_PAGE_LIMIT = 100
+
+
+class AirflowDagClient:
+    """Reads and updates DAGs of one Airflow webserver in bulk using the `/api/v1/dags` endpoints."""
+
+    def __init__(
+        self,
+        airflow_url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        page_limit: int = DEFAULT_PAGE_LIMIT,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+    ):
+        """Initialize the AirflowDagClient.
+
+        Args:
+            airflow_url: Base URL for Airflow webserver (e.g., http://localhost:8080)
+            username: Username for Airflow basic auth
+            password: Password for Airflow basic auth
+            page_limit: Number of DAGs requested per page when listing
+            max_parallel: Maximum number of per-DAG requests sent at the same time
+        """
+        self.airflow_url = airflow_url
+        self.username = username
+        self.password = password
+        self.page_limit = page_limit
+        self.max_parallel = max_parallel
+
+    def _make_request(
+        self, endpoint: str, method: str = "GET", params: dict = None, data: dict = None
+    ) -> requests.Response:
+        """Make authenticated request to Airflow API."""
+        url = urljoin(self.airflow_url, endpoint)
+        auth = (
+            (self.username, self.password) if self.username and self.password else None
+        )
+
+        with span("http.request", method=method, url=endpoint) as current:
+            response = requests.request(
+                method=method,
+                url=url,
+                auth=auth,
+                params=params,
+                json=data,
+                headers={"Content-Type": "application/json"},
+            )
+            current.set_attribute("status_code", response.status_code)
+        return response
+
+    def list_dags(self, dag_id_pattern: Optional[str] = None) -> Dict[str, dict]:
+        """List all DAGs whose ID contains the pattern, following pagination.
+
+        Args:
+            dag_id_pattern: Substring the DAG ID must contain, all DAGs are listed if None
+
+        Returns:
+            Dictionary mapping DAG ID to the DAG data returned by Airflow
+
+        Raises:
+            RuntimeError: If Airflow responds with an error
+        """
+        dags: Dict[str, dict] = {}
+        offset = 0
+        while True:
+            params = {"limit": self.page_limit, "offset": offset}
+            if dag_id_pattern:
+                params["dag_id_pattern"] = dag_id_pattern
+            response = self._make_request("/api/v1/dags", params=params)
+            if response.status_code != 200:
+                raise RuntimeError(f"Error listing DAGs: HTTP {response.status_code}")
+
+            payload = response.json()
+            page = payload.get("dags", [])
+            for dag in page:
+                dags[dag["dag_id"]] = dag
+
+            offset += len(page)
+            if not page or offset >= payload.get("total_entries", offset):
+                return dags
+
+    def _patch_dag(self, dag_id: str, update_data: dict) -> Optional[str]:
+        """Update a single DAG and return an error message on failure."""
+        try:
+            response = self._make_request(
+                f"/api/v1/dags/{dag_id}", method="PATCH", data=update_data
+            )
+        except Exception as e:
+            return str(e)
+        if response.status_code != 200:
+            return f"HTTP {response.status_code}: {response.text}"
+        return None
+
+    def set_paused(
+        self,
+        changes: Dict[str, bool],
+        listed_dags: Dict[str, dict],
+        dag_id_pattern: Optional[str],
+    ) -> Dict[str, Optional[str]]:
+        """Set the pause state of many DAGs with as few requests as possible.
+
+        For every pause state, a single bulk `PATCH /api/v1/dags?dag_id_pattern=` request is used
+        when the DAGs matching `dag_id_pattern` that are not yet in that state are exactly the DAGs
+        to change, so no other DAG is affected. Otherwise the DAGs are updated with concurrent
+        per-DAG PATCH requests. The bulk request only updates one page of DAGs, so DAGs missing
+        from its response, e.g. beyond the server's `maximum_page_limit`, are updated per DAG.
+
+        Args:
+            changes: Dictionary mapping DAG ID to the desired `is_paused` value
+            listed_dags: Result of `list_dags(dag_id_pattern)`, used to check that a bulk update is safe
+            dag_id_pattern: Pattern used to list `listed_dags`
+
+        Returns:
+            Dictionary mapping each changed DAG ID to an error message, or None on success
+        """
+        results: Dict[str, Optional[str]] = {}
+        per_dag: List[str] = []
+
+        for is_paused in (True, False):
+            dag_ids = {
+                dag_id for dag_id, value in changes.items() if value == is_paused
+            }
+            if not dag_ids:
+                continue
+
+            affected = {
+                dag_id
+                for dag_id, dag in listed_dags.items()
+                if dag.get("is_paused") != is_paused
+            }
+            if dag_id_pattern and affected == dag_ids:
+                error, updated = self._bulk_set_paused(
+                    dag_id_pattern, is_paused, len(listed_dags)
+                )
+                if error is not None:
+                    results.update({dag_id: error for dag_id in dag_ids})
+                    continue
+                results.update({dag_id: None for dag_id in dag_ids & updated})
+                per_dag.extend(sorted(dag_ids - updated))
+            else:
+                per_dag.extend(sorted(dag_ids))
+
+        if per_dag:
+            workers = min(self.max_parallel, len(per_dag))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                errors = pool.map(
+                    lambda dag_id: self._patch_dag(
+                        dag_id, {"is_paused": changes[dag_id]}
+                    ),
+                    per_dag,
+                )
+                results.update(zip(per_dag, errors))
+
+        return results
+
+    def _bulk_set_paused(
+        self, dag_id_pattern: str, is_paused: bool, limit: int
+    ) -> Tuple[Optional[str], Set[str]]:
+        """Set the pause state of the DAGs matching the pattern in one request.
+
+        Airflow applies the request to one page of matching DAGs, so `limit` is set to the number
+        of matching DAGs and the DAGs the response lists are returned as the updated ones.
+
+        Returns:
+            Error message or None on success, and the IDs of the updated DAGs
+        """
+        try:
+            response = self._make_request(
+                "/api/v1/dags",
+                method="PATCH",
+                params={
+                    "dag_id_pattern": dag_id_pattern,
+                    "update_mask": "is_paused",
+                    "limit": limit,
+                    "offset": 0,
+                },
+                data={"is_paused": is_paused},
+            )
+        except Exception as e:
+            return str(e), set()
+        if response.status_code != 200:
+            return f"HTTP {response.status_code}: {response.text}", set()
+        return None, {dag["dag_id"] for dag in response.json().get("dags", [])}
@@ -7,7 +7,10 @@ from urllib.parse import urljoin
 
 import requests
 
+from acme_portal_sdk.compact import CompactDeploymentDetails, StringInterner
 from acme_portal_sdk.deployment_finder import DeploymentDetails, DeploymentFinder
+from acme_portal_sdk.naming import DEFAULT_NAME_CODEC, DeploymentNameCodec
+from acme_portal_sdk.tracing import span
 
 if TYPE_CHECKING:
     from acme_portal_sdk.flow_finder import FlowDetails
@@ -24,6 +27,8 @@ class AirflowDeploymentFinder(DeploymentFinder):
         airflow_url: Optional[str] = None,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        compact: bool = False,
+        name_codec: Optional[DeploymentNameCodec] = None,
     ):
         """Initialize the AirflowDeploymentFinder and verify Airflow credentials.
 
@@ -31,7 +36,11 @@ class AirflowDeploymentFinder(DeploymentFinder):
             airflow_url: Base URL for Airflow webserver (e.g., http://localhost:8080)
             username: Username for Airflow basic auth
             password: Password for Airflow basic auth
+            compact: Return CompactDeploymentDetails, which use less memory for large result sets
+            name_codec: Codec for DAG IDs and tags, defaults to `project--branch--flow--env`
         """
+        self.name_codec = name_codec or DEFAULT_NAME_CODEC
+        self.details_class = CompactDeploymentDetails if compact else DeploymentDetails
         self.airflow_url = airflow_url or os.environ.get("AIRFLOW_URL")
         self.username = username or os.environ.get("AIRFLOW_USERNAME")
         self.password = password or os.environ.get("AIRFLOW_PASSWORD")
@@ -66,14 +75,16 @@ class AirflowDeploymentFinder(DeploymentFinder):
             (self.username, self.password) if self.username and self.password else None
         )
 
-        response = requests.request(
-            method=method,
-            url=url,
-            auth=auth,
-            params=params,
-            json=data,
-            headers={"Content-Type": "application/json"},
-        )
+        with span("http.request", method=method, url=endpoint) as current:
+            response = requests.request(
+                method=method,
+                url=url,
+                auth=auth,
+                params=params,
+                json=data,
+                headers={"Content-Type": "application/json"},
+            )
+            current.set_attribute("status_code", response.status_code)
         return response
 
     def _get_dag_url(self, dag_id: str) -> str:
@@ -111,51 +122,50 @@ class AirflowDeploymentFinder(DeploymentFinder):
             dags_data = response.json()
             dags = dags_data.get("dags", [])
 
+            # Share one copy of values repeated across DAGs, like project names and tags
+            intern = StringInterner()
             result = []
             for dag in dags:
                 print(f"Processing DAG: {dag['dag_id']}")
 
-                # Parse DAG ID into components
+                # Parse DAG ID and tags into components
                 dag_id = dag["dag_id"]
-                parts = dag_id.split("--") if "--" in dag_id else [dag_id]
+                name = self.name_codec.decode(dag_id)
+                tag_values = self.name_codec.parse_tags(dag.get("tags", []))
 
                 # Extract project, branch, flow name, and env from DAG ID or tags
-                if len(parts) >= 4:
-                    project_name = parts[0]
-                    branch = parts[1]
-                    flow_name = parts[-2].replace("-", "_")
-                    env = parts[-1]
-                else:
-                    # Fallback: try to extract from tags or use defaults
-                    project_name = (
-                        self._extract_tag_value(dag.get("tags", []), "PROJECT")
-                        or "unknown"
+                if name is not None:
+                    project_name = name.project_name or tag_values.get(
+                        self.name_codec.project_name_tag, "unknown"
                     )
-                    branch = (
-                        self._extract_tag_value(dag.get("tags", []), "BRANCH") or "main"
+                    branch = name.branch or tag_values.get(
+                        self.name_codec.branch_tag, "main"
                     )
+                    flow_name = name.flow_name
+                    env = name.env
+                else:
+                    # Fallback: try to extract from tags or use defaults
+                    project_name = tag_values.get("PROJECT") or "unknown"
+                    branch = tag_values.get("BRANCH") or "main"
                     flow_name = dag_id.replace("-", "_")
-                    env = self._extract_tag_value(dag.get("tags", []), "ENV") or "dev"
+                    env = tag_values.get("ENV") or "dev"
 
                 # Extract additional metadata from tags
-                commit_hash = (
-                    self._extract_tag_value(dag.get("tags", []), "COMMIT_HASH") or ""
-                )
+                commit_hash = tag_values.get(self.name_codec.commit_hash_tag) or ""
                 package_version = (
-                    self._extract_tag_value(dag.get("tags", []), "PACKAGE_VERSION")
-                    or ""
+                    tag_values.get(self.name_codec.package_version_tag) or ""
                 )
 
                 # Construct deployment info
-                deploy_info = DeploymentDetails(
+                deploy_info = self.details_class(
                     name=dag_id,
-                    project_name=project_name,
-                    branch=branch,
-                    flow_name=flow_name,
-                    env=env,
-                    commit_hash=commit_hash,
-                    package_version=package_version,
-                    tags=dag.get("tags", []),
+                    project_name=intern(project_name),
+                    branch=intern(branch),
+                    flow_name=intern(flow_name),
+                    env=intern(env),
+                    commit_hash=intern(commit_hash),
+                    package_version=intern(package_version),
+                    tags=intern.intern_all(dag.get("tags", [])),
                     id=dag["dag_id"],  # In Airflow, dag_id is the unique identifier
                     created_at=dag.get("created_at", ""),
                     updated_at=dag.get("last_parsed_time", ""),
@@ -208,13 +218,6 @@ class AirflowDeploymentFinder(DeploymentFinder):
             traceback.print_exc(file=sys.stderr)
             raise
 
-    def _extract_tag_value(self, tags: List[str], tag_prefix: str) -> Optional[str]:
-        """Extract value from tags with format 'PREFIX=value'."""
-        for tag in tags:
-            if tag.startswith(f"{tag_prefix}="):
-                return tag.split("=", 1)[1]
-        return None
-
 
 if __name__ == "__main__":
     finder = AirflowDeploymentFinder()
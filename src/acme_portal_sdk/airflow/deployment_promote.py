@@ -6,7 +6,15 @@ from typing import List, Optional
 import requests
 from urllib.parse import urljoin
 
+from acme_portal_sdk.airflow.dag_client import AirflowDagClient
+from acme_portal_sdk.deploy_executor import (
+    DEFAULT_MAX_PARALLEL,
+    DeployBatchResult,
+    DeployResult,
+)
 from acme_portal_sdk.deployment_promote import DeploymentPromote
+from acme_portal_sdk.naming import DeploymentNameCodec
+from acme_portal_sdk.tracing import span
 
 
 class AirflowDeploymentPromote(DeploymentPromote):
@@ -20,6 +28,7 @@ class AirflowDeploymentPromote(DeploymentPromote):
         source_password: Optional[str] = None,
         target_username: Optional[str] = None,
         target_password: Optional[str] = None,
+        name_codec: Optional[DeploymentNameCodec] = None,
     ):
         """Initialize the AirflowDeploymentPromote.
 
@@ -30,7 +39,10 @@ class AirflowDeploymentPromote(DeploymentPromote):
             source_password: Password for source Airflow basic auth
             target_username: Username for target Airflow basic auth
             target_password: Password for target Airflow basic auth
+            name_codec: Codec for DAG IDs, defaults to `project--branch--flow--env` with the flow
+                name used as given
         """
+        self.name_codec = name_codec or DeploymentNameCodec(hyphenate_flow_name=False)
         self.source_airflow_url = source_airflow_url or os.environ.get(
             "AIRFLOW_SOURCE_URL"
         )
@@ -73,14 +85,16 @@ class AirflowDeploymentPromote(DeploymentPromote):
         url = urljoin(base_url, endpoint)
         auth = (username, password) if username and password else None
 
-        response = requests.request(
-            method=method,
-            url=url,
-            auth=auth,
-            params=params,
-            json=data,
-            headers={"Content-Type": "application/json"},
-        )
+        with span("http.request", method=method, url=endpoint) as current:
+            response = requests.request(
+                method=method,
+                url=url,
+                auth=auth,
+                params=params,
+                json=data,
+                headers={"Content-Type": "application/json"},
+            )
+            current.set_attribute("status_code", response.status_code)
         return response
 
     def promote(
@@ -103,11 +117,11 @@ class AirflowDeploymentPromote(DeploymentPromote):
         try:
             for flow_name in flows_to_deploy:
                 # Construct DAG IDs for source and target environments
-                source_dag_id = (
-                    f"{project_name}--{branch_name}--{flow_name}--{source_env}"
+                source_dag_id = self.name_codec.encode(
+                    project_name, branch_name, flow_name, source_env
                 )
-                target_dag_id = (
-                    f"{project_name}--{branch_name}--{flow_name}--{target_env}"
+                target_dag_id = self.name_codec.encode(
+                    project_name, branch_name, flow_name, target_env
                 )
 
                 print(f"Promoting DAG from {source_dag_id} to {target_dag_id}")
@@ -156,6 +170,105 @@ class AirflowDeploymentPromote(DeploymentPromote):
             traceback.print_exc(file=sys.stderr)
             raise
 
+    def promote_many(
+        self,
+        project_name: str,
+        branch_name: str,
+        source_env: str,
+        target_env: str,
+        flows_to_deploy: List[str],
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+    ) -> DeployBatchResult:
+        """Promote many DAGs from one Airflow environment to another with a minimal number of API requests.
+
+        Source and target DAGs of the project and branch are each listed once using `dag_id_pattern`.
+        Only target DAGs whose pause state differs from the source DAG are updated, using Airflow's
+        bulk PATCH where it affects no other DAG and concurrent per-DAG PATCH requests otherwise.
+
+        Args:
+            project_name: Name of the project
+            branch_name: Name of the branch
+            source_env: Source environment
+            target_env: Target environment
+            flows_to_deploy: List of flow names to promote
+            max_parallel: Maximum number of per-DAG requests sent at the same time
+
+        Returns:
+            DeployBatchResult with one result per flow, named after the target DAG
+        """
+        dag_ids = {
+            flow_name: (
+                self.name_codec.encode(
+                    project_name, branch_name, flow_name, source_env
+                ),
+                self.name_codec.encode(
+                    project_name, branch_name, flow_name, target_env
+                ),
+            )
+            for flow_name in flows_to_deploy
+        }
+        # Substring shared by all source and target DAG IDs, like "project--branch--"
+        dag_id_pattern = (
+            os.path.commonprefix(
+                [dag_id for pair in dag_ids.values() for dag_id in pair]
+            )
+            or None
+        )
+        source_client = AirflowDagClient(
+            self.source_airflow_url,
+            self.source_username,
+            self.source_password,
+            max_parallel=max_parallel,
+        )
+        target_client = AirflowDagClient(
+            self.target_airflow_url,
+            self.target_username,
+            self.target_password,
+            max_parallel=max_parallel,
+        )
+        source_dags = source_client.list_dags(dag_id_pattern)
+        target_dags = target_client.list_dags(dag_id_pattern)
+
+        errors = {}
+        changes = {}
+        target_dag_ids = {}
+        for flow_name in flows_to_deploy:
+            source_dag_id, target_dag_id = dag_ids[flow_name]
+            target_dag_ids[flow_name] = target_dag_id
+
+            source_dag = source_dags.get(source_dag_id)
+            target_dag = target_dags.get(target_dag_id)
+            if source_dag is None:
+                errors[target_dag_id] = f"Source DAG {source_dag_id} not found"
+            elif target_dag is None:
+                errors[target_dag_id] = (
+                    f"Target DAG {target_dag_id} not found. Cannot promote - DAG file must exist in target environment."
+                )
+            elif (
+                "is_paused" in source_dag
+                and target_dag.get("is_paused") != source_dag["is_paused"]
+            ):
+                changes[target_dag_id] = source_dag["is_paused"]
+
+        errors.update(target_client.set_paused(changes, target_dags, dag_id_pattern))
+
+        results = [
+            DeployResult(
+                name=target_dag_ids[flow_name],
+                flow_name=flow_name,
+                error=errors.get(target_dag_ids[flow_name]),
+            )
+            for flow_name in flows_to_deploy
+        ]
+        for result in results:
+            if result.succeeded:
+                print(
+                    f"Successfully promoted {result.flow_name} from {source_env} to {target_env}"
+                )
+            else:
+                print(f"Failed to promote {result.flow_name}: {result.error}")
+        return DeployBatchResult(results=results)
+
     def _get_dag_config(
         self, base_url: str, username: str, password: str, dag_id: str
     ) -> Optional[dict]:
@@ -1,12 +1,17 @@
 import os
 import sys
 import traceback
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import requests
 from urllib.parse import urljoin
 
+from acme_portal_sdk.airflow.dag_client import AirflowDagClient
+from acme_portal_sdk.deploy_executor import (DEFAULT_MAX_PARALLEL,
+                                             DeployBatchResult, DeployResult)
 from acme_portal_sdk.flow_deploy import DeployInfo, FlowDeployer
+from acme_portal_sdk.tracing import span
 
 
 class AirflowFlowDeployer(FlowDeployer):
@@ -43,14 +48,16 @@ class AirflowFlowDeployer(FlowDeployer):
             (self.username, self.password) if self.username and self.password else None
         )
 
-        response = requests.request(
-            method=method,
-            url=url,
-            auth=auth,
-            params=params,
-            json=data,
-            headers={"Content-Type": "application/json"},
-        )
+        with span("http.request", method=method, url=endpoint) as current:
+            response = requests.request(
+                method=method,
+                url=url,
+                auth=auth,
+                params=params,
+                json=data,
+                headers={"Content-Type": "application/json"},
+            )
+            current.set_attribute("status_code", response.status_code)
         return response
 
     def deploy(self, flow_deploy_info: DeployInfo) -> None:
@@ -123,6 +130,73 @@ class AirflowFlowDeployer(FlowDeployer):
             traceback.print_exc(file=sys.stderr)
             raise
 
+    def deploy_many(
+        self,
+        deploy_infos: List[DeployInfo],
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+    ) -> DeployBatchResult:
+        """Deploy many flows to Airflow with a minimal number of API requests.
+
+        DAGs are listed once using a `dag_id_pattern` shared by all deployments. Only DAGs whose
+        pause state differs from the requested one are updated, using Airflow's bulk PATCH where
+        it affects no other DAG and concurrent per-DAG PATCH requests otherwise.
+
+        Args:
+            deploy_infos: Configuration for each deployment
+            max_parallel: Maximum number of per-DAG requests sent at the same time
+
+        Returns:
+            DeployBatchResult with one result per deploy info
+        """
+        if not deploy_infos:
+            return DeployBatchResult()
+
+        dag_client = AirflowDagClient(
+            self.airflow_url, self.username, self.password, max_parallel=max_parallel
+        )
+        dag_id_pattern = os.path.commonprefix([info.name for info in deploy_infos])
+        listed_dags = dag_client.list_dags(dag_id_pattern or None)
+
+        errors = {}
+        changes = {}
+        for info in deploy_infos:
+            dag = listed_dags.get(info.name)
+            if dag is None:
+                errors[info.name] = (
+                    f"DAG {info.name} not found in Airflow. Make sure the DAG file is in the DAGs folder."
+                )
+            elif info.paused is not None and dag.get("is_paused") != info.paused:
+                changes[info.name] = info.paused
+
+        errors.update(dag_client.set_paused(changes, listed_dags, dag_id_pattern))
+
+        to_trigger = [
+            info
+            for info in deploy_infos
+            if getattr(info, "trigger_run", False) and errors.get(info.name) is None
+        ]
+        if to_trigger:
+            with ThreadPoolExecutor(max_workers=min(max_parallel, len(to_trigger))) as pool:
+                list(
+                    pool.map(
+                        lambda info: self._trigger_dag_run(
+                            info.name, info.parameters or {}
+                        ),
+                        to_trigger,
+                    )
+                )
+
+        results = [
+            DeployResult(
+                name=info.name, flow_name=info.flow_name, error=errors.get(info.name)
+            )
+            for info in deploy_infos
+        ]
+        print(
+            f"Deployment of {len(deploy_infos)} DAGs completed, {len(changes)} updated"
+        )
+        return DeployBatchResult(results=results)
+
     def _trigger_dag_run(self, dag_id: str, parameters: dict) -> None:
         """Trigger a DAG run."""
         try:
@@ -5,7 +5,10 @@ import traceback
 from pprint import pp
 from typing import Dict, List, Optional
 
+from acme_portal_sdk.compact import StringInterner
 from acme_portal_sdk.flow_finder import FlowDetails, FlowFinder
+from acme_portal_sdk.import_discovery import DiscoveredObject, ImportDiscovery
+from acme_portal_sdk.tracing import traced
 
 AirflowFlowDetails = FlowDetails
 
@@ -13,8 +16,24 @@ AirflowFlowDetails = FlowDetails
 class AirflowFlowFinder(FlowFinder):
     """Scans Python code directories to identify Airflow DAGs by analyzing DAG instantiations, extracting metadata and organizing found DAGs into flat list."""
 
-    def __init__(self, root_dir: str):
+    def __init__(
+        self,
+        root_dir: str,
+        import_discovery: Optional[ImportDiscovery] = None,
+        package_name: Optional[str] = None,
+    ):
+        """Initialize the AirflowFlowFinder.
+
+        Args:
+            root_dir: Package directory to scan
+            import_discovery: Also import modules in worker processes to find DAGs that only
+                exist at runtime, e.g. built in loops or by factories. Off by default.
+            package_name: Import path of the root directory, used as prefix of the import paths
+                of DAGs. Defaults to the name of the root directory.
+        """
         self.root_dir = root_dir
+        self.import_discovery = import_discovery
+        self.package_name = package_name or os.path.basename(root_dir)
 
     class _DAGVisitor(ast.NodeVisitor):
         """AST visitor to find Airflow DAG definitions in Python code."""
@@ -162,7 +181,8 @@ class AirflowFlowFinder(FlowFinder):
                         kwargs[keyword.arg] = keyword.value.value
             return kwargs
 
-    def _scan_file(self, file_path: str) -> Dict[str, FlowDetails]:
+    @traced(attributes=lambda self, file_path, intern: {"file": file_path})
+    def _scan_file(self, file_path: str, intern: StringInterner) -> Dict[str, FlowDetails]:
         """Scan a single Python file for DAGs."""
         dags = {}
         try:
@@ -177,29 +197,7 @@ class AirflowFlowFinder(FlowFinder):
 
             # Process found DAGs
             for key, dag_data in visitor.dags.items():
-                # Add file information
-                dag_data["source_path"] = file_path
-                dag_data["source_relative"] = os.path.relpath(
-                    file_path, start=self.root_dir
-                )
-                dag_data["grouping"] = dag_data["source_relative"].split(os.sep)[
-                    :-1
-                ]  # Grouping by directory structure
-                package_name = os.path.basename(self.root_dir)
-                import_path = (
-                    f"{package_name}.{dag_data['source_relative'].replace(os.sep, '.').replace('.py', '')}"
-                )
-                
-                # Add import_path to child_attributes
-                if "child_attributes" not in dag_data:
-                    dag_data["child_attributes"] = {}
-                dag_data["child_attributes"]["import_path"] = import_path
-                
-                dag_data = FlowDetails(**dag_data)
-                # Add the DAG to the results
-                dags[key] = dag_data
-
-                print(f"Added DAG to results: {dag_data.name}")
+                dags[key] = self._to_flow_details(file_path, dag_data, intern)
 
         except Exception as e:
             print(f"Error scanning {file_path}: {str(e)}")
@@ -207,11 +205,76 @@ class AirflowFlowFinder(FlowFinder):
 
         return dags
 
+    def _to_flow_details(
+        self, file_path: str, dag_data: dict, intern: StringInterner
+    ) -> FlowDetails:
+        """Add file information to the data of a DAG found in a file."""
+        dag_data["source_path"] = file_path
+        dag_data["source_relative"] = os.path.relpath(
+            file_path, start=self.root_dir
+        )
+        dag_data["grouping"] = intern.intern_all(
+            dag_data["source_relative"].split(os.sep)[:-1]
+        )  # Grouping by directory structure
+        import_path = (
+            f"{self.package_name}.{dag_data['source_relative'].replace(os.sep, '.').replace('.py', '')}"
+        )
+
+        # Add import_path to child_attributes
+        if "child_attributes" not in dag_data:
+            dag_data["child_attributes"] = {}
+        dag_data["child_attributes"]["import_path"] = import_path
+
+        dag_data = FlowDetails(**dag_data)
+        print(f"Added DAG to results: {dag_data.name}")
+        return dag_data
+
+    def _runtime_dags(
+        self,
+        file_path: str,
+        objects: List[DiscoveredObject],
+        static_dags: List[FlowDetails],
+        intern: StringInterner,
+    ) -> Dict[str, FlowDetails]:
+        """Convert DAGs found by importing a file, skipping those the AST scan already found."""
+        known = {dag.name for dag in static_dags} | {
+            dag.child_attributes.get("obj_name") for dag in static_dags
+        }
+        module = os.path.splitext(os.path.basename(file_path))[0]
+        dags = {}
+        for obj in objects:
+            display_name = obj.name.replace("-", "_")
+            if display_name in known or (obj.obj_name and obj.obj_name in known):
+                continue
+            print(f"Found DAG at runtime: {display_name} in {file_path}")
+            dag_key = f"{obj.name}_{file_path}"
+            dags[dag_key] = self._to_flow_details(
+                file_path,
+                {
+                    "name": display_name,
+                    "original_name": obj.name,
+                    "description": obj.description,
+                    "id": dag_key,
+                    "child_attributes": {
+                        "obj_type": "dag",
+                        "obj_name": obj.obj_name,
+                        "obj_parent_type": "module",
+                        "obj_parent": module,
+                        "module": module,
+                    },
+                },
+                intern,
+            )
+        return dags
+
     def _scan_directory(self, root_dir: str) -> Dict[str, FlowDetails]:
         """Recursively scan a directory for Python files with DAGs."""
         all_dags = {}
+        dags_by_file: Dict[str, List[FlowDetails]] = {}
 
         print(f"Scanning directory: {root_dir}")
+        # Directory names repeat across the groupings of all DAGs of one scan
+        intern = StringInterner()
 
         try:
             for root, dirs, files in os.walk(root_dir):
@@ -219,10 +282,22 @@ class AirflowFlowFinder(FlowFinder):
                     if file.endswith(".py"):
                         file_path = os.path.join(root, file)
                         print(f"Examining file: {file_path}")
-                        dags = self._scan_file(file_path)
+                        dags = self._scan_file(file_path, intern)
                         if dags:
                             print(f"Found {len(dags)} DAGs in {file_path}")
                         all_dags.update(dags)
+                        dags_by_file[file_path] = list(dags.values())
+
+            if self.import_discovery is not None:
+                discovered = self.import_discovery.discover(
+                    "airflow", root_dir, list(dags_by_file), self.package_name
+                )
+                for file_path, static_dags in dags_by_file.items():
+                    objects = discovered.get(os.path.abspath(file_path))
+                    if objects:
+                        all_dags.update(
+                            self._runtime_dags(file_path, objects, static_dags, intern)
+                        )
         except Exception as e:
             print(f"Error walking directory {root_dir}: {str(e)}")
             traceback.print_exc(file=sys.stderr)
@@ -0,0 +1,677 @@
+"""Asynchronous counterparts of the SDK base classes and adapters between both variants.
+
+Each `Async*` class declares the same operations as its synchronous base class as coroutines,
+so an application running an event loop can overlap them, e.g. scan flows while deployments are
+fetched:
+
+    flows, deployments = await asyncio.gather(
+        to_async(flow_finder).find_flows(), to_async(deployment_finder).get_deployments()
+    )
+
+`to_async` runs a synchronous implementation in worker threads and `to_sync` runs an
+asynchronous implementation in an event loop of its own, so either variant can be used where the
+other is expected. Adapters are unwrapped instead of being stacked.
+"""
+
+import asyncio
+import contextvars
+import functools
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from .deployment_finder import DeploymentDetails, DeploymentFinder
+from .deployment_promote import DeploymentPromote, PromoteWorkflow
+from .flow_deploy import DeployInfo, DeployWorkflow, FlowDeployer
+from .flow_finder import FlowDetails, FlowFinder
+from .serialization import dumps
+from .tracing import instrument_methods
+
+T = TypeVar("T")
+
+
+class AsyncFlowFinder(ABC):
+    """Asynchronous variant of FlowFinder."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Record implementations as spans while tracing is enabled
+        instrument_methods(cls, "find_flows")
+
+    @abstractmethod
+    async def find_flows(
+        self,
+        *,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[FlowDetails]:
+        """Find flows, see FlowFinder.find_flows.
+
+        kwargs:
+            flows_to_fetch: Optional list of flows to selectively re-fetch data for
+            flow_groups: Optional list of flow group names to selectively re-fetch
+
+        Returns:
+            List of FlowDetails objects
+        """
+        pass
+
+    async def __call__(
+        self,
+        *,
+        flows_to_fetch: Optional[List[dict]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        return [
+            x.to_dict()
+            for x in await self.find_flows(
+                flows_to_fetch=[FlowDetails.from_dict(x) for x in flows_to_fetch]
+                if flows_to_fetch is not None
+                else None,
+                flow_groups=flow_groups,
+            )
+        ]
+
+    async def to_json(
+        self,
+        *,
+        flows_to_fetch: Optional[List[dict]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> str:
+        """Passthrough method for find_flows call returning JSON, encoded with orjson when installed"""
+        return dumps(await self(flows_to_fetch=flows_to_fetch, flow_groups=flow_groups))
+
+
+class AsyncDeploymentFinder(ABC):
+    """Asynchronous variant of DeploymentFinder."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Record implementations as spans while tracing is enabled
+        instrument_methods(cls, "get_deployments")
+
+    @abstractmethod
+    async def get_deployments(
+        self,
+        *,
+        deployments_to_fetch: Optional[List[DeploymentDetails]] = None,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+    ) -> List[DeploymentDetails]:
+        """Find deployments, see DeploymentFinder.get_deployments.
+
+        kwargs:
+            deployments_to_fetch: Optional list of specific deployments to re-fetch
+            flows_to_fetch: Optional list of flows to re-fetch deployments for
+
+        Returns:
+            List of DeploymentDetails objects
+        """
+        pass
+
+    async def __call__(
+        self,
+        *,
+        deployments_to_fetch: Optional[List[dict]] = None,
+        flows_to_fetch: Optional[List[dict]] = None,
+    ) -> List[Dict[str, Any]]:
+        return [
+            x.to_dict()
+            for x in await self.get_deployments(
+                deployments_to_fetch=[
+                    DeploymentDetails.from_dict(x) for x in deployments_to_fetch
+                ]
+                if deployments_to_fetch is not None
+                else None,
+                flows_to_fetch=[FlowDetails.from_dict(x) for x in flows_to_fetch]
+                if flows_to_fetch is not None
+                else None,
+            )
+        ]
+
+    async def to_json(
+        self,
+        *,
+        deployments_to_fetch: Optional[List[dict]] = None,
+        flows_to_fetch: Optional[List[dict]] = None,
+    ) -> str:
+        """Passthrough method for get_deployments call returning JSON, encoded with orjson when installed"""
+        return dumps(
+            await self(
+                deployments_to_fetch=deployments_to_fetch, flows_to_fetch=flows_to_fetch
+            )
+        )
+
+
+class AsyncDeploymentPromote(ABC):
+    """Asynchronous variant of DeploymentPromote."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Record implementations as spans while tracing is enabled
+        instrument_methods(cls, "promote")
+
+    @abstractmethod
+    async def promote(
+        self,
+        project_name: str,
+        branch_name: str,
+        source_env: str,
+        target_env: str,
+        flows_to_deploy: List[str],
+        **kwargs: Any,
+    ):
+        """Promote flows from one environment to another, see DeploymentPromote.promote.
+
+        Args:
+            project_name: Name of the project
+            branch_name: Name of the branch
+            source_env: Source environment
+            target_env: Target environment
+            flows_to_deploy: List of flow names to promote
+            **kwargs: Keyword arguments specific to the implementation, e.g.
+                `target_env_vars`
+        """
+        pass
+
+
+class AsyncFlowDeployer(ABC):
+    """Asynchronous variant of FlowDeployer."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Record implementations as spans while tracing is enabled
+        instrument_methods(cls, "deploy")
+
+    @abstractmethod
+    async def deploy(self, flow_deploy_info: DeployInfo) -> None:
+        """
+        Deploy a flow.
+
+        Args:
+            flow_deploy_info: Configuration for the deployment
+        """
+        pass
+
+
+class AsyncDeployWorkflow(ABC):
+    """Asynchronous variant of DeployWorkflow."""
+
+    @abstractmethod
+    async def run(self, *args: Any, **kwargs: Any) -> Optional[str]:
+        """
+        Run the deployment workflow for the specified flows, see DeployWorkflow.run.
+
+        Args:
+            *args: Positional arguments specific to the implementation
+            **kwargs: Keyword arguments specific to the implementation
+
+        Returns:
+            Optional[str]: URL of the deployment if successful, None otherwise
+        """
+        pass
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Optional[str]:
+        """Call the run method with the provided arguments."""
+        return await self.run(*args, **kwargs)
+
+
+class AsyncPromoteWorkflow(ABC):
+    """Asynchronous variant of PromoteWorkflow."""
+
+    @abstractmethod
+    async def run(self, *args: Any, **kwargs: Any) -> Optional[str]:
+        """
+        Run the promotion workflow for the specified flows, see PromoteWorkflow.run.
+
+        Args:
+            *args: Positional arguments specific to the implementation
+            **kwargs: Keyword arguments specific to the implementation
+
+        Returns:
+            Optional[str]: URL of the promotion if successful, None otherwise
+        """
+        pass
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Optional[str]:
+        """Call the run method with the provided arguments."""
+        return await self.run(*args, **kwargs)
+
+
+async def run_in_thread(
+    executor: Optional[Executor], function: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """
+    Call a blocking function in a worker thread without blocking the event loop.
+
+    The context is copied to the thread, so spans recorded by the function are nested under the
+    current span.
+
+    Args:
+        executor: Executor to run the function in, the event loop's default executor if None
+        function: Function to call
+        *args: Positional arguments of the function
+        **kwargs: Keyword arguments of the function
+
+    Returns:
+        Return value of the function
+    """
+    context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(context.run, function, *args, **kwargs)
+    )
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """
+    Wait for a coroutine from synchronous code.
+
+    The coroutine runs in a new event loop. When called while an event loop is running in the
+    current thread, the new loop runs in a separate thread, as the running loop cannot be
+    blocked to run it.
+
+    Args:
+        awaitable: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+
+    async def wait() -> T:
+        return await awaitable
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(wait())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, wait()).result()
+
+
+class AsyncFlowFinderAdapter(AsyncFlowFinder):
+    """Asynchronous interface to a FlowFinder, running it in worker threads."""
+
+    def __init__(self, flow_finder: FlowFinder, executor: Optional[Executor] = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            flow_finder: Finder to run
+            executor: Executor running the finder, the event loop's default executor if None
+        """
+        self.flow_finder = flow_finder
+        self.executor = executor
+
+    async def find_flows(
+        self,
+        *,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[FlowDetails]:
+        return await run_in_thread(
+            self.executor,
+            self.flow_finder.find_flows,
+            flows_to_fetch=flows_to_fetch,
+            flow_groups=flow_groups,
+        )
+
+
+class SyncFlowFinderAdapter(FlowFinder):
+    """Synchronous interface to an AsyncFlowFinder."""
+
+    def __init__(self, flow_finder: AsyncFlowFinder):
+        """
+        Initialize the adapter.
+
+        Args:
+            flow_finder: Finder to run
+        """
+        self.flow_finder = flow_finder
+
+    def find_flows(
+        self,
+        *,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[FlowDetails]:
+        return run_sync(
+            self.flow_finder.find_flows(
+                flows_to_fetch=flows_to_fetch, flow_groups=flow_groups
+            )
+        )
+
+
+class AsyncDeploymentFinderAdapter(AsyncDeploymentFinder):
+    """Asynchronous interface to a DeploymentFinder, running it in worker threads."""
+
+    def __init__(
+        self, deployment_finder: DeploymentFinder, executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            deployment_finder: Finder to run
+            executor: Executor running the finder, the event loop's default executor if None
+        """
+        self.deployment_finder = deployment_finder
+        self.executor = executor
+
+    async def get_deployments(
+        self,
+        *,
+        deployments_to_fetch: Optional[List[DeploymentDetails]] = None,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+    ) -> List[DeploymentDetails]:
+        return await run_in_thread(
+            self.executor,
+            self.deployment_finder.get_deployments,
+            deployments_to_fetch=deployments_to_fetch,
+            flows_to_fetch=flows_to_fetch,
+        )
+
+
+class SyncDeploymentFinderAdapter(DeploymentFinder):
+    """Synchronous interface to an AsyncDeploymentFinder."""
+
+    def __init__(self, deployment_finder: AsyncDeploymentFinder):
+        """
+        Initialize the adapter.
+
+        Args:
+            deployment_finder: Finder to run
+        """
+        self.deployment_finder = deployment_finder
+
+    def get_deployments(
+        self,
+        *,
+        deployments_to_fetch: Optional[List[DeploymentDetails]] = None,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+    ) -> List[DeploymentDetails]:
+        return run_sync(
+            self.deployment_finder.get_deployments(
+                deployments_to_fetch=deployments_to_fetch, flows_to_fetch=flows_to_fetch
+            )
+        )
+
+
+class AsyncDeploymentPromoteAdapter(AsyncDeploymentPromote):
+    """Asynchronous interface to a DeploymentPromote, running it in worker threads."""
+
+    def __init__(
+        self, deployment_promote: DeploymentPromote, executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            deployment_promote: Promoter to run
+            executor: Executor running the promoter, the event loop's default executor if None
+        """
+        self.deployment_promote = deployment_promote
+        self.executor = executor
+
+    async def promote(
+        self,
+        project_name: str,
+        branch_name: str,
+        source_env: str,
+        target_env: str,
+        flows_to_deploy: List[str],
+        **kwargs: Any,
+    ):
+        return await run_in_thread(
+            self.executor,
+            self.deployment_promote.promote,
+            project_name,
+            branch_name,
+            source_env,
+            target_env,
+            flows_to_deploy,
+            **kwargs,
+        )
+
+
+class SyncDeploymentPromoteAdapter(DeploymentPromote):
+    """Synchronous interface to an AsyncDeploymentPromote."""
+
+    def __init__(self, deployment_promote: AsyncDeploymentPromote):
+        """
+        Initialize the adapter.
+
+        Args:
+            deployment_promote: Promoter to run
+        """
+        self.deployment_promote = deployment_promote
+
+    def promote(
+        self,
+        project_name: str,
+        branch_name: str,
+        source_env: str,
+        target_env: str,
+        flows_to_deploy: List[str],
+        **kwargs: Any,
+    ):
+        return run_sync(
+            self.deployment_promote.promote(
+                project_name,
+                branch_name,
+                source_env,
+                target_env,
+                flows_to_deploy,
+                **kwargs,
+            )
+        )
+
+
+class AsyncFlowDeployerAdapter(AsyncFlowDeployer):
+    """Asynchronous interface to a FlowDeployer, running it in worker threads."""
+
+    def __init__(
+        self, flow_deployer: FlowDeployer, executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            flow_deployer: Deployer to run
+            executor: Executor running the deployer, the event loop's default executor if None
+        """
+        self.flow_deployer = flow_deployer
+        self.executor = executor
+
+    async def deploy(self, flow_deploy_info: DeployInfo) -> None:
+        return await run_in_thread(
+            self.executor, self.flow_deployer.deploy, flow_deploy_info
+        )
+
+
+class SyncFlowDeployerAdapter(FlowDeployer):
+    """Synchronous interface to an AsyncFlowDeployer."""
+
+    def __init__(self, flow_deployer: AsyncFlowDeployer):
+        """
+        Initialize the adapter.
+
+        Args:
+            flow_deployer: Deployer to run
+        """
+        self.flow_deployer = flow_deployer
+
+    def deploy(self, flow_deploy_info: DeployInfo) -> None:
+        return run_sync(self.flow_deployer.deploy(flow_deploy_info))
+
+
+class AsyncDeployWorkflowAdapter(AsyncDeployWorkflow):
+    """Asynchronous interface to a DeployWorkflow, running it in worker threads."""
+
+    def __init__(self, workflow: DeployWorkflow, executor: Optional[Executor] = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            workflow: Workflow to run
+            executor: Executor running the workflow, the event loop's default executor if None
+        """
+        self.workflow = workflow
+        self.executor = executor
+
+    async def run(self, *args: Any, **kwargs: Any) -> Optional[str]:
+        return await run_in_thread(self.executor, self.workflow.run, *args, **kwargs)
+
+
+class SyncDeployWorkflowAdapter(DeployWorkflow):
+    """Synchronous interface to an AsyncDeployWorkflow."""
+
+    def __init__(self, workflow: AsyncDeployWorkflow):
+        """
+        Initialize the adapter.
+
+        Args:
+            workflow: Workflow to run
+        """
+        self.workflow = workflow
+
+    def run(self, *args: Any, **kwargs: Any) -> Optional[str]:
+        return run_sync(self.workflow.run(*args, **kwargs))
+
+
+class AsyncPromoteWorkflowAdapter(AsyncPromoteWorkflow):
+    """Asynchronous interface to a PromoteWorkflow, running it in worker threads."""
+
+    def __init__(self, workflow: PromoteWorkflow, executor: Optional[Executor] = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            workflow: Workflow to run
+            executor: Executor running the workflow, the event loop's default executor if None
+        """
+        self.workflow = workflow
+        self.executor = executor
+
+    async def run(self, *args: Any, **kwargs: Any) -> Optional[str]:
+        return await run_in_thread(self.executor, self.workflow.run, *args, **kwargs)
+
+
+class SyncPromoteWorkflowAdapter(PromoteWorkflow):
+    """Synchronous interface to an AsyncPromoteWorkflow."""
+
+    def __init__(self, workflow: AsyncPromoteWorkflow):
+        """
+        Initialize the adapter.
+
+        Args:
+            workflow: Workflow to run
+        """
+        self.workflow = workflow
+
+    def run(self, *args: Any, **kwargs: Any) -> Optional[str]:
+        return run_sync(self.workflow.run(*args, **kwargs))
+
+
+# Synchronous base class, asynchronous base class, adapter to async, adapter to sync and the
+# attribute both adapters keep the wrapped object in
+_ADAPTERS = (
+    (
+        FlowFinder,
+        AsyncFlowFinder,
+        AsyncFlowFinderAdapter,
+        SyncFlowFinderAdapter,
+        "flow_finder",
+    ),
+    (
+        DeploymentFinder,
+        AsyncDeploymentFinder,
+        AsyncDeploymentFinderAdapter,
+        SyncDeploymentFinderAdapter,
+        "deployment_finder",
+    ),
+    (
+        DeploymentPromote,
+        AsyncDeploymentPromote,
+        AsyncDeploymentPromoteAdapter,
+        SyncDeploymentPromoteAdapter,
+        "deployment_promote",
+    ),
+    (
+        FlowDeployer,
+        AsyncFlowDeployer,
+        AsyncFlowDeployerAdapter,
+        SyncFlowDeployerAdapter,
+        "flow_deployer",
+    ),
+    (
+        DeployWorkflow,
+        AsyncDeployWorkflow,
+        AsyncDeployWorkflowAdapter,
+        SyncDeployWorkflowAdapter,
+        "workflow",
+    ),
+    (
+        PromoteWorkflow,
+        AsyncPromoteWorkflow,
+        AsyncPromoteWorkflowAdapter,
+        SyncPromoteWorkflowAdapter,
+        "workflow",
+    ),
+)
+
+# Asynchronous variant of each synchronous base class
+ASYNC_BASE_CLASSES = {row[0]: row[1] for row in _ADAPTERS}
+
+
+def to_async(component: Any, executor: Optional[Executor] = None) -> Any:
+    """
+    Return the asynchronous interface of an SDK component.
+
+    Asynchronous components are returned unchanged, adapters created by `to_sync` are unwrapped
+    and synchronous components are wrapped in an adapter running them in worker threads.
+
+    Args:
+        component: Finder, promoter, deployer or workflow
+        executor: Executor running a synchronous component, the event loop's default executor
+            if None
+
+    Returns:
+        Instance of the Async* variant of the component's base class
+
+    Raises:
+        TypeError: If the component does not implement an SDK base class
+    """
+    for sync_class, async_class, async_adapter, sync_adapter, attribute in _ADAPTERS:
+        if isinstance(component, async_class):
+            return component
+        if isinstance(component, sync_adapter):
+            return getattr(component, attribute)
+        if isinstance(component, sync_class):
+            return async_adapter(component, executor)
+    raise TypeError(f"{type(component).__name__} does not implement an SDK base class")
+
+
+def to_sync(component: Any) -> Any:
+    """
+    Return the synchronous interface of an SDK component.
+
+    Synchronous components are returned unchanged, adapters created by `to_async` are unwrapped
+    and asynchronous components are wrapped in an adapter running them in an event loop.
+
+    Args:
+        component: Finder, promoter, deployer or workflow
+
+    Returns:
+        Instance of the component's synchronous base class
+
+    Raises:
+        TypeError: If the component does not implement an SDK base class
+    """
+    for sync_class, async_class, async_adapter, sync_adapter, attribute in _ADAPTERS:
+        if isinstance(component, sync_class):
+            return component
+        if isinstance(component, async_adapter):
+            return getattr(component, attribute)
+        if isinstance(component, async_class):
+            return sync_adapter(component)
+    raise TypeError(f"{type(component).__name__} does not implement an SDK base class")
@@ -0,0 +1,83 @@
+from dataclasses import fields
+from typing import Any, Dict, Iterable, List, Type, TypeVar
+
+from .deployment_finder import DeploymentDetails
+from .flow_finder import FlowDetails
+
+T = TypeVar("T")
+
+
+class StringInterner:
+    """Returns one shared string object for equal strings.
+
+    Values such as project, branch and environment names and tags repeat across many records.
+    Passing them through one interner while building the records keeps a single copy of each
+    distinct value. Unlike `sys.intern`, the strings are released together with the interner
+    and the records using them.
+    """
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+
+    def __call__(self, value: Any) -> Any:
+        """Return the shared copy of a string, other values are returned unchanged."""
+        if type(value) is not str:
+            return value
+        return self._strings.setdefault(value, value)
+
+    def intern_all(self, values: Iterable[Any]) -> List[Any]:
+        """Return a new list with every string replaced by its shared copy."""
+        return [self(value) for value in values]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+def _slotted_variant(cls: Type[T], name: str, doc: str) -> Type[T]:
+    """Create a copy of a dataclass that stores its fields in `__slots__`.
+
+    The copy has the fields and methods of the dataclass, including `to_dict` and `from_dict`,
+    but does not inherit from it, as instances of a subclass would still get a `__dict__`. It is
+    registered as a virtual subclass instead, so its instances pass `isinstance` checks for the
+    dataclass. Like `dataclass(slots=True)` of Python 3.10, the class attributes holding field
+    defaults are left out, the generated `__init__` supplies the defaults.
+    """
+    field_names = tuple(record_field.name for record_field in fields(cls))
+    namespace = {
+        key: value
+        for key, value in vars(cls).items()
+        if key not in field_names
+        and key not in ("__dict__", "__weakref__", "_abc_impl")
+    }
+    namespace.update(
+        {
+            "__slots__": field_names,
+            "__qualname__": name,
+            "__module__": __name__,
+            "__doc__": doc,
+        }
+    )
+    slotted = type(cls)(name, cls.__bases__, namespace)
+    cls.register(slotted)  # type: ignore[attr-defined]
+    return slotted
+
+
+CompactFlowDetails = _slotted_variant(
+    FlowDetails,
+    "CompactFlowDetails",
+    """FlowDetails variant storing its fields in `__slots__`.
+
+    Has the same fields and methods as FlowDetails, passes `isinstance` checks for it and uses
+    less memory per instance. Instances do not accept attributes other than the fields.
+    """,
+)
+
+CompactDeploymentDetails = _slotted_variant(
+    DeploymentDetails,
+    "CompactDeploymentDetails",
+    """DeploymentDetails variant storing its fields in `__slots__`.
+
+    Has the same fields and methods as DeploymentDetails, passes `isinstance` checks for it and
+    uses less memory per instance. Instances do not accept attributes other than the fields.
+    """,
+)
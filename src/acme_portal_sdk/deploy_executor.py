@@ -0,0 +1,134 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .flow_deploy import DeployInfo, FlowDeployer
+
+DEFAULT_MAX_PARALLEL = 4
+
+
+@dataclass
+class DeployResult:
+    """Outcome of deploying a single flow.
+
+    Attributes:
+        name: Name of the deployment
+        flow_name: Name of the deployed flow
+        error: Error message if the deployment failed, None otherwise
+    """
+
+    name: str
+    flow_name: str
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the deployment succeeded."""
+        return self.error is None
+
+
+@dataclass
+class DeployBatchResult:
+    """Outcome of deploying a batch of flows.
+
+    Attributes:
+        results: Per-flow results in the order the deploy infos were given
+    """
+
+    results: List[DeployResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[DeployResult]:
+        """Results of deployments that succeeded."""
+        return [r for r in self.results if r.succeeded]
+
+    @property
+    def failed(self) -> List[DeployResult]:
+        """Results of deployments that failed."""
+        return [r for r in self.results if not r.succeeded]
+
+    def raise_for_failures(self) -> None:
+        """
+        Raise an error summarizing all failed deployments, if any.
+
+        Raises:
+            RuntimeError: If at least one deployment failed
+        """
+        failed = self.failed
+        if failed:
+            details = "; ".join(f"{r.name}: {r.error}" for r in failed)
+            raise RuntimeError(
+                f"{len(failed)} of {len(self.results)} deployments failed: {details}"
+            )
+
+
+class DeploymentExecutor:
+    """Runs FlowDeployer.deploy for many deploy infos concurrently with bounded parallelism.
+
+    A failure of one deployment does not stop the others. Each deploy info is passed to the
+    deployer on its own, so deployers must not share mutable state between deploy calls.
+    """
+
+    def __init__(
+        self, deployer: FlowDeployer, max_parallel: int = DEFAULT_MAX_PARALLEL
+    ):
+        """
+        Initialize the DeploymentExecutor.
+
+        Args:
+            deployer: Deployer used to deploy each flow
+            max_parallel: Maximum number of deployments running at the same time
+        """
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+        self.deployer = deployer
+        self.max_parallel = max_parallel
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _deploy_one(self, deploy_info: DeployInfo) -> DeployResult:
+        """Deploy a single flow and capture the outcome."""
+        try:
+            self.deployer.deploy(deploy_info)
+            return DeployResult(name=deploy_info.name, flow_name=deploy_info.flow_name)
+        except Exception as e:
+            self.logger.error(f"Deployment {deploy_info.name} failed: {e}")
+            return DeployResult(
+                name=deploy_info.name, flow_name=deploy_info.flow_name, error=str(e)
+            )
+
+    def execute(self, deploy_infos: List[DeployInfo]) -> DeployBatchResult:
+        """
+        Deploy all flows, running up to `max_parallel` deployments at once.
+
+        Args:
+            deploy_infos: Configuration for each deployment
+
+        Returns:
+            DeployBatchResult with one result per deploy info
+        """
+        if not deploy_infos:
+            return DeployBatchResult()
+
+        workers = min(self.max_parallel, len(deploy_infos))
+        if workers == 1:
+            results = [self._deploy_one(info) for info in deploy_infos]
+        else:
+            # Run each deployment in a copy of the caller's context, so tracing spans of the
+            # deployments are nested in the caller's span
+            contexts = [copy_context() for _ in deploy_infos]
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(
+                        lambda context, info: context.run(self._deploy_one, info),
+                        contexts,
+                        deploy_infos,
+                    )
+                )
+
+        batch = DeployBatchResult(results=results)
+        self.logger.info(
+            f"Deployed {len(batch.succeeded)} of {len(results)} flows, {len(batch.failed)} failed"
+        )
+        return batch
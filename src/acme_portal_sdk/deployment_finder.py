@@ -1,12 +1,14 @@
-from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, field
+from abc import ABC, ABCMeta, abstractmethod
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from .flow_finder import FlowDetails
+from .serialization import dumps, record_to_dict
+from .tracing import instrument_methods
 
 
 @dataclass
-class DeploymentDetails:
+class DeploymentDetails(metaclass=ABCMeta):
     """Holds details about an existing deployment.
 
     Attributes:
@@ -43,7 +45,7 @@ class DeploymentDetails:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the DeploymentDetails to a dictionary suitable for JSON serialization."""
-        return asdict(self)
+        return record_to_dict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DeploymentDetails":
@@ -54,6 +56,11 @@ class DeploymentDetails:
 class DeploymentFinder(ABC):
     """Discovers existing deployments in target environments, with implementations providing environment-specific discovery."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Record implementations as spans while tracing is enabled
+        instrument_methods(cls, "get_deployments")
+
     @abstractmethod
     def get_deployments(
         self,
@@ -91,3 +98,16 @@ class DeploymentFinder(ABC):
                 else flows_to_fetch,
             )
         ]
+
+    def to_json(
+        self,
+        *,
+        deployments_to_fetch: Optional[List[dict]] = None,
+        flows_to_fetch: Optional[List[dict]] = None,
+    ) -> str:
+        """Passthrough method for get_deployments call returning JSON, encoded with orjson when installed"""
+        return dumps(
+            self(
+                deployments_to_fetch=deployments_to_fetch, flows_to_fetch=flows_to_fetch
+            )
+        )
@@ -1,10 +1,17 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
+from .tracing import instrument_methods
+
 
 class DeploymentPromote(ABC):
     """Responsible for promoting flows between different environments (e.g., dev to prod), managing the transition of deployments"""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Record implementations as spans while tracing is enabled
+        instrument_methods(cls, "promote")
+
     @abstractmethod
     def promote(
         self,
@@ -0,0 +1,409 @@
+from array import array
+from itertools import compress
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+from .deployment_finder import DeploymentDetails
+from .serialization import dumps
+
+# Columns with few distinct values, stored as integer codes into a list of distinct values
+CATEGORICAL_COLUMNS = (
+    "project_name",
+    "branch",
+    "flow_name",
+    "env",
+    "commit_hash",
+    "package_version",
+)
+# Columns stored as lists of values
+VALUE_COLUMNS = (
+    "name",
+    "tags",
+    "id",
+    "created_at",
+    "updated_at",
+    "flow_id",
+    "url",
+    "child_attributes",
+)
+COLUMNS = ("name", *CATEGORICAL_COLUMNS, *VALUE_COLUMNS[1:])
+
+# 32-bit codes, exported to Arrow without copying
+_CODE_TYPE = "i"
+
+
+class _Categorical:
+    """Column stored as an array of codes into a list of distinct values."""
+
+    __slots__ = ("codes", "categories")
+
+    def __init__(self, codes: array, categories: List[Any]):
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def encode(cls, values: Iterable[Any]) -> "_Categorical":
+        lookup: Dict[Any, int] = {}
+        categories: List[Any] = []
+        codes = array(_CODE_TYPE)
+        for value in values:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(categories)
+                categories.append(value)
+            codes.append(code)
+        return cls(codes, categories)
+
+    def decode(self) -> List[Any]:
+        categories = self.categories
+        return [categories[code] for code in self.codes]
+
+    def take(self, indices: Sequence[int]) -> "_Categorical":
+        codes = self.codes
+        return _Categorical(
+            array(_CODE_TYPE, [codes[i] for i in indices]), self.categories
+        )
+
+
+class DeploymentTable:
+    """Column-oriented table of deployments for aggregate queries.
+
+    Columns with few distinct values (project, branch, flow, environment, commit and version) are
+    stored as arrays of integer codes, so filters and groupings compare integers instead of strings
+    and each distinct value is stored once. Tables are immutable; filter() and take() return new
+    tables sharing the distinct values.
+    """
+
+    def __init__(
+        self,
+        categorical: Dict[str, _Categorical],
+        values: Dict[str, List[Any]],
+        length: int,
+    ):
+        """Initialize the table from encoded columns, use from_deployments() to build one."""
+        self._categorical = categorical
+        self._values = values
+        self._length = length
+
+    @classmethod
+    def from_deployments(
+        cls, deployments: Iterable[Union[DeploymentDetails, Dict[str, Any]]]
+    ) -> "DeploymentTable":
+        """
+        Build a table from `get_deployments` results or their dictionary form.
+
+        Args:
+            deployments: DeploymentDetails objects, or dictionaries as returned by `DeploymentFinder.__call__`
+
+        Returns:
+            DeploymentTable with one row per deployment
+        """
+        rows = [
+            deployment if isinstance(deployment, dict) else _record_values(deployment)
+            for deployment in deployments
+        ]
+        categorical = {
+            column: _Categorical.encode(
+                row.get(column, _default(column)) for row in rows
+            )
+            for column in CATEGORICAL_COLUMNS
+        }
+        values = {
+            column: [row.get(column, _default(column)) for row in rows]
+            for column in VALUE_COLUMNS
+        }
+        return cls(categorical, values, len(rows))
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Names of the columns, in DeploymentDetails field order."""
+        return COLUMNS
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Get the values of a column.
+
+        Args:
+            name: Column name, one of `columns`
+
+        Returns:
+            Value of the column in each row
+
+        Raises:
+            KeyError: If the column does not exist
+        """
+        if name in self._categorical:
+            return self._categorical[name].decode()
+        return list(self._values[name])
+
+    def distinct(self, name: str) -> List[Any]:
+        """
+        Get the distinct values of a column in order of first appearance.
+
+        Args:
+            name: Column name
+
+        Returns:
+            Distinct values present in the table
+        """
+        if name in self._categorical:
+            column = self._categorical[name]
+            present = set(column.codes)
+            return [
+                value for code, value in enumerate(column.categories) if code in present
+            ]
+        return list(dict.fromkeys(self._values[name]))
+
+    def _matcher(
+        self, name: str, condition: Any
+    ) -> Tuple[Sequence[Any], Callable[[Any], bool]]:
+        """Return the stored column and a test of its stored items for a filter condition.
+
+        For categorical columns the condition is evaluated once per distinct value and the test
+        compares codes.
+        """
+        if callable(condition):
+            matches = condition
+        else:
+            accepted = (
+                set(condition)
+                if isinstance(condition, (list, tuple, set, frozenset))
+                else {condition}
+            )
+            matches = accepted.__contains__
+        if name in self._categorical:
+            column = self._categorical[name]
+            codes = {
+                code for code, value in enumerate(column.categories) if matches(value)
+            }
+            return column.codes, codes.__contains__
+        return self._values[name], matches
+
+    def filter(
+        self, **conditions: Union[Any, Iterable[Any], Callable[[Any], bool]]
+    ) -> "DeploymentTable":
+        """
+        Select the rows matching all conditions.
+
+        Args:
+            **conditions: Column name mapped to a value, a list/tuple/set of accepted values or a
+                predicate, e.g. `env="prod"` or `flow_name=["a", "b"]`. Predicates are called
+                with each distinct value of categorical columns and each value of other columns.
+
+        Returns:
+            New table with the matching rows
+
+        Raises:
+            KeyError: If a column does not exist
+        """
+        indices: Sequence[int] = range(self._length)
+        for name, condition in conditions.items():
+            if name not in self._categorical and name not in self._values:
+                raise KeyError(name)
+            stored, test = self._matcher(name, condition)
+            if len(indices) < self._length:
+                stored = list(map(stored.__getitem__, indices))
+            indices = list(compress(indices, map(test, stored)))
+        return self.take(indices)
+
+    def take(self, indices: Sequence[int]) -> "DeploymentTable":
+        """
+        Select rows by position.
+
+        Args:
+            indices: Row positions, in the order they should appear in the new table
+
+        Returns:
+            New table with the selected rows
+        """
+        categorical = {
+            name: column.take(indices) for name, column in self._categorical.items()
+        }
+        values = {
+            name: [column[i] for i in indices] for name, column in self._values.items()
+        }
+        return DeploymentTable(categorical, values, len(indices))
+
+    def _keys(self, columns: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Return the values of several columns as one tuple per row."""
+        return list(zip(*(self.column(name) for name in columns))) if columns else []
+
+    def group_by(self, *columns: str) -> Dict[Any, "DeploymentTable"]:
+        """
+        Split the table into groups of rows with equal values in the given columns.
+
+        Args:
+            *columns: Column names to group by
+
+        Returns:
+            Dictionary mapping each value, or tuple of values for several columns, to its rows
+        """
+        groups: Dict[Any, List[int]] = {}
+        for index, key in enumerate(self._group_keys(columns)):
+            groups.setdefault(key, []).append(index)
+        return {key: self.take(indices) for key, indices in groups.items()}
+
+    def count_by(self, *columns: str) -> Dict[Any, int]:
+        """
+        Count rows per distinct value of the given columns, e.g. deployments per environment.
+
+        Args:
+            *columns: Column names to group by
+
+        Returns:
+            Dictionary mapping each value, or tuple of values for several columns, to its row count
+        """
+        counts: Dict[Any, int] = {}
+        for key in self._group_keys(columns):
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def _group_keys(self, columns: Sequence[str]) -> Iterable[Any]:
+        """Return the grouping key of each row, a value for one column and a tuple otherwise."""
+        if len(columns) == 1:
+            return self.column(columns[0])
+        return self._keys(columns)
+
+    def pivot(
+        self,
+        index: str = "flow_name",
+        columns: str = "env",
+        values: str = "commit_hash",
+    ) -> Dict[Any, Dict[Any, Any]]:
+        """
+        Pivot one column into a matrix of two other columns, e.g. the commit per flow and environment.
+
+        When several rows share an index and column value, the most recently updated row is used.
+
+        Args:
+            index: Column whose values become the rows of the matrix
+            columns: Column whose values become the columns of the matrix
+            values: Column whose values fill the matrix
+
+        Returns:
+            Dictionary mapping each index value to a dictionary of column value to cell value.
+            Combinations without a row are absent.
+        """
+        matrix: Dict[Any, Dict[Any, Any]] = {}
+        updated: Dict[Tuple[Any, Any], str] = {}
+        for row_key, column_key, value, updated_at in zip(
+            self.column(index),
+            self.column(columns),
+            self.column(values),
+            self._values["updated_at"],
+        ):
+            updated_at = updated_at or ""
+            cell = (row_key, column_key)
+            if cell in updated and updated[cell] > updated_at:
+                continue
+            updated[cell] = updated_at
+            matrix.setdefault(row_key, {})[column_key] = value
+        return matrix
+
+    def missing(
+        self, index: str = "flow_name", columns: str = "env", value: Any = "prod"
+    ) -> List[Any]:
+        """
+        Find index values without a row for a column value, e.g. flows without a prod deployment.
+
+        Args:
+            index: Column to report values of
+            columns: Column that must contain `value`
+            value: Required value
+
+        Returns:
+            Distinct values of `index` that have no row with `columns` equal to `value`
+        """
+        present = set(self.filter(**{columns: value}).distinct(index))
+        return [key for key in self.distinct(index) if key not in present]
+
+    def to_deployments(self) -> List[DeploymentDetails]:
+        """Convert the rows back to DeploymentDetails objects."""
+        return [DeploymentDetails(**row) for row in self.to_records()]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Convert the rows to dictionaries in the format of `DeploymentDetails.to_dict`."""
+        data = {name: self.column(name) for name in COLUMNS}
+        return [
+            dict(zip(COLUMNS, row)) for row in zip(*(data[name] for name in COLUMNS))
+        ]
+
+    def to_arrow(self):
+        """
+        Export the table as a `pyarrow.Table`.
+
+        Categorical columns become dictionary arrays whose indices reuse the code buffers without
+        copying. `tags` becomes a list of strings and `child_attributes` a JSON string.
+
+        Returns:
+            pyarrow.Table with one column per DeploymentDetails field
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        pa = _import_pyarrow()
+        arrays = {}
+        for name in COLUMNS:
+            if name in self._categorical:
+                column = self._categorical[name]
+                arrays[name] = pa.DictionaryArray.from_arrays(
+                    _codes_to_arrow(pa, column.codes),
+                    pa.array(column.categories, type=pa.string()),
+                )
+            elif name == "tags":
+                arrays[name] = pa.array(self._values[name], type=pa.list_(pa.string()))
+            elif name == "child_attributes":
+                arrays[name] = pa.array(
+                    [dumps(value) for value in self._values[name]], type=pa.string()
+                )
+            else:
+                arrays[name] = pa.array(self._values[name], type=pa.string())
+        return pa.table(arrays)
+
+    def to_parquet(self, path: str, **kwargs: Any) -> None:
+        """
+        Write the table to a Parquet file.
+
+        Args:
+            path: Destination file path
+            **kwargs: Additional arguments for `pyarrow.parquet.write_table`
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path, **kwargs)
+
+
+def _record_values(deployment: DeploymentDetails) -> Dict[str, Any]:
+    """Read the fields of a record without copying its lists and dicts."""
+    return {name: getattr(deployment, name) for name in COLUMNS}
+
+
+def _default(column: str) -> Any:
+    """Value used for columns missing from a dictionary row."""
+    return {} if column == "child_attributes" else None
+
+
+def _codes_to_arrow(pa: Any, codes: array) -> Any:
+    """Wrap a code array as an Arrow int32 array, without copying when the item sizes match."""
+    if codes.itemsize == 4:
+        return pa.Array.from_buffers(
+            pa.int32(), len(codes), [None, pa.py_buffer(codes)]
+        )
+    return pa.array(codes.tolist(), type=pa.int32())
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow or explain how to install it."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "pyarrow is not installed. Install it with: pip install 'acme_portal_sdk[arrow]'"
+        )
+    return pyarrow
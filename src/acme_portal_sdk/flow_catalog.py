@@ -0,0 +1,100 @@
+import importlib
+import logging
+from importlib.util import find_spec
+from typing import Any, Dict, List, Optional, Tuple
+
+from .flow_finder import FlowDetails, FlowFinder
+
+
+class FlowCatalog:
+    """Caches the result of a single FlowFinder scan and the flow objects imported from it.
+
+    A catalog is meant to live for the duration of one command (e.g. a deploy or promote run)
+    and be shared by every component that needs the list of flows or the flow objects, so the
+    project is scanned once and every flow module is imported once.
+    """
+
+    def __init__(self, flow_finder: FlowFinder):
+        """
+        Initialize the catalog.
+
+        Args:
+            flow_finder: Finder used to scan the project for flows on first access
+        """
+        self.flow_finder = flow_finder
+        self._flows: Optional[List[FlowDetails]] = None
+        self._imported: Dict[Tuple[str, str], Any] = {}
+
+    def get_flows(self) -> List[FlowDetails]:
+        """
+        Get all flows found by the flow finder, scanning the project on first call only.
+
+        Returns:
+            List of FlowDetails objects
+        """
+        if self._flows is None:
+            self._flows = self.flow_finder.find_flows()
+        return self._flows
+
+    def get_flow_names(self) -> List[str]:
+        """
+        Get names of all flows in the catalog.
+
+        Returns:
+            List of FlowDetails.name values
+        """
+        return [flow.name for flow in self.get_flows()]
+
+    def get_flows_by_name(self, flow_names: List[str]) -> List[FlowDetails]:
+        """
+        Get flows whose name is in the given list.
+
+        Args:
+            flow_names: Names of flows to select (FlowDetails.name)
+
+        Returns:
+            List of matching FlowDetails objects, in catalog order
+        """
+        names = set(flow_names)
+        return [flow for flow in self.get_flows() if flow.name in names]
+
+    def import_flow(self, import_path: str, obj_name: str) -> Any:
+        """
+        Import a flow object from a module, reusing the object on repeated calls.
+
+        Args:
+            import_path: Python import path of the module
+            obj_name: Name of the flow object in the module
+
+        Returns:
+            The imported flow object
+
+        Raises:
+            ImportError: If the module cannot be found
+            AttributeError: If the object is not defined in the module
+        """
+        key = (import_path, obj_name)
+        if key in self._imported:
+            return self._imported[key]
+
+        try:
+            if find_spec(import_path) is None:
+                raise ImportError(f"Module {import_path} not found")
+
+            module = importlib.import_module(import_path)
+
+            if not hasattr(module, obj_name):
+                raise AttributeError(f"Function {obj_name} not found in {import_path}")
+
+            flow_object = getattr(module, obj_name)
+        except Exception as e:
+            logging.error(f"Error importing {obj_name} from {import_path}: {e}")
+            raise
+
+        self._imported[key] = flow_object
+        return flow_object
+
+    def refresh(self) -> None:
+        """Drop cached flows and imported objects so the next access re-scans the project."""
+        self._flows = None
+        self._imported.clear()
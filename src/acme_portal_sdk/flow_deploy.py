@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from .tracing import instrument_methods
+
 
 @dataclass
 class DeployInfo:
@@ -64,6 +66,11 @@ class DeployInfoPrep(ABC):
 class FlowDeployer(ABC):
     """Deploys flows, with implementations handling the deployment to specific execution environment."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Record implementations as spans while tracing is enabled
+        instrument_methods(cls, "deploy")
+
     @abstractmethod
     def deploy(self, flow_deploy_info: DeployInfo) -> None:
         """
@@ -1,10 +1,20 @@
-from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Optional
+import copy
+import hashlib
+import importlib
+import os
+import threading
+import time
+from abc import ABC, ABCMeta, abstractmethod
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .serialization import dumps, loads, record_to_dict
+from .tracing import instrument_methods
 
 
 @dataclass
-class FlowDetails:
+class FlowDetails(metaclass=ABCMeta):
     """Holds details about a flow.
 
     Flow (often named Workflow/Job/DAG) is a unit of work in a program.
@@ -35,7 +45,7 @@ class FlowDetails:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the FlowDetails to a dictionary suitable for JSON serialization."""
-        return asdict(self)
+        return record_to_dict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "FlowDetails":
@@ -46,6 +56,11 @@ class FlowDetails:
 class FlowFinder(ABC):
     """Finds flows (units of work/programs) in a given context, with implementations providing specific discovery mechanisms."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Record implementations as spans while tracing is enabled
+        instrument_methods(cls, "find_flows")
+
     @abstractmethod
     def find_flows(
         self,
@@ -80,3 +95,236 @@ class FlowFinder(ABC):
                 flow_groups=flow_groups,
             )
         ]
+
+    def to_json(
+        self,
+        *,
+        flows_to_fetch: Optional[List[dict]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> str:
+        """Passthrough method for find_flows call returning JSON, encoded with orjson when installed"""
+        return dumps(self(flows_to_fetch=flows_to_fetch, flow_groups=flow_groups))
+
+
+def tree_fingerprint(
+    root_dirs: Sequence[str], suffixes: Tuple[str, ...] = (".py",)
+) -> str:
+    """
+    Summarize the state of directory trees without reading files.
+
+    Combines the modification time of every directory, which changes when entries are added,
+    removed or renamed, with the size and modification time of every file with one of the
+    suffixes.
+
+    Args:
+        root_dirs: Directories to summarize
+        suffixes: File name suffixes to include
+
+    Returns:
+        Hex digest that changes when a matching file or the set of entries changes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for root_dir in root_dirs:
+        for root, dirs, files in os.walk(root_dir):
+            dirs.sort()
+            try:
+                digest.update(f"d{root}\0{os.stat(root).st_mtime_ns}\n".encode())
+            except OSError:
+                continue
+            for name in sorted(files):
+                if not name.endswith(suffixes):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                digest.update(f"f{name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _record_class_name(record_class: type) -> str:
+    """Module and qualified name of a record class, used to import it again."""
+    return f"{record_class.__module__}.{record_class.__qualname__}"
+
+
+def _resolve_record_class(name: Optional[str]) -> type:
+    """Import a record class named by `_record_class_name`, or return FlowDetails."""
+    if name:
+        module_name, _, class_name = name.rpartition(".")
+        try:
+            record_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError, ValueError):
+            return FlowDetails
+        if isinstance(record_class, type) and issubclass(record_class, FlowDetails):
+            return record_class
+    return FlowDetails
+
+
+class CachingFlowFinder(FlowFinder):
+    """Memoizes the results of any FlowFinder until the scanned files change.
+
+    Each call computes `tree_fingerprint` of the root directories, which only stats files, and
+    returns the result stored for the same fingerprint and selective-refetch arguments. Results of
+    an older fingerprint are dropped. Results can also expire after a time to live and be
+    persisted to a JSON file, so repeat calls from new processes are served from the file.
+    Callers get copies of the cached flows, so modifying a result does not change the cache.
+    """
+
+    def __init__(
+        self,
+        flow_finder: FlowFinder,
+        root_dirs: Optional[Union[str, Sequence[str]]] = None,
+        ttl: Optional[float] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        suffixes: Tuple[str, ...] = (".py",),
+    ):
+        """
+        Initialize the CachingFlowFinder.
+
+        Args:
+            flow_finder: Finder whose results are cached
+            root_dirs: Directories the finder scans, its `root_dir` attribute if None
+            ttl: Seconds a result is reused, forever while the tree is unchanged if None
+            cache_path: JSON file persisting results between processes, memory only if None
+            suffixes: File name suffixes whose changes invalidate results
+
+        Raises:
+            ValueError: If no root directory is given and the finder has no `root_dir`
+        """
+        if root_dirs is None:
+            root_dirs = getattr(flow_finder, "root_dir", None)
+            if root_dirs is None:
+                raise ValueError(
+                    f"{type(flow_finder).__name__} has no root_dir, pass root_dirs explicitly"
+                )
+        self.flow_finder = flow_finder
+        self.root_dirs = [root_dirs] if isinstance(root_dirs, str) else list(root_dirs)
+        self.ttl = ttl
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self.suffixes = suffixes
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[str] = None
+        self._entries: Dict[Tuple[Any, ...], Tuple[float, List[FlowDetails]]] = {}
+        self._loaded = False
+
+    @staticmethod
+    def _key(
+        flows_to_fetch: Optional[List[FlowDetails]], flow_groups: Optional[List[str]]
+    ) -> Tuple[Any, ...]:
+        """Cache key of the selective-refetch arguments."""
+        flows = (
+            None
+            if flows_to_fetch is None
+            else tuple(
+                sorted((flow.name, flow.source_relative) for flow in flows_to_fetch)
+            )
+        )
+        groups = None if flow_groups is None else tuple(sorted(flow_groups))
+        return (flows, groups)
+
+    @staticmethod
+    def _copy(flows: List[FlowDetails]) -> List[FlowDetails]:
+        """Copy flows together with their mutable grouping and child attributes."""
+        return [
+            replace(
+                flow,
+                grouping=list(flow.grouping),
+                child_attributes=copy.deepcopy(flow.child_attributes),
+            )
+            for flow in flows
+        ]
+
+    def find_flows(
+        self,
+        *,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[FlowDetails]:
+        """Return the cached result for the current tree, calling the wrapped finder on a miss."""
+        fingerprint = tree_fingerprint(self.root_dirs, self.suffixes)
+        key = self._key(flows_to_fetch, flow_groups)
+        with self._lock:
+            self._load()
+            if fingerprint != self._fingerprint:
+                self._fingerprint = fingerprint
+                self._entries = {}
+            entry = self._entries.get(key)
+            if entry is not None and (
+                self.ttl is None or time.time() - entry[0] < self.ttl
+            ):
+                return self._copy(entry[1])
+
+        flows = self.flow_finder.find_flows(
+            flows_to_fetch=flows_to_fetch, flow_groups=flow_groups
+        )
+        with self._lock:
+            # Keep the result only if the tree did not change while it was scanned
+            if fingerprint == self._fingerprint:
+                self._entries[key] = (time.time(), self._copy(flows))
+                self._save()
+        return list(flows)
+
+    def invalidate(self) -> None:
+        """Drop all cached results, including the persisted ones."""
+        with self._lock:
+            self._fingerprint = None
+            self._entries = {}
+            self._loaded = True
+            if self.cache_path is not None and self.cache_path.exists():
+                self.cache_path.unlink()
+
+    def _load(self) -> None:
+        """Read persisted results on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            data = loads(self.cache_path.read_bytes())
+            entries = {}
+            for entry in data["entries"]:
+                flows = entry["flows_to_fetch"]
+                groups = entry["flow_groups"]
+                key = (
+                    None if flows is None else tuple(map(tuple, flows)),
+                    None if groups is None else tuple(groups),
+                )
+                # Rebuild the records as the class the wrapped finder returned
+                record_class = _resolve_record_class(entry.get("record_class"))
+                entries[key] = (
+                    entry["stored_at"],
+                    [record_class.from_dict(flow) for flow in entry["flows"]],
+                )
+            fingerprint = data["fingerprint"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Ignoring unreadable flow cache {self.cache_path}: {str(e)}")
+            return
+        self._fingerprint = fingerprint
+        self._entries = entries
+
+    def _save(self) -> None:
+        """Persist the results of the current fingerprint."""
+        if self.cache_path is None:
+            return
+        data = {
+            "fingerprint": self._fingerprint,
+            "entries": [
+                {
+                    "flows_to_fetch": flows,
+                    "flow_groups": groups,
+                    "stored_at": stored_at,
+                    "record_class": (
+                        _record_class_name(type(result[0])) if result else None
+                    ),
+                    "flows": [flow.to_dict() for flow in result],
+                }
+                for (flows, groups), (stored_at, result) in self._entries.items()
+            ],
+        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.cache_path.with_name(
+            f"{self.cache_path.name}.{os.getpid()}.tmp"
+        )
+        temporary.write_text(dumps(data), encoding="utf-8")
+        os.replace(temporary, self.cache_path)
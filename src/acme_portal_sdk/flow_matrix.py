@@ -0,0 +1,165 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
+
+from .deployment_finder import DeploymentDetails
+from .flow_finder import FlowDetails
+
+
+@dataclass
+class FlowDeployments:
+    """A flow together with its latest deployment in each environment.
+
+    Attributes:
+        flow: The flow
+        deployments: Environment name mapped to the most recently updated deployment of the flow
+            in that environment. Environments without a deployment are absent.
+    """
+
+    flow: FlowDetails
+    deployments: Dict[str, DeploymentDetails] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the FlowDeployments to a dictionary suitable for JSON serialization."""
+        return {
+            "flow": self.flow.to_dict(),
+            "deployments": {
+                env: deployment.to_dict()
+                for env, deployment in self.deployments.items()
+            },
+        }
+
+    def to_reference_dict(self) -> Dict[str, Any]:
+        """Convert the FlowDeployments to a dictionary naming the flow and deployment IDs.
+
+        Used where the flows and deployments are serialized alongside, see
+        `FlowDeploymentMatrix.to_reference_dict`.
+        """
+        return {
+            "flow": self.flow.name,
+            "deployments": {
+                env: deployment.id for env, deployment in self.deployments.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FlowDeployments":
+        """Create a FlowDeployments instance from a dictionary representation."""
+        return cls(
+            flow=FlowDetails.from_dict(data["flow"]),
+            deployments={
+                env: DeploymentDetails.from_dict(deployment)
+                for env, deployment in data["deployments"].items()
+            },
+        )
+
+
+@dataclass
+class FlowDeploymentMatrix:
+    """Flows joined with their deployments, as a flow by environment matrix.
+
+    Attributes:
+        environments: Environments with at least one deployment, in order of first appearance
+        flows: One entry per flow, in the order the flows were given
+        orphaned_deployments: Deployments whose flow was not found
+    """
+
+    environments: List[str] = field(default_factory=list)
+    flows: List[FlowDeployments] = field(default_factory=list)
+    orphaned_deployments: List[DeploymentDetails] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the FlowDeploymentMatrix to a dictionary suitable for JSON serialization."""
+        return {
+            "environments": list(self.environments),
+            "flows": [flow_deployments.to_dict() for flow_deployments in self.flows],
+            "orphaned_deployments": [
+                deployment.to_dict() for deployment in self.orphaned_deployments
+            ],
+        }
+
+    def to_reference_dict(self) -> Dict[str, Any]:
+        """Convert the FlowDeploymentMatrix to a dictionary referring to its records.
+
+        Flows are given by name and deployments by ID instead of in full, for payloads that
+        already hold the flows and deployments, like `PortalSnapshot.to_dict`.
+        """
+        return {
+            "environments": list(self.environments),
+            "flows": [
+                flow_deployments.to_reference_dict() for flow_deployments in self.flows
+            ],
+            "orphaned_deployments": [
+                deployment.id for deployment in self.orphaned_deployments
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FlowDeploymentMatrix":
+        """Create a FlowDeploymentMatrix instance from a dictionary representation."""
+        return cls(
+            environments=list(data["environments"]),
+            flows=[FlowDeployments.from_dict(flow) for flow in data["flows"]],
+            orphaned_deployments=[
+                DeploymentDetails.from_dict(deployment)
+                for deployment in data["orphaned_deployments"]
+            ],
+        )
+
+
+def _join_key(flow_name: str) -> str:
+    """Standardize a flow name the way deployment finders do."""
+    return flow_name.replace("-", "_")
+
+
+def join_flows_and_deployments(
+    flows: Iterable[FlowDetails], deployments: Iterable[DeploymentDetails]
+) -> FlowDeploymentMatrix:
+    """
+    Join flows with their deployments by flow name.
+
+    Deployments are indexed once by flow name and environment, keeping the most recently updated
+    deployment of each pair, and every flow is then looked up in the index, so the join takes time
+    linear in the number of flows and deployments. Flow names are compared with hyphens replaced
+    by underscores, like the deployment finders standardize them.
+
+    Args:
+        flows: Result of `FlowFinder.find_flows`
+        deployments: Result of `DeploymentFinder.get_deployments`
+
+    Returns:
+        FlowDeploymentMatrix with the latest deployment per flow and environment and the
+        deployments, in their original order, that do not belong to any of the flows
+    """
+    deployments = list(deployments)
+    latest: Dict[str, Dict[str, DeploymentDetails]] = {}
+    environments: Dict[str, None] = {}
+    for deployment in deployments:
+        environments.setdefault(deployment.env)
+        by_env = latest.setdefault(_join_key(deployment.flow_name), {})
+        current = by_env.get(deployment.env)
+        if current is None or (deployment.updated_at or "") > (
+            current.updated_at or ""
+        ):
+            by_env[deployment.env] = deployment
+
+    matched = set()
+    flow_deployments = []
+    for flow in flows:
+        key = _join_key(flow.name)
+        by_env = latest.get(key)
+        if by_env is not None:
+            matched.add(key)
+        flow_deployments.append(
+            FlowDeployments(flow=flow, deployments=dict(by_env or {}))
+        )
+
+    orphaned = [
+        deployment
+        for deployment in deployments
+        if _join_key(deployment.flow_name) not in matched
+    ]
+    return FlowDeploymentMatrix(
+        environments=list(environments),
+        flows=flow_deployments,
+        orphaned_deployments=orphaned,
+    )
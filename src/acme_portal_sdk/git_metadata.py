@@ -0,0 +1,220 @@
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_SECTION_PATTERN = re.compile(r'^\[\s*([^\s\]"]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+
+
+def find_git_dir(path: str = ".") -> Optional[Path]:
+    """
+    Find the git directory of the repository containing a path.
+
+    Follows `gitdir:` pointers used by worktrees and submodules, where `.git` is a file.
+
+    Args:
+        path: Directory inside the repository
+
+    Returns:
+        Path to the git directory, or None if the path is not inside a repository
+    """
+    current = Path(path).resolve()
+    for directory in (current, *current.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text(encoding="utf-8").strip()
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[len("gitdir:") :].strip())
+                return (
+                    git_dir
+                    if git_dir.is_absolute()
+                    else (directory / git_dir).resolve()
+                )
+    return None
+
+
+def parse_git_config(content: str) -> Dict[Tuple[str, Optional[str]], Dict[str, str]]:
+    """
+    Parse the sections of a git config file.
+
+    Args:
+        content: Content of the config file
+
+    Returns:
+        Dictionary mapping (section, subsection) to the keys and values of that section,
+        e.g. `("remote", "origin") -> {"url": ...}`
+    """
+    sections: Dict[Tuple[str, Optional[str]], Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        match = _SECTION_PATTERN.match(line)
+        if match:
+            key = (match.group(1).lower(), match.group(2))
+            current = sections.setdefault(key, {})
+            continue
+        if current is None or "=" not in line:
+            continue
+        name, value = line.split("=", 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        current[name.strip().lower()] = value
+    return sections
+
+
+class GitMetadataProvider:
+    """Reads repository metadata from the files in the git directory without running git.
+
+    Reads `config` for remote URLs, `HEAD` for the branch, and loose refs or `packed-refs` for the
+    commit hash. Worktrees are supported by following the `.git` file and the `commondir` pointer.
+    Parsed files are cached and only read again when their modification time or size changes.
+    Methods return None when the information cannot be read, so callers can fall back to git.
+    `get_branch` also returns None for a detached HEAD, which `is_detached` tells apart.
+    """
+
+    def __init__(self, path: str = "."):
+        """
+        Initialize the provider.
+
+        Args:
+            path: Directory inside the repository
+        """
+        self.path = path
+        self._cache: Dict[Tuple[Path, str], Tuple[Tuple[int, int], object]] = {}
+        self._lock = threading.Lock()
+
+    def _git_dirs(self) -> Optional[Tuple[Path, Path]]:
+        """Return the git directory of the worktree and the directory shared by all worktrees."""
+        git_dir = find_git_dir(self.path)
+        if git_dir is None:
+            return None
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            pointer = Path(commondir_file.read_text(encoding="utf-8").strip())
+            common_dir = (
+                pointer if pointer.is_absolute() else (git_dir / pointer).resolve()
+            )
+        return git_dir, common_dir
+
+    def _read_cached(
+        self, path: Path, kind: str, parse: Callable[[str], T]
+    ) -> Optional[T]:
+        """Parse a file, reusing the previous result while its mtime and size are unchanged."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (path, kind)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]  # type: ignore[return-value]
+        try:
+            parsed = parse(path.read_text(encoding="utf-8"))
+        except OSError:
+            return None
+        with self._lock:
+            self._cache[key] = (signature, parsed)
+        return parsed
+
+    def get_remote_url(self, remote: str = "origin") -> Optional[str]:
+        """
+        Get the URL of a remote as configured.
+
+        Args:
+            remote: Name of the remote
+
+        Returns:
+            The remote URL, or None if it is not configured
+        """
+        dirs = self._git_dirs()
+        if dirs is None:
+            return None
+        config = self._read_cached(dirs[1] / "config", "config", parse_git_config)
+        if config is None:
+            return None
+        return config.get(("remote", remote), {}).get("url")
+
+    def _read_head(self) -> Optional[str]:
+        """Return the content of HEAD for the current worktree."""
+        dirs = self._git_dirs()
+        if dirs is None:
+            return None
+        return self._read_cached(dirs[0] / "HEAD", "head", str.strip)
+
+    def get_branch(self) -> Optional[str]:
+        """
+        Get the checked out branch.
+
+        Returns:
+            The branch name, or None for a detached HEAD
+        """
+        head = self._read_head()
+        if head is None or not head.startswith("ref: refs/heads/"):
+            return None
+        return head[len("ref: refs/heads/") :]
+
+    def is_detached(self) -> Optional[bool]:
+        """
+        Check whether HEAD is detached, e.g. in a CI checkout of a commit.
+
+        Returns:
+            True for a detached HEAD, False if a branch is checked out, or None if HEAD
+            cannot be read
+        """
+        head = self._read_head()
+        if head is None:
+            return None
+        return not head.startswith("ref: ")
+
+    def get_commit_hash(self) -> Optional[str]:
+        """
+        Get the hash of the checked out commit.
+
+        Returns:
+            The full commit hash, or None if it cannot be resolved
+        """
+        head = self._read_head()
+        if head is None:
+            return None
+        if not head.startswith("ref: "):
+            return head
+        return self._resolve_ref(head[len("ref: ") :])
+
+    def _resolve_ref(self, ref: str) -> Optional[str]:
+        """Resolve a ref from loose ref files or packed-refs."""
+        dirs = self._git_dirs()
+        if dirs is None:
+            return None
+        git_dir, common_dir = dirs
+        for directory in (git_dir, common_dir):
+            value = self._read_cached(directory / ref, "ref", str.strip)
+            if value:
+                return value
+        packed = self._read_cached(
+            common_dir / "packed-refs", "packed-refs", _parse_packed_refs
+        )
+        if packed is None:
+            return None
+        return packed.get(ref)
+
+
+def _parse_packed_refs(content: str) -> Dict[str, str]:
+    """Map ref names to commit hashes from the content of a packed-refs file."""
+    refs = {}
+    for line in content.splitlines():
+        if not line or line[0] in "#^":
+            continue
+        commit_hash, _, ref = line.partition(" ")
+        refs[ref.strip()] = commit_hash
+    return refs
@@ -1,11 +1,30 @@
-from .github_workflow import (CommandExecutor, GithubActionsDeployWorkflow,
+from .github_workflow import (AsyncGithubActionsDeployWorkflow,
+                              AsyncGithubActionsPromoteWorkflow,
+                              CommandCancelledError, CommandExecutor,
+                              GithubActionsDeployWorkflow,
                               GithubActionsPromoteWorkflow,
-                              GitHubWorkflowService, GitService)
+                              GitHubRestWorkflowService,
+                              GitHubWorkflowService, GitService,
+                              WorkflowRunGroup, WorkflowRunHandle,
+                              shard_flows)
+from .rest_client import GitHubConnectionError, GitHubRestClient
+from .run_watcher import WorkflowRunStatus, WorkflowRunWatcher
 
 __all__ = [
     "GithubActionsDeployWorkflow",
     "GithubActionsPromoteWorkflow",
+    "AsyncGithubActionsDeployWorkflow",
+    "AsyncGithubActionsPromoteWorkflow",
     "GitHubWorkflowService",
+    "GitHubRestWorkflowService",
     "GitService",
     "CommandExecutor",
+    "CommandCancelledError",
+    "WorkflowRunHandle",
+    "WorkflowRunGroup",
+    "shard_flows",
+    "GitHubRestClient",
+    "GitHubConnectionError",
+    "WorkflowRunStatus",
+    "WorkflowRunWatcher",
 ]
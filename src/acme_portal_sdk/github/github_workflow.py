@@ -1,38 +1,231 @@
+import asyncio
 import json
 import os
 import subprocess
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+import uuid
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from typing import (Any, Callable, Dict, List, Optional, Sequence, Tuple,
+                    Union)
 
+from ..async_api import AsyncDeployWorkflow, AsyncPromoteWorkflow
 from ..deployment_promote import PromoteWorkflow
 from ..flow_deploy import DeployWorkflow
+from ..git_metadata import GitMetadataProvider
+from ..tracing import traced
+from .rest_client import (GitHubConnectionError, GitHubRestClient,
+                          repository_from_url)
+from .run_watcher import WorkflowRunStatus, WorkflowRunWatcher
+
+
+# Seconds after which gh and git commands started by the workflows are killed
+DEFAULT_COMMAND_TIMEOUT = 120.0
+
+
+class CommandCancelledError(subprocess.SubprocessError):
+    """Raised when a command is cancelled before it finishes."""
+
+    def __init__(self, cmd: Union[str, Sequence[str]]):
+        super().__init__(f"Command {cmd!r} was cancelled")
+        self.cmd = cmd
+
+
+# Callback receiving each output line of a command and the name of its stream, `stdout` or `stderr`
+OutputCallback = Callable[[str, str], None]
+
+
+def _command_attributes(
+    executor: Any, command: Union[str, Sequence[str]], *args: Any, **kwargs: Any
+) -> Dict[str, str]:
+    """Span attributes of a command, only the program name as arguments may hold secrets."""
+    if isinstance(command, str):
+        program = command.split(None, 1)[0] if command.strip() else ""
+    else:
+        program = command[0] if command else ""
+    return {"command": os.path.basename(program)}
 
 
 class CommandExecutor:
-    """Executes shell commands and returns their output."""
+    """Executes commands and returns their output.
+
+    Commands given as a string are run through the shell. Commands given as a list of arguments
+    are run directly, without a shell, so arguments need no quoting.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Initialize the CommandExecutor.
+
+        Args:
+            timeout: Default maximum number of seconds a command may run, unlimited if None
+        """
+        self.timeout = timeout
 
+    @traced("CommandExecutor.execute", attributes=_command_attributes)
     def execute(
-        self, command: str, working_dir: Optional[str] = None
+        self,
+        command: Union[str, Sequence[str]],
+        working_dir: Optional[str] = None,
+        timeout: Optional[float] = None,
+        on_output: Optional[OutputCallback] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> Tuple[str, str]:
         """
-        Execute a shell command and return its output.
+        Execute a command and return its output.
 
         Args:
-            command: The command to execute
+            command: The command to execute, a shell command string or a list of arguments
             working_dir: The directory to run the command in
+            timeout: Maximum number of seconds the command may run, uses the executor default if None
+            on_output: Function called with each output line and its stream name while the command runs
+            cancel_event: Event that kills the command when set
 
         Returns:
             Tuple of (stdout, stderr) from the command
+
+        Raises:
+            subprocess.CalledProcessError: If the command exits with a non-zero code
+            subprocess.TimeoutExpired: If the command runs longer than the timeout
+            CommandCancelledError: If cancel_event is set before the command finishes
         """
+        timeout = timeout if timeout is not None else self.timeout
         process = subprocess.Popen(
             command,
-            shell=True,
+            shell=isinstance(command, str),
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             cwd=working_dir,
             text=True,
         )
-        stdout, stderr = process.communicate()
+
+        if on_output is None and cancel_event is None:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+        else:
+            stdout, stderr = self._stream(process, command, timeout, on_output, cancel_event)
+
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, command, stdout, stderr
+            )
+
+        return stdout, stderr
+
+    @staticmethod
+    def _stream(
+        process: "subprocess.Popen[str]",
+        command: Union[str, Sequence[str]],
+        timeout: Optional[float],
+        on_output: Optional[OutputCallback],
+        cancel_event: Optional[threading.Event],
+    ) -> Tuple[str, str]:
+        """Read both output streams line by line until the process exits, is cancelled or times out."""
+        outputs: Dict[str, List[str]] = {"stdout": [], "stderr": []}
+
+        def read(stream, name: str) -> None:
+            for line in stream:
+                outputs[name].append(line)
+                if on_output is not None:
+                    on_output(line.rstrip("\n"), name)
+
+        readers = [
+            threading.Thread(target=read, args=(process.stdout, "stdout"), daemon=True),
+            threading.Thread(target=read, args=(process.stderr, "stderr"), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while process.poll() is None:
+            if cancel_event is not None and cancel_event.is_set():
+                process.kill()
+                process.wait()
+                raise CommandCancelledError(command)
+            if deadline is not None and time.monotonic() >= deadline:
+                process.kill()
+                process.wait()
+                raise subprocess.TimeoutExpired(command, timeout)
+            try:
+                process.wait(timeout=0.05)
+            except subprocess.TimeoutExpired:
+                pass
+
+        for reader in readers:
+            reader.join()
+        return "".join(outputs["stdout"]), "".join(outputs["stderr"])
+
+    @traced("CommandExecutor.execute_async", attributes=_command_attributes)
+    async def execute_async(
+        self,
+        command: Union[str, Sequence[str]],
+        working_dir: Optional[str] = None,
+        timeout: Optional[float] = None,
+        on_output: Optional[OutputCallback] = None,
+    ) -> Tuple[str, str]:
+        """
+        Execute a command without blocking the event loop and return its output.
+
+        Cancelling the awaiting task kills the command.
+
+        Args:
+            command: The command to execute, a shell command string or a list of arguments
+            working_dir: The directory to run the command in
+            timeout: Maximum number of seconds the command may run, uses the executor default if None
+            on_output: Function called with each output line and its stream name while the command runs
+
+        Returns:
+            Tuple of (stdout, stderr) from the command
+
+        Raises:
+            subprocess.CalledProcessError: If the command exits with a non-zero code
+            subprocess.TimeoutExpired: If the command runs longer than the timeout
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        if isinstance(command, str):
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=working_dir,
+            )
+        else:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=working_dir,
+            )
+
+        async def read(stream, name: str) -> str:
+            lines = []
+            async for raw_line in stream:
+                line = raw_line.decode("utf-8", errors="replace")
+                lines.append(line)
+                if on_output is not None:
+                    on_output(line.rstrip("\n"), name)
+            return "".join(lines)
+
+        try:
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    read(process.stdout, "stdout"),
+                    read(process.stderr, "stderr"),
+                    process.wait(),
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(command, timeout)
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
 
         if process.returncode != 0:
             raise subprocess.CalledProcessError(
@@ -42,11 +235,67 @@ class CommandExecutor:
         return stdout, stderr
 
 
+async def _execute_async(
+    command_executor: CommandExecutor,
+    command: Union[str, Sequence[str]],
+    working_dir: Optional[str] = None,
+) -> Tuple[str, str]:
+    """Run a command asynchronously, in a worker thread for executors without `execute_async`."""
+    execute_async = getattr(command_executor, "execute_async", None)
+    if execute_async is not None and asyncio.iscoroutinefunction(execute_async):
+        return await execute_async(command, working_dir)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, command_executor.execute, command, working_dir
+    )
+
+
 class GitService:
-    """Provides Git-related functionality."""
+    """Provides Git-related functionality.
+
+    Repository information is read from the git directory by GitMetadataProvider. Git commands are
+    only run when the files cannot be read.
+    """
 
-    def __init__(self, command_executor: CommandExecutor):
+    def __init__(self, command_executor: CommandExecutor, read_git_files: bool = True):
+        """
+        Initialize the GitService.
+
+        Args:
+            command_executor: Executor for git commands
+            read_git_files: Read repository information from the git directory before running git
+        """
         self.command_executor = command_executor
+        self.read_git_files = read_git_files
+        self._metadata_providers: Dict[str, GitMetadataProvider] = {}
+
+    def _metadata(self, working_dir: Optional[str]) -> Optional[GitMetadataProvider]:
+        """Return the cached metadata provider for a directory."""
+        if not self.read_git_files:
+            return None
+        key = working_dir or "."
+        provider = self._metadata_providers.get(key)
+        if provider is None:
+            provider = self._metadata_providers[key] = GitMetadataProvider(key)
+        return provider
+
+    def _read_or_execute(
+        self,
+        read: Callable[[GitMetadataProvider], Optional[str]],
+        command: List[str],
+        working_dir: Optional[str],
+    ) -> str:
+        """Read a value from the git directory, running the git command if it is not found."""
+        provider = self._metadata(working_dir)
+        if provider is not None:
+            try:
+                value = read(provider)
+            except (OSError, ValueError):
+                value = None
+            if value:
+                return value
+        stdout, _ = self.command_executor.execute(command, working_dir)
+        return stdout.strip()
 
     def get_repository_url(self, working_dir: Optional[str] = None) -> Optional[str]:
         """
@@ -59,33 +308,274 @@ class GitService:
             The URL of the repository or None if not found
         """
         try:
-            # Get the remote URL
-            stdout, _ = self.command_executor.execute(
-                "git remote get-url origin", working_dir
+            remote_url = self._read_or_execute(
+                lambda provider: provider.get_remote_url("origin"),
+                ["git", "remote", "get-url", "origin"],
+                working_dir,
             )
-            remote_url = stdout.strip()
+            return self._to_https_url(remote_url)
+        except (subprocess.CalledProcessError, Exception) as e:
+            print(f"Error getting repository URL: {e}")
+            return None
 
-            # Convert SSH URL to HTTPS URL if needed
-            if remote_url.startswith("git@github.com:"):
-                remote_url = remote_url.replace(
-                    "git@github.com:", "https://github.com/"
-                )
-                if remote_url.endswith(".git"):
-                    remote_url = remote_url[:-4]
+    def get_branch_name(self, working_dir: Optional[str] = None) -> Optional[str]:
+        """
+        Get the checked out branch.
 
-            return remote_url
-        except (subprocess.CalledProcessError, Exception) as e:
+        Args:
+            working_dir: The directory to run the Git command in
+
+        Returns:
+            The branch name or None if not found or HEAD is detached
+        """
+        provider = self._metadata(working_dir)
+        if provider is not None:
+            try:
+                detached = provider.is_detached()
+            except (OSError, ValueError):
+                detached = None
+            if detached:
+                # No branch to look up, git would only report "HEAD"
+                return None
+        try:
+            branch = self._read_or_execute(
+                lambda provider: provider.get_branch(),
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+                working_dir,
+            )
+        except Exception as e:
+            print(f"Error getting branch name: {e}")
+            return None
+        return None if branch == "HEAD" else branch
+
+    def get_commit_hash(self, working_dir: Optional[str] = None) -> Optional[str]:
+        """
+        Get the hash of the checked out commit.
+
+        Args:
+            working_dir: The directory to run the Git command in
+
+        Returns:
+            The full commit hash or None if not found
+        """
+        try:
+            return self._read_or_execute(
+                lambda provider: provider.get_commit_hash(),
+                ["git", "rev-parse", "HEAD"],
+                working_dir,
+            )
+        except Exception as e:
+            print(f"Error getting commit hash: {e}")
+            return None
+
+    async def get_repository_url_async(
+        self, working_dir: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get the URL of the Git repository without blocking the event loop.
+
+        Args:
+            working_dir: The directory to run the Git command in
+
+        Returns:
+            The URL of the repository or None if not found
+        """
+        provider = self._metadata(working_dir)
+        remote_url = provider.get_remote_url("origin") if provider is not None else None
+        if remote_url:
+            return self._to_https_url(remote_url)
+        try:
+            stdout, _ = await _execute_async(
+                self.command_executor, ["git", "remote", "get-url", "origin"], working_dir
+            )
+            return self._to_https_url(stdout)
+        except Exception as e:
             print(f"Error getting repository URL: {e}")
             return None
 
+    @staticmethod
+    def _to_https_url(remote_url: str) -> str:
+        """Convert an SSH remote URL to an HTTPS URL if needed."""
+        remote_url = remote_url.strip()
+        if remote_url.startswith("git@github.com:"):
+            remote_url = remote_url.replace("git@github.com:", "https://github.com/")
+            if remote_url.endswith(".git"):
+                remote_url = remote_url[:-4]
+        return remote_url
+
+
+class WorkflowRunHandle:
+    """Handle to a dispatched GitHub workflow run whose URL is resolved in the background."""
+
+    def __init__(self, workflow_file: str, correlation_id: str):
+        """
+        Initialize the handle.
+
+        Args:
+            workflow_file: The workflow file name
+            correlation_id: Unique identifier sent with the dispatch to find the run
+        """
+        self.workflow_file = workflow_file
+        self.correlation_id = correlation_id
+        self._future: "Future[Optional[str]]" = Future()
+
+    def done(self) -> bool:
+        """Whether the run URL lookup has finished."""
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for the run URL.
+
+        Args:
+            timeout: Maximum number of seconds to wait, waits until the lookup finishes if None
+
+        Returns:
+            URL to the workflow run or None if it could not be found
+        """
+        return self._future.result(timeout=timeout)
+
+    def add_done_callback(self, callback) -> None:
+        """
+        Call `callback(run_url)` once the run URL lookup finishes.
+
+        Args:
+            callback: Function receiving the run URL or None
+        """
+        self._future.add_done_callback(lambda future: callback(future.result()))
+
+    def set_result(self, run_url: Optional[str]) -> None:
+        """
+        Complete the handle once the run URL lookup finishes.
+
+        Args:
+            run_url: URL to the workflow run or None if it could not be found
+        """
+        self._future.set_result(run_url)
+
+    async def result_async(self) -> Optional[str]:
+        """
+        Wait for the run URL without blocking the event loop.
+
+        Returns:
+            URL to the workflow run or None if it could not be found
+        """
+        return await asyncio.wrap_future(self._future)
+
+    def __await__(self):
+        """Wait for the run URL without blocking the event loop, see result_async."""
+        return self.result_async().__await__()
+
+
+class WorkflowRunGroup:
+    """Aggregate handle to workflow runs dispatched together, e.g. the shards of a deployment."""
+
+    def __init__(self, handles: List[Optional[WorkflowRunHandle]], shards: List[List[str]]):
+        """
+        Initialize the group.
+
+        Args:
+            handles: Handle of each dispatched run, None for runs that failed to dispatch
+            shards: Flows sent to each run, in the same order as `handles`
+        """
+        self.handles = handles
+        self.shards = shards
+
+    def done(self) -> bool:
+        """Whether the run URL lookups of all runs have finished."""
+        return all(handle is None or handle.done() for handle in self.handles)
+
+    def result(self, timeout: Optional[float] = None) -> List[Optional[str]]:
+        """
+        Wait for the run URLs.
+
+        Args:
+            timeout: Maximum number of seconds to wait for all runs, waits until all lookups finish if None
+
+        Returns:
+            URL of each run in shard order, None for runs that failed to dispatch or were not found
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        run_urls = []
+        for handle in self.handles:
+            if handle is None:
+                run_urls.append(None)
+                continue
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            run_urls.append(handle.result(timeout=remaining))
+        return run_urls
+
+
+def shard_flows(
+    flows: List[str],
+    shard_count: int,
+    flow_durations: Optional[Dict[str, float]] = None,
+) -> List[List[str]]:
+    """
+    Split flows into balanced shards.
+
+    Flows are assigned longest first to the shard with the lowest total duration. Flows without a
+    known duration count as the average known duration, or 1 if no duration is known, so without
+    durations the shards differ in size by at most one flow.
+
+    Args:
+        flows: Flow names to split
+        shard_count: Maximum number of shards, fewer are returned if there are fewer flows
+        flow_durations: Historical deploy time of each flow, in any consistent unit
+
+    Returns:
+        Non-empty shards, each keeping the original order of its flows
+
+    Raises:
+        ValueError: If shard_count is less than 1
+    """
+    if shard_count < 1:
+        raise ValueError("shard_count must be at least 1")
+    durations = flow_durations or {}
+    known = [durations[flow] for flow in flows if flow in durations]
+    default = sum(known) / len(known) if known else 1.0
+
+    positions = {flow: index for index, flow in enumerate(flows)}
+    shards: List[List[str]] = [[] for _ in range(min(shard_count, len(flows)))]
+    loads = [0.0] * len(shards)
+    for flow in sorted(flows, key=lambda flow: -durations.get(flow, default)):
+        target = loads.index(min(loads))
+        shards[target].append(flow)
+        loads[target] += durations.get(flow, default)
+    return [sorted(shard, key=positions.__getitem__) for shard in shards]
+
 
 class GitHubWorkflowService:
     """Service for GitHub workflow operations."""
 
-    def __init__(self, command_executor: CommandExecutor, git_service: GitService):
+    def __init__(
+        self,
+        command_executor: CommandExecutor,
+        git_service: GitService,
+        correlation_input: Optional[str] = None,
+        run_lookup_timeout: float = 30.0,
+    ):
+        """
+        Initialize the GitHubWorkflowService.
+
+        Args:
+            command_executor: Executor for gh and git commands
+            git_service: Service providing repository information
+            correlation_input: Name of a workflow_dispatch input that receives a unique correlation id.
+                The workflow must declare this input and include it in its `run-name`, so the
+                dispatched run can be told apart from concurrent dispatches. If None, the run is
+                matched by workflow, event, branch and creation time.
+            run_lookup_timeout: Maximum number of seconds to poll for the dispatched run
+        """
         self.command_executor = command_executor
         self.git_service = git_service
-        self._verify_gh_cli_installed()
+        self.correlation_input = correlation_input
+        self.run_lookup_timeout = run_lookup_timeout
+        if self.VERIFY_GH_CLI_ON_INIT:
+            self._verify_gh_cli_installed()
+
+    # Whether the GitHub CLI is verified when the service is created
+    VERIFY_GH_CLI_ON_INIT = True
 
     def _verify_gh_cli_installed(self) -> None:
         """
@@ -95,7 +585,7 @@ class GitHubWorkflowService:
             RuntimeError: If GitHub CLI is not installed or not accessible
         """
         try:
-            self.command_executor.execute("gh --version")
+            self.command_executor.execute(["gh", "--version"])
         except subprocess.CalledProcessError:
             raise RuntimeError(
                 "GitHub CLI (gh) is not installed or not in PATH. "
@@ -104,6 +594,13 @@ class GitHubWorkflowService:
         except Exception as e:
             raise RuntimeError(f"Error verifying GitHub CLI installation: {e}")
 
+    # Delays between run lookups: first delay, growth factor and upper bound, in seconds
+    RUN_LOOKUP_INITIAL_DELAY = 0.5
+    RUN_LOOKUP_BACKOFF = 2.0
+    RUN_LOOKUP_MAX_DELAY = 4.0
+    # Tolerated difference between the local clock and GitHub's run creation time
+    RUN_LOOKUP_CLOCK_SKEW = timedelta(seconds=10)
+
     def trigger_workflow(
         self,
         workflow_file: str,
@@ -130,11 +627,14 @@ class GitHubWorkflowService:
             print(f"Error triggering GitHub workflow: {e}")
             return None
 
-    def trigger_workflow_via_github_cli(
-        self, workflow_file: str, workflow_inputs: Dict[str, str], workflow_ref: str
+    async def trigger_workflow_async(
+        self,
+        workflow_file: str,
+        workflow_inputs: Dict[str, str],
+        workflow_ref: str = "main",
     ) -> Optional[str]:
         """
-        Trigger a GitHub workflow using the GitHub CLI.
+        Trigger a GitHub workflow and wait for the URL of its run without blocking the event loop.
 
         Args:
             workflow_file: The workflow file name
@@ -145,31 +645,300 @@ class GitHubWorkflowService:
             URL to the workflow run or None on error
         """
         try:
-            # Format workflow inputs for CLI command
-            input_args = " ".join(
-                [f"-f {key}={value}" for key, value in workflow_inputs.items()]
+            handle = await self.dispatch_workflow_async(
+                workflow_file, workflow_inputs, workflow_ref
             )
+            if handle is None:
+                return None
+            return await handle.result_async()
+        except Exception as e:
+            print(f"Error triggering GitHub workflow: {e}")
+            return None
+
+    def trigger_workflow_via_github_cli(
+        self, workflow_file: str, workflow_inputs: Dict[str, str], workflow_ref: str
+    ) -> Optional[str]:
+        """
+        Trigger a GitHub workflow using the GitHub CLI and wait for the URL of its run.
+
+        Args:
+            workflow_file: The workflow file name
+            workflow_inputs: The inputs for the workflow
+            workflow_ref: The git ref (branch/tag) for the workflow
+
+        Returns:
+            URL to the workflow run or None on error
+        """
+        handle = self.dispatch_workflow(workflow_file, workflow_inputs, workflow_ref)
+        if handle is None:
+            return None
+        return handle.result()
+
+    def dispatch_workflow(
+        self,
+        workflow_file: str,
+        workflow_inputs: Dict[str, str],
+        workflow_ref: str = "main",
+    ) -> Optional[WorkflowRunHandle]:
+        """
+        Dispatch a GitHub workflow and return immediately with a handle to its run.
 
-            # Run the workflow using GitHub CLI
-            command = f"gh workflow run {workflow_file} -r {workflow_ref} {input_args}"
-            stdout, _ = self.command_executor.execute(command)
+        The run URL is looked up in a background thread by polling with exponential backoff.
+
+        Args:
+            workflow_file: The workflow file name
+            workflow_inputs: The inputs for the workflow
+            workflow_ref: The git ref (branch/tag) for the workflow
+
+        Returns:
+            Handle resolving to the URL of the workflow run, or None if the dispatch failed
+        """
+        correlation_id, inputs = self._correlated_inputs(workflow_inputs)
+        try:
+            dispatched_at = datetime.now(timezone.utc)
+            self._dispatch(workflow_file, inputs, workflow_ref)
             print("Workflow triggered, getting run info...")
+        except Exception as e:
+            print(f"Error dispatching GitHub workflow: {e}")
+            return None
 
-            # Wait briefly to ensure the workflow has been registered
-            time.sleep(2)
+        return self._start_run_lookup(
+            workflow_file, correlation_id, workflow_ref, dispatched_at
+        )
 
-            # Get the workflow name from the file path
-            workflow_name = os.path.basename(workflow_file)
+    async def dispatch_workflow_async(
+        self,
+        workflow_file: str,
+        workflow_inputs: Dict[str, str],
+        workflow_ref: str = "main",
+    ) -> Optional[WorkflowRunHandle]:
+        """
+        Dispatch a GitHub workflow without blocking the event loop.
 
-            # Get the list of runs for this workflow
-            list_command = f"gh run list --workflow={workflow_name} --limit=1 --json databaseId,url"
-            stdout, _ = self.command_executor.execute(list_command)
+        Several dispatches can be awaited concurrently, e.g. with `asyncio.gather`. The run URL is
+        looked up in a background thread as in dispatch_workflow().
 
-            return self.parse_workflow_run_response(stdout)
+        Args:
+            workflow_file: The workflow file name
+            workflow_inputs: The inputs for the workflow
+            workflow_ref: The git ref (branch/tag) for the workflow
+
+        Returns:
+            Handle resolving to the URL of the workflow run, or None if the dispatch failed
+        """
+        correlation_id, inputs = self._correlated_inputs(workflow_inputs)
+        try:
+            dispatched_at = datetime.now(timezone.utc)
+            await self._dispatch_async(workflow_file, inputs, workflow_ref)
+            print("Workflow triggered, getting run info...")
         except Exception as e:
-            print(f"Error using GitHub CLI: {e}")
+            print(f"Error dispatching GitHub workflow: {e}")
             return None
 
+        return self._start_run_lookup(
+            workflow_file, correlation_id, workflow_ref, dispatched_at
+        )
+
+    def _correlated_inputs(
+        self, workflow_inputs: Dict[str, str]
+    ) -> Tuple[str, Dict[str, str]]:
+        """Create a correlation id and add it to the inputs if a correlation input is configured."""
+        correlation_id = uuid.uuid4().hex[:12]
+        inputs = dict(workflow_inputs)
+        if self.correlation_input:
+            inputs[self.correlation_input] = correlation_id
+        return correlation_id, inputs
+
+    def _start_run_lookup(
+        self,
+        workflow_file: str,
+        correlation_id: str,
+        workflow_ref: str,
+        dispatched_at: datetime,
+    ) -> WorkflowRunHandle:
+        """Create a handle and resolve its run URL in a background thread."""
+        handle = WorkflowRunHandle(workflow_file, correlation_id)
+        threading.Thread(
+            target=self._resolve_run_url,
+            args=(handle, workflow_ref, dispatched_at),
+            daemon=True,
+        ).start()
+        return handle
+
+    @staticmethod
+    def _dispatch_command(
+        workflow_file: str, workflow_inputs: Dict[str, str], workflow_ref: str
+    ) -> List[str]:
+        """Build the `gh workflow run` arguments, passed without a shell so inputs need no quoting."""
+        command = ["gh", "workflow", "run", workflow_file, "-r", workflow_ref]
+        for key, value in workflow_inputs.items():
+            command.extend(["-f", f"{key}={value}"])
+        return command
+
+    async def _dispatch_async(
+        self, workflow_file: str, workflow_inputs: Dict[str, str], workflow_ref: str
+    ) -> None:
+        """Send a workflow_dispatch event using the GitHub CLI without blocking the event loop."""
+        await _execute_async(
+            self.command_executor,
+            self._dispatch_command(workflow_file, workflow_inputs, workflow_ref),
+        )
+
+    def _dispatch(
+        self, workflow_file: str, workflow_inputs: Dict[str, str], workflow_ref: str
+    ) -> None:
+        """Send a workflow_dispatch event using the GitHub CLI."""
+        self.command_executor.execute(
+            self._dispatch_command(workflow_file, workflow_inputs, workflow_ref)
+        )
+
+    def _list_runs(self, workflow_file: str) -> List[Dict[str, Any]]:
+        """List recent workflow_dispatch runs of a workflow using the GitHub CLI, newest first."""
+        workflow_name = os.path.basename(workflow_file)
+        stdout, _ = self.command_executor.execute(
+            [
+                "gh",
+                "run",
+                "list",
+                f"--workflow={workflow_name}",
+                "--event=workflow_dispatch",
+                "--limit=20",
+                "--json",
+                "databaseId,url,displayTitle,createdAt,headBranch",
+            ]
+        )
+        return json.loads(stdout)
+
+    def _resolve_run_url(
+        self, handle: WorkflowRunHandle, workflow_ref: str, dispatched_at: datetime
+    ) -> None:
+        """Poll for the dispatched run and complete the handle with its URL."""
+        try:
+            run_url = self.find_workflow_run_url(
+                handle.workflow_file,
+                workflow_ref,
+                dispatched_at,
+                correlation_id=handle.correlation_id if self.correlation_input else None,
+            )
+        except Exception as e:
+            print(f"Error getting workflow run info: {e}")
+            run_url = None
+        handle.set_result(run_url)
+
+    def find_workflow_run_url(
+        self,
+        workflow_file: str,
+        workflow_ref: str,
+        dispatched_at: datetime,
+        correlation_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Poll GitHub for a dispatched workflow run with exponential backoff.
+
+        Args:
+            workflow_file: The workflow file name
+            workflow_ref: The git ref (branch/tag) the workflow was dispatched on
+            dispatched_at: Time of the dispatch
+            correlation_id: Correlation id expected in the run title, if the workflow receives one
+
+        Returns:
+            URL to the workflow run or None if it was not found before `run_lookup_timeout`
+        """
+        workflow_name = os.path.basename(workflow_file)
+        deadline = time.monotonic() + self.run_lookup_timeout
+        delay = self.RUN_LOOKUP_INITIAL_DELAY
+
+        while True:
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            run = self._match_run(
+                self._list_runs(workflow_file), workflow_ref, dispatched_at, correlation_id
+            )
+            if run is not None:
+                return self.parse_workflow_run_response(json.dumps([run]))
+            if time.monotonic() >= deadline:
+                print(f"Workflow run of {workflow_name} not found before timeout")
+                return None
+            delay = min(delay * self.RUN_LOOKUP_BACKOFF, self.RUN_LOOKUP_MAX_DELAY)
+
+    def _match_run(
+        self,
+        runs: List[Dict[str, Any]],
+        workflow_ref: str,
+        dispatched_at: datetime,
+        correlation_id: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Select the dispatched run from a list of runs.
+
+        With a correlation id, the run whose title contains it is selected. Otherwise the earliest
+        run on the ref created after the dispatch is selected. Runs created up to
+        RUN_LOOKUP_CLOCK_SKEW before the dispatch are only considered if there is no such run, the
+        latest of them being the closest to the dispatch. Without a correlation id, a run
+        dispatched by someone else at about the same time can still be selected.
+        """
+        if correlation_id is not None:
+            return next(
+                (run for run in runs if correlation_id in run.get("displayTitle", "")),
+                None,
+            )
+
+        earliest_created = dispatched_at - self.RUN_LOOKUP_CLOCK_SKEW
+        after_dispatch = []
+        within_skew = []
+        for run in runs:
+            if run.get("headBranch") not in (None, workflow_ref):
+                continue
+            created_at = datetime.fromisoformat(
+                run["createdAt"].replace("Z", "+00:00")
+            )
+            if created_at >= dispatched_at:
+                after_dispatch.append((created_at, run))
+            elif created_at >= earliest_created:
+                within_skew.append((created_at, run))
+        if after_dispatch:
+            return min(after_dispatch, key=lambda candidate: candidate[0])[1]
+        if within_skew:
+            return max(within_skew, key=lambda candidate: candidate[0])[1]
+        return None
+
+    def get_api_token(self) -> str:
+        """
+        Get a token for the GitHub REST API.
+
+        Returns:
+            Token from the `GITHUB_TOKEN` or `GH_TOKEN` environment variable, or from `gh auth token`
+        """
+        token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+        if token:
+            return token
+        stdout, _ = self.command_executor.execute(["gh", "auth", "token"])
+        return stdout.strip()
+
+    def create_run_watcher(
+        self,
+        on_status_change: Optional[Callable[[WorkflowRunStatus], None]] = None,
+    ) -> WorkflowRunWatcher:
+        """
+        Create a watcher tracking workflow runs of the current repository.
+
+        Args:
+            on_status_change: Function called with the new status of a run when it changes
+
+        Returns:
+            WorkflowRunWatcher using the GitHub REST API
+
+        Raises:
+            RuntimeError: If the repository URL cannot be determined
+        """
+        repository_url = self.git_service.get_repository_url()
+        if not repository_url:
+            raise RuntimeError("Could not determine the GitHub repository URL")
+        return WorkflowRunWatcher(
+            GitHubRestClient(token=self.get_api_token()),
+            repository_from_url(repository_url),
+            on_status_change=on_status_change,
+        )
+
     def parse_workflow_run_response(self, run_list_output: str) -> Optional[str]:
         """
         Parse the GitHub CLI response for workflow run information.
@@ -202,29 +971,252 @@ class GitHubWorkflowService:
             return None
 
 
+class GitHubRestWorkflowService(GitHubWorkflowService):
+    """GitHub workflow service calling the GitHub REST API instead of spawning `gh` processes.
+
+    Workflows are dispatched and their runs listed over one keep-alive connection. The token is
+    read once, from the `GITHUB_TOKEN` or `GH_TOKEN` environment variable or from `gh auth token`.
+    When no token or repository can be determined, the GitHub CLI is used as a fallback, and
+    dispatching and run listing fall back to the GitHub CLI when the API request fails.
+    """
+
+    # The GitHub CLI is only verified when it is needed as a fallback
+    VERIFY_GH_CLI_ON_INIT = False
+
+    def __init__(
+        self,
+        command_executor: CommandExecutor,
+        git_service: GitService,
+        correlation_input: Optional[str] = None,
+        run_lookup_timeout: float = 30.0,
+        client: Optional[GitHubRestClient] = None,
+        repository: Optional[str] = None,
+    ):
+        """
+        Initialize the GitHubRestWorkflowService.
+
+        Args:
+            command_executor: Executor for the gh and git fallback commands
+            git_service: Service providing repository information
+            correlation_input: Name of a workflow_dispatch input that receives a unique correlation id,
+                see GitHubWorkflowService
+            run_lookup_timeout: Maximum number of seconds to poll for the dispatched run
+            client: GitHub REST API client, created on first use if None
+            repository: Repository slug, e.g. `owner/name`, read from the `GITHUB_REPOSITORY`
+                environment variable or the origin remote if None
+        """
+        super().__init__(command_executor, git_service, correlation_input, run_lookup_timeout)
+        self._client = client
+        self._repository = repository
+        self._token: Optional[str] = None
+        self._rest_api_available = True
+        self._gh_cli_verified = False
+        self._lock = threading.Lock()
+
+    def get_api_token(self) -> str:
+        """
+        Get a token for the GitHub REST API, reading it only once.
+
+        Returns:
+            Token from the `GITHUB_TOKEN` or `GH_TOKEN` environment variable, or from `gh auth token`,
+            empty if neither is available
+        """
+        with self._lock:
+            if self._token is None:
+                try:
+                    self._token = super().get_api_token()
+                except Exception as e:
+                    print(f"Error getting GitHub token: {e}")
+                    self._token = ""
+            return self._token
+
+    def _get_repository(self) -> str:
+        """Return the repository slug, resolving it on first use."""
+        if self._repository is None:
+            repository = os.environ.get("GITHUB_REPOSITORY")
+            if not repository:
+                repository_url = self.git_service.get_repository_url()
+                if not repository_url:
+                    raise RuntimeError("Could not determine the GitHub repository URL")
+                repository = repository_from_url(repository_url)
+            self._repository = repository
+        return self._repository
+
+    def _get_client(self) -> GitHubRestClient:
+        """Return the shared REST client, creating it on first use."""
+        if self._client is None:
+            token = self.get_api_token()
+            if not token:
+                raise RuntimeError("No GitHub token available")
+            self._client = GitHubRestClient(token=token)
+        return self._client
+
+    def _rest_api(self) -> Optional[Tuple[GitHubRestClient, str]]:
+        """Return the client and repository, or None if the REST API cannot be used.
+
+        Once the client or repository cannot be determined, the REST API is not tried again.
+        """
+        if not self._rest_api_available:
+            return None
+        try:
+            return self._get_client(), self._get_repository()
+        except Exception as e:
+            self._rest_api_available = False
+            print(f"GitHub REST API unavailable, using GitHub CLI: {e}")
+            return None
+
+    def _verify_gh_cli_once(self) -> None:
+        """Verify the GitHub CLI before its first use as a fallback."""
+        if not self._gh_cli_verified:
+            self._verify_gh_cli_installed()
+            self._gh_cli_verified = True
+
+    def _dispatch(
+        self, workflow_file: str, workflow_inputs: Dict[str, str], workflow_ref: str
+    ) -> None:
+        """Send a workflow_dispatch event using the REST API."""
+        rest_api = self._rest_api()
+        if rest_api is not None:
+            client, repository = rest_api
+            workflow_name = os.path.basename(workflow_file)
+            try:
+                client.request(
+                    "POST",
+                    f"/repos/{repository}/actions/workflows/{workflow_name}/dispatches",
+                    body={"ref": workflow_ref, "inputs": workflow_inputs},
+                )
+                return
+            except GitHubConnectionError as e:
+                if e.sent:
+                    # GitHub may have started the workflow, so don't dispatch it twice
+                    raise
+                print(f"Error dispatching workflow via REST API, using GitHub CLI: {e}")
+            except RuntimeError as e:
+                # GitHub answered with an error status, so the workflow was not dispatched
+                print(f"Error dispatching workflow via REST API, using GitHub CLI: {e}")
+        self._verify_gh_cli_once()
+        super()._dispatch(workflow_file, workflow_inputs, workflow_ref)
+
+    async def _dispatch_async(
+        self, workflow_file: str, workflow_inputs: Dict[str, str], workflow_ref: str
+    ) -> None:
+        """Send a workflow_dispatch event using the REST API in a worker thread."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self._dispatch, workflow_file, workflow_inputs, workflow_ref
+        )
+
+    def _list_runs(self, workflow_file: str) -> List[Dict[str, Any]]:
+        """List recent workflow_dispatch runs of a workflow using the REST API, newest first."""
+        rest_api = self._rest_api()
+        if rest_api is not None:
+            client, repository = rest_api
+            workflow_name = os.path.basename(workflow_file)
+            try:
+                response = client.request(
+                    "GET",
+                    f"/repos/{repository}/actions/workflows/{workflow_name}/runs",
+                    params={"event": "workflow_dispatch", "per_page": 20},
+                )
+            except Exception as e:
+                print(f"Error listing workflow runs via REST API, using GitHub CLI: {e}")
+            else:
+                # Use the field names of `gh run list --json` so run matching is shared
+                return [
+                    {
+                        "databaseId": run["id"],
+                        "url": run.get("html_url"),
+                        "displayTitle": run.get("display_title", ""),
+                        "createdAt": run["created_at"],
+                        "headBranch": run.get("head_branch"),
+                    }
+                    for run in response.data.get("workflow_runs", [])
+                ]
+        self._verify_gh_cli_once()
+        return super()._list_runs(workflow_file)
+
+    def create_run_watcher(
+        self,
+        on_status_change: Optional[Callable[[WorkflowRunStatus], None]] = None,
+    ) -> WorkflowRunWatcher:
+        """
+        Create a watcher tracking workflow runs of the current repository.
+
+        The watcher shares the connection used for dispatching.
+
+        Args:
+            on_status_change: Function called with the new status of a run when it changes
+
+        Returns:
+            WorkflowRunWatcher using the GitHub REST API
+        """
+        return WorkflowRunWatcher(
+            self._get_client(), self._get_repository(), on_status_change=on_status_change
+        )
+
+
+def _create_workflow_service(
+    command_executor: CommandExecutor,
+    git_service: GitService,
+    correlation_input: Optional[str],
+    use_rest_api: bool,
+) -> GitHubWorkflowService:
+    """Create the REST or GitHub CLI based workflow service."""
+    service_class = GitHubRestWorkflowService if use_rest_api else GitHubWorkflowService
+    return service_class(
+        command_executor, git_service, correlation_input=correlation_input
+    )
+
+
 class GithubActionsDeployWorkflow(DeployWorkflow):
     """Implements the DeployWorkflow interface using GitHub Actions"""
 
-    def __init__(self, workflow_file: str = "deploy.yml", default_ref: str = "main"):
+    def __init__(
+        self,
+        workflow_file: str = "deploy.yml",
+        default_ref: str = "main",
+        correlation_input: Optional[str] = None,
+        use_rest_api: bool = True,
+        shard_count: int = 1,
+        flow_durations: Optional[Dict[str, float]] = None,
+    ):
         """
         Initialize the GitHub Actions deploy workflow.
 
         Args:
             workflow_file: The workflow file name (default: deploy.yml)
             default_ref: Default git ref to use if none provided in run() (default: main)
+            correlation_input: Optional name of a workflow input used to identify the dispatched run,
+                see GitHubWorkflowService
+            use_rest_api: Call the GitHub REST API directly instead of the GitHub CLI,
+                see GitHubRestWorkflowService
+            shard_count: Number of parallel workflow runs the flows are split into by run(),
+                values above 1 require `correlation_input`
+            flow_durations: Historical deploy time of each flow, used to balance the shards
         """
+        if shard_count > 1 and not correlation_input:
+            raise ValueError("Sharded deployment requires correlation_input to tell runs apart")
         self.workflow_file = workflow_file
         self.default_ref = default_ref
-        self.command_executor = CommandExecutor()
+        self.shard_count = shard_count
+        self.flow_durations = flow_durations
+        self.command_executor = CommandExecutor(timeout=DEFAULT_COMMAND_TIMEOUT)
         self.git_service = GitService(self.command_executor)
-        self.workflow_service = GitHubWorkflowService(
-            self.command_executor, self.git_service
+        self.workflow_service = _create_workflow_service(
+            self.command_executor, self.git_service, correlation_input, use_rest_api
         )
 
+    def _workflow_inputs(self, flows_to_deploy: List[str]) -> Dict[str, str]:
+        """Build workflow inputs, converting the flow list to a comma-separated string."""
+        return {"flows-to-deploy": ",".join(flows_to_deploy)}
+
     def run(self, flows_to_deploy: List[str], ref: Optional[str] = None, **kwargs) -> Optional[str]:
         """
         Run the deployment workflow for the specified flows using GitHub Actions.
 
+        With a shard_count above 1, one run is dispatched per shard and the URL of the first run is
+        returned once every run has started. Use dispatch_sharded() to get the URLs of all runs.
+
         Args:
             flows_to_deploy: List of flow names to deploy
             ref: The git ref (branch/tag) for the workflow (optional, uses default_ref if not provided)
@@ -237,15 +1229,12 @@ class GithubActionsDeployWorkflow(DeployWorkflow):
         if ref is None:
             ref = getattr(self, 'default_ref', 'main')
 
-        # Convert list to comma-separated string for GitHub Actions input
-        flows_str = ",".join(flows_to_deploy)
-
-        # Prepare workflow inputs
-        workflow_inputs = {"flows-to-deploy": flows_str}
+        if getattr(self, "shard_count", 1) > 1:
+            return self._run_sharded(flows_to_deploy, ref)
 
         # Trigger the workflow
         run_url = self.workflow_service.trigger_workflow(
-            self.workflow_file, workflow_inputs, ref
+            self.workflow_file, self._workflow_inputs(flows_to_deploy), ref
         )
 
         if run_url:
@@ -259,24 +1248,138 @@ class GithubActionsDeployWorkflow(DeployWorkflow):
             )
             return None
 
+    def dispatch(
+        self, flows_to_deploy: List[str], ref: Optional[str] = None, **kwargs
+    ) -> Optional[WorkflowRunHandle]:
+        """
+        Dispatch the deployment workflow and return without waiting for the run URL.
+
+        Args:
+            flows_to_deploy: List of flow names to deploy
+            ref: The git ref (branch/tag) for the workflow (optional, uses default_ref if not provided)
+            **kwargs: Additional workflow parameters (for future extensibility)
+
+        Returns:
+            Optional[WorkflowRunHandle]: Handle resolving to the run URL, None if the dispatch failed
+        """
+        if ref is None:
+            ref = self.default_ref
+        return self.workflow_service.dispatch_workflow(
+            self.workflow_file, self._workflow_inputs(flows_to_deploy), ref
+        )
+
+    def dispatch_sharded(
+        self,
+        flows_to_deploy: List[str],
+        ref: Optional[str] = None,
+        shard_count: Optional[int] = None,
+    ) -> WorkflowRunGroup:
+        """
+        Split the flows into balanced shards and dispatch one workflow run per shard.
+
+        Args:
+            flows_to_deploy: List of flow names to deploy
+            ref: The git ref (branch/tag) for the workflow (optional, uses default_ref if not provided)
+            shard_count: Number of shards, uses the shard_count of the workflow if not provided
+
+        Returns:
+            WorkflowRunGroup resolving to the URL of every run
+
+        Raises:
+            ValueError: If the workflow has no correlation_input
+        """
+        shards = self._shards(flows_to_deploy, shard_count)
+        handles = [self.dispatch(shard, ref) for shard in shards]
+        return WorkflowRunGroup(handles, shards)
+
+    def _shards(
+        self, flows_to_deploy: List[str], shard_count: Optional[int] = None
+    ) -> List[List[str]]:
+        """Split the flows into the shards of a sharded deployment."""
+        if not self.workflow_service.correlation_input:
+            raise ValueError("Sharded deployment requires correlation_input to tell runs apart")
+        return shard_flows(
+            flows_to_deploy, shard_count or self.shard_count, self.flow_durations
+        )
+
+    @staticmethod
+    def _report_shards(
+        shards: List[List[str]], run_urls: List[Optional[str]]
+    ) -> Optional[str]:
+        """Print the run of each shard and return the URL of the first run if all runs started."""
+        for shard, run_url in zip(shards, run_urls):
+            print(f"Deployment of {', '.join(shard)}: {run_url or 'failed to trigger'}")
+        if not run_urls or not all(run_urls):
+            print(
+                "Failed to trigger deployment workflow. Check your GitHub CLI installation and permissions."
+            )
+            return None
+        return run_urls[0]
+
+    def _run_sharded(self, flows_to_deploy: List[str], ref: str) -> Optional[str]:
+        """Run the sharded deployment and return the URL of the first run if all runs started."""
+        group = self.dispatch_sharded(flows_to_deploy, ref)
+        return self._report_shards(group.shards, group.result())
+
+    def create_run_watcher(
+        self,
+        on_status_change: Optional[Callable[[WorkflowRunStatus], None]] = None,
+    ) -> WorkflowRunWatcher:
+        """
+        Create a watcher for runs of this workflow, e.g. to track URLs returned by run().
+
+        Args:
+            on_status_change: Function called with the new status of a run when it changes
+
+        Returns:
+            WorkflowRunWatcher using the GitHub REST API
+        """
+        return self.workflow_service.create_run_watcher(on_status_change)
+
 
 class GithubActionsPromoteWorkflow(PromoteWorkflow):
     """Implements the PromoteWorkflow interface using GitHub Actions."""
 
-    def __init__(self, workflow_file: str = "promote.yml"):
+    def __init__(
+        self,
+        workflow_file: str = "promote.yml",
+        correlation_input: Optional[str] = None,
+        use_rest_api: bool = True,
+    ):
         """
         Initialize the GitHub Actions promote workflow.
 
         Args:
             workflow_file: The workflow file name (default: promote.yml)
+            correlation_input: Optional name of a workflow input used to identify the dispatched run,
+                see GitHubWorkflowService
+            use_rest_api: Call the GitHub REST API directly instead of the GitHub CLI,
+                see GitHubRestWorkflowService
         """
         self.workflow_file = workflow_file
-        self.command_executor = CommandExecutor()
+        self.command_executor = CommandExecutor(timeout=DEFAULT_COMMAND_TIMEOUT)
         self.git_service = GitService(self.command_executor)
-        self.workflow_service = GitHubWorkflowService(
-            self.command_executor, self.git_service
+        self.workflow_service = _create_workflow_service(
+            self.command_executor, self.git_service, correlation_input, use_rest_api
         )
 
+    @staticmethod
+    def _workflow_inputs(
+        flows_to_deploy: List[str],
+        source_env: Optional[str],
+        target_env: Optional[str],
+        ref: Optional[str],
+    ) -> Dict[str, str]:
+        """Validate required parameters and build workflow inputs."""
+        if not source_env or not target_env or not ref:
+            raise ValueError("source_env, target_env, and ref are required parameters")
+
+        return {
+            "flows-to-deploy": ",".join(flows_to_deploy),
+            "source-env": source_env,
+            "target-env": target_env,
+        }
+
     def run(self, flows_to_deploy: List[str], source_env: Optional[str] = None, target_env: Optional[str] = None, ref: Optional[str] = None, **kwargs) -> Optional[str]:
         """
         Run the promotion workflow for the specified flows using GitHub Actions.
@@ -291,19 +1394,9 @@ class GithubActionsPromoteWorkflow(PromoteWorkflow):
         Returns:
             Optional[str]: URL of the workflow run if successful, None otherwise
         """
-        # Validate required parameters
-        if not source_env or not target_env or not ref:
-            raise ValueError("source_env, target_env, and ref are required parameters")
-
-        # Convert list to comma-separated string for GitHub Actions input
-        flows_str = ",".join(flows_to_deploy)
-
-        # Prepare workflow inputs
-        workflow_inputs = {
-            "flows-to-deploy": flows_str,
-            "source-env": source_env,
-            "target-env": target_env,
-        }
+        workflow_inputs = self._workflow_inputs(
+            flows_to_deploy, source_env, target_env, ref
+        )
 
         # Trigger the workflow
         run_url = self.workflow_service.trigger_workflow(
@@ -320,3 +1413,161 @@ class GithubActionsPromoteWorkflow(PromoteWorkflow):
                 "Failed to trigger promotion workflow. Check your GitHub CLI installation and permissions."
             )
             return None
+
+    def dispatch(
+        self,
+        flows_to_deploy: List[str],
+        source_env: Optional[str] = None,
+        target_env: Optional[str] = None,
+        ref: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[WorkflowRunHandle]:
+        """
+        Dispatch the promotion workflow and return without waiting for the run URL.
+
+        Args:
+            flows_to_deploy: List of flow names to promote
+            source_env: Source environment (required)
+            target_env: Target environment (required)
+            ref: The git ref (branch/tag) for the workflow (required)
+            **kwargs: Additional workflow parameters (for future extensibility)
+
+        Returns:
+            Optional[WorkflowRunHandle]: Handle resolving to the run URL, None if the dispatch failed
+        """
+        workflow_inputs = self._workflow_inputs(
+            flows_to_deploy, source_env, target_env, ref
+        )
+        return self.workflow_service.dispatch_workflow(
+            self.workflow_file, workflow_inputs, ref
+        )
+
+    def create_run_watcher(
+        self,
+        on_status_change: Optional[Callable[[WorkflowRunStatus], None]] = None,
+    ) -> WorkflowRunWatcher:
+        """
+        Create a watcher for runs of this workflow, e.g. to track URLs returned by run().
+
+        Args:
+            on_status_change: Function called with the new status of a run when it changes
+
+        Returns:
+            WorkflowRunWatcher using the GitHub REST API
+        """
+        return self.workflow_service.create_run_watcher(on_status_change)
+
+
+class AsyncGithubActionsDeployWorkflow(AsyncDeployWorkflow):
+    """Implements the AsyncDeployWorkflow interface using GitHub Actions.
+
+    Dispatches runs with the asynchronous methods of GitHubWorkflowService, so several
+    deployments, or the shards of one, are dispatched concurrently on one event loop.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        Initialize the workflow.
+
+        Args:
+            *args: Positional arguments of GithubActionsDeployWorkflow
+            **kwargs: Keyword arguments of GithubActionsDeployWorkflow
+        """
+        self.workflow = GithubActionsDeployWorkflow(*args, **kwargs)
+
+    async def run(
+        self, flows_to_deploy: List[str], ref: Optional[str] = None, **kwargs
+    ) -> Optional[str]:
+        """
+        Run the deployment workflow for the specified flows, see GithubActionsDeployWorkflow.run.
+
+        Args:
+            flows_to_deploy: List of flow names to deploy
+            ref: The git ref (branch/tag) for the workflow (optional, uses default_ref if not provided)
+            **kwargs: Additional workflow parameters (for future extensibility)
+
+        Returns:
+            Optional[str]: URL of the workflow run if successful, None otherwise
+        """
+        workflow = self.workflow
+        if ref is None:
+            ref = workflow.default_ref
+        service = workflow.workflow_service
+
+        if workflow.shard_count > 1:
+            shards = workflow._shards(flows_to_deploy)
+            run_urls = await asyncio.gather(
+                *(
+                    service.trigger_workflow_async(
+                        workflow.workflow_file, workflow._workflow_inputs(shard), ref
+                    )
+                    for shard in shards
+                )
+            )
+            return workflow._report_shards(shards, list(run_urls))
+
+        run_url = await service.trigger_workflow_async(
+            workflow.workflow_file, workflow._workflow_inputs(flows_to_deploy), ref
+        )
+
+        if run_url:
+            print(
+                f"Deployment workflow triggered successfully. You can monitor it at: {run_url}"
+            )
+            return run_url
+        print(
+            "Failed to trigger deployment workflow. Check your GitHub CLI installation and permissions."
+        )
+        return None
+
+
+class AsyncGithubActionsPromoteWorkflow(AsyncPromoteWorkflow):
+    """Implements the AsyncPromoteWorkflow interface using GitHub Actions."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        Initialize the workflow.
+
+        Args:
+            *args: Positional arguments of GithubActionsPromoteWorkflow
+            **kwargs: Keyword arguments of GithubActionsPromoteWorkflow
+        """
+        self.workflow = GithubActionsPromoteWorkflow(*args, **kwargs)
+
+    async def run(
+        self,
+        flows_to_deploy: List[str],
+        source_env: Optional[str] = None,
+        target_env: Optional[str] = None,
+        ref: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[str]:
+        """
+        Run the promotion workflow for the specified flows, see GithubActionsPromoteWorkflow.run.
+
+        Args:
+            flows_to_deploy: List of flow names to promote
+            source_env: Source environment (required)
+            target_env: Target environment (required)
+            ref: The git ref (branch/tag) for the workflow (required)
+            **kwargs: Additional workflow parameters (for future extensibility)
+
+        Returns:
+            Optional[str]: URL of the workflow run if successful, None otherwise
+        """
+        workflow_inputs = self.workflow._workflow_inputs(
+            flows_to_deploy, source_env, target_env, ref
+        )
+        run_url = await self.workflow.workflow_service.trigger_workflow_async(
+            self.workflow.workflow_file, workflow_inputs, ref
+        )
+
+        if run_url:
+            print(
+                f"Promotion workflow triggered successfully. You can monitor it at: {run_url}"
+            )
+            return run_url
+        print(
+            "Failed to trigger promotion workflow. Check your GitHub CLI installation and permissions."
+        )
+        return None
@@ -0,0 +1,219 @@
+import http.client
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode, urlsplit
+
+from ..tracing import span
+
+DEFAULT_API_URL = "https://api.github.com"
+
+# Methods that are safe to send again when the response was lost
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
+@dataclass
+class GitHubResponse:
+    """Response of a GitHub REST API request.
+
+    Attributes:
+        status: HTTP status code
+        headers: Response headers with lower-case names
+        data: Decoded JSON body, None for empty bodies and 304 responses
+    """
+
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    data: Any = None
+
+
+class GitHubConnectionError(ConnectionError):
+    """Request that failed without a response from GitHub.
+
+    Attributes:
+        sent: Whether the request was written to the connection, in which case GitHub
+            may have processed it
+    """
+
+    def __init__(self, message: str, sent: bool):
+        super().__init__(message)
+        self.sent = sent
+
+
+def repository_from_url(repository_url: str) -> str:
+    """
+    Convert a GitHub repository URL into an `owner/name` slug.
+
+    Args:
+        repository_url: HTTPS or SSH URL of the repository
+
+    Returns:
+        Repository slug, e.g. `owner/name`
+
+    Raises:
+        ValueError: If the URL does not point to a repository
+    """
+    path = repository_url.strip()
+    if path.startswith("git@"):
+        path = path.split(":", 1)[1]
+    else:
+        path = urlsplit(path).path
+    path = path.strip("/")
+    if path.endswith(".git"):
+        path = path[:-4]
+    parts = path.split("/")
+    if len(parts) != 2 or not all(parts):
+        raise ValueError(f"Not a GitHub repository URL: {repository_url}")
+    return path
+
+
+class GitHubRestClient:
+    """Minimal GitHub REST API client reusing one keep-alive connection for all requests."""
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        api_url: Optional[str] = None,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            token: GitHub token, read from the `GITHUB_TOKEN` or `GH_TOKEN` environment variable if None
+            api_url: Base URL of the API, read from `GITHUB_API_URL` or defaults to https://api.github.com
+            timeout: Socket timeout in seconds for each request
+        """
+        self.token = (
+            token or os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+        )
+        self.api_url = (
+            api_url or os.environ.get("GITHUB_API_URL") or DEFAULT_API_URL
+        ).rstrip("/")
+        self.timeout = timeout
+        parsed = urlsplit(self.api_url)
+        self._scheme = parsed.scheme
+        self._netloc = parsed.netloc
+        self._base_path = parsed.path
+        self._connection: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        """Return the open connection, creating it on first use."""
+        if self._connection is None:
+            connection_class = (
+                http.client.HTTPSConnection
+                if self._scheme == "https"
+                else http.client.HTTPConnection
+            )
+            self._connection = connection_class(self._netloc, timeout=self.timeout)
+        return self._connection
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> GitHubResponse:
+        """
+        Send a request to the GitHub REST API.
+
+        Args:
+            method: HTTP method
+            path: API path, e.g. `/repos/owner/name/actions/runs/1`
+            params: Query string parameters
+            body: JSON body
+            headers: Additional request headers, e.g. `If-None-Match`
+
+        Returns:
+            GitHubResponse with status, headers and decoded JSON body
+
+        Raises:
+            RuntimeError: If GitHub responds with a status of 400 or above
+            GitHubConnectionError: If the request failed without a response
+        """
+        url = f"{self._base_path}{path}"
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        request_headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "acme-portal-sdk",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if self.token:
+            request_headers["Authorization"] = f"Bearer {self.token}"
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode("utf-8")
+            request_headers["Content-Type"] = "application/json"
+        request_headers.update(headers or {})
+
+        with span("http.request", method=method, url=path) as current, self._lock:
+            response = self._send(method, url, payload, request_headers)
+            current.set_attribute("status_code", response.status)
+
+        if response.status >= 400:
+            raise RuntimeError(
+                f"GitHub API {method} {path} failed: HTTP {response.status} {response.data}"
+            )
+        return response
+
+    def _send(
+        self, method: str, url: str, payload: Optional[bytes], headers: Dict[str, str]
+    ) -> GitHubResponse:
+        """Send a request on the shared connection and read the full response.
+
+        The server may close an idle keep-alive connection, so a failed request is sent
+        once more on a new connection. Requests with other methods than GET and HEAD are
+        only sent again if they could not be written to a reused connection, as GitHub
+        may already have processed a request whose response was lost.
+        """
+        for attempt in range(2):
+            reused = self._connection is not None
+            connection = self._get_connection()
+            try:
+                connection.request(method, url, body=payload, headers=headers)
+            except (http.client.HTTPException, OSError) as e:
+                self._reset_connection()
+                if attempt == 0 and (reused or method in IDEMPOTENT_METHODS):
+                    continue
+                raise GitHubConnectionError(
+                    f"GitHub API {method} {url} could not be sent: {e}", sent=False
+                ) from e
+            try:
+                response = connection.getresponse()
+                raw = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                self._reset_connection()
+                if attempt == 0 and method in IDEMPOTENT_METHODS:
+                    continue
+                raise GitHubConnectionError(
+                    f"GitHub API {method} {url} got no response: {e}", sent=True
+                ) from e
+            break
+        try:
+            data = json.loads(raw) if raw else None
+        except ValueError:
+            data = raw.decode("utf-8", errors="replace")
+        return GitHubResponse(
+            status=response.status,
+            headers={key.lower(): value for key, value in response.getheaders()},
+            data=data,
+        )
+
+    def _reset_connection(self) -> None:
+        """Close the shared connection so that the next request opens a new one."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
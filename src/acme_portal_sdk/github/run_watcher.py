@@ -0,0 +1,235 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Union
+
+from .rest_client import GitHubRestClient
+
+# Seconds between polls of a run, by run status
+POLL_INTERVALS = {
+    "requested": 5.0,
+    "queued": 10.0,
+    "pending": 10.0,
+    "waiting": 30.0,
+    "in_progress": 5.0,
+}
+DEFAULT_POLL_INTERVAL = 5.0
+
+
+@dataclass
+class WorkflowRunStatus:
+    """Status of a GitHub Actions workflow run.
+
+    Attributes:
+        run_id: Identifier of the run
+        status: Run status, e.g. `queued`, `in_progress` or `completed`
+        conclusion: Result of a completed run, e.g. `success` or `failure`, None otherwise
+        url: URL of the run on GitHub
+    """
+
+    run_id: int
+    status: str
+    conclusion: Optional[str]
+    url: str
+
+    @property
+    def completed(self) -> bool:
+        """Whether the run has finished."""
+        return self.status == "completed"
+
+
+def run_id_from_url(run_url: str) -> int:
+    """
+    Extract the run id from a workflow run URL.
+
+    Args:
+        run_url: URL like https://github.com/owner/name/actions/runs/123
+
+    Returns:
+        The run id
+    """
+    return int(run_url.rstrip("/").rsplit("/", 1)[1])
+
+
+@dataclass
+class _WatchedRun:
+    etag: Optional[str] = None
+    status: Optional[WorkflowRunStatus] = None
+    next_poll_at: float = 0.0
+
+
+class WorkflowRunWatcher:
+    """Tracks many GitHub Actions workflow runs until they complete.
+
+    Each run is polled with an `If-None-Match` conditional request, so unchanged runs are answered
+    with `304 Not Modified`, which does not count against the GitHub API rate limit. The interval
+    between polls of a run depends on its status. `on_status_change` is called whenever the status
+    or conclusion of a run changes. Completed runs stop being polled.
+    """
+
+    def __init__(
+        self,
+        client: GitHubRestClient,
+        repository: str,
+        on_status_change: Optional[Callable[[WorkflowRunStatus], None]] = None,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            client: GitHub REST API client
+            repository: Repository slug, e.g. `owner/name`
+            on_status_change: Function called with the new status of a run when it changes
+        """
+        self.client = client
+        self.repository = repository
+        self.on_status_change = on_status_change
+        self._runs: Dict[int, _WatchedRun] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, run: Union[int, str]) -> int:
+        """
+        Start tracking a run.
+
+        Args:
+            run: Run id or run URL
+
+        Returns:
+            The run id
+        """
+        run_id = run_id_from_url(run) if isinstance(run, str) else run
+        with self._lock:
+            self._runs.setdefault(run_id, _WatchedRun())
+        return run_id
+
+    def unwatch(self, run_id: int) -> None:
+        """Stop tracking a run."""
+        with self._lock:
+            self._runs.pop(run_id, None)
+
+    @property
+    def statuses(self) -> Dict[int, Optional[WorkflowRunStatus]]:
+        """Last known status of each tracked run, None if not fetched yet."""
+        with self._lock:
+            return {run_id: run.status for run_id, run in self._runs.items()}
+
+    def pending(self) -> List[int]:
+        """Ids of tracked runs that have not completed."""
+        with self._lock:
+            return [
+                run_id
+                for run_id, run in self._runs.items()
+                if run.status is None or not run.status.completed
+            ]
+
+    def _poll_run(
+        self, run_id: int, watched: _WatchedRun
+    ) -> Optional[WorkflowRunStatus]:
+        """Fetch one run and return its status if it changed."""
+        headers = {"If-None-Match": watched.etag} if watched.etag else {}
+        response = self.client.request(
+            "GET", f"/repos/{self.repository}/actions/runs/{run_id}", headers=headers
+        )
+        if response.status == 304:
+            return None
+
+        watched.etag = response.headers.get("etag", watched.etag)
+        data = response.data
+        status = WorkflowRunStatus(
+            run_id=run_id,
+            status=data["status"],
+            conclusion=data.get("conclusion"),
+            url=data.get("html_url", ""),
+        )
+        if status == watched.status:
+            return None
+        watched.status = status
+        return status
+
+    def poll(self) -> List[WorkflowRunStatus]:
+        """
+        Poll every tracked, incomplete run that is due and report changes.
+
+        Returns:
+            New statuses of runs whose status changed
+        """
+        now = time.monotonic()
+        with self._lock:
+            due = [
+                (run_id, run)
+                for run_id, run in self._runs.items()
+                if (run.status is None or not run.status.completed)
+                and run.next_poll_at <= now
+            ]
+
+        changed = []
+        for run_id, watched in due:
+            try:
+                status = self._poll_run(run_id, watched)
+            except Exception as e:
+                print(f"Error polling workflow run {run_id}: {e}")
+                status = None
+            current = watched.status.status if watched.status else None
+            watched.next_poll_at = time.monotonic() + POLL_INTERVALS.get(
+                current, DEFAULT_POLL_INTERVAL
+            )
+            if status is not None:
+                changed.append(status)
+                if self.on_status_change is not None:
+                    self.on_status_change(status)
+        return changed
+
+    def _next_poll_delay(self) -> float:
+        """Seconds until the next tracked run is due."""
+        with self._lock:
+            due_times = [
+                run.next_poll_at
+                for run in self._runs.values()
+                if run.status is None or not run.status.completed
+            ]
+        if not due_times:
+            return 0.0
+        return max(min(due_times) - time.monotonic(), 0.0)
+
+    def wait(
+        self, timeout: Optional[float] = None
+    ) -> Dict[int, Optional[WorkflowRunStatus]]:
+        """
+        Poll until all tracked runs complete.
+
+        Args:
+            timeout: Maximum number of seconds to wait, waits until completion if None
+
+        Returns:
+            Last known status of each tracked run
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.pending() and not self._stop.is_set():
+            self.poll()
+            if not self.pending():
+                break
+            delay = self._next_poll_delay()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                delay = min(delay, remaining)
+            self._stop.wait(delay)
+        return self.statuses
+
+    def start(self) -> None:
+        """Poll in a background thread until all tracked runs complete or `stop` is called."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.wait, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background polling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
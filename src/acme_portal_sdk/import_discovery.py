@@ -0,0 +1,511 @@
+"""Runtime discovery of flows and DAGs by importing modules in isolated workers.
+
+The AST based finders only see flows and DAGs written out literally in the source.
+Objects built in loops or by factory functions are only visible after the module runs.
+`ImportDiscovery` imports each candidate module in its own Python process, limited in
+time and memory, and reports the Airflow `DAG` and Prefect `Flow` objects it defines.
+Results are cached by the content of the module and of the project modules it imports,
+so repeat runs only import changed modules. Imports that time out or whose worker dies
+before answering are retried on the next run.
+
+Running this file as a script starts a worker: it reads a request as JSON from stdin and
+writes the discovered objects as JSON to stdout.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+DEFAULT_CACHE_PATH = (
+    Path.home() / ".cache" / "acme_portal_sdk" / "import_discovery.json"
+)
+
+# Object kinds that can be discovered, with the class name, the package defining the
+# class and a case-insensitive text that a module must contain to be imported
+KINDS = {
+    "airflow": ("DAG", "airflow", "dag"),
+    "prefect": ("Flow", "prefect", "flow"),
+}
+
+_CACHE_VERSION = 1
+
+
+@dataclass
+class DiscoveredObject:
+    """A flow or DAG found by importing a module.
+
+    Attributes:
+        name: DAG ID or flow name
+        obj_name: Name of the module global holding the object, empty if it is not held
+            by one
+        description: Description of the DAG or flow
+    """
+
+    name: str
+    obj_name: str
+    description: str = ""
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert the DiscoveredObject to a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "obj_name": self.obj_name,
+            "description": self.description,
+        }
+
+
+def module_import_path(
+    root_dir: str, file_path: str, package_name: Optional[str] = None
+) -> str:
+    """Return a file's import path, by default in the package named after its root."""
+    relative = os.path.splitext(os.path.relpath(file_path, start=root_dir))[0]
+    package_name = package_name or os.path.basename(os.path.abspath(root_dir))
+    parts = [*package_name.split("."), *relative.split(os.sep)]
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def import_root(root_dir: str, package_name: str) -> str:
+    """
+    Return the directory to put on `sys.path` to import a root directory under a package
+    name.
+
+    Args:
+        root_dir: Package directory
+        package_name: Import path of the root directory, e.g. `company.flows`
+
+    Returns:
+        Directory `package_name.count(".") + 1` levels above the root directory
+
+    Raises:
+        ValueError: If the root directory path does not end with the parts of the
+            package name, so the modules could not be imported under that name
+    """
+    directory = os.path.abspath(root_dir)
+    for part in reversed(package_name.split(".")):
+        if os.path.basename(directory) != part:
+            raise ValueError(
+                f"Cannot import {root_dir} as package {package_name!r}, the directory "
+                f"path must end with {package_name.replace('.', os.sep)}"
+            )
+        directory = os.path.dirname(directory)
+    return directory
+
+
+class ImportDiscovery:
+    """Finds Airflow DAGs and Prefect flows by importing modules in worker processes.
+
+    Each module is imported by a fresh Python process with the directory holding the
+    package on `sys.path`, see `import_root`, so it is imported under the same path the
+    finders report. A worker that exceeds the timeout is killed, and its address space
+    is limited to the memory limit on platforms supporting `resource.setrlimit`. Errors
+    raised by the import are reported and cached like results. Timeouts and workers
+    killed before answering are reported but not cached, as they may be caused by a busy
+    machine rather than by the module.
+
+    The cache key of a module is a hash of its content, the hashes of the project
+    modules it imports, directly or indirectly, including parent packages, and the
+    installed distributions.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        memory_limit_mb: Optional[int] = 1024,
+        max_workers: Optional[int] = None,
+        cache_path: Optional[Union[str, Path]] = DEFAULT_CACHE_PATH,
+    ):
+        """
+        Initialize the discovery engine.
+
+        Args:
+            timeout: Seconds a module may take to import
+            memory_limit_mb: Address space limit of a worker in MiB, None for no limit
+            max_workers: Number of modules imported at the same time, the CPU count if
+                None
+            cache_path: JSON file persisting results between runs, None to cache in
+                memory only
+        """
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._environment: Optional[str] = None
+
+    def discover(
+        self,
+        kind: str,
+        root_dir: str,
+        file_paths: Iterable[str],
+        package_name: Optional[str] = None,
+    ) -> Dict[str, List[DiscoveredObject]]:
+        """
+        Import candidate modules and collect the DAGs or flows they define.
+
+        Files that do not mention the kind's marker text (`dag` or `flow`, ignoring
+        case) are not imported.
+
+        Args:
+            kind: "airflow" or "prefect"
+            root_dir: Package directory the files belong to
+            file_paths: Python files to consider
+            package_name: Import path of the root directory, its name if None
+
+        Returns:
+            Dictionary mapping each imported file to the objects it defines. Files that
+            failed to import map to an empty list.
+
+        Raises:
+            ValueError: If the kind is unknown or the root directory cannot be imported
+                under the package name
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind {kind!r}, use one of {', '.join(KINDS)}")
+        marker = KINDS[kind][2]
+        root_dir = os.path.abspath(root_dir)
+        package_name = package_name or os.path.basename(root_dir)
+        root = import_root(root_dir, package_name)
+        fingerprints = _Fingerprints(
+            root_dir, package_name, self._environment_fingerprint()
+        )
+        cache = self._load_cache()
+
+        results: Dict[str, List[DiscoveredObject]] = {}
+        to_import = []
+        for file_path in file_paths:
+            file_path = os.path.abspath(file_path)
+            content = fingerprints.content(file_path)
+            if content is None or marker not in content.lower():
+                continue
+            key = f"{kind}:{package_name}:{file_path}"
+            fingerprint = fingerprints.of(file_path)
+            entry = cache.get(key)
+            if entry is not None and entry["fingerprint"] == fingerprint:
+                results[file_path] = [
+                    DiscoveredObject(**item) for item in entry["objects"]
+                ]
+            else:
+                to_import.append((key, file_path, fingerprint))
+
+        if to_import:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                imported = executor.map(
+                    lambda item: self._import_module(
+                        kind, root_dir, package_name, item[1], root
+                    ),
+                    to_import,
+                )
+                for (key, file_path, fingerprint), (objects, error, answered) in zip(
+                    to_import, imported
+                ):
+                    if error is not None:
+                        print(f"Error importing {file_path}: {error}", file=sys.stderr)
+                    results[file_path] = objects
+                    if not answered:
+                        continue
+                    cache[key] = {
+                        "fingerprint": fingerprint,
+                        "objects": [item.to_dict() for item in objects],
+                        "error": error,
+                    }
+            self._save_cache()
+        return results
+
+    def clear_cache(self) -> None:
+        """Forget all cached results, so every module is imported again."""
+        self._cache = {}
+        self._save_cache()
+
+    def _import_module(
+        self, kind: str, root_dir: str, package_name: str, file_path: str, root: str
+    ):
+        """
+        Import one module in a worker process.
+
+        Returns:
+            Tuple of the objects found, the error message or None, and whether the
+            worker answered
+        """
+        request = {
+            "kind": kind,
+            "module": module_import_path(root_dir, file_path, package_name),
+            "sys_path": [root, *sys.path],
+            "memory_limit": (
+                self.memory_limit_mb * 1024 * 1024
+                if self.memory_limit_mb is not None
+                else None
+            ),
+        }
+        try:
+            # Isolated mode keeps this file's directory, which holds the SDK's airflow
+            # and prefect packages, off sys.path; the worker uses the path sent in the
+            # request instead
+            completed = subprocess.run(
+                [sys.executable, "-I", os.path.abspath(__file__)],
+                input=json.dumps(request),
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                cwd=root,
+            )
+        except subprocess.TimeoutExpired:
+            return [], f"Import timed out after {self.timeout:g} seconds", False
+
+        try:
+            response = json.loads(completed.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            # Killed before answering, e.g. by the memory limit
+            lines = completed.stderr.strip().splitlines()
+            detail = lines[-1] if lines else f"exit code {completed.returncode}"
+            return [], f"Worker failed: {detail}", False
+        objects = [DiscoveredObject(**item) for item in response["objects"]]
+        return objects, response["error"], True
+
+    def _environment_fingerprint(self) -> str:
+        """Hash of the interpreter and installed distributions, computed once."""
+        if self._environment is None:
+            from importlib.metadata import distributions
+
+            installed = sorted(
+                f"{dist.metadata['Name']}=={dist.version}" for dist in distributions()
+            )
+            self._environment = _hash(
+                "\n".join([sys.version, sys.executable, *installed])
+            )
+        return self._environment
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_path is not None and self.cache_path.exists():
+                try:
+                    with open(self.cache_path, "r", encoding="utf-8") as file:
+                        data = json.load(file)
+                    if data.get("version") == _CACHE_VERSION:
+                        self._cache = data["entries"]
+                except (OSError, ValueError) as e:
+                    print(
+                        "Ignoring unreadable import discovery cache "
+                        f"{self.cache_path}: {e}",
+                        file=sys.stderr,
+                    )
+        return self._cache
+
+    def _save_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.cache_path.with_name(
+            f"{self.cache_path.name}.{os.getpid()}.tmp"
+        )
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump({"version": _CACHE_VERSION, "entries": self._cache}, file)
+        os.replace(temporary, self.cache_path)
+
+
+class _Fingerprints:
+    """Content hashes of project modules, combined with those of their imports."""
+
+    def __init__(self, root_dir: str, package_name: str, environment: str):
+        self.root_dir = root_dir
+        self.package_name = package_name
+        self.environment = environment
+        self._contents: Dict[str, Optional[str]] = {}
+        self._fingerprints: Dict[str, str] = {}
+
+    def content(self, file_path: str) -> Optional[str]:
+        if file_path not in self._contents:
+            try:
+                with open(file_path, "r", encoding="utf-8") as file:
+                    self._contents[file_path] = file.read()
+            except (OSError, UnicodeDecodeError):
+                self._contents[file_path] = None
+        return self._contents[file_path]
+
+    def of(self, file_path: str) -> str:
+        """Fingerprint of a module and every project module it depends on."""
+        if file_path not in self._fingerprints:
+            dependencies: Set[str] = set()
+            self._collect(file_path, dependencies)
+            self._fingerprints[file_path] = _hash(
+                "\n".join(
+                    [
+                        self.environment,
+                        *(
+                            f"{path}:{_hash(self.content(path) or '')}"
+                            for path in sorted(dependencies)
+                        ),
+                    ]
+                )
+            )
+        return self._fingerprints[file_path]
+
+    def _collect(self, file_path: str, seen: Set[str]) -> None:
+        """Add a module, its parents and the project modules it imports to `seen`."""
+        if file_path in seen:
+            return
+        seen.add(file_path)
+        module = module_import_path(self.root_dir, file_path, self.package_name)
+        parts = module.split(".")
+        for index in range(self.package_name.count(".") + 1, len(parts)):
+            package = self._module_file(".".join(parts[:index]))
+            if package is not None:
+                self._collect(package, seen)
+        for imported in self._imports(file_path, module):
+            self._collect(imported, seen)
+
+    def _imports(self, file_path: str, module: str) -> List[str]:
+        """Files of the project modules imported by a module."""
+        content = self.content(file_path)
+        if content is None:
+            return []
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            return []
+        is_package = os.path.basename(file_path) == "__init__.py"
+        package = module.split(".") if is_package else module.split(".")[:-1]
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    base_parts = package[: len(package) - node.level + 1]
+                    base = ".".join(
+                        [*base_parts, *([node.module] if node.module else [])]
+                    )
+                else:
+                    base = node.module or ""
+                names.append(base)
+                names.extend(f"{base}.{alias.name}" for alias in node.names)
+        files = []
+        for name in names:
+            imported = self._module_file(name)
+            if imported is not None:
+                files.append(imported)
+        return files
+
+    def _module_file(self, module: str) -> Optional[str]:
+        """File of a module inside the root directory, None for other modules."""
+        if module != self.package_name and not module.startswith(
+            f"{self.package_name}."
+        ):
+            return None
+        base = os.path.join(
+            self.root_dir, *module[len(self.package_name) + 1 :].split(".")
+        )
+        for candidate in (f"{base}.py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _is_instance_of(obj: Any, class_name: str, package: str) -> bool:
+    """Check the class of an object by name, without importing its defining package."""
+    return any(
+        cls.__name__ == class_name and cls.__module__.split(".")[0] == package
+        for cls in type(obj).__mro__
+    )
+
+
+def _describe(kind: str, obj: Any, obj_name: str) -> Dict[str, str]:
+    return {
+        "name": obj.dag_id if kind == "airflow" else obj.name,
+        "obj_name": obj_name,
+        "description": getattr(obj, "description", "") or "",
+    }
+
+
+def _find_objects(
+    kind: str, module_name: str, preloaded: Set[str]
+) -> List[Dict[str, str]]:
+    """Collect the objects defined by an imported module.
+
+    Objects also held by project modules the module imported are defined there, not
+    here.
+    """
+    class_name, package, _ = KINDS[kind]
+    module = sys.modules[module_name]
+    project = module_name.split(".")[0]
+    dependencies = [
+        vars(other)
+        for name, other in list(sys.modules.items())
+        if other is not None
+        and name != module_name
+        and name not in preloaded
+        and name.split(".")[0] == project
+    ]
+    found = []
+    seen = set()
+    for obj_name, obj in list(vars(module).items()):
+        if id(obj) in seen or not _is_instance_of(obj, class_name, package):
+            continue
+        if any(namespace.get(obj_name) is obj for namespace in dependencies):
+            continue
+        seen.add(id(obj))
+        found.append(_describe(kind, obj, obj_name))
+    if kind == "airflow":
+        # DAGs created in a `with DAG(...)` block are registered even when not kept in a
+        # global
+        dag_module = sys.modules.get("airflow.models.dag")
+        registered = getattr(
+            getattr(dag_module, "DagContext", None), "autoregistered_dags", ()
+        )
+        for dag, dag_module_name in list(registered):
+            registered_in = getattr(dag_module_name, "__name__", dag_module_name)
+            if id(dag) not in seen and registered_in == module_name:
+                seen.add(id(dag))
+                found.append(_describe(kind, dag, ""))
+    return found
+
+
+def _worker_main() -> None:
+    """Import the requested module and write the objects it defines to stdout."""
+    request = json.loads(sys.stdin.read())
+    if request.get("memory_limit"):
+        try:
+            import resource
+
+            limit = request["memory_limit"]
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            pass
+    sys.path[:] = request["sys_path"]
+
+    output = sys.stdout
+    # Keep anything printed by the imported module out of the response
+    sys.stdout = sys.stderr
+    response: Dict[str, Any] = {"objects": [], "error": None}
+    try:
+        import importlib
+
+        preloaded = set(sys.modules)
+        importlib.import_module(request["module"])
+        response["objects"] = _find_objects(
+            request["kind"], request["module"], preloaded
+        )
+    except BaseException as e:
+        # SystemExit and MemoryError raised by the module are import failures too
+        traceback.print_exc(file=sys.stderr)
+        response["error"] = f"{type(e).__name__}: {e}"
+    output.write(json.dumps(response) + "\n")
+    output.flush()
+
+
+if __name__ == "__main__":
+    _worker_main()
@@ -0,0 +1,177 @@
+"""Flow finding across several package directories, e.g. the packages of a monorepo.
+
+`MultiRootFlowFinder` scans each directory with a finder of its own, concurrently, and
+merges their flows. Selective refetches only scan the directories holding the requested
+flows.
+"""
+
+import os
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from .flow_finder import FlowDetails, FlowFinder
+
+
+@dataclass
+class FlowRoot:
+    """A directory of flows scanned as one shard of a MultiRootFlowFinder.
+
+    Attributes:
+        root_dir: Package directory to scan
+        package_name: Import path of the directory, defaults to the name of the
+            directory
+        name: Name of the shard, used as first grouping level of its flows. Defaults to
+            the package name.
+    """
+
+    root_dir: str
+    package_name: Optional[str] = None
+    name: Optional[str] = None
+
+    def __post_init__(self):
+        if self.package_name is None:
+            self.package_name = os.path.basename(os.path.normpath(self.root_dir))
+        if self.name is None:
+            self.name = self.package_name
+
+
+class MultiRootFlowFinder(FlowFinder):
+    """Finds flows in several package directories, e.g. the flow packages of a monorepo.
+
+    Every root is a shard with its own finder, created by `finder_factory`, so state
+    kept by a finder is kept per root. Roots are scanned concurrently and their flows
+    merged, with the shard name prepended to the grouping of each flow. The last result
+    of each shard is kept, so a selective refetch only scans the shards holding the
+    requested flows or groups.
+    """
+
+    def __init__(
+        self,
+        roots: Sequence[FlowRoot],
+        finder_factory: Callable[[FlowRoot], FlowFinder],
+        max_workers: Optional[int] = None,
+        group_by_root: bool = True,
+    ):
+        """
+        Initialize the MultiRootFlowFinder.
+
+        Args:
+            roots: Directories to scan
+            finder_factory: Creates the finder of a root, e.g. a `PrefectFlowFinder` of
+                `root.root_dir` with `package_name=root.package_name`
+            max_workers: Number of roots scanned at the same time, all of them if None
+            group_by_root: Prepend the shard name to the grouping of each flow
+
+        Raises:
+            ValueError: If two roots have the same name
+        """
+        names = [root.name for root in roots]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(
+                f"Flow roots must have unique names, repeated: {', '.join(duplicates)}"
+            )
+        self.roots = list(roots)
+        self.finders: Dict[str, FlowFinder] = {
+            root.name: finder_factory(root) for root in roots
+        }
+        self.max_workers = max_workers or max(1, len(self.roots))
+        self.group_by_root = group_by_root
+        self._results: Dict[str, List[FlowDetails]] = {}
+
+    def _merge(self, root: FlowRoot, flows: List[FlowDetails]) -> List[FlowDetails]:
+        """Prepend the shard name to the grouping of a shard's flows."""
+        if not self.group_by_root:
+            return flows
+        return [replace(flow, grouping=[root.name, *flow.grouping]) for flow in flows]
+
+    def _scan(self, requests: Dict[str, dict]) -> Dict[str, List[FlowDetails]]:
+        """Call the finders of several shards concurrently with their keyword arguments.
+
+        A shard that fails is reported and left out of the result.
+        """
+        roots = [root for root in self.roots if root.name in requests]
+
+        def scan(root: FlowRoot) -> Optional[List[FlowDetails]]:
+            try:
+                return self.finders[root.name].find_flows(**requests[root.name])
+            except Exception as e:
+                print(
+                    f"Error finding flows in {root.root_dir}: {str(e)}", file=sys.stderr
+                )
+                traceback.print_exc(file=sys.stderr)
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(scan, roots))
+        return {
+            root.name: self._merge(root, flows)
+            for root, flows in zip(roots, results)
+            if flows is not None
+        }
+
+    def _shard_of(self, flow: FlowDetails) -> Optional[str]:
+        """Name of the shard a flow was found in."""
+        source_path = os.path.abspath(flow.source_path)
+        for root in self.roots:
+            if source_path.startswith(os.path.abspath(root.root_dir) + os.sep):
+                return root.name
+        if self.group_by_root and flow.grouping and flow.grouping[0] in self.finders:
+            return flow.grouping[0]
+        return None
+
+    def find_flows(
+        self,
+        *,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[FlowDetails]:
+        """Find flows in all roots, or re-fetch flows and groups from their roots.
+
+        Args:
+            flows_to_fetch: Optional list of flows to selectively re-fetch data for
+            flow_groups: Optional list of flow group names to selectively re-fetch. A
+                shard name re-fetches every flow of that shard.
+
+        Returns:
+            List of FlowDetails objects, ordered by root
+        """
+        if flows_to_fetch is None and flow_groups is None:
+            self._results = self._scan({root.name: {} for root in self.roots})
+            return [
+                flow for root in self.roots for flow in self._results.get(root.name, [])
+            ]
+
+        whole_shards: Set[str] = set()
+        requests: Dict[str, dict] = {}
+        for flow in flows_to_fetch or []:
+            shard = self._shard_of(flow)
+            if shard is None:
+                continue
+            if self.group_by_root and flow.grouping[:1] == [shard]:
+                # Hand the flow back to its finder as that finder returned it
+                flow = replace(flow, grouping=flow.grouping[1:])
+            requests.setdefault(shard, {}).setdefault("flows_to_fetch", []).append(flow)
+        for group in flow_groups or []:
+            if group in self.finders:
+                whole_shards.add(group)
+                continue
+            # Groups are looked up in the last result of each shard, or in every shard
+            # before the first full scan
+            for name in self.finders:
+                known = self._results.get(name)
+                if known is None or any(group in flow.grouping for flow in known):
+                    requests.setdefault(name, {}).setdefault("flow_groups", []).append(
+                        group
+                    )
+
+        for name in whole_shards:
+            requests[name] = {}
+        results = self._scan(requests)
+        for name in whole_shards:
+            if name in results:
+                self._results[name] = results[name]
+        return [flow for root in self.roots for flow in results.get(root.name, [])]
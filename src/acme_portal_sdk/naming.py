@@ -0,0 +1,202 @@
+from string import Formatter
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+NAME_FIELDS = ("project_name", "branch", "flow_name", "env")
+
+DEFAULT_NAME_TEMPLATE = "{project_name}--{branch}--{flow_name}--{env}"
+
+
+class DeploymentName(NamedTuple):
+    """Components of a deployment name.
+
+    Attributes:
+        project_name: Name of the project, None if the naming scheme does not include it
+        branch: Name of the branch, None if the naming scheme does not include it
+        flow_name: Standardized flow name, with underscores instead of hyphens
+        env: Environment name
+    """
+
+    project_name: Optional[str]
+    branch: Optional[str]
+    flow_name: str
+    env: str
+
+
+class DeploymentNameCodec:
+    """Encodes and decodes deployment names and deployment tags.
+
+    Deployment names are built from a template of `{project_name}`, `{branch}`, `{flow_name}` and
+    `{env}` fields joined by one separator, `{project_name}--{branch}--{flow_name}--{env}` by default.
+    The template is parsed once when the codec is created, so decoding a name is a single split.
+
+    Tags have the format `KEY=VALUE`. The keys used for project, branch, commit hash and package
+    version can be configured.
+    """
+
+    def __init__(
+        self,
+        template: str = DEFAULT_NAME_TEMPLATE,
+        hyphenate_flow_name: bool = True,
+        project_name_tag: str = "PROJECT_NAME",
+        branch_tag: str = "BRANCH_NAME",
+        commit_hash_tag: str = "COMMIT_HASH",
+        package_version_tag: str = "PACKAGE_VERSION",
+    ):
+        """
+        Initialize the codec.
+
+        Args:
+            template: Deployment name template, fields separated by the same non-empty separator
+            hyphenate_flow_name: Replace underscores in flow names with hyphens when encoding
+            project_name_tag: Tag key holding the project name
+            branch_tag: Tag key holding the branch name
+            commit_hash_tag: Tag key holding the commit hash
+            package_version_tag: Tag key holding the package version
+
+        Raises:
+            ValueError: If the template uses unknown or repeated fields, misses `flow_name` or
+                `env`, or does not use one separator between all fields
+        """
+        self.template = template
+        self.hyphenate_flow_name = hyphenate_flow_name
+        self.project_name_tag = project_name_tag
+        self.branch_tag = branch_tag
+        self.commit_hash_tag = commit_hash_tag
+        self.package_version_tag = package_version_tag
+        self.separator, self.fields = self._parse_template(template)
+        # Position of each DeploymentName field in a split name, None if the template omits it.
+        # Leading fields are read from the start of a name and trailing fields from its end,
+        # so extra separators in the middle of a name do not shift the environment.
+        split = (len(self.fields) + 1) // 2
+        positions = {
+            field: index if index < split else index - len(self.fields)
+            for index, field in enumerate(self.fields)
+        }
+        self._positions = tuple(positions.get(field) for field in NAME_FIELDS)
+
+    @staticmethod
+    def _parse_template(template: str):
+        """Return the separator and the ordered field names of a name template."""
+        separators = set()
+        field_names: List[str] = []
+        for position, (literal, field_name, _, _) in enumerate(
+            Formatter().parse(template)
+        ):
+            if position > 0 or literal:
+                separators.add(literal)
+            if field_name is None:
+                continue
+            if field_name not in NAME_FIELDS or field_name in field_names:
+                raise ValueError(
+                    f"Invalid field {field_name!r} in deployment name template {template!r}"
+                )
+            field_names.append(field_name)
+        if "flow_name" not in field_names or "env" not in field_names:
+            raise ValueError(
+                f"Deployment name template {template!r} must contain {{flow_name}} and {{env}}"
+            )
+        if len(separators) != 1 or "" in separators:
+            raise ValueError(
+                f"Deployment name template {template!r} must join its fields with one separator"
+            )
+        return separators.pop(), tuple(field_names)
+
+    def encode(
+        self,
+        project_name: Optional[str],
+        branch: Optional[str],
+        flow_name: str,
+        env: str,
+    ) -> str:
+        """
+        Build a deployment name.
+
+        Args:
+            project_name: Name of the project
+            branch: Name of the branch
+            flow_name: Name of the flow
+            env: Environment name
+
+        Returns:
+            Deployment name
+        """
+        if self.hyphenate_flow_name:
+            flow_name = flow_name.replace("_", "-")
+        values = {
+            "project_name": project_name,
+            "branch": branch,
+            "flow_name": flow_name,
+            "env": env,
+        }
+        return self.separator.join(values[field] for field in self.fields)
+
+    def decode(self, name: str) -> Optional[DeploymentName]:
+        """
+        Split a deployment name into its components.
+
+        Args:
+            name: Deployment name
+
+        Returns:
+            DeploymentName with the flow name standardized to underscores, or None if the name
+            has fewer parts than the template
+        """
+        parts = name.split(self.separator)
+        if len(parts) < len(self.fields):
+            return None
+        project_index, branch_index, flow_index, env_index = self._positions
+        return DeploymentName(
+            None if project_index is None else parts[project_index],
+            None if branch_index is None else parts[branch_index],
+            parts[flow_index].replace("-", "_"),
+            parts[env_index],
+        )
+
+    @staticmethod
+    def parse_tags(tags: Iterable[str]) -> Dict[str, str]:
+        """
+        Parse `KEY=VALUE` tags in one pass.
+
+        Tags without `=` are ignored. When a key appears more than once, the first value is kept.
+
+        Args:
+            tags: Deployment tags
+
+        Returns:
+            Dictionary mapping tag keys to values
+        """
+        result: Dict[str, str] = {}
+        for tag in tags:
+            key, separator, value = tag.partition("=")
+            if separator and key not in result:
+                result[key] = value
+        return result
+
+    def encode_tags(
+        self,
+        project_name: str,
+        branch: str,
+        commit_hash: str,
+        package_version: str,
+    ) -> List[str]:
+        """
+        Build the tags identifying the source of a deployment.
+
+        Args:
+            project_name: Name of the project
+            branch: Name of the branch
+            commit_hash: Git commit hash
+            package_version: Package version
+
+        Returns:
+            List of `KEY=VALUE` tags
+        """
+        return [
+            f"{self.project_name_tag}={project_name}",
+            f"{self.branch_tag}={branch}",
+            f"{self.commit_hash_tag}={commit_hash}",
+            f"{self.package_version_tag}={package_version}",
+        ]
+
+
+DEFAULT_NAME_CODEC = DeploymentNameCodec()
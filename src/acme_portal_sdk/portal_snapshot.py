@@ -0,0 +1,215 @@
+import asyncio
+import contextvars
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from .async_api import AsyncDeploymentFinder, AsyncFlowFinder, run_sync
+from .deployment_finder import DeploymentDetails, DeploymentFinder
+from .flow_finder import FlowDetails, FlowFinder
+from .flow_matrix import FlowDeploymentMatrix, join_flows_and_deployments
+from .serialization import dumps
+
+# Status of a part of the snapshot
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+SKIPPED = "skipped"
+
+
+@dataclass
+class SnapshotPart:
+    """Outcome of one part of a portal snapshot.
+
+    Attributes:
+        status: "ok", "error", "timeout", or "skipped" for the join when an input is missing
+        seconds: Time taken, or waited until the deadline
+        count: Number of items returned
+        error: Exception type and message, or the exceeded deadline
+    """
+
+    status: str = SKIPPED
+    seconds: float = 0.0
+    count: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the SnapshotPart to a dictionary suitable for JSON serialization."""
+        return {
+            "status": self.status,
+            "seconds": self.seconds,
+            "count": self.count,
+            "error": self.error,
+        }
+
+
+@dataclass
+class PortalSnapshot:
+    """Flows, deployments and their join, read concurrently for the portal.
+
+    Attributes:
+        flows: Flows found, empty if finding them failed
+        deployments: Deployments found, empty if finding them failed
+        matrix: Flows joined with their deployments, None unless both reads succeeded
+        parts: Outcome of the "flows", "deployments" and "join" parts
+        seconds: Total time taken
+    """
+
+    flows: List[FlowDetails] = field(default_factory=list)
+    deployments: List[DeploymentDetails] = field(default_factory=list)
+    matrix: Optional[FlowDeploymentMatrix] = None
+    parts: Dict[str, SnapshotPart] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        """Whether every part succeeded."""
+        return all(part.status == OK for part in self.parts.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the PortalSnapshot to a dictionary suitable for JSON serialization."""
+        return {
+            "flows": [flow.to_dict() for flow in self.flows],
+            "deployments": [deployment.to_dict() for deployment in self.deployments],
+            # The matrix refers to the flows and deployments above by name and ID
+            "matrix": (
+                self.matrix.to_reference_dict() if self.matrix is not None else None
+            ),
+            "parts": {name: part.to_dict() for name, part in self.parts.items()},
+            "seconds": self.seconds,
+            "complete": self.complete,
+        }
+
+    def to_json(self) -> str:
+        """Encode the snapshot as JSON, with orjson when installed."""
+        return dumps(self.to_dict())
+
+
+def _in_daemon_thread(function: Callable[[], Any]) -> "asyncio.Future[Any]":
+    """Call a blocking function in a daemon thread and return an awaitable of its result.
+
+    Daemon threads are used instead of an executor, so a call that exceeds its deadline neither
+    delays the end of the event loop nor the exit of the process.
+    """
+    future: "Future[Any]" = Future()
+    context = contextvars.copy_context()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(context.run(function))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return asyncio.wrap_future(future)
+
+
+async def _read(
+    name: str, read: Optional[Awaitable[List[Any]]], deadline: Optional[float]
+) -> Tuple[SnapshotPart, List[Any]]:
+    """Await one read, recording its outcome instead of raising."""
+    if read is None:
+        return SnapshotPart(ERROR, error=f"No {name} finder configured"), []
+    started = time.perf_counter()
+    try:
+        items = list(await asyncio.wait_for(read, deadline))
+    except asyncio.TimeoutError:
+        part = SnapshotPart(TIMEOUT, error=f"No result within {deadline:g} seconds")
+        items = []
+    except Exception as e:
+        print(f"Error reading {name}: {str(e)}")
+        traceback.print_exc(file=sys.stderr)
+        part = SnapshotPart(ERROR, error=f"{type(e).__name__}: {e}")
+        items = []
+    else:
+        part = SnapshotPart(OK, count=len(items))
+    part.seconds = time.perf_counter() - started
+    return part, items
+
+
+async def take_portal_snapshot_async(
+    flow_finder: Union[FlowFinder, AsyncFlowFinder, None],
+    deployment_finder: Union[DeploymentFinder, AsyncDeploymentFinder, None],
+    flow_deadline: Optional[float] = None,
+    deployment_deadline: Optional[float] = None,
+) -> PortalSnapshot:
+    """
+    Find flows and deployments concurrently and join them.
+
+    Synchronous finders run in threads of their own, asynchronous finders on the event loop. A
+    read that raises or exceeds its deadline leaves its part of the snapshot empty, and the join
+    is skipped, while the other read is still returned.
+
+    Args:
+        flow_finder: Finder of the project's flows, None records the flows part as failed
+        deployment_finder: Finder of the project's deployments, None records the deployments
+            part as failed
+        flow_deadline: Seconds to wait for the flows, no limit if None
+        deployment_deadline: Seconds to wait for the deployments, no limit if None
+
+    Returns:
+        PortalSnapshot with the results and the outcome and timing of each part
+    """
+    started = time.perf_counter()
+    find_flows: Optional[Awaitable[List[Any]]] = None
+    if isinstance(flow_finder, AsyncFlowFinder):
+        find_flows = flow_finder.find_flows()
+    elif flow_finder is not None:
+        find_flows = _in_daemon_thread(flow_finder.find_flows)
+    get_deployments: Optional[Awaitable[List[Any]]] = None
+    if isinstance(deployment_finder, AsyncDeploymentFinder):
+        get_deployments = deployment_finder.get_deployments()
+    elif deployment_finder is not None:
+        get_deployments = _in_daemon_thread(deployment_finder.get_deployments)
+
+    (flows_part, flows), (deployments_part, deployments) = await asyncio.gather(
+        _read("flows", find_flows, flow_deadline),
+        _read("deployments", get_deployments, deployment_deadline),
+    )
+    snapshot = PortalSnapshot(
+        flows=flows,
+        deployments=deployments,
+        parts={
+            "flows": flows_part,
+            "deployments": deployments_part,
+            "join": SnapshotPart(),
+        },
+    )
+
+    if flows_part.status == OK and deployments_part.status == OK:
+        join_started = time.perf_counter()
+        snapshot.matrix = join_flows_and_deployments(flows, deployments)
+        snapshot.parts["join"] = SnapshotPart(
+            OK,
+            seconds=time.perf_counter() - join_started,
+            count=len(snapshot.matrix.flows),
+        )
+    snapshot.seconds = time.perf_counter() - started
+    return snapshot
+
+
+def take_portal_snapshot(
+    flow_finder: Union[FlowFinder, AsyncFlowFinder, None],
+    deployment_finder: Union[DeploymentFinder, AsyncDeploymentFinder, None],
+    flow_deadline: Optional[float] = None,
+    deployment_deadline: Optional[float] = None,
+) -> PortalSnapshot:
+    """
+    Find flows and deployments concurrently and join them, from synchronous code.
+
+    See `take_portal_snapshot_async` for the arguments.
+
+    Returns:
+        PortalSnapshot with the results and the outcome and timing of each part
+    """
+    return run_sync(
+        take_portal_snapshot_async(
+            flow_finder, deployment_finder, flow_deadline, deployment_deadline
+        )
+    )
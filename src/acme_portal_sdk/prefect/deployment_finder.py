@@ -2,37 +2,107 @@ import os
 import sys
 import traceback
 from pprint import pp
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, List, Optional, TYPE_CHECKING
 
 from prefect.client.orchestration import get_client
+from prefect.client.schemas.filters import DeploymentFilter, DeploymentFilterName
 
-from acme_portal_sdk.deployment_finder import (DeploymentDetails,
-                                               DeploymentFinder)
+from acme_portal_sdk.async_api import AsyncDeploymentFinder
+from acme_portal_sdk.compact import CompactDeploymentDetails, StringInterner
+from acme_portal_sdk.deployment_finder import DeploymentDetails, DeploymentFinder
+from acme_portal_sdk.naming import DEFAULT_NAME_CODEC, DeploymentNameCodec
+from acme_portal_sdk.tracing import span
 
 if TYPE_CHECKING:
     from acme_portal_sdk.flow_finder import FlowDetails
 
+# Most deployments Prefect's API returns from one `read_deployments` call
+READ_DEPLOYMENTS_PAGE_LIMIT = 200
 
-class PrefectDeploymentFinder(DeploymentFinder):
-    """Finds Prefect deployments in a given context.
 
-    Connects to Prefect's API to discover and retrieve information about existing deployments in the Prefect backend.
+def read_all_deployments(
+    client: Any,
+    deployment_filter: Optional[DeploymentFilter] = None,
+    page_limit: int = READ_DEPLOYMENTS_PAGE_LIMIT,
+) -> List[Any]:
+    """
+    Read every deployment matching a filter with a sync Prefect client.
+
+    Prefect returns at most `page_limit` deployments per call, so pages are read until a
+    short page comes back.
+
+    Args:
+        client: Sync Prefect client
+        deployment_filter: Filter of the deployments to read, all deployments if None
+        page_limit: Number of deployments requested per call
+
+    Returns:
+        Deployments matching the filter
+    """
+    deployments: List[Any] = []
+    while True:
+        page = client.read_deployments(
+            deployment_filter=deployment_filter,
+            limit=page_limit,
+            offset=len(deployments),
+        )
+        deployments.extend(page)
+        if len(page) < page_limit:
+            return deployments
+
+
+async def read_all_deployments_async(
+    client: Any,
+    deployment_filter: Optional[DeploymentFilter] = None,
+    page_limit: int = READ_DEPLOYMENTS_PAGE_LIMIT,
+) -> List[Any]:
+    """
+    Read every deployment matching a filter with an async Prefect client.
+
+    See `read_all_deployments` for the arguments.
+
+    Returns:
+        Deployments matching the filter
+    """
+    deployments: List[Any] = []
+    while True:
+        page = await client.read_deployments(
+            deployment_filter=deployment_filter,
+            limit=page_limit,
+            offset=len(deployments),
+        )
+        deployments.extend(page)
+        if len(page) < page_limit:
+            return deployments
+
+
+def read_deployments_by_name(
+    client: Any, names: List[str], page_limit: int = READ_DEPLOYMENTS_PAGE_LIMIT
+) -> List[Any]:
     """
+    Read the deployments with the given names with a sync Prefect client.
+
+    Args:
+        client: Sync Prefect client
+        names: Names of the deployments to read
+        page_limit: Number of deployments requested per call
+
+    Returns:
+        Deployments with any of the names
+    """
+    deployment_filter = DeploymentFilter(name=DeploymentFilterName(any_=list(names)))
+    return read_all_deployments(client, deployment_filter, page_limit)
+
 
-    def __init__(self):
-        """Initialize the PrefectDeploymentFinder and verify Prefect credentials."""
+class _PrefectDeploymentReader:
+    """Converts deployments read from Prefect's API, shared by the sync and async finders."""
+
+    def __init__(
+        self, compact: bool = False, name_codec: Optional[DeploymentNameCodec] = None
+    ):
+        self.name_codec = name_codec or DEFAULT_NAME_CODEC
+        self.details_class = CompactDeploymentDetails if compact else DeploymentDetails
         self.credentials_verified = False
-        try:
-            client = get_client(sync_client=True)
-            # Make a simple API call to verify authentication
-            client.read_deployments(limit=1)
-            self.credentials_verified = True
-            print("Prefect authentication verified successfully.")
-        except ImportError:
-            print("Error: Prefect package not installed or not found")
-        except Exception as e:
-            print(f"Error authenticating with Prefect: {str(e)}")
-            traceback.print_exc(file=sys.stderr)
 
     def _get_deployment_url(self, deployment_id: str) -> str:
         """Construct the URL for a given deployment ID."""
@@ -49,98 +119,141 @@ class PrefectDeploymentFinder(DeploymentFinder):
         )
         return f"{prefect_app_url}/deployments/deployment/{deployment_id}"
 
+    def _to_deployment_details(
+        self,
+        deployments: List[Any],
+        deployments_to_fetch: Optional[List[DeploymentDetails]],
+        flows_to_fetch: Optional[List["FlowDetails"]],
+    ) -> List[DeploymentDetails]:
+        """Convert deployments returned by `read_deployments`, keeping the selected ones."""
+        # Share one copy of values repeated across deployments, like project names and tags
+        intern = StringInterner()
+        deployment_ids_to_fetch = (
+            {d.id for d in deployments_to_fetch}
+            if deployments_to_fetch is not None
+            else None
+        )
+        flow_names_to_fetch = (
+            {f.name for f in flows_to_fetch} if flows_to_fetch is not None else None
+        )
+        result = []
+        for deployment in deployments:
+            print(f"Processing deployment: {deployment.name}")
+
+            # Parse deployment name into components, with a standardized flow name
+            name = self.name_codec.decode(deployment.name)
+            if name is None:
+                print(
+                    f"Skipping deployment with insufficient name parts: {deployment.name}"
+                )
+                continue
+            flow_name = name.flow_name
+
+            tag_values = self.name_codec.parse_tags(deployment.tags)
+
+            # Construct deployment info
+            deploy_info = self.details_class(
+                name=deployment.name,
+                project_name=intern(
+                    name.project_name
+                    or tag_values.get(self.name_codec.project_name_tag, "")
+                ),
+                branch=intern(
+                    name.branch or tag_values.get(self.name_codec.branch_tag, "")
+                ),
+                flow_name=intern(flow_name),
+                env=intern(name.env),
+                commit_hash=intern(tag_values.get(self.name_codec.commit_hash_tag, "")),
+                package_version=intern(
+                    tag_values.get(self.name_codec.package_version_tag, "")
+                ),
+                tags=intern.intern_all(deployment.tags),
+                id=str(deployment.id),
+                created_at=str(deployment.created),
+                updated_at=str(deployment.updated),
+                flow_id=str(deployment.flow_id),
+                url=self._get_deployment_url(str(deployment.id)),
+            )
+
+            # Filter based on selective parameters
+            should_include = True
+
+            # If no selective parameters provided, include all
+            if deployments_to_fetch is None and flows_to_fetch is None:
+                should_include = True
+            else:
+                should_include = False
+
+                # Check if this deployment should be included based on deployments_to_fetch
+                if deployment_ids_to_fetch is not None:
+                    if deploy_info.id in deployment_ids_to_fetch:
+                        should_include = True
+
+                # Check if this deployment should be included based on flows_to_fetch
+                if flow_names_to_fetch is not None and not should_include:
+                    if deploy_info.flow_name in flow_names_to_fetch:
+                        should_include = True
+
+            if should_include:
+                result.append(deploy_info)
+                print(
+                    f"Added deployment: {deploy_info.project_name}/{flow_name} ({deploy_info.branch}/{deploy_info.env})"
+                )
+
+        return result
+
+
+class PrefectDeploymentFinder(_PrefectDeploymentReader, DeploymentFinder):
+    """Finds Prefect deployments in a given context.
+
+    Connects to Prefect's API to discover and retrieve information about existing deployments in the Prefect backend.
+    """
+
+    def __init__(
+        self, compact: bool = False, name_codec: Optional[DeploymentNameCodec] = None
+    ):
+        """Initialize the PrefectDeploymentFinder and verify Prefect credentials.
+
+        Args:
+            compact: Return CompactDeploymentDetails, which use less memory for large result sets
+            name_codec: Codec for deployment names and tags, defaults to `project--branch--flow--env`
+        """
+        super().__init__(compact=compact, name_codec=name_codec)
+        try:
+            client = get_client(sync_client=True)
+            # Make a simple API call to verify authentication
+            client.read_deployments(limit=1)
+            self.credentials_verified = True
+            print("Prefect authentication verified successfully.")
+        except ImportError:
+            print("Error: Prefect package not installed or not found")
+        except Exception as e:
+            print(f"Error authenticating with Prefect: {str(e)}")
+            traceback.print_exc(file=sys.stderr)
+
     def get_deployments(
         self,
         deployments_to_fetch: Optional[List[DeploymentDetails]] = None,
-        flows_to_fetch: Optional[List["FlowDetails"]] = None
+        flows_to_fetch: Optional[List["FlowDetails"]] = None,
     ) -> List[DeploymentDetails]:
         """Connect to Prefect and get deployment information.
-        
+
         Args:
             deployments_to_fetch: Optional list of specific deployments to re-fetch
             flows_to_fetch: Optional list of flows to re-fetch deployments for
-            
+
         Returns:
             List of DeploymentDetails objects
         """
         try:
             client = get_client(sync_client=True)
-            deployments = client.read_deployments()
-
-            result = []
-            for deployment in deployments:
-                print(f"Processing deployment: {deployment.name}")
-
-                # Parse deployment name into components
-                parts = deployment.name.split("--")
-                if len(parts) < 4:
-                    print(
-                        f"Skipping deployment with insufficient name parts: {deployment.name}"
-                    )
-                    continue
-
-                # Create a standardized flow name (replace hyphens with underscores)
-                flow_name = parts[-2].replace("-", "_")
-
-                # Construct deployment info
-                deploy_info = DeploymentDetails(
-                    name=deployment.name,
-                    project_name=parts[0],
-                    branch=parts[1],
-                    flow_name=flow_name,
-                    env=parts[-1],
-                    commit_hash=next(
-                        (
-                            tag.split("=")[1]
-                            for tag in deployment.tags
-                            if "COMMIT_HASH" in tag
-                        ),
-                        "",
-                    ),
-                    package_version=next(
-                        (
-                            tag.split("=")[1]
-                            for tag in deployment.tags
-                            if "PACKAGE_VERSION" in tag
-                        ),
-                        "",
-                    ),
-                    tags=deployment.tags,
-                    id=str(deployment.id),
-                    created_at=str(deployment.created),
-                    updated_at=str(deployment.updated),
-                    flow_id=str(deployment.flow_id),
-                    url=self._get_deployment_url(str(deployment.id)),
-                )
-                
-                # Filter based on selective parameters
-                should_include = True
-                
-                # If no selective parameters provided, include all
-                if deployments_to_fetch is None and flows_to_fetch is None:
-                    should_include = True
-                else:
-                    should_include = False
-                    
-                    # Check if this deployment should be included based on deployments_to_fetch
-                    if deployments_to_fetch is not None:
-                        deployment_ids_to_fetch = {d.id for d in deployments_to_fetch}
-                        if deploy_info.id in deployment_ids_to_fetch:
-                            should_include = True
-                    
-                    # Check if this deployment should be included based on flows_to_fetch
-                    if flows_to_fetch is not None and not should_include:
-                        flow_names_to_fetch = {f.name for f in flows_to_fetch}
-                        if deploy_info.flow_name in flow_names_to_fetch:
-                            should_include = True
-
-                if should_include:
-                    result.append(deploy_info)
-                    print(
-                        f"Added deployment: {deploy_info.project_name}/{flow_name} ({deploy_info.branch}/{deploy_info.env})"
-                    )
-
-            return result
+            with span("prefect.read_deployments") as current:
+                deployments = read_all_deployments(client)
+                current.set_attribute("count", len(deployments))
+
+            return self._to_deployment_details(
+                deployments, deployments_to_fetch, flows_to_fetch
+            )
         except ImportError:
             print("Error: Prefect package not installed or not found")
             raise
@@ -150,6 +263,59 @@ class PrefectDeploymentFinder(DeploymentFinder):
             raise
 
 
+class AsyncPrefectDeploymentFinder(_PrefectDeploymentReader, AsyncDeploymentFinder):
+    """Finds Prefect deployments with Prefect's asynchronous client.
+
+    Returns the same deployments as PrefectDeploymentFinder without blocking the event loop.
+    Credentials are verified by `verify_credentials`, as constructors cannot await.
+    """
+
+    async def verify_credentials(self) -> bool:
+        """Make a simple API call to verify authentication.
+
+        Returns:
+            Whether the call succeeded, also stored in `credentials_verified`
+        """
+        try:
+            async with get_client() as client:
+                await client.read_deployments(limit=1)
+            self.credentials_verified = True
+            print("Prefect authentication verified successfully.")
+        except Exception as e:
+            print(f"Error authenticating with Prefect: {str(e)}")
+            traceback.print_exc(file=sys.stderr)
+        return self.credentials_verified
+
+    async def get_deployments(
+        self,
+        *,
+        deployments_to_fetch: Optional[List[DeploymentDetails]] = None,
+        flows_to_fetch: Optional[List["FlowDetails"]] = None,
+    ) -> List[DeploymentDetails]:
+        """Connect to Prefect and get deployment information.
+
+        Args:
+            deployments_to_fetch: Optional list of specific deployments to re-fetch
+            flows_to_fetch: Optional list of flows to re-fetch deployments for
+
+        Returns:
+            List of DeploymentDetails objects
+        """
+        try:
+            async with get_client() as client:
+                with span("prefect.read_deployments") as current:
+                    deployments = await read_all_deployments_async(client)
+                    current.set_attribute("count", len(deployments))
+
+            return self._to_deployment_details(
+                deployments, deployments_to_fetch, flows_to_fetch
+            )
+        except Exception as e:
+            print(f"Error getting deployments: {str(e)}")
+            traceback.print_exc(file=sys.stderr)
+            raise
+
+
 if __name__ == "__main__":
     finder = PrefectDeploymentFinder()
     deployments = finder.get_deployments()
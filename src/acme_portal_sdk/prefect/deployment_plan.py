@@ -0,0 +1,240 @@
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional
+
+from prefect.client.orchestration import get_client
+
+from acme_portal_sdk.deploy_executor import (
+    DEFAULT_MAX_PARALLEL,
+    DeployBatchResult,
+    DeploymentExecutor,
+)
+from acme_portal_sdk.naming import DeploymentNameCodec
+from acme_portal_sdk.prefect.deployment_finder import read_deployments_by_name
+from acme_portal_sdk.prefect.flow_deploy import PrefectDeployInfo, PrefectFlowDeployer
+from acme_portal_sdk.tracing import span
+
+FINGERPRINT_TAG = "DEPLOY_FINGERPRINT"
+
+CREATE = "create"
+UPDATE = "update"
+UNCHANGED = "unchanged"
+
+
+@dataclass
+class PlannedDeployment:
+    """A deployment together with the action needed to bring it up to date.
+
+    Attributes:
+        deploy_info: Deployment configuration, with the fingerprint tag attached
+        action: One of `create`, `update` or `unchanged`
+        fingerprint: Fingerprint of the deployment configuration
+        existing_fingerprint: Fingerprint of the deployment currently registered in Prefect, if any
+    """
+
+    deploy_info: PrefectDeployInfo
+    action: str
+    fingerprint: str
+    existing_fingerprint: Optional[str] = None
+
+
+@dataclass
+class DeploymentPlan:
+    """Set of deployments to create, update or leave unchanged.
+
+    Attributes:
+        items: Planned deployments in the order the deploy infos were given
+    """
+
+    items: List[PlannedDeployment] = field(default_factory=list)
+
+    @property
+    def to_apply(self) -> List[PlannedDeployment]:
+        """Deployments that need to be created or updated."""
+        return [item for item in self.items if item.action != UNCHANGED]
+
+    @property
+    def unchanged(self) -> List[PlannedDeployment]:
+        """Deployments whose configuration matches the registered deployment."""
+        return [item for item in self.items if item.action == UNCHANGED]
+
+    def summary(self) -> str:
+        """
+        Render the plan as a human readable diff.
+
+        Returns:
+            One line per deployment prefixed with `+` (create), `~` (update) or `=` (unchanged),
+            followed by a totals line
+        """
+        symbols = {CREATE: "+", UPDATE: "~", UNCHANGED: "="}
+        lines = [
+            f"{symbols[item.action]} {item.deploy_info.name} ({item.action})"
+            for item in self.items
+        ]
+        counts = {
+            action: sum(1 for item in self.items if item.action == action)
+            for action in (CREATE, UPDATE, UNCHANGED)
+        }
+        lines.append(
+            f"Plan: {counts[CREATE]} to create, {counts[UPDATE]} to update, {counts[UNCHANGED]} unchanged"
+        )
+        return "\n".join(lines)
+
+
+class PrefectDeploymentPlanner:
+    """Plans and applies Prefect deployments, skipping those whose configuration is already registered.
+
+    Each deployment configuration is reduced to a fingerprint that is stored as a
+    `DEPLOY_FINGERPRINT=<value>` tag on the deployment. Planning reads the existing deployments
+    with one filtered read and compares fingerprints, so only new or changed deployments are
+    applied.
+    """
+
+    def __init__(
+        self,
+        deployer: PrefectFlowDeployer,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+    ):
+        """
+        Initialize the PrefectDeploymentPlanner.
+
+        Args:
+            deployer: Deployer used to apply the plan
+            max_parallel: Maximum number of deployments applied at the same time
+        """
+        self.deployer = deployer
+        self.max_parallel = max_parallel
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def fingerprint(deploy_info: PrefectDeployInfo) -> str:
+        """
+        Compute a fingerprint of the deployment configuration.
+
+        The fingerprint covers every setting passed to Prefect when deploying, except the flow
+        function object and an existing fingerprint tag.
+
+        Args:
+            deploy_info: Deployment configuration
+
+        Returns:
+            Hex digest identifying the configuration
+        """
+        payload = {
+            "name": deploy_info.name,
+            "flow_name": deploy_info.flow_name,
+            "work_pool_name": deploy_info.work_pool_name,
+            "work_queue_name": deploy_info.work_queue_name,
+            "parameters": deploy_info.parameters,
+            "job_variables": deploy_info.job_variables,
+            "cron": deploy_info.cron,
+            "paused": deploy_info.paused,
+            "concurrency_limit": deploy_info.concurrency_limit,
+            "description": deploy_info.description,
+            "tags": sorted(
+                tag
+                for tag in (deploy_info.tags or [])
+                if not tag.startswith(f"{FINGERPRINT_TAG}=")
+            ),
+            "triggers": deploy_info.triggers,
+            "image_uri": deploy_info.image_uri,
+            "version": deploy_info.version,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _with_fingerprint_tag(
+        deploy_info: PrefectDeployInfo, fingerprint: str
+    ) -> PrefectDeployInfo:
+        """Return a copy of the deploy info tagged with the given fingerprint only."""
+        tags = [
+            tag
+            for tag in (deploy_info.tags or [])
+            if not tag.startswith(f"{FINGERPRINT_TAG}=")
+        ]
+        tags.append(f"{FINGERPRINT_TAG}={fingerprint}")
+        return replace(deploy_info, tags=tags)
+
+    def _read_existing_fingerprints(
+        self, deployment_names: List[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Read fingerprints of registered deployments with the given names.
+
+        Args:
+            deployment_names: Names of deployments to look up
+
+        Returns:
+            Dictionary mapping each registered deployment name to its fingerprint,
+            or None if the deployment has no fingerprint tag
+        """
+        if not deployment_names:
+            return {}
+        client = get_client(sync_client=True)
+        with span("prefect.read_deployments", names=len(deployment_names)):
+            deployments = read_deployments_by_name(client, list(deployment_names))
+        result = {}
+        for deployment in deployments:
+            result[deployment.name] = DeploymentNameCodec.parse_tags(
+                deployment.tags
+            ).get(FINGERPRINT_TAG)
+        return result
+
+    def plan(
+        self, deploy_infos: List[PrefectDeployInfo], force: bool = False
+    ) -> DeploymentPlan:
+        """
+        Compare deploy infos against registered deployments and decide what to apply.
+
+        Args:
+            deploy_infos: Desired deployment configurations
+            force: Update registered deployments even if their fingerprint is unchanged
+
+        Returns:
+            DeploymentPlan with one planned deployment per deploy info, holding a copy of
+            the deploy info tagged with its fingerprint
+        """
+        existing = self._read_existing_fingerprints(
+            [info.name for info in deploy_infos]
+        )
+
+        items = []
+        for deploy_info in deploy_infos:
+            fingerprint = self.fingerprint(deploy_info)
+            deploy_info = self._with_fingerprint_tag(deploy_info, fingerprint)
+            if deploy_info.name not in existing:
+                action = CREATE
+            elif existing[deploy_info.name] == fingerprint and not force:
+                action = UNCHANGED
+            else:
+                action = UPDATE
+            items.append(
+                PlannedDeployment(
+                    deploy_info=deploy_info,
+                    action=action,
+                    fingerprint=fingerprint,
+                    existing_fingerprint=existing.get(deploy_info.name),
+                )
+            )
+        return DeploymentPlan(items=items)
+
+    def apply(self, plan: DeploymentPlan) -> DeployBatchResult:
+        """
+        Deploy the planned creates and updates, skipping unchanged deployments.
+
+        Args:
+            plan: Plan returned by `plan`
+
+        Returns:
+            Per-flow results of the applied deployments
+        """
+        to_apply = [item.deploy_info for item in plan.to_apply]
+        self.logger.info(
+            f"Applying {len(to_apply)} deployments, skipping {len(plan.unchanged)} unchanged"
+        )
+        return DeploymentExecutor(
+            self.deployer, max_parallel=self.max_parallel
+        ).execute(to_apply)
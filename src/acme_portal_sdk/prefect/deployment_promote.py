@@ -3,10 +3,16 @@ from typing import Any, Dict, List, Optional
 
 from prefect.client.orchestration import get_client
 
+from acme_portal_sdk.deploy_executor import (DEFAULT_MAX_PARALLEL,
+                                             DeployBatchResult,
+                                             DeploymentExecutor)
 from acme_portal_sdk.deployment_promote import DeploymentPromote
+from acme_portal_sdk.naming import DEFAULT_NAME_CODEC, DeploymentNameCodec
+from acme_portal_sdk.prefect.deployment_finder import read_deployments_by_name
 from acme_portal_sdk.prefect.flow_deploy import (PrefectDeployInfo,
                                                  PrefectDeployInfoPrep,
                                                  PrefectFlowDeployer)
+from acme_portal_sdk.tracing import span
 
 
 class PrefectDeploymentPromote(DeploymentPromote):
@@ -16,6 +22,8 @@ class PrefectDeploymentPromote(DeploymentPromote):
         self,
         deployer: PrefectFlowDeployer,
         flow_deploy_info_prep: PrefectDeployInfoPrep,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+        name_codec: Optional[DeploymentNameCodec] = None,
     ):
         """
         Initialize the DeploymentPromote with a flow deployer.
@@ -23,64 +31,120 @@ class PrefectDeploymentPromote(DeploymentPromote):
         Args:
             deployer: A flow deployer instance to handle the actual deployment
             flow_deploy_info_prep: A helper to prepare deployment info
+            max_parallel: Maximum number of target deployments created at the same time
+            name_codec: Codec for deployment names and tags, defaults to `project--branch--flow--env`
         """
         self.deployer = deployer
         self.flow_deploy_info_prep = flow_deploy_info_prep
+        self.max_parallel = max_parallel
+        self.name_codec = name_codec or DEFAULT_NAME_CODEC
         self.logger = logging.getLogger(self.__class__.__name__)
 
     @staticmethod
-    def _extract_tag_value(tags: List[str], tag_name: str) -> str:
+    def _extract_tag_value(
+        tags: List[str], tag_values: Dict[str, str], tag_name: str
+    ) -> str:
         """
-        Extract a value from deployment tags.
+        Extract a value from parsed deployment tags.
 
         Args:
-            tags: List of tags in the format "KEY=VALUE"
+            tags: List of tags in the format "KEY=VALUE", used in the error message
+            tag_values: Tags parsed with `DeploymentNameCodec.parse_tags`
             tag_name: The key to extract
 
         Returns:
             The extracted value string
         """
-        matched_tags = [x for x in tags if x.startswith(f"{tag_name}=")]
-        if not matched_tags:
+        if tag_name not in tag_values:
             raise ValueError(f"Tag {tag_name} not found in tags: {tags}")
-        return matched_tags[0].split("=")[1]
+        return tag_values[tag_name]
 
-    def _get_source_deployment_info(
+    def _source_deployment_name(
         self, project_name: str, branch_name: str, flow_name: str, source_env: str
-    ) -> Dict[str, Any]:
+    ) -> str:
+        """Build the name of the source deployment for a flow."""
+        return self.name_codec.encode(project_name, branch_name, flow_name, source_env)
+
+    def _get_source_deployments_info(
+        self,
+        project_name: str,
+        branch_name: str,
+        flow_names: List[str],
+        source_env: str,
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Get information about a source deployment.
+        Get information about source deployments of multiple flows with one filtered read.
 
         Args:
             project_name: Name of the project
             branch_name: Name of the branch
-            flow_name: Name of the flow
+            flow_names: Names of the flows
             source_env: Source environment name
 
         Returns:
-            Dictionary containing deployment information
-        """
-        client = get_client(sync_client=True)
-        underscore_flow_name = flow_name.replace("-", "_")
-        hyphen_flow_name = flow_name.replace("_", "-")
+            Dictionary mapping each flow name to its deployment information
 
-        deployment_name = (
-            f"{project_name}--{branch_name}--{hyphen_flow_name}--{source_env}"
-        )
+        Raises:
+            ValueError: If a source deployment is missing for any of the flows
+        """
+        names_to_flows = {
+            self._source_deployment_name(
+                project_name, branch_name, flow_name, source_env
+            ): flow_name.replace("-", "_")
+            for flow_name in flow_names
+        }
+        if not names_to_flows:
+            return {}
 
+        client = get_client(sync_client=True)
         try:
-            result = dict(
-                client.read_deployment_by_name(
-                    f"{underscore_flow_name}/{deployment_name}"
-                )
-            )
-            return result
+            with span("prefect.read_deployments", names=len(names_to_flows)):
+                deployments = read_deployments_by_name(client, list(names_to_flows))
         except Exception as e:
             self.logger.error(
-                f"Error fetching deployment info for `{underscore_flow_name}/{deployment_name}`: {e}"
+                f"Error fetching source deployments from `{source_env}`: {e}"
             )
             raise
 
+        result = {}
+        for deployment in deployments:
+            flow_name = names_to_flows.get(deployment.name)
+            if flow_name is not None:
+                result[flow_name] = dict(deployment)
+
+        missing = [
+            f"{flow_name}/{name}"
+            for name, flow_name in names_to_flows.items()
+            if flow_name not in result
+        ]
+        if missing:
+            raise ValueError(
+                f"Source deployments not found in `{source_env}`: {', '.join(missing)}"
+            )
+        return result
+
+    def _get_source_deployment_info(
+        self, project_name: str, branch_name: str, flow_name: str, source_env: str
+    ) -> Dict[str, Any]:
+        """
+        Get information about a source deployment.
+
+        Args:
+            project_name: Name of the project
+            branch_name: Name of the branch
+            flow_name: Name of the flow
+            source_env: Source environment name
+
+        Returns:
+            Dictionary containing deployment information
+        """
+        return self._get_source_deployments_info(
+            project_name=project_name,
+            branch_name=branch_name,
+            flow_names=[flow_name],
+            source_env=source_env,
+        )[flow_name.replace("-", "_")]
+
     def _prepare_deploy_info(
         self,
         source_deployment_info: Dict[str, Any],
@@ -103,10 +167,14 @@ class PrefectDeploymentPromote(DeploymentPromote):
         # Extract necessary information from source deployment
         image_uri = source_deployment_info["job_variables"]["image"]
         tags = source_deployment_info["tags"]
-        package_version = self._extract_tag_value(tags, "PACKAGE_VERSION")
-        commit_hash = self._extract_tag_value(tags, "COMMIT_HASH")
-        project_name = self._extract_tag_value(tags, "PROJECT_NAME")
-        branch_name = self._extract_tag_value(tags, "BRANCH_NAME")
+        codec = self.name_codec
+        tag_values = codec.parse_tags(tags)
+        package_version = self._extract_tag_value(
+            tags, tag_values, codec.package_version_tag
+        )
+        commit_hash = self._extract_tag_value(tags, tag_values, codec.commit_hash_tag)
+        project_name = self._extract_tag_value(tags, tag_values, codec.project_name_tag)
+        branch_name = self._extract_tag_value(tags, tag_values, codec.branch_tag)
 
         # Create deploy info for target environment
         deploy_infos = self.flow_deploy_info_prep.prep_deploy_info(
@@ -122,15 +190,26 @@ class PrefectDeploymentPromote(DeploymentPromote):
 
         return deploy_infos
 
-    def _execute_deployments(self, deploy_infos: List[PrefectDeployInfo]) -> None:
+    def _execute_deployments(
+        self, deploy_infos: List[PrefectDeployInfo]
+    ) -> DeployBatchResult:
         """
-        Execute deployments for the prepared deployment info objects.
+        Execute deployments for the prepared deployment info objects concurrently.
 
         Args:
             deploy_infos: List of deployment info objects to deploy
+
+        Returns:
+            Per-flow results of the deployments
+
+        Raises:
+            RuntimeError: If any of the deployments failed, after all of them were attempted
         """
-        for deploy_info in deploy_infos:
-            self.deployer.deploy(deploy_info)
+        result = DeploymentExecutor(
+            self.deployer, max_parallel=self.max_parallel
+        ).execute(deploy_infos)
+        result.raise_for_failures()
+        return result
 
     def promote(
         self,
@@ -157,20 +236,20 @@ class PrefectDeploymentPromote(DeploymentPromote):
             flow_name.replace("-", "_") for flow_name in flows_to_deploy
         ]
 
+        # Get source deployment info for all flows up front
+        source_deployments_info = self._get_source_deployments_info(
+            project_name=project_name,
+            branch_name=branch_name,
+            flow_names=std_flows_to_deploy,
+            source_env=source_env,
+        )
+
         all_deploy_infos = []
 
         for flow_name in std_flows_to_deploy:
-            # Get source deployment info
-            source_deployment_info = self._get_source_deployment_info(
-                project_name=project_name,
-                branch_name=branch_name,
-                flow_name=flow_name,
-                source_env=source_env,
-            )
-
             # Prepare deployment info for target environment
             deploy_infos = self._prepare_deploy_info(
-                source_deployment_info=source_deployment_info,
+                source_deployment_info=source_deployments_info[flow_name],
                 target_env=target_env,
                 flow_name=flow_name,
                 env_vars=target_env_vars,
@@ -1,16 +1,17 @@
-import importlib
 import logging
 from dataclasses import dataclass
-from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from prefect.events import (DeploymentCompoundTrigger, DeploymentEventTrigger,
                             DeploymentMetricTrigger, DeploymentSequenceTrigger)
 
+from acme_portal_sdk.flow_catalog import FlowCatalog
 from acme_portal_sdk.flow_deploy import (DeployInfo, DeployInfoPrep,
                                          FlowDeployer)
+from acme_portal_sdk.naming import DEFAULT_NAME_CODEC, DeploymentNameCodec
 from acme_portal_sdk.prefect.flow_finder import PrefectFlowFinder
+from acme_portal_sdk.tracing import span
 
 
 @dataclass
@@ -67,10 +68,28 @@ class PrefectDeployInfoPrep(DeployInfoPrep):
         static_flow_deploy_config: Union[Path, str],
         default_work_pool: str,
         prefect_flow_finder: PrefectFlowFinder,
+        flow_catalog: Optional[FlowCatalog] = None,
+        name_codec: Optional[DeploymentNameCodec] = None,
     ):
+        """
+        Initialize the PrefectDeployInfoPrep.
+
+        Args:
+            static_flow_deploy_config: Path to the YAML file with per flow deployment configuration
+            default_work_pool: Work pool used when a flow does not configure one
+            prefect_flow_finder: Finder used to discover flows in the project
+            flow_catalog: Optional catalog shared with other components of the same command.
+                If not provided, a catalog is created from `prefect_flow_finder`, so the project
+                is scanned once for the lifetime of this object.
+            name_codec: Codec for deployment names and tags, defaults to `project--branch--flow--env`
+        """
+        self.name_codec = name_codec or DEFAULT_NAME_CODEC
         self.static_flow_deploy_config = static_flow_deploy_config
         self.default_work_pool = default_work_pool
         self.prefect_flow_finder = prefect_flow_finder
+        self.flow_catalog = (
+            flow_catalog if flow_catalog is not None else FlowCatalog(prefect_flow_finder)
+        )
         # Dict with keys being FlowDetails.name and values being dicts of parameters for DeployInfo
         self.config = self._load_yaml_config()
 
@@ -97,25 +116,7 @@ class PrefectDeployInfoPrep(DeployInfoPrep):
         Returns:
             The imported function
         """
-        try:
-            # Check if module exists
-            if find_spec(module_path) is None:
-                raise ImportError(f"Module {module_path} not found")
-
-            # Import module
-            module = importlib.import_module(module_path)
-
-            # Get function
-            if not hasattr(module, function_name):
-                raise AttributeError(
-                    f"Function {function_name} not found in {module_path}"
-                )
-
-            return getattr(module, function_name)
-
-        except Exception as e:
-            logging.error(f"Error importing {function_name} from {module_path}: {e}")
-            raise
+        return self.flow_catalog.import_flow(module_path, function_name)
 
     def prep_deploy_info(
         self,
@@ -150,10 +151,7 @@ class PrefectDeployInfoPrep(DeployInfoPrep):
         ]
 
         # Find all available flows and filter to those we want to deploy
-        all_flows = self.prefect_flow_finder.find_flows()
-        flows_info_to_deploy = [
-            flow for flow in all_flows if flow.name in std_flows_to_deploy
-        ]
+        flows_info_to_deploy = self.flow_catalog.get_flows_by_name(std_flows_to_deploy)
 
         # Create deployment info objects
         deploy_infos = []
@@ -164,10 +162,8 @@ class PrefectDeployInfoPrep(DeployInfoPrep):
             else:
                 extra_deploy_config = {}
 
-            hyphen_flow_name = flow_info.name.replace("_", "-")
-
-            deployment_name = (
-                f"{project_name}--{branch_name}--{hyphen_flow_name}--{env}"
+            deployment_name = self.name_codec.encode(
+                project_name, branch_name, flow_info.name, env
             )
 
             # Create environment variables dictionary
@@ -177,12 +173,9 @@ class PrefectDeployInfoPrep(DeployInfoPrep):
             }
 
             # Create tags list
-            tags = [
-                f"PROJECT_NAME={project_name}",
-                f"BRANCH_NAME={branch_name}",
-                f"COMMIT_HASH={commit_hash}",
-                f"PACKAGE_VERSION={package_version}",
-            ]
+            tags = self.name_codec.encode_tags(
+                project_name, branch_name, commit_hash, package_version
+            )
 
             # Create version string
             version = f"{branch_name}-{commit_hash}"
@@ -192,7 +185,7 @@ class PrefectDeployInfoPrep(DeployInfoPrep):
                 flow_info.child_attributes["import_path"], flow_info.child_attributes["obj_name"]
             )
 
-            # Standardize flow name if needed
+            # Standardize flow name if needed, on a copy so the shared imported flow is not mutated
             underscore_flow_name = flow_info.name.replace("-", "_")
             if (
                 hasattr(flow_function, "name")
@@ -201,7 +194,12 @@ class PrefectDeployInfoPrep(DeployInfoPrep):
                 logging.info(
                     f"Standardizing flow name {flow_function.name} for deployment to {underscore_flow_name}"
                 )
-                flow_function.name = underscore_flow_name
+                if hasattr(flow_function, "with_options"):
+                    flow_function = flow_function.with_options(
+                        name=underscore_flow_name
+                    )
+                else:
+                    flow_function.name = underscore_flow_name
 
             # Create PrefectDeployInfo instance with all required properties
             deploy_info = PrefectDeployInfo(
@@ -264,23 +262,24 @@ class PrefectFlowDeployer(FlowDeployer):
             )
 
             # Deploy the flow using the configuration from flow_deploy_info
-            flow_function.deploy(
-                name=flow_deploy_info.name,
-                description=flow_deploy_info.description,
-                work_pool_name=flow_deploy_info.work_pool_name,
-                work_queue_name=flow_deploy_info.work_queue_name,
-                cron=flow_deploy_info.cron,
-                parameters=flow_deploy_info.parameters,
-                job_variables=flow_deploy_info.job_variables,
-                image=flow_deploy_info.image_uri,
-                tags=flow_deploy_info.tags,
-                version=flow_deploy_info.version,
-                paused=flow_deploy_info.paused,
-                concurrency_limit=flow_deploy_info.concurrency_limit,
-                triggers=triggers,
-                build=False,
-                push=False,
-            )
+            with span("prefect.deploy", deployment=flow_deploy_info.name):
+                flow_function.deploy(
+                    name=flow_deploy_info.name,
+                    description=flow_deploy_info.description,
+                    work_pool_name=flow_deploy_info.work_pool_name,
+                    work_queue_name=flow_deploy_info.work_queue_name,
+                    cron=flow_deploy_info.cron,
+                    parameters=flow_deploy_info.parameters,
+                    job_variables=flow_deploy_info.job_variables,
+                    image=flow_deploy_info.image_uri,
+                    tags=flow_deploy_info.tags,
+                    version=flow_deploy_info.version,
+                    paused=flow_deploy_info.paused,
+                    concurrency_limit=flow_deploy_info.concurrency_limit,
+                    triggers=triggers,
+                    build=False,
+                    push=False,
+                )
 
             self.logger.info(f"Successfully deployed flow {flow_deploy_info.name}")
 
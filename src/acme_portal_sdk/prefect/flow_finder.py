@@ -6,7 +6,10 @@ from dataclasses import dataclass
 from pprint import pp
 from typing import Dict, List, Optional
 
+from acme_portal_sdk.compact import StringInterner
 from acme_portal_sdk.flow_finder import FlowDetails, FlowFinder
+from acme_portal_sdk.import_discovery import DiscoveredObject, ImportDiscovery
+from acme_portal_sdk.tracing import traced
 
 PrefectFlowDetails = FlowDetails
 
@@ -40,8 +43,24 @@ class PrefectFlowAttributes:
 class PrefectFlowFinder(FlowFinder):
     """Scans Python code directories to identify Prefect flows by analyzing decorators, extracting metadata and organizing found flows into flat list."""
 
-    def __init__(self, root_dir: str):
+    def __init__(
+        self,
+        root_dir: str,
+        import_discovery: Optional[ImportDiscovery] = None,
+        package_name: Optional[str] = None,
+    ):
+        """Initialize the PrefectFlowFinder.
+
+        Args:
+            root_dir: Package directory to scan
+            import_discovery: Also import modules in worker processes to find flows that only
+                exist at runtime, e.g. built in loops or by factories. Off by default.
+            package_name: Import path of the root directory, used as prefix of the import paths
+                of flows. Defaults to the name of the root directory.
+        """
         self.root_dir = root_dir
+        self.import_discovery = import_discovery
+        self.package_name = package_name or os.path.basename(root_dir)
 
     class _FlowVisitor(ast.NodeVisitor):
         """AST visitor to find Prefect flow decorators in Python code."""
@@ -126,7 +145,8 @@ class PrefectFlowFinder(FlowFinder):
                         kwargs[keyword.arg] = keyword.value.s
             return kwargs
 
-    def _scan_file(self, file_path: str) -> Dict[str, FlowDetails]:
+    @traced(attributes=lambda self, file_path, intern: {"file": file_path})
+    def _scan_file(self, file_path: str, intern: StringInterner) -> Dict[str, FlowDetails]:
         """Scan a single Python file for flows."""
         flows = {}
         try:
@@ -141,31 +161,7 @@ class PrefectFlowFinder(FlowFinder):
 
             # Process found flows
             for key, flow_data in visitor.flows.items():
-                # Add file information
-                flow_data["source_path"] = file_path
-                flow_data["source_relative"] = os.path.relpath(
-                    file_path, start=self.root_dir
-                )
-                flow_data["grouping"] = flow_data["source_relative"].split(os.sep)[
-                    :-1
-                ]  # Grouping by directory structure
-                package_name = os.path.basename(self.root_dir)
-                import_path = (
-                    f"{package_name}.{flow_data['source_relative'].replace(os.sep, '.').replace('.py', '')}"
-                )
-                
-                # Update the import_path in the PrefectFlowAttributes and convert to dict
-                prefect_attrs = flow_data["child_attributes"]  # Get the dataclass directly
-                prefect_attrs.import_path = import_path
-                
-                # Convert PrefectFlowAttributes to dict for child_attributes
-                flow_data["child_attributes"] = prefect_attrs.to_dict()
-                
-                flow_data = FlowDetails(**flow_data)
-                # Add the flow to the results
-                flows[key] = flow_data
-
-                print(f"Added flow to results: {flow_data.name}")
+                flows[key] = self._to_flow_details(file_path, flow_data, intern)
 
         except Exception as e:
             print(f"Error scanning {file_path}: {str(e)}")
@@ -173,11 +169,75 @@ class PrefectFlowFinder(FlowFinder):
 
         return flows
 
+    def _to_flow_details(
+        self, file_path: str, flow_data: dict, intern: StringInterner
+    ) -> FlowDetails:
+        """Add file information to the data of a flow found in a file."""
+        flow_data["source_path"] = file_path
+        flow_data["source_relative"] = os.path.relpath(
+            file_path, start=self.root_dir
+        )
+        flow_data["grouping"] = intern.intern_all(
+            flow_data["source_relative"].split(os.sep)[:-1]
+        )  # Grouping by directory structure
+        import_path = (
+            f"{self.package_name}.{flow_data['source_relative'].replace(os.sep, '.').replace('.py', '')}"
+        )
+
+        # Update the import_path in the PrefectFlowAttributes and convert to dict
+        prefect_attrs = flow_data["child_attributes"]  # Get the dataclass directly
+        prefect_attrs.import_path = import_path
+
+        # Convert PrefectFlowAttributes to dict for child_attributes
+        flow_data["child_attributes"] = prefect_attrs.to_dict()
+
+        flow_data = FlowDetails(**flow_data)
+        print(f"Added flow to results: {flow_data.name}")
+        return flow_data
+
+    def _runtime_flows(
+        self,
+        file_path: str,
+        objects: List[DiscoveredObject],
+        static_flows: List[FlowDetails],
+        intern: StringInterner,
+    ) -> Dict[str, FlowDetails]:
+        """Convert flows found by importing a file, skipping those the AST scan already found."""
+        known = {flow.name for flow in static_flows} | {
+            flow.child_attributes.get("obj_name") for flow in static_flows
+        }
+        module = os.path.splitext(os.path.basename(file_path))[0]
+        flows = {}
+        for obj in objects:
+            display_name = obj.name.replace("-", "_")
+            # Deployments import flows by global name, so flows without one cannot be deployed
+            if not obj.obj_name or display_name in known or obj.obj_name in known:
+                continue
+            print(f"Found flow at runtime: {display_name} in {file_path}")
+            flow_key = f"{obj.name}_{file_path}"
+            flows[flow_key] = self._to_flow_details(
+                file_path,
+                {
+                    "name": display_name,
+                    "original_name": obj.name,
+                    "description": obj.description,
+                    "id": flow_key,
+                    "child_attributes": PrefectFlowAttributes(
+                        obj_name=obj.obj_name, module=module, import_path=""
+                    ),
+                },
+                intern,
+            )
+        return flows
+
     def _scan_directory(self, root_dir: str) -> Dict[str, FlowDetails]:
         """Recursively scan a directory for Python files with flows."""
         all_flows = {}
+        flows_by_file: Dict[str, List[FlowDetails]] = {}
 
         print(f"Scanning directory: {root_dir}")
+        # Directory names repeat across the groupings of all flows of one scan
+        intern = StringInterner()
 
         try:
             # todo: https://stackoverflow.com/questions/25229592/python-how-to-implement-something-like-gitignore-behavior
@@ -186,10 +246,22 @@ class PrefectFlowFinder(FlowFinder):
                     if file.endswith(".py"):
                         file_path = os.path.join(root, file)
                         print(f"Examining file: {file_path}")
-                        flows = self._scan_file(file_path)
+                        flows = self._scan_file(file_path, intern)
                         if flows:
                             print(f"Found {len(flows)} flows in {file_path}")
                         all_flows.update(flows)
+                        flows_by_file[file_path] = list(flows.values())
+
+            if self.import_discovery is not None:
+                discovered = self.import_discovery.discover(
+                    "prefect", root_dir, list(flows_by_file), self.package_name
+                )
+                for file_path, static_flows in flows_by_file.items():
+                    objects = discovered.get(os.path.abspath(file_path))
+                    if objects:
+                        all_flows.update(
+                            self._runtime_flows(file_path, objects, static_flows, intern)
+                        )
         except Exception as e:
             print(f"Error walking directory {root_dir}: {str(e)}")
             traceback.print_exc(file=sys.stderr)
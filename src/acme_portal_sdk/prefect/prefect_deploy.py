@@ -2,10 +2,19 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from acme_config import add_main_arguments, load_saved_parameters
+from acme_portal_sdk.deploy_executor import DEFAULT_MAX_PARALLEL
+from acme_portal_sdk.flow_catalog import FlowCatalog
+from acme_portal_sdk.github.github_workflow import (
+    DEFAULT_COMMAND_TIMEOUT,
+    CommandExecutor,
+    GitService,
+)
+from acme_portal_sdk.prefect.deployment_plan import PrefectDeploymentPlanner
 from acme_portal_sdk.prefect.flow_deploy import (
+    PrefectDeployInfo,
     PrefectDeployInfoPrep,
     PrefectFlowDeployer,
 )
@@ -51,44 +60,70 @@ def import_flow_finder():
         ) from e
 
 
-def parse_args():
-    parser = argparse.ArgumentParser(description="Deploy flows to prefect")
-    subparsers = parser.add_subparsers(dest="command")
-    # Deploy parser for initial deployment
-    deploy_parser = subparsers.add_parser("deploy")
-    add_main_arguments(deploy_parser)
-    deploy_parser.add_argument(
+def _add_max_parallel_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=DEFAULT_MAX_PARALLEL,
+        help="Maximum number of flows deployed at the same time",
+    )
+
+
+def _add_deploy_arguments(parser: argparse.ArgumentParser) -> None:
+    add_main_arguments(parser)
+    parser.add_argument(
         "-project-name",
         type=lambda x: str(x).replace("_", "-"),
         required=True,
         help="Name of the project",
     )
-    deploy_parser.add_argument(
+    parser.add_argument(
         "-branch-name",
         type=lambda x: str(x).replace("_", "-"),
-        required=True,
-        help="Name of the branch",
+        default=None,
+        help="Name of the branch, read from the git repository if not given",
     )
-    deploy_parser.add_argument(
-        "-commit-hash", type=str, required=True, help="Git commit hash"
+    parser.add_argument(
+        "-commit-hash",
+        type=str,
+        default=None,
+        help="Git commit hash, read from the git repository if not given",
     )
-    deploy_parser.add_argument("-image-uri", type=str, required=True, help="Image URI")
-    deploy_parser.add_argument(
+    parser.add_argument("-image-uri", type=str, required=True, help="Image URI")
+    parser.add_argument(
         "-package-version", type=str, required=True, help="Package version"
     )
-    deploy_parser.add_argument(
+    parser.add_argument(
         "-static-flow-config-path",
         type=str,
         required=True,
         help="Path to static flow deployment configuration file",
     )
-    deploy_parser.add_argument(
+    parser.add_argument(
         "--flows-to-deploy",
         type=str,
         default="all",
         help="Comma separated list of flow config names to deploy, or 'all'",
     )
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Deploy flows to prefect")
+    subparsers = parser.add_subparsers(dest="command")
+    # Deploy parser for initial deployment
+    deploy_parser = subparsers.add_parser("deploy")
+    _add_deploy_arguments(deploy_parser)
+    _add_max_parallel_argument(deploy_parser)
+    deploy_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Deploy all selected flows, including those whose configuration is unchanged",
+    )
+
+    # Plan parser for showing which deployments would be created or updated
+    plan_parser = subparsers.add_parser("plan")
+    _add_deploy_arguments(plan_parser)
+
     # Promote parser for promoting deployment from one environment to another
     promote_parser = subparsers.add_parser("promote")
     add_main_arguments(promote_parser)
@@ -104,8 +139,8 @@ def parse_args():
     promote_parser.add_argument(
         "-branch-name",
         type=lambda x: str(x).replace("_", "-"),
-        required=True,
-        help="Name of the branch",
+        default=None,
+        help="Name of the branch, read from the git repository if not given",
     )
     promote_parser.add_argument(
         "-static-flow-config-path",
@@ -119,30 +154,76 @@ def parse_args():
         default="all",
         help="Comma separated list of flow config names to deploy, or 'all'",
     )
+    _add_max_parallel_argument(promote_parser)
 
     return parser.parse_args()
 
 
-def deploy(args):
+def _fill_git_metadata(args, git_service: Optional[GitService] = None) -> None:
+    """
+    Fill in branch name and commit hash arguments that were not given from the git repository.
+
+    Args:
+        args: Parsed command line arguments
+        git_service: Service reading the repository, created for the current directory if None
+
+    Raises:
+        ValueError: If a missing value cannot be read from the repository
+    """
+    missing = [
+        name
+        for name in ("branch_name", "commit_hash")
+        if hasattr(args, name) and not getattr(args, name)
+    ]
+    if not missing:
+        return
+    if git_service is None:
+        git_service = GitService(CommandExecutor(timeout=DEFAULT_COMMAND_TIMEOUT))
+
+    if "branch_name" in missing:
+        branch_name = git_service.get_branch_name()
+        if not branch_name:
+            raise ValueError("-branch-name is required when no branch is checked out")
+        args.branch_name = branch_name.replace("_", "-")
+    if "commit_hash" in missing:
+        commit_hash = git_service.get_commit_hash()
+        if not commit_hash:
+            raise ValueError("-commit-hash is required outside of a git repository")
+        args.commit_hash = commit_hash
+
+
+def _prep_deploy_infos(args) -> List[PrefectDeployInfo]:
+    """
+    Prepare deployment info for the flows selected by command line arguments.
+
+    Args:
+        args: Parsed arguments of the `deploy` or `plan` command
+
+    Returns:
+        List of deployment info objects
+    """
     # Load environment variables
     env_vars = load_saved_parameters(args.app_name, args.env, args.ver_number)
 
-    # Get the flow_finder instance
+    # Get the flow_finder instance and share a single scan of it across the command
     flow_finder = import_flow_finder()
+    flow_catalog = FlowCatalog(flow_finder)
 
-    # Initialize deploy info prep and deployer
+    # Initialize deploy info prep
     deploy_info_prep = PrefectDeployInfoPrep(
         static_flow_deploy_config=args.static_flow_config_path,
         default_work_pool=DEFAULT_WORK_POOL,
         prefect_flow_finder=flow_finder,
+        flow_catalog=flow_catalog,
     )
-    deployer = PrefectFlowDeployer()
 
     # Determine which flows to deploy
-    flows_to_deploy = _get_flows_to_deploy(args.flows_to_deploy, flow_finder)
+    flows_to_deploy = _get_flows_to_deploy(
+        args.flows_to_deploy, flow_catalog=flow_catalog
+    )
 
     # Prepare deployment info
-    deploy_infos = deploy_info_prep.prep_deploy_info(
+    return deploy_info_prep.prep_deploy_info(
         project_name=args.project_name,
         branch_name=args.branch_name,
         commit_hash=args.commit_hash,
@@ -153,30 +234,54 @@ def deploy(args):
         env_vars=env_vars,
     )
 
-    # Execute deployments
-    for deploy_info in deploy_infos:
-        deployer.deploy(deploy_info)
 
+def deploy(args):
+    deploy_infos = _prep_deploy_infos(args)
+    planner = PrefectDeploymentPlanner(
+        PrefectFlowDeployer(), max_parallel=args.max_parallel
+    )
+
+    # Only create and update deployments whose configuration changed, unless forced. Forced
+    # deployments are planned too, so they carry the fingerprint tag later plans compare against.
+    deployment_plan = planner.plan(deploy_infos, force=args.force)
+    print(deployment_plan.summary())
+    result = planner.apply(deployment_plan)
 
-def _get_flows_to_deploy(flows_arg: str, flow_finder=None) -> List[str]:
+    # Report all failures once every flow was attempted
+    result.raise_for_failures()
+
+
+def plan(args):
+    deploy_infos = _prep_deploy_infos(args)
+    planner = PrefectDeploymentPlanner(PrefectFlowDeployer())
+    print(planner.plan(deploy_infos).summary())
+
+
+def _get_flows_to_deploy(
+    flows_arg: str,
+    flow_finder=None,
+    flow_catalog: Optional[FlowCatalog] = None,
+) -> List[str]:
     """
     Determine which flows to deploy based on input argument.
 
     Args:
         flows_arg: String containing flow names or 'all'
         flow_finder: Optional flow finder instance, will be imported if None
+        flow_catalog: Optional catalog to read flows from, takes precedence over flow_finder
 
     Returns:
         List of flow names to deploy
     """
     if flows_arg == "all":
-        # Import flow_finder if not provided
-        if flow_finder is None:
-            flow_finder = import_flow_finder()
+        if flow_catalog is None:
+            # Import flow_finder if not provided
+            if flow_finder is None:
+                flow_finder = import_flow_finder()
+            flow_catalog = FlowCatalog(flow_finder)
 
         # Get all available flows
-        all_flows = flow_finder.find_flows()
-        return [flow.name for flow in all_flows]
+        return flow_catalog.get_flow_names()
     else:
         return flows_arg.split(",")
 
@@ -185,24 +290,30 @@ def promote(args):
     # Load environment variables
     env_vars = load_saved_parameters(args.app_name, args.env, args.ver_number)
 
-    # Get the flow_finder instance
+    # Get the flow_finder instance and share a single scan of it across the command
     flow_finder = import_flow_finder()
+    flow_catalog = FlowCatalog(flow_finder)
 
     # Initialize deploy info prep and deployer
     deploy_info_prep = PrefectDeployInfoPrep(
         static_flow_deploy_config=args.static_flow_config_path,
         default_work_pool=DEFAULT_WORK_POOL,
         prefect_flow_finder=flow_finder,
+        flow_catalog=flow_catalog,
     )
     deployer = PrefectFlowDeployer()
 
     # Create the promotion handler
     promotion_handler = PrefectDeploymentPromote(
-        deployer=deployer, flow_deploy_info_prep=deploy_info_prep
+        deployer=deployer,
+        flow_deploy_info_prep=deploy_info_prep,
+        max_parallel=args.max_parallel,
     )
 
     # Determine which flows to promote
-    flows_to_promote = _get_flows_to_deploy(args.flows_to_deploy, flow_finder)
+    flows_to_promote = _get_flows_to_deploy(
+        args.flows_to_deploy, flow_catalog=flow_catalog
+    )
 
     # Execute the promotion
     promotion_handler.promote(
@@ -216,8 +327,13 @@ def promote(args):
 
 
 def main_logic(args):
+    if args.command in ("deploy", "plan", "promote"):
+        _fill_git_metadata(args)
+
     if args.command == "deploy":
         deploy(args)
+    elif args.command == "plan":
+        plan(args)
     elif args.command == "promote":
         promote(args)
     else:
@@ -0,0 +1,346 @@
+import contextlib
+import cProfile
+import io
+import json
+import math
+import os
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .deployment_finder import DeploymentFinder
+from .flow_finder import FlowFinder
+
+# Metrics that can be limited in a budgets file, with the unit used in the file
+BUDGET_METRICS = ("cold_ms", "warm_p50_ms", "warm_p95_ms", "peak_memory_mb")
+
+
+@dataclass
+class HotFunction:
+    """A function that took a large share of a profiled call.
+
+    Attributes:
+        function: Location and name, as `file:line(name)`
+        calls: Number of calls
+        own_time: Seconds spent in the function itself
+        cumulative_time: Seconds spent in the function and the functions it called
+    """
+
+    function: str
+    calls: int
+    own_time: float
+    cumulative_time: float
+
+
+@dataclass
+class PathProfile:
+    """Latency and memory of one read path, e.g. `find_flows`.
+
+    Attributes:
+        name: Name of the read path
+        cold: Seconds taken by the first call in the process
+        warm: Seconds taken by each following call
+        peak_memory: Peak bytes allocated during one call, measured with tracemalloc
+        hot_functions: Functions with the most own time during one call
+        error: Exception type and message if the read path raised, in which case it was not
+            measured further
+    """
+
+    name: str
+    cold: Optional[float] = None
+    warm: List[float] = field(default_factory=list)
+    peak_memory: Optional[int] = None
+    hot_functions: List[HotFunction] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def warm_p50(self) -> Optional[float]:
+        """Median of the warm call latencies in seconds."""
+        return percentile(self.warm, 50)
+
+    @property
+    def warm_p95(self) -> Optional[float]:
+        """95th percentile of the warm call latencies in seconds."""
+        return percentile(self.warm, 95)
+
+    def metrics(self) -> Dict[str, Optional[float]]:
+        """Return the metrics that can be limited in a budgets file."""
+        return {
+            "cold_ms": _to_ms(self.cold),
+            "warm_p50_ms": _to_ms(self.warm_p50),
+            "warm_p95_ms": _to_ms(self.warm_p95),
+            "peak_memory_mb": (
+                self.peak_memory / (1024 * 1024)
+                if self.peak_memory is not None
+                else None
+            ),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the PathProfile to a dictionary suitable for JSON serialization."""
+        return {
+            "name": self.name,
+            **self.metrics(),
+            "warm_ms": [_to_ms(seconds) for seconds in self.warm],
+            "peak_memory_bytes": self.peak_memory,
+            "hot_functions": [vars(function).copy() for function in self.hot_functions],
+            "error": self.error,
+        }
+
+
+def _to_ms(seconds: Optional[float]) -> Optional[float]:
+    return seconds * 1000 if seconds is not None else None
+
+
+def percentile(values: List[float], percent: float) -> Optional[float]:
+    """
+    Compute a percentile with the nearest-rank method.
+
+    Args:
+        values: Samples
+        percent: Percentile between 0 and 100
+
+    Returns:
+        The smallest sample that at least `percent` percent of the samples are less than or equal
+        to, or None if there are no samples
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _hot_functions(profiler: cProfile.Profile, top: int) -> List[HotFunction]:
+    """Return the functions with the most own time recorded by a profiler."""
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+    result = []
+    for (file_name, line, function_name), (_, calls, own, cumulative, _) in rows[:top]:
+        location = f"{file_name}:{line}({function_name})" if line else function_name
+        result.append(
+            HotFunction(
+                function=location,
+                calls=calls,
+                own_time=own,
+                cumulative_time=cumulative,
+            )
+        )
+    return result
+
+
+def profile_call(
+    name: str, call: Callable[[], Any], runs: int = 5, top: int = 10
+) -> Tuple[PathProfile, Any]:
+    """
+    Measure a read path.
+
+    The call is made `runs` times to measure latency, where the first call is the cold one, once
+    more under tracemalloc to measure peak memory and once more under cProfile to find hot
+    functions, so measuring overhead does not distort the latencies. Output printed by the call
+    is discarded.
+
+    Args:
+        name: Name of the read path
+        call: Function performing the read
+        runs: Number of timed calls, at least 1
+        top: Number of hot functions to report
+
+    Returns:
+        Tuple of the PathProfile and the result of the last timed call, None if the call raised
+    """
+    profile = PathProfile(name=name)
+    result = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            for run in range(max(1, runs)):
+                started = time.perf_counter()
+                result = call()
+                elapsed = time.perf_counter() - started
+                if run == 0:
+                    profile.cold = elapsed
+                else:
+                    profile.warm.append(elapsed)
+
+            tracing_memory = tracemalloc.is_tracing()
+            if not tracing_memory:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            try:
+                call()
+                profile.peak_memory = max(
+                    0, tracemalloc.get_traced_memory()[1] - baseline
+                )
+            finally:
+                if not tracing_memory:
+                    tracemalloc.stop()
+
+            profiler = cProfile.Profile()
+            profiler.runcall(call)
+            profile.hot_functions = _hot_functions(profiler, top)
+        except Exception as e:
+            profile.error = f"{type(e).__name__}: {e}"
+            result = None
+    return profile, result
+
+
+def profile_read_paths(
+    flow_finder: Optional[FlowFinder],
+    deployment_finder: Optional[DeploymentFinder],
+    runs: int = 5,
+    top: int = 10,
+) -> List[PathProfile]:
+    """
+    Measure the read paths used by the acme-portal extension.
+
+    Profiles `find_flows` and `get_deployments` and their selective refetch of a single flow and
+    deployment found by the full read.
+
+    Args:
+        flow_finder: Project FlowFinder, skipped if None
+        deployment_finder: Project DeploymentFinder, skipped if None
+        runs: Number of timed calls per read path
+        top: Number of hot functions to report per read path
+
+    Returns:
+        One PathProfile per measured read path
+    """
+    profiles = []
+    if flow_finder is not None:
+        profile, flows = profile_call("find_flows", flow_finder.find_flows, runs, top)
+        profiles.append(profile)
+        if flows:
+            profiles.append(
+                profile_call(
+                    "find_flows (selective)",
+                    lambda: flow_finder.find_flows(flows_to_fetch=flows[:1]),
+                    runs,
+                    top,
+                )[0]
+            )
+    if deployment_finder is not None:
+        profile, deployments = profile_call(
+            "get_deployments", deployment_finder.get_deployments, runs, top
+        )
+        profiles.append(profile)
+        if deployments:
+            profiles.append(
+                profile_call(
+                    "get_deployments (selective)",
+                    lambda: deployment_finder.get_deployments(
+                        deployments_to_fetch=deployments[:1]
+                    ),
+                    runs,
+                    top,
+                )[0]
+            )
+    return profiles
+
+
+def load_budgets(path: Union[str, Path]) -> Dict[str, Dict[str, float]]:
+    """
+    Load a budgets file.
+
+    The file is a JSON object mapping read path names to limits, e.g.
+    `{"find_flows": {"warm_p95_ms": 200, "peak_memory_mb": 50}}`. The limits are `cold_ms`,
+    `warm_p50_ms`, `warm_p95_ms` and `peak_memory_mb`.
+
+    Args:
+        path: Path of the budgets file
+
+    Returns:
+        Dictionary mapping read path names to metric limits
+
+    Raises:
+        ValueError: If the file contains an unknown metric
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        budgets = json.load(file)
+    for name, limits in budgets.items():
+        unknown = set(limits) - set(BUDGET_METRICS)
+        if unknown:
+            raise ValueError(
+                f"Unknown budget metrics for {name}: {', '.join(sorted(unknown))}. "
+                f"Use {', '.join(BUDGET_METRICS)}"
+            )
+    return budgets
+
+
+def check_budgets(
+    profiles: List[PathProfile], budgets: Dict[str, Dict[str, float]]
+) -> List[str]:
+    """
+    Compare profiles with budgets.
+
+    Args:
+        profiles: Measured read paths
+        budgets: Limits per read path, as returned by `load_budgets`
+
+    Returns:
+        One message per exceeded limit, empty if all budgets are met. A budgeted read path that
+        failed or was not measured counts as exceeded.
+    """
+    by_name = {profile.name: profile for profile in profiles}
+    violations = []
+    for name, limits in budgets.items():
+        profile = by_name.get(name)
+        if profile is None or profile.error is not None:
+            reason = profile.error if profile is not None else "not measured"
+            violations.append(f"{name}: {reason}")
+            continue
+        metrics = profile.metrics()
+        for metric, limit in limits.items():
+            value = metrics[metric]
+            if value is not None and value > limit:
+                violations.append(
+                    f"{name}: {metric} {value:.1f} exceeds budget {limit:g}"
+                )
+    return violations
+
+
+def format_report(profiles: List[PathProfile]) -> str:
+    """
+    Format profiles as a human readable report.
+
+    Args:
+        profiles: Measured read paths
+
+    Returns:
+        Report text
+    """
+    lines = [
+        f"{'read path':<30} {'cold ms':>10} {'warm p50':>10} {'warm p95':>10} {'peak MB':>10}"
+    ]
+    for profile in profiles:
+        if profile.error is not None:
+            lines.append(f"{profile.name:<30} ❌ {profile.error}")
+            continue
+        metrics = profile.metrics()
+        values = [
+            "-" if metrics[metric] is None else f"{metrics[metric]:.1f}"
+            for metric in BUDGET_METRICS
+        ]
+        lines.append(
+            f"{profile.name:<30} " + " ".join(f"{value:>10}" for value in values)
+        )
+    for profile in profiles:
+        if not profile.hot_functions:
+            continue
+        lines.append("")
+        lines.append(f"Hot functions in {profile.name} (own time):")
+        for function in profile.hot_functions:
+            lines.append(
+                f"  {function.own_time * 1000:>9.1f} ms {function.calls:>8} calls  "
+                f"{_shorten_path(function.function)}"
+            )
+    return "\n".join(lines)
+
+
+def _shorten_path(location: str) -> str:
+    """Show locations inside the working directory relative to it."""
+    cwd = os.getcwd() + os.sep
+    return location[len(cwd) :] if location.startswith(cwd) else location
@@ -0,0 +1,144 @@
+import json
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+
+def _is_container_type(field_type: Any) -> bool:
+    """Whether a field annotation is a list or dict type."""
+    if isinstance(field_type, str):
+        return field_type.split("[", 1)[0] in ("List", "Dict", "list", "dict")
+    return field_type in (list, dict) or getattr(field_type, "__origin__", None) in (
+        list,
+        dict,
+    )
+
+
+@lru_cache(maxsize=None)
+def _record_layout(cls: type) -> Tuple[Tuple[str, ...], Tuple[str, ...], bool]:
+    """Return the layout of a dataclass used by `record_to_dict`.
+
+    The layout is the field names, the names of the list and dict fields, and whether instances
+    keep their fields in a `__dict__` rather than in `__slots__`.
+    """
+    record_fields = fields(cls)
+    return (
+        tuple(record_field.name for record_field in record_fields),
+        tuple(
+            record_field.name
+            for record_field in record_fields
+            if _is_container_type(record_field.type)
+        ),
+        cls.__dictoffset__ != 0,
+    )
+
+
+def record_to_dict(record: Any) -> Dict[str, Any]:
+    """
+    Convert a dataclass record to a dictionary.
+
+    Unlike `dataclasses.asdict`, values are not copied recursively. Fields declared as lists or
+    dicts are copied so the result can be changed without changing the record, but values nested
+    inside them are shared.
+
+    Args:
+        record: Dataclass instance
+
+    Returns:
+        Dictionary mapping field names to values
+    """
+    names, container_names, has_dict = _record_layout(type(record))
+    values = record.__dict__ if has_dict else None
+    if values is not None and len(values) == len(names):
+        # Only the fields are set, in declaration order
+        result = values.copy()
+    else:
+        # Slotted records, and records with attributes besides the fields
+        result = {name: getattr(record, name) for name in names}
+    for name in container_names:
+        value = result[name]
+        if isinstance(value, list):
+            result[name] = list(value)
+        elif isinstance(value, dict):
+            result[name] = dict(value)
+    return result
+
+
+def dumps(data: Any) -> str:
+    """
+    Encode data as compact JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON serializable data
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(content: Any) -> Any:
+    """
+    Decode JSON, using orjson when it is installed.
+
+    Args:
+        content: JSON string or bytes
+
+    Returns:
+        Decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def packb(data: Any) -> bytes:
+    """
+    Encode data as msgpack.
+
+    Args:
+        data: Data made of dicts, lists, strings, numbers, booleans and None
+
+    Returns:
+        Encoded bytes
+
+    Raises:
+        ImportError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise ImportError(
+            "msgpack is not installed. Install it with: pip install 'acme_portal_sdk[fast]'"
+        )
+    return msgpack.packb(data, use_bin_type=True)
+
+
+def unpackb(content: bytes) -> Any:
+    """
+    Decode msgpack.
+
+    Args:
+        content: Encoded bytes
+
+    Returns:
+        Decoded data
+
+    Raises:
+        ImportError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise ImportError(
+            "msgpack is not installed. Install it with: pip install 'acme_portal_sdk[fast]'"
+        )
+    return msgpack.unpackb(content, raw=False)
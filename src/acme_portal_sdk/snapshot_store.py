@@ -0,0 +1,489 @@
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .deployment_finder import DeploymentDetails, DeploymentFinder
+from .flow_finder import FlowDetails, FlowFinder
+from .serialization import dumps, loads
+
+DEFAULT_SNAPSHOT_PATH = Path.home() / ".cache" / "acme_portal_sdk" / "snapshots.sqlite3"
+
+FLOWS = "flows"
+DEPLOYMENTS = "deployments"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    project TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    saved_at REAL NOT NULL,
+    records TEXT NOT NULL,
+    PRIMARY KEY (project, kind)
+)
+"""
+
+
+@dataclass
+class Snapshot:
+    """Result of a read path, either stored by an earlier call or just fetched.
+
+    Attributes:
+        items: FlowDetails or DeploymentDetails objects
+        saved_at: Time the items were fetched, in seconds since the epoch
+        stale: True if the items were read from the store and have not been revalidated yet
+    """
+
+    items: List[Any]
+    saved_at: float
+    stale: bool
+
+    @property
+    def age(self) -> float:
+        """Seconds since the items were fetched."""
+        return max(0.0, time.time() - self.saved_at)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the Snapshot to a dictionary suitable for JSON serialization."""
+        return {
+            "items": [item.to_dict() for item in self.items],
+            "saved_at": self.saved_at,
+            "stale": self.stale,
+        }
+
+
+class SnapshotStore:
+    """Persists the last `find_flows` and `get_deployments` results per project in SQLite.
+
+    Each project has one row per kind of result, holding the records as JSON. Every operation
+    opens its own connection, so a store can be shared by threads, and the database uses
+    write-ahead logging, so several processes can read while one writes.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_SNAPSHOT_PATH):
+        """
+        Initialize the store, creating the database on first use.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), timeout=30)
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.execute(_SCHEMA)
+                    connection.commit()
+                    self._initialized = True
+        return connection
+
+    def load(
+        self, project: str, kind: str
+    ) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        """
+        Read stored records.
+
+        Args:
+            project: Project key
+            kind: `FLOWS` or `DEPLOYMENTS`
+
+        Returns:
+            Tuple of the records, as dictionaries, and the time they were saved, or None if
+            nothing is stored
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT records, saved_at FROM snapshots WHERE project = ? AND kind = ?",
+                (project, kind),
+            ).fetchone()
+        if row is None:
+            return None
+        return loads(row[0]), row[1]
+
+    def save(
+        self,
+        project: str,
+        kind: str,
+        records: List[Dict[str, Any]],
+        saved_at: Optional[float] = None,
+    ) -> None:
+        """
+        Replace stored records.
+
+        Args:
+            project: Project key
+            kind: `FLOWS` or `DEPLOYMENTS`
+            records: Records as dictionaries, e.g. from `FlowDetails.to_dict`
+            saved_at: Time the records were fetched, now if None
+        """
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO snapshots (project, kind, saved_at, records) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        project,
+                        kind,
+                        time.time() if saved_at is None else saved_at,
+                        dumps(records),
+                    ),
+                )
+
+    def delete(self, project: str, kind: Optional[str] = None) -> None:
+        """
+        Remove stored records.
+
+        Args:
+            project: Project key
+            kind: `FLOWS` or `DEPLOYMENTS`, both if None
+        """
+        with closing(self._connect()) as connection:
+            with connection:
+                if kind is None:
+                    connection.execute(
+                        "DELETE FROM snapshots WHERE project = ?", (project,)
+                    )
+                else:
+                    connection.execute(
+                        "DELETE FROM snapshots WHERE project = ? AND kind = ?",
+                        (project, kind),
+                    )
+
+
+class StaleWhileRevalidate:
+    """Serves the stored result of a read path at once and refreshes it in the background.
+
+    `read()` returns the stored snapshot flagged as stale and starts a revalidation, which calls
+    the read path, stores its result and passes the fresh snapshot to `on_update`. Only one
+    revalidation runs at a time. `start()` also revalidates periodically, waiting the refresh
+    interval randomized by the jitter fraction between runs, so many clients do not refresh in
+    lockstep.
+
+    Revalidations run in daemon threads, so a short-lived process does not wait for a background
+    refresh before it exits. The next process then serves the older result and revalidates it
+    again.
+    """
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        project: str,
+        kind: str,
+        fetch: Callable[[], List[Any]],
+        decode: Callable[[Dict[str, Any]], Any],
+        refresh_interval: float = 300.0,
+        jitter: float = 0.2,
+        max_age: float = 0.0,
+        on_update: Optional[Callable[[Snapshot], None]] = None,
+    ):
+        """
+        Initialize the revalidator.
+
+        Args:
+            store: Store holding the snapshots
+            project: Project key
+            kind: `FLOWS` or `DEPLOYMENTS`
+            fetch: Read path returning objects with a `to_dict` method
+            decode: Converts a stored record back to an object
+            refresh_interval: Mean seconds between periodic revalidations
+            jitter: Fraction by which each interval is randomly shortened or lengthened
+            max_age: Seconds a stored snapshot is served as fresh, without revalidation
+            on_update: Called with each fresh snapshot after it is stored
+        """
+        self.store = store
+        self.project = project
+        self.kind = kind
+        self.fetch = fetch
+        self.decode = decode
+        self.refresh_interval = refresh_interval
+        self.jitter = jitter
+        self.max_age = max_age
+        self.on_update = on_update
+        self._lock = threading.Lock()
+        self._pending: Optional[Future] = None
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    def _refresh(self) -> Snapshot:
+        """Fetch, store and publish a fresh snapshot."""
+        try:
+            snapshot = Snapshot(
+                items=list(self.fetch()), saved_at=time.time(), stale=False
+            )
+            self.store.save(
+                self.project,
+                self.kind,
+                [item.to_dict() for item in snapshot.items],
+                snapshot.saved_at,
+            )
+            if self.on_update is not None:
+                self.on_update(snapshot)
+            return snapshot
+        except Exception as e:
+            print(
+                f"Error revalidating {self.kind} snapshot of {self.project}: {str(e)}"
+            )
+            traceback.print_exc(file=sys.stderr)
+            raise
+
+    def read(self) -> Snapshot:
+        """
+        Return the stored snapshot, revalidating it in the background.
+
+        Without a stored snapshot the read path is called and stored before returning.
+
+        Returns:
+            Stored snapshot flagged as stale, stored snapshot younger than `max_age`, or a fresh
+            snapshot
+
+        Raises:
+            Exception: Any error of the read path when nothing is stored
+        """
+        stored = self.store.load(self.project, self.kind)
+        if stored is None:
+            return self.revalidate().result()
+        records, saved_at = stored
+        snapshot = Snapshot(
+            items=[self.decode(record) for record in records],
+            saved_at=saved_at,
+            stale=True,
+        )
+        if snapshot.age < self.max_age:
+            snapshot.stale = False
+        else:
+            self.revalidate()
+        return snapshot
+
+    def revalidate(self) -> "Future[Snapshot]":
+        """
+        Start a revalidation unless one is already running.
+
+        Returns:
+            Future resolving to the fresh snapshot
+        """
+        with self._lock:
+            if self._pending is None or self._pending.done():
+                self._pending = self._start_refresh()
+            return self._pending
+
+    def _start_refresh(self) -> "Future[Snapshot]":
+        """Run `_refresh` in a daemon thread and return a future of its result."""
+        future: "Future[Snapshot]" = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self._refresh())
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+    def next_interval(self) -> float:
+        """Seconds to wait before the next periodic revalidation."""
+        return self.refresh_interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def start(self) -> None:
+        """Revalidate periodically in a background thread until `stop()` is called."""
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_periodically, daemon=True
+        )
+        self._refresher.start()
+
+    def _refresh_periodically(self) -> None:
+        while not self._stop.wait(self.next_interval()):
+            try:
+                self.revalidate().result()
+            except Exception:
+                # Already reported; keep serving the last snapshot and retry next interval
+                pass
+
+    def stop(self) -> None:
+        """Stop periodic revalidation, letting a running revalidation finish."""
+        self._stop.set()
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+
+
+def _backend_url(finder: Any) -> Optional[str]:
+    """URL of the API a finder reads from, `PREFECT_API_URL` unless it has its own."""
+    for attribute in ("airflow_url", "api_url", "base_url"):
+        url = getattr(finder, attribute, None)
+        if url:
+            return str(url)
+    return os.environ.get("PREFECT_API_URL")
+
+
+def _default_project(finder: Any, backend_url: Optional[str] = None) -> str:
+    """Key a wrapped finder by working directory, class, `root_dir` and backend URL."""
+    finder_class = type(finder)
+    parts = [
+        str(Path.cwd().resolve()),
+        f"{finder_class.__module__}.{finder_class.__qualname__}",
+    ]
+    root_dir = getattr(finder, "root_dir", None)
+    if root_dir is not None:
+        parts.append(str(Path(root_dir).resolve()))
+    if backend_url is not None:
+        parts.append(backend_url)
+    return "|".join(parts)
+
+
+class SnapshotFlowFinder(FlowFinder):
+    """Wraps a FlowFinder to return its last result at once and refresh it in the background.
+
+    Full `find_flows` calls are served by a `StaleWhileRevalidate` over a `SnapshotStore`.
+    Selective refetches are passed to the wrapped finder unchanged.
+    """
+
+    def __init__(
+        self,
+        flow_finder: FlowFinder,
+        project: Optional[str] = None,
+        store: Optional[SnapshotStore] = None,
+        refresh_interval: float = 300.0,
+        jitter: float = 0.2,
+        max_age: float = 0.0,
+        on_update: Optional[Callable[[Snapshot], None]] = None,
+    ):
+        """
+        Initialize the SnapshotFlowFinder.
+
+        Args:
+            flow_finder: Finder performing the actual scan
+            project: Project key in the store, the working directory, the
+                finder's class and its `root_dir` if None
+            store: Snapshot store, `DEFAULT_SNAPSHOT_PATH` if None
+            refresh_interval: Mean seconds between periodic revalidations, see `start()`
+            jitter: Fraction by which each interval is randomly shortened or lengthened
+            max_age: Seconds a stored snapshot is served as fresh, without revalidation
+            on_update: Called with each fresh snapshot after it is stored
+        """
+        self.flow_finder = flow_finder
+        self.snapshots = StaleWhileRevalidate(
+            store=store or SnapshotStore(),
+            project=project or _default_project(flow_finder),
+            kind=FLOWS,
+            fetch=flow_finder.find_flows,
+            decode=FlowDetails.from_dict,
+            refresh_interval=refresh_interval,
+            jitter=jitter,
+            max_age=max_age,
+            on_update=on_update,
+        )
+
+    def find_flows(
+        self,
+        *,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[FlowDetails]:
+        """Return the stored flows, or the wrapped finder's result for selective refetches."""
+        if flows_to_fetch is not None or flow_groups is not None:
+            return self.flow_finder.find_flows(
+                flows_to_fetch=flows_to_fetch, flow_groups=flow_groups
+            )
+        return self.snapshots.read().items
+
+    def read_snapshot(self) -> Snapshot:
+        """Return the stored flows with their age and staleness, see `StaleWhileRevalidate.read`."""
+        return self.snapshots.read()
+
+    def start(self) -> None:
+        """Revalidate the stored flows periodically."""
+        self.snapshots.start()
+
+    def stop(self) -> None:
+        """Stop periodic revalidation."""
+        self.snapshots.stop()
+
+
+class SnapshotDeploymentFinder(DeploymentFinder):
+    """Wraps a DeploymentFinder to return its last result at once and refresh it in the background.
+
+    Full `get_deployments` calls are served by a `StaleWhileRevalidate` over a `SnapshotStore`.
+    Selective refetches are passed to the wrapped finder unchanged.
+    """
+
+    def __init__(
+        self,
+        deployment_finder: DeploymentFinder,
+        project: Optional[str] = None,
+        store: Optional[SnapshotStore] = None,
+        refresh_interval: float = 300.0,
+        jitter: float = 0.2,
+        max_age: float = 0.0,
+        on_update: Optional[Callable[[Snapshot], None]] = None,
+    ):
+        """
+        Initialize the SnapshotDeploymentFinder.
+
+        Args:
+            deployment_finder: Finder performing the actual fetch
+            project: Project key in the store, the working directory, the
+                finder's class and the URL of its API if None, i.e. its
+                `airflow_url` or the `PREFECT_API_URL` environment variable
+            store: Snapshot store, `DEFAULT_SNAPSHOT_PATH` if None
+            refresh_interval: Mean seconds between periodic revalidations, see `start()`
+            jitter: Fraction by which each interval is randomly shortened or lengthened
+            max_age: Seconds a stored snapshot is served as fresh, without revalidation
+            on_update: Called with each fresh snapshot after it is stored
+        """
+        self.deployment_finder = deployment_finder
+        self.snapshots = StaleWhileRevalidate(
+            store=store or SnapshotStore(),
+            project=project
+            or _default_project(deployment_finder, _backend_url(deployment_finder)),
+            kind=DEPLOYMENTS,
+            fetch=deployment_finder.get_deployments,
+            decode=DeploymentDetails.from_dict,
+            refresh_interval=refresh_interval,
+            jitter=jitter,
+            max_age=max_age,
+            on_update=on_update,
+        )
+
+    def get_deployments(
+        self,
+        *,
+        deployments_to_fetch: Optional[List[DeploymentDetails]] = None,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+    ) -> List[DeploymentDetails]:
+        """Return the stored deployments, or the wrapped finder's result for selective refetches."""
+        if deployments_to_fetch is not None or flows_to_fetch is not None:
+            return self.deployment_finder.get_deployments(
+                deployments_to_fetch=deployments_to_fetch, flows_to_fetch=flows_to_fetch
+            )
+        return self.snapshots.read().items
+
+    def read_snapshot(self) -> Snapshot:
+        """Return the stored deployments with their age and staleness, see `StaleWhileRevalidate.read`."""
+        return self.snapshots.read()
+
+    def start(self) -> None:
+        """Revalidate the stored deployments periodically."""
+        self.snapshots.start()
+
+    def stop(self) -> None:
+        """Stop periodic revalidation."""
+        self.snapshots.stop()
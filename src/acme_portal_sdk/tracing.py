@@ -0,0 +1,545 @@
+"""Optional tracing and metrics for SDK operations.
+
+Operations such as `FlowFinder.find_flows`, `DeploymentFinder.get_deployments`, HTTP and Prefect
+API calls, `FlowDeployer.deploy`, `DeploymentPromote.promote` and `CommandExecutor.execute` are
+recorded as spans. Spans are only created while at least one exporter is registered; otherwise
+instrumented code checks one module variable and runs unchanged.
+
+    from acme_portal_sdk import tracing
+
+    tracing.add_exporter(tracing.JsonLinesExporter("spans.jsonl"))
+
+Exporters can also be configured with the `ACME_PORTAL_SDK_TRACE_JSONL` and
+`ACME_PORTAL_SDK_PROMETHEUS_TEXTFILE` environment variables, read when the package is imported.
+"""
+
+import atexit
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .serialization import dumps
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TRACE_JSONL_ENV = "ACME_PORTAL_SDK_TRACE_JSONL"
+PROMETHEUS_TEXTFILE_ENV = "ACME_PORTAL_SDK_PROMETHEUS_TEXTFILE"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """A timed operation.
+
+    Attributes:
+        name: Operation name, e.g. `PrefectFlowFinder.find_flows` or `http.request`
+        trace_id: Identifier shared by a span and all spans started inside it
+        span_id: Identifier of the span
+        parent_id: Identifier of the enclosing span, None for a root span
+        start_time: Start time in seconds since the epoch
+        duration: Duration in seconds
+        attributes: Details of the operation, e.g. the requested URL
+        error: Exception type and message if the operation raised
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_time: float
+    duration: float = 0.0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute, converting values other than str, int, float and bool to str."""
+        if value is not None and not isinstance(value, (str, int, float, bool)):
+            value = str(value)
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the span to a dictionary suitable for JSON serialization."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "attributes": dict(self.attributes),
+            "error": self.error,
+        }
+
+
+class SpanExporter(ABC):
+    """Receives finished spans."""
+
+    def on_start(self, span: Span) -> None:
+        """Called when a span starts, before any span started inside it."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Called when a span ends."""
+
+    def shutdown(self) -> None:
+        """Flush buffered data and release resources."""
+
+
+_exporters: Tuple[SpanExporter, ...] = ()
+_exporters_lock = threading.Lock()
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "acme_portal_sdk_current_span", default=None
+)
+
+
+def add_exporter(exporter: SpanExporter) -> SpanExporter:
+    """
+    Register an exporter, enabling tracing.
+
+    Args:
+        exporter: Exporter receiving every span finished from now on
+
+    Returns:
+        The exporter, for use with `remove_exporter`
+    """
+    global _exporters
+    with _exporters_lock:
+        _exporters = (*_exporters, exporter)
+    return exporter
+
+
+def remove_exporter(exporter: SpanExporter) -> None:
+    """Unregister an exporter and shut it down. Tracing is disabled when no exporter is left."""
+    global _exporters
+    with _exporters_lock:
+        _exporters = tuple(item for item in _exporters if item is not exporter)
+    exporter.shutdown()
+
+
+def clear_exporters() -> None:
+    """Unregister and shut down all exporters, disabling tracing."""
+    for exporter in _exporters:
+        remove_exporter(exporter)
+
+
+def is_enabled() -> bool:
+    """Whether any exporter is registered."""
+    return bool(_exporters)
+
+
+class _NoopSpan:
+    """Span context returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _SpanContext:
+    """Context manager that times a span and passes it to the exporters."""
+
+    __slots__ = ("_span", "_started", "_token", "_exporters")
+
+    def __init__(self, name: str, attributes: Mapping[str, Any]):
+        parent = _current_span.get()
+        self._span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent is not None else None,
+            start_time=0.0,
+        )
+        for key, value in attributes.items():
+            self._span.set_attribute(key, value)
+        # Spans are delivered to the exporters registered when they started
+        self._exporters = _exporters
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        self._span.start_time = time.time()
+        for exporter in self._exporters:
+            _call_exporter(exporter.on_start, self._span)
+        self._started = time.perf_counter()
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> bool:
+        self._span.duration = time.perf_counter() - self._started
+        if exc_type is not None:
+            self._span.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        for exporter in self._exporters:
+            _call_exporter(exporter.export, self._span)
+        return False
+
+
+def _call_exporter(method: Callable[[Span], None], span: Span) -> None:
+    """Call an exporter, logging instead of raising so tracing never breaks an operation."""
+    try:
+        method(span)
+    except Exception:
+        logger.exception(f"Span exporter failed for span {span.name}")
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """
+    Record the enclosed block as a span.
+
+        with tracing.span("prefect.read_deployments") as current:
+            deployments = client.read_deployments()
+            current.set_attribute("count", len(deployments))
+
+    Args:
+        name: Operation name
+        **attributes: Initial span attributes
+
+    Returns:
+        Context manager yielding the Span, or an object ignoring attributes when tracing is disabled
+    """
+    if not _exporters:
+        return _NOOP_SPAN
+    return _SpanContext(name, attributes)
+
+
+def traced(
+    name: Optional[str] = None,
+    attributes: Optional[Callable[..., Mapping[str, Any]]] = None,
+) -> Callable[[F], F]:
+    """
+    Decorator recording each call of a function or coroutine function as a span.
+
+    Args:
+        name: Span name, defaults to the qualified name of the function
+        attributes: Function called with the same arguments as the decorated function, returning
+            span attributes. Only called while tracing is enabled.
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        def start(args: Sequence[Any], kwargs: Dict[str, Any]) -> _SpanContext:
+            return _SpanContext(
+                span_name, attributes(*args, **kwargs) if attributes is not None else {}
+            )
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not _exporters:
+                    return await func(*args, **kwargs)
+                with start(args, kwargs):
+                    return await func(*args, **kwargs)
+
+            wrapper: Any = async_wrapper
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not _exporters:
+                    return func(*args, **kwargs)
+                with start(args, kwargs):
+                    return func(*args, **kwargs)
+
+        wrapper.__traced__ = True
+        return wrapper
+
+    return decorator
+
+
+def instrument_methods(cls: type, *method_names: str) -> None:
+    """
+    Trace methods defined by a class, named `<class name>.<method name>`.
+
+    Called from `__init_subclass__` of the SDK base classes, so implementations such as project
+    specific finders in `.acme_portal_sdk` are traced without changes. Abstract, inherited and
+    already traced methods are left unchanged.
+
+    Args:
+        cls: Class defining the methods
+        *method_names: Names of the methods to trace
+    """
+    for method_name in method_names:
+        method = cls.__dict__.get(method_name)
+        if (
+            not callable(method)
+            or getattr(method, "__isabstractmethod__", False)
+            or getattr(method, "__traced__", False)
+        ):
+            continue
+        setattr(cls, method_name, traced(f"{cls.__name__}.{method_name}")(method))
+
+
+class JsonLinesExporter(SpanExporter):
+    """Writes each finished span as one JSON object per line."""
+
+    def __init__(
+        self, path: Union[str, Path, None] = None, stream: Optional[TextIO] = None
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: File to append spans to
+            stream: Open text stream to write spans to, used when no path is given
+
+        Raises:
+            ValueError: If neither path nor stream is given
+        """
+        if path is None and stream is None:
+            raise ValueError("Either path or stream must be given")
+        self._owns_stream = path is not None
+        self._stream = open(path, "a", encoding="utf-8") if path is not None else stream
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = dumps(span.to_dict())
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._owns_stream and not self._stream.closed:
+                self._stream.close()
+
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class PrometheusTextfileExporter(SpanExporter):
+    """Aggregates span durations into Prometheus metrics written to a textfile.
+
+    The file uses the Prometheus text format and can be collected by the node exporter textfile
+    collector. It holds a `<prefix>_span_duration_seconds` histogram and a
+    `<prefix>_span_errors_total` counter, both labelled with the span name. The file is replaced
+    atomically at most once per `write_interval` and on shutdown.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        prefix: str = "acme_portal_sdk",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        write_interval: float = 10.0,
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: Textfile to write, should end with `.prom` for the node exporter
+            prefix: Prefix of the metric names
+            buckets: Upper bounds of the histogram buckets in seconds
+            write_interval: Minimum number of seconds between writes of the file
+        """
+        self.path = Path(path)
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self.write_interval = write_interval
+        self._lock = threading.Lock()
+        # Span name mapped to [bucket counts..., count, sum, errors]
+        self._metrics: Dict[str, List[float]] = {}
+        self._last_write = 0.0
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            metric = self._metrics.get(span.name)
+            if metric is None:
+                metric = self._metrics[span.name] = [0.0] * (len(self.buckets) + 3)
+            bucket = bisect_left(self.buckets, span.duration)
+            if bucket < len(self.buckets):
+                metric[bucket] += 1
+            metric[-3] += 1
+            metric[-2] += span.duration
+            if span.error is not None:
+                metric[-1] += 1
+            due = time.monotonic() - self._last_write >= self.write_interval
+        if due:
+            self.write()
+
+    def render(self) -> str:
+        """Render the aggregated metrics in the Prometheus text format."""
+        histogram = f"{self.prefix}_span_duration_seconds"
+        errors = f"{self.prefix}_span_errors_total"
+        lines = [
+            f"# HELP {histogram} Duration of acme_portal_sdk operations.",
+            f"# TYPE {histogram} histogram",
+        ]
+        with self._lock:
+            metrics = {name: list(values) for name, values in self._metrics.items()}
+        for name, values in sorted(metrics.items()):
+            label = f'span="{_escape_label(name)}"'
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                lines.append(
+                    f'{histogram}_bucket{{{label},le="{bound:g}"}} {cumulative:g}'
+                )
+            lines.append(f'{histogram}_bucket{{{label},le="+Inf"}} {values[-3]:g}')
+            lines.append(f"{histogram}_sum{{{label}}} {values[-2]!r}")
+            lines.append(f"{histogram}_count{{{label}}} {values[-3]:g}")
+        lines.append(
+            f"# HELP {errors} Number of acme_portal_sdk operations that raised."
+        )
+        lines.append(f"# TYPE {errors} counter")
+        for name, values in sorted(metrics.items()):
+            lines.append(f'{errors}{{span="{_escape_label(name)}"}} {values[-1]:g}')
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        """Write the metrics, replacing the file atomically so collectors never read partial data."""
+        content = self.render()
+        temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        temporary.write_text(content, encoding="utf-8")
+        os.replace(temporary, self.path)
+        self._last_write = time.monotonic()
+
+    def shutdown(self) -> None:
+        self.write()
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class OpenTelemetryExporter(SpanExporter):
+    """Forwards spans to an OpenTelemetry tracer.
+
+    Each span is started on the tracer when the SDK span starts, as a child of the span it was
+    started in, and ended when the SDK span ends, so it is exported by the processors configured
+    on the tracer provider.
+    """
+
+    def __init__(self, tracer: Any = None):
+        """
+        Initialize the exporter.
+
+        Args:
+            tracer: Object implementing the OpenTelemetry `Tracer` interface, defaults to
+                `opentelemetry.trace.get_tracer("acme_portal_sdk")`
+
+        Raises:
+            ImportError: If no tracer is given and opentelemetry-api is not installed
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            if tracer is None:
+                raise ImportError(
+                    "opentelemetry-api is not installed. Install it with: pip install opentelemetry-api"
+                )
+            trace = None
+        self._trace = trace
+        self.tracer = (
+            tracer if tracer is not None else trace.get_tracer("acme_portal_sdk")
+        )
+        self._lock = threading.Lock()
+        self._open: Dict[str, Any] = {}
+
+    def on_start(self, span: Span) -> None:
+        context = None
+        with self._lock:
+            parent = self._open.get(span.parent_id) if span.parent_id else None
+        if parent is not None and self._trace is not None:
+            context = self._trace.set_span_in_context(parent)
+        otel_span = self.tracer.start_span(
+            span.name,
+            context=context,
+            attributes=dict(span.attributes),
+            start_time=int(span.start_time * 1e9),
+        )
+        with self._lock:
+            self._open[span.span_id] = otel_span
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            otel_span = self._open.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            otel_span.set_attribute(key, value)
+        if span.error is not None:
+            otel_span.set_attribute("error.message", span.error)
+            if self._trace is not None:
+                otel_span.set_status(
+                    self._trace.Status(self._trace.StatusCode.ERROR, span.error)
+                )
+        otel_span.end(end_time=int((span.start_time + span.duration) * 1e9))
+
+
+def configure_from_env(
+    environ: Optional[Mapping[str, str]] = None,
+) -> List[SpanExporter]:
+    """
+    Register exporters configured with environment variables.
+
+    `ACME_PORTAL_SDK_TRACE_JSONL` adds a JsonLinesExporter writing to the given file and
+    `ACME_PORTAL_SDK_PROMETHEUS_TEXTFILE` adds a PrometheusTextfileExporter.
+
+    Args:
+        environ: Environment variables, defaults to `os.environ`
+
+    Returns:
+        The registered exporters
+    """
+    environ = os.environ if environ is None else environ
+    exporters: List[SpanExporter] = []
+    if environ.get(TRACE_JSONL_ENV):
+        exporters.append(JsonLinesExporter(environ[TRACE_JSONL_ENV]))
+    if environ.get(PROMETHEUS_TEXTFILE_ENV):
+        exporters.append(PrometheusTextfileExporter(environ[PROMETHEUS_TEXTFILE_ENV]))
+    for exporter in exporters:
+        add_exporter(exporter)
+    if exporters:
+        atexit.register(clear_exporters)
+    return exporters
@@ -0,0 +1,95 @@
+"""Factories and stub finders shared by the acme_portal_sdk tests."""
+
+import os
+import threading
+from typing import Any, List, Optional
+
+from acme_portal_sdk.deployment_finder import DeploymentDetails
+from acme_portal_sdk.flow_finder import FlowDetails, FlowFinder
+
+
+def make_flow(name: str, **fields: Any) -> FlowDetails:
+    """Build a flow defined in `flows/<name>.py`, with `fields` replacing the defaults."""
+    values = {
+        "name": name,
+        "original_name": name,
+        "description": "",
+        "id": name,
+        "source_path": f"/project/flows/{name}.py",
+        "source_relative": f"flows/{name}.py",
+    }
+    values.update(fields)
+    return FlowDetails(**values)
+
+
+def make_deployment(
+    flow_name: str = "flow",
+    env: str = "dev",
+    commit_hash: str = "abc123",
+    updated_at: str = "2024-01-01",
+    branch: str = "main",
+    **fields: Any,
+) -> DeploymentDetails:
+    """Build a deployment in the project "project", with `fields` replacing the defaults."""
+    values = {
+        "name": f"project--{branch}--{flow_name.replace('_', '-')}--{env}",
+        "project_name": "project",
+        "branch": branch,
+        "flow_name": flow_name,
+        "env": env,
+        "commit_hash": commit_hash,
+        "package_version": "1.0.0",
+        "tags": [f"COMMIT_HASH={commit_hash}"],
+        "id": f"{flow_name}-{env}-{commit_hash}",
+        "created_at": "2024-01-01",
+        "updated_at": updated_at,
+        "flow_id": f"flow-{flow_name}",
+        "url": "",
+    }
+    values.update(fields)
+    return DeploymentDetails(**values)
+
+
+class CountingFlowFinder(FlowFinder):
+    """Returns one flow per name in `names`, or per Python file of `root_dir`, and records calls.
+
+    Clear `release` to block scans until it is set again, and set `fail` to make scans raise.
+    """
+
+    def __init__(self, root_dir: Optional[str] = None):
+        self.root_dir = root_dir
+        self.names = ["etl"]
+        self.calls: List[dict] = []
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def find_flows(
+        self,
+        *,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[FlowDetails]:
+        self.calls.append(
+            {"flows_to_fetch": flows_to_fetch, "flow_groups": flow_groups}
+        )
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("scan failed")
+        if self.root_dir is None:
+            flows = [make_flow(name) for name in self.names]
+        else:
+            flows = [
+                make_flow(
+                    name[:-3],
+                    source_path=os.path.join(self.root_dir, name),
+                    source_relative=name,
+                    grouping=["group"],
+                )
+                for name in sorted(os.listdir(self.root_dir))
+                if name.endswith(".py")
+            ]
+        if flows_to_fetch is not None:
+            names = {flow.name for flow in flows_to_fetch}
+            flows = [flow for flow in flows if flow.name in names]
+        return flows
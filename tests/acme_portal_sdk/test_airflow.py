@@ -238,3 +238,176 @@ class TestAirflowDeploymentPromote:
         """Test error when required URLs are not set."""
         with pytest.raises(ValueError, match="AIRFLOW_SOURCE_URL not set"):
             AirflowDeploymentPromote()
+
+
+class _FakeAirflowApi:
+    """Callable replacement for requests.request serving DAGs from memory.
+
+    Like Airflow, listing and bulk updates apply to one page of at most `page_limit` DAGs.
+    """
+
+    def __init__(self, dags_by_host, page_limit=100):
+        self.dags_by_host = dags_by_host
+        self.page_limit = page_limit
+        self.calls = []
+
+    def _page(self, matched, params):
+        offset = int(params.get("offset", 0))
+        limit = min(int(params.get("limit", self.page_limit)), self.page_limit)
+        return matched[offset : offset + limit]
+
+    def __call__(self, method, url, auth=None, params=None, json=None, headers=None):
+        self.calls.append((method, url, dict(params or {}), json))
+        host, _, path = url.partition("//")[2].partition("/")
+        dags = self.dags_by_host[host]
+        response = MagicMock()
+        response.status_code = 200
+        pattern = (params or {}).get("dag_id_pattern", "")
+        matched = [d for d in dags.values() if pattern in d["dag_id"]]
+        if method == "GET" and path == "api/v1/dags":
+            response.json.return_value = {
+                "dags": self._page(matched, params),
+                "total_entries": len(matched),
+            }
+        elif method == "PATCH" and path == "api/v1/dags":
+            page = self._page(matched, params or {})
+            for dag in page:
+                dag["is_paused"] = json["is_paused"]
+            response.json.return_value = {"dags": page, "total_entries": len(matched)}
+        elif method == "PATCH":
+            dags[path.rsplit("/", 1)[1]]["is_paused"] = json["is_paused"]
+        return response
+
+
+def _dags(*specs):
+    return {dag_id: {"dag_id": dag_id, "is_paused": paused} for dag_id, paused in specs}
+
+
+class TestAirflowBulkOperations:
+    """Test cases for batch deploy and promote of Airflow DAGs."""
+
+    def test_deploy_many_uses_bulk_patch(self):
+        """Test that deploy_many lists once and updates all DAGs with one bulk PATCH."""
+        api = _FakeAirflowApi(
+            {
+                "airflow:8080": _dags(
+                    ("proj--main--a--dev", True),
+                    ("proj--main--b--dev", True),
+                    ("proj--main--c--dev", False),
+                )
+            }
+        )
+        deployer = AirflowFlowDeployer(airflow_url="http://airflow:8080")
+        infos = [
+            DeployInfo(name=f"proj--main--{x}--dev", flow_name=x, paused=False)
+            for x in ("a", "b", "c")
+        ]
+
+        with patch("requests.request", side_effect=api):
+            result = deployer.deploy_many(infos)
+
+        assert len(result.succeeded) == 3
+        assert [(c[0], c[1].endswith("/api/v1/dags")) for c in api.calls] == [
+            ("GET", True),
+            ("PATCH", True),
+        ]
+        assert api.calls[1][2]["dag_id_pattern"] == "proj--main--"
+        assert not any(
+            d["is_paused"] for d in api.dags_by_host["airflow:8080"].values()
+        )
+
+    def test_bulk_patch_beyond_page_limit(self):
+        """Test that DAGs beyond the page a bulk PATCH updates are updated per DAG."""
+        api = _FakeAirflowApi(
+            {
+                "airflow:8080": _dags(
+                    *((f"proj--main--f{i:03d}--dev", True) for i in range(150))
+                )
+            },
+            page_limit=100,
+        )
+        deployer = AirflowFlowDeployer(airflow_url="http://airflow:8080")
+        infos = [
+            DeployInfo(
+                name=f"proj--main--f{i:03d}--dev", flow_name=f"f{i:03d}", paused=False
+            )
+            for i in range(150)
+        ]
+
+        with patch("requests.request", side_effect=api):
+            result = deployer.deploy_many(infos)
+
+        assert len(result.succeeded) == 150
+        bulk = [
+            c for c in api.calls if c[0] == "PATCH" and c[1].endswith("/api/v1/dags")
+        ]
+        assert bulk[0][2]["limit"] == 150
+        assert len([c for c in api.calls if c[0] == "PATCH"]) == 51
+        assert not any(
+            d["is_paused"] for d in api.dags_by_host["airflow:8080"].values()
+        )
+
+    def test_deploy_many_falls_back_to_per_dag_patch(self):
+        """Test that DAGs outside the batch are never changed by a bulk PATCH."""
+        api = _FakeAirflowApi(
+            {
+                "airflow:8080": _dags(
+                    ("proj--main--a--dev", True),
+                    ("proj--main--b--dev", True),
+                    ("proj--main--other--dev", True),
+                )
+            }
+        )
+        deployer = AirflowFlowDeployer(airflow_url="http://airflow:8080")
+        infos = [
+            DeployInfo(name="proj--main--a--dev", flow_name="a", paused=False),
+            DeployInfo(name="proj--main--b--dev", flow_name="b", paused=False),
+            DeployInfo(name="proj--main--missing--dev", flow_name="missing"),
+        ]
+
+        with patch("requests.request", side_effect=api):
+            result = deployer.deploy_many(infos)
+
+        assert [r.name for r in result.failed] == ["proj--main--missing--dev"]
+        patched = sorted(c[1] for c in api.calls if c[0] == "PATCH")
+        assert patched == [
+            "http://airflow:8080/api/v1/dags/proj--main--a--dev",
+            "http://airflow:8080/api/v1/dags/proj--main--b--dev",
+        ]
+        assert api.dags_by_host["airflow:8080"]["proj--main--other--dev"]["is_paused"]
+
+    def test_promote_many(self):
+        """Test that promote_many lists source and target once and copies pause state."""
+        api = _FakeAirflowApi(
+            {
+                "dev-airflow:8080": _dags(
+                    ("proj--main--a--dev", False), ("proj--main--b--dev", False)
+                ),
+                "prod-airflow:8080": _dags(
+                    ("proj--main--a--prod", True), ("proj--main--b--prod", False)
+                ),
+            }
+        )
+        promoter = AirflowDeploymentPromote(
+            source_airflow_url="http://dev-airflow:8080",
+            target_airflow_url="http://prod-airflow:8080",
+        )
+
+        with patch("requests.request", side_effect=api):
+            result = promoter.promote_many(
+                project_name="proj",
+                branch_name="main",
+                source_env="dev",
+                target_env="prod",
+                flows_to_deploy=["a", "b", "c"],
+            )
+
+        assert len(api.calls) == 3
+        assert [r.name for r in result.succeeded] == [
+            "proj--main--a--prod",
+            "proj--main--b--prod",
+        ]
+        assert "Source DAG proj--main--c--dev not found" in result.failed[0].error
+        assert not api.dags_by_host["prod-airflow:8080"]["proj--main--a--prod"][
+            "is_paused"
+        ]
@@ -0,0 +1,299 @@
+"""Tests for the asynchronous base classes and their adapters."""
+
+import asyncio
+import threading
+from typing import List, Optional
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from conftest import make_deployment, make_flow
+
+from acme_portal_sdk.async_api import (
+    AsyncDeploymentFinder,
+    AsyncDeploymentPromote,
+    AsyncDeployWorkflow,
+    AsyncFlowDeployer,
+    AsyncFlowFinder,
+    AsyncFlowFinderAdapter,
+    AsyncPromoteWorkflow,
+    SyncFlowFinderAdapter,
+    run_sync,
+    to_async,
+    to_sync,
+)
+from acme_portal_sdk.deployment_finder import DeploymentFinder
+from acme_portal_sdk.deployment_promote import DeploymentPromote, PromoteWorkflow
+from acme_portal_sdk.flow_deploy import DeployInfo, DeployWorkflow, FlowDeployer
+from acme_portal_sdk.flow_finder import FlowDetails, FlowFinder
+
+try:
+    import prefect  # noqa: F401
+
+    PREFECT_AVAILABLE = True
+except ImportError:
+    PREFECT_AVAILABLE = False
+
+
+class ThreadRecordingFlowFinder(FlowFinder):
+    """Returns fixed flows and records the thread it ran in."""
+
+    def __init__(self):
+        self.threads: List[str] = []
+
+    def find_flows(
+        self,
+        *,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[FlowDetails]:
+        self.threads.append(threading.current_thread().name)
+        flows = [make_flow("etl"), make_flow("report")]
+        if flows_to_fetch is not None:
+            names = {flow.name for flow in flows_to_fetch}
+            flows = [flow for flow in flows if flow.name in names]
+        return flows
+
+
+class NativeAsyncFlowFinder(AsyncFlowFinder):
+    async def find_flows(
+        self,
+        *,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[FlowDetails]:
+        await asyncio.sleep(0)
+        return [make_flow("etl")] if flow_groups is None else []
+
+
+class TestAdapters:
+    """Test cases for to_async, to_sync and the adapters."""
+
+    def test_sync_finder_runs_in_worker_thread(self):
+        """Test that an adapted sync finder runs outside the event loop's thread."""
+        inner = ThreadRecordingFlowFinder()
+        finder = to_async(inner)
+
+        async def scan():
+            return await asyncio.gather(
+                finder.find_flows(),
+                finder.find_flows(flows_to_fetch=[make_flow("report")]),
+            )
+
+        everything, selected = asyncio.run(scan())
+
+        assert isinstance(finder, AsyncFlowFinderAdapter)
+        assert [flow.name for flow in everything] == ["etl", "report"]
+        assert [flow.name for flow in selected] == ["report"]
+        assert threading.main_thread().name not in inner.threads
+
+    def test_async_finder_from_sync_code(self):
+        """Test that an adapted async finder can be called with and without a running loop."""
+        finder = to_sync(NativeAsyncFlowFinder())
+
+        async def inside_loop():
+            return finder.find_flows()
+
+        assert isinstance(finder, SyncFlowFinderAdapter)
+        assert [flow.name for flow in finder.find_flows()] == ["etl"]
+        assert finder.find_flows(flow_groups=["daily"]) == []
+        assert [flow.name for flow in asyncio.run(inside_loop())] == ["etl"]
+
+    def test_adapters_are_unwrapped(self):
+        """Test that converting back returns the original object instead of stacking adapters."""
+        sync_finder = ThreadRecordingFlowFinder()
+        async_finder = NativeAsyncFlowFinder()
+
+        assert to_sync(to_async(sync_finder)) is sync_finder
+        assert to_async(to_sync(async_finder)) is async_finder
+        assert to_async(async_finder) is async_finder
+        assert to_sync(sync_finder) is sync_finder
+
+    def test_every_base_class_is_bridged(self):
+        """Test that arguments and results pass through the adapters of every base class."""
+        deployment = make_deployment("etl")
+        deployment_finder = Mock(spec=DeploymentFinder)
+        deployment_finder.get_deployments.return_value = [deployment]
+        promote = Mock(spec=DeploymentPromote)
+        deployer = Mock(spec=FlowDeployer)
+        deploy_workflow = Mock(spec=DeployWorkflow)
+        deploy_workflow.run.return_value = "https://example.com/runs/1"
+        promote_workflow = Mock(spec=PromoteWorkflow)
+        promote_workflow.run.return_value = "https://example.com/runs/2"
+        info = DeployInfo(name="etl-dev", flow_name="etl")
+
+        async def use_all():
+            return await asyncio.gather(
+                to_async(deployment_finder).to_json(
+                    flows_to_fetch=[make_flow("etl").to_dict()]
+                ),
+                to_async(promote).promote("p", "main", "dev", "prod", ["etl"]),
+                to_async(deployer).deploy(info),
+                to_async(deploy_workflow)(["etl"], ref="main"),
+                to_async(promote_workflow).run(["etl"], source_env="dev"),
+            )
+
+        payload, _, _, deploy_url, promote_url = asyncio.run(use_all())
+
+        assert '"flow_name":"etl"' in payload.replace(" ", "")
+        assert deployment_finder.get_deployments.call_args.kwargs["flows_to_fetch"] == [
+            make_flow("etl")
+        ]
+        promote.promote.assert_called_once_with("p", "main", "dev", "prod", ["etl"])
+        deployer.deploy.assert_called_once_with(info)
+        deploy_workflow.run.assert_called_once_with(["etl"], ref="main")
+        assert deploy_url == "https://example.com/runs/1"
+        assert promote_url == "https://example.com/runs/2"
+
+        for async_class, sync_class in (
+            (AsyncDeploymentFinder, DeploymentFinder),
+            (AsyncDeploymentPromote, DeploymentPromote),
+            (AsyncFlowDeployer, FlowDeployer),
+            (AsyncDeployWorkflow, DeployWorkflow),
+            (AsyncPromoteWorkflow, PromoteWorkflow),
+        ):
+            assert isinstance(to_sync(Mock(spec=async_class)), sync_class)
+
+        async_deployer = Mock(spec=AsyncFlowDeployer)
+        to_sync(async_deployer).deploy(info)
+        async_deployer.deploy.assert_awaited_once_with(info)
+
+    def test_promote_keyword_arguments_pass_through(self):
+        """Test that `target_env_vars` reaches the promoter through both adapters."""
+        calls = []
+
+        class EnvVarPromote(DeploymentPromote):
+            def promote(
+                self,
+                project_name,
+                branch_name,
+                source_env,
+                target_env,
+                flows_to_deploy,
+                target_env_vars=None,
+            ):
+                calls.append(target_env_vars)
+
+        promote = to_async(EnvVarPromote())
+        asyncio.run(
+            promote.promote(
+                "p", "main", "dev", "prod", ["etl"], target_env_vars={"A": "1"}
+            )
+        )
+        async_promote = Mock(spec=AsyncDeploymentPromote)
+        to_sync(async_promote).promote(
+            "p", "main", "dev", "prod", ["etl"], target_env_vars={"B": "2"}
+        )
+
+        assert calls == [{"A": "1"}]
+        async_promote.promote.assert_awaited_once_with(
+            "p", "main", "dev", "prod", ["etl"], target_env_vars={"B": "2"}
+        )
+
+    def test_unknown_component(self):
+        """Test that objects implementing no base class are rejected."""
+        with pytest.raises(TypeError, match="SDK base class"):
+            to_async(object())
+        with pytest.raises(TypeError, match="SDK base class"):
+            to_sync(object())
+
+    def test_configured_async_finder_is_adapted(self, tmp_path):
+        """Test that the CLI loads an async implementation configured in `.acme_portal_sdk`."""
+        from acme_portal_sdk._main import load_sdk_object
+
+        (tmp_path / "flow_finder.py").write_text(
+            "from acme_portal_sdk.async_api import AsyncFlowFinder\n"
+            "\n"
+            "class Finder(AsyncFlowFinder):\n"
+            "    async def find_flows(self, *, flows_to_fetch=None, flow_groups=None):\n"
+            "        return []\n"
+            "\n"
+            "flow_finder = Finder()\n"
+        )
+
+        finder = load_sdk_object("flow_finder.py", FlowFinder, tmp_path)
+
+        assert isinstance(finder, SyncFlowFinderAdapter)
+        assert finder.find_flows() == []
+
+    def test_run_sync_propagates_errors(self):
+        """Test that exceptions raised by the coroutine reach the caller."""
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_sync(fail())
+
+
+@pytest.mark.skipif(not PREFECT_AVAILABLE, reason="Prefect not available")
+class TestAsyncPrefectDeploymentFinder:
+    """Test cases for AsyncPrefectDeploymentFinder."""
+
+    @patch("acme_portal_sdk.prefect.deployment_finder.get_client")
+    def test_reads_deployments_with_async_client(self, mock_get_client, monkeypatch):
+        """Test that deployments are read and converted like the sync finder does."""
+        from acme_portal_sdk.prefect.deployment_finder import (
+            AsyncPrefectDeploymentFinder,
+        )
+
+        monkeypatch.setenv(
+            "PREFECT_API_URL", "https://api.prefect.cloud/api/accounts/a/workspaces/w"
+        )
+        deployments = []
+        for index, flow_name in enumerate(["flow1", "flow2"]):
+            deployment = Mock()
+            deployment.name = f"project1--main--{flow_name}--dev"
+            deployment.tags = ["COMMIT_HASH=abc123", "PACKAGE_VERSION=1.0.0"]
+            deployment.id = f"deploy{index}"
+            deployment.created = deployment.updated = "2023-01-01"
+            deployment.flow_id = f"flow{index}"
+            deployments.append(deployment)
+        client = AsyncMock()
+        client.read_deployments.return_value = deployments
+        mock_get_client.return_value.__aenter__.return_value = client
+
+        finder = AsyncPrefectDeploymentFinder()
+        everything = asyncio.run(finder.get_deployments())
+        selected = asyncio.run(
+            finder.get_deployments(flows_to_fetch=[make_flow("flow2")])
+        )
+
+        mock_get_client.assert_called_with()
+        assert [d.flow_name for d in everything] == ["flow1", "flow2"]
+        assert [d.id for d in selected] == ["deploy1"]
+        assert everything[0].commit_hash == "abc123"
+        assert everything[0].url.endswith("/deployments/deployment/deploy0")
+
+    @patch("acme_portal_sdk.prefect.deployment_finder.get_client")
+    def test_reads_every_page(self, mock_get_client, monkeypatch):
+        """Test that deployments beyond Prefect's page limit are read too."""
+        from acme_portal_sdk.prefect.deployment_finder import (
+            AsyncPrefectDeploymentFinder,
+        )
+
+        monkeypatch.setenv(
+            "PREFECT_API_URL", "https://api.prefect.cloud/api/accounts/a/workspaces/w"
+        )
+        deployments = []
+        for index in range(450):
+            deployment = Mock()
+            deployment.name = f"project1--main--flow{index}--dev"
+            deployment.tags = []
+            deployment.id = f"deploy{index}"
+            deployments.append(deployment)
+        client = AsyncMock()
+        client.read_deployments.side_effect = (
+            lambda deployment_filter, limit, offset: deployments[
+                offset : offset + limit
+            ]
+        )
+        mock_get_client.return_value.__aenter__.return_value = client
+
+        result = asyncio.run(AsyncPrefectDeploymentFinder().get_deployments())
+
+        assert len(result) == 450
+        assert [c.kwargs["offset"] for c in client.read_deployments.call_args_list] == [
+            0,
+            200,
+            400,
+        ]
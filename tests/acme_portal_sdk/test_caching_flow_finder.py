@@ -0,0 +1,203 @@
+"""Tests for CachingFlowFinder."""
+
+import os
+
+import pytest
+from conftest import CountingFlowFinder
+
+from acme_portal_sdk.compact import CompactFlowDetails
+from acme_portal_sdk.flow_finder import CachingFlowFinder, tree_fingerprint
+
+
+@pytest.fixture
+def flows_dir(tmp_path):
+    directory = tmp_path / "flows"
+    directory.mkdir()
+    (directory / "etl.py").write_text("# etl\n")
+    (directory / "report.py").write_text("# report\n")
+    return directory
+
+
+class CompactFlowFinder(CountingFlowFinder):
+    """Returns the flows of CountingFlowFinder as CompactFlowDetails."""
+
+    def find_flows(self, *, flows_to_fetch=None, flow_groups=None):
+        flows = super().find_flows(
+            flows_to_fetch=flows_to_fetch, flow_groups=flow_groups
+        )
+        return [CompactFlowDetails.from_dict(flow.to_dict()) for flow in flows]
+
+
+def _bump_mtime(path, seconds=10):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+class TestTreeFingerprint:
+    """Test cases for tree_fingerprint."""
+
+    def test_changes_with_matching_files_only(self, flows_dir):
+        """Test that edits of Python files change the fingerprint and other files do not."""
+        before = tree_fingerprint([str(flows_dir)])
+        (flows_dir / "notes.txt").write_text("notes")
+        _bump_mtime(flows_dir, seconds=-10)
+        assert tree_fingerprint([str(flows_dir)]) != before
+
+        before = tree_fingerprint([str(flows_dir)])
+        _bump_mtime(flows_dir / "notes.txt")
+        assert tree_fingerprint([str(flows_dir)]) == before
+        _bump_mtime(flows_dir / "etl.py")
+        assert tree_fingerprint([str(flows_dir)]) != before
+
+
+class TestCachingFlowFinder:
+    """Test cases for CachingFlowFinder."""
+
+    def test_repeat_calls_are_served_from_cache(self, flows_dir):
+        """Test that the wrapped finder is called once while the tree is unchanged."""
+        inner = CountingFlowFinder(str(flows_dir))
+        finder = CachingFlowFinder(inner)
+
+        first = finder.find_flows()
+        second = finder.find_flows()
+
+        assert [flow.name for flow in first] == ["etl", "report"]
+        assert second == first
+        assert second is not first
+        assert len(inner.calls) == 1
+
+    def test_file_changes_invalidate(self, flows_dir):
+        """Test that editing or adding a file re-runs the finder."""
+        inner = CountingFlowFinder(str(flows_dir))
+        finder = CachingFlowFinder(inner)
+        finder.find_flows()
+
+        _bump_mtime(flows_dir / "etl.py")
+        finder.find_flows()
+        (flows_dir / "audit.py").write_text("# audit\n")
+        _bump_mtime(flows_dir)
+        flows = finder.find_flows()
+
+        assert len(inner.calls) == 3
+        assert [flow.name for flow in flows] == ["audit", "etl", "report"]
+
+    def test_selective_arguments_are_keyed_separately(self, flows_dir):
+        """Test that selective refetches are cached apart from full scans."""
+        inner = CountingFlowFinder(str(flows_dir))
+        finder = CachingFlowFinder(inner)
+        flows = finder.find_flows()
+
+        selected = finder.find_flows(flows_to_fetch=flows[:1])
+        finder.find_flows(flows_to_fetch=flows[:1])
+        finder.find_flows(flow_groups=["group"])
+        finder.find_flows()
+
+        assert [flow.name for flow in selected] == ["etl"]
+        assert len(inner.calls) == 3
+
+    def test_ttl_expires_results(self, flows_dir, monkeypatch):
+        """Test that results older than the time to live are fetched again."""
+        now = [1000.0]
+        monkeypatch.setattr("acme_portal_sdk.flow_finder.time.time", lambda: now[0])
+        inner = CountingFlowFinder(str(flows_dir))
+        finder = CachingFlowFinder(inner, ttl=60)
+
+        finder.find_flows()
+        now[0] += 30
+        finder.find_flows()
+        now[0] += 31
+        finder.find_flows()
+
+        assert len(inner.calls) == 2
+
+    def test_results_persist_between_instances(self, flows_dir, tmp_path):
+        """Test that a new instance reads results saved by an earlier one."""
+        cache_path = tmp_path / "cache" / "flows.json"
+        CachingFlowFinder(
+            CountingFlowFinder(str(flows_dir)), cache_path=cache_path
+        ).find_flows()
+        inner = CountingFlowFinder(str(flows_dir))
+
+        flows = CachingFlowFinder(inner, cache_path=cache_path).find_flows()
+
+        assert cache_path.exists()
+        assert inner.calls == []
+        assert [flow.name for flow in flows] == ["etl", "report"]
+        assert flows[0].grouping == ["group"]
+
+    def test_reloaded_results_keep_record_class(self, flows_dir, tmp_path):
+        """Test that flows read back from the cache file keep their class."""
+        cache_path = tmp_path / "flows.json"
+        from_memory = CachingFlowFinder(
+            CompactFlowFinder(str(flows_dir)), cache_path=cache_path
+        )
+        from_memory.find_flows()
+        inner = CompactFlowFinder(str(flows_dir))
+
+        flows = CachingFlowFinder(inner, cache_path=cache_path).find_flows()
+
+        assert inner.calls == []
+        assert {type(flow) for flow in flows} == {CompactFlowDetails}
+        assert {type(flow) for flow in from_memory.find_flows()} == {CompactFlowDetails}
+        assert flows == from_memory.find_flows()
+
+    def test_unreadable_cache_file_is_ignored(self, flows_dir, tmp_path):
+        """Test that a corrupt cache file falls back to the wrapped finder."""
+        cache_path = tmp_path / "flows.json"
+        cache_path.write_text("not json")
+        inner = CountingFlowFinder(str(flows_dir))
+
+        flows = CachingFlowFinder(inner, cache_path=cache_path).find_flows()
+
+        assert len(inner.calls) == 1
+        assert len(flows) == 2
+
+    def test_results_are_copies(self, flows_dir):
+        """Test that modifying a returned flow does not change later results."""
+        inner = CountingFlowFinder(str(flows_dir))
+        finder = CachingFlowFinder(inner)
+
+        first = finder.find_flows()
+        first[0].name = "renamed"
+        first[0].grouping.append("extra")
+        first[0].child_attributes["key"] = "value"
+        second = finder.find_flows()
+        second[1].grouping.clear()
+
+        assert second[0].name == "etl"
+        assert second[0].grouping == ["group"]
+        assert second[0].child_attributes == {}
+        assert finder.find_flows()[1].grouping == ["group"]
+        assert len(inner.calls) == 1
+
+    def test_cache_file_without_fingerprint_is_ignored(self, flows_dir, tmp_path):
+        """Test that a cache file missing its fingerprint falls back to the wrapped finder."""
+        cache_path = tmp_path / "flows.json"
+        cache_path.write_text('{"entries": []}')
+        inner = CountingFlowFinder(str(flows_dir))
+
+        flows = CachingFlowFinder(inner, cache_path=cache_path).find_flows()
+
+        assert len(inner.calls) == 1
+        assert len(flows) == 2
+
+    def test_invalidate(self, flows_dir, tmp_path):
+        """Test that invalidate drops cached results and the cache file."""
+        cache_path = tmp_path / "flows.json"
+        inner = CountingFlowFinder(str(flows_dir))
+        finder = CachingFlowFinder(inner, cache_path=cache_path)
+        finder.find_flows()
+
+        finder.invalidate()
+        assert not cache_path.exists()
+        finder.find_flows()
+
+        assert len(inner.calls) == 2
+
+    def test_requires_root_dirs(self):
+        """Test that a finder without root_dir needs explicit root directories."""
+        inner = CountingFlowFinder("unused")
+        del inner.root_dir
+
+        with pytest.raises(ValueError, match="root_dirs"):
+            CachingFlowFinder(inner)
@@ -0,0 +1,155 @@
+"""Tests for CommandExecutor."""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from acme_portal_sdk.github.github_workflow import (
+    CommandCancelledError,
+    CommandExecutor,
+    GitHubWorkflowService,
+    GitService,
+)
+
+PRINT_LINES = "import sys; print('out 1'); print('err 1', file=sys.stderr); print('out two words')"
+SLEEP = "import time; time.sleep(30)"
+
+
+class TestCommandExecutor:
+    """Test cases for CommandExecutor."""
+
+    def test_argv_runs_without_shell(self):
+        """Test that argument lists are passed through unquoted."""
+        stdout, _ = CommandExecutor().execute(
+            [sys.executable, "-c", "import sys; print(sys.argv[1])", "a b; echo c"]
+        )
+
+        assert stdout == "a b; echo c\n"
+
+    def test_streams_lines_to_callback(self):
+        """Test that each output line is reported with its stream."""
+        lines = []
+        stdout, stderr = CommandExecutor().execute(
+            [sys.executable, "-c", PRINT_LINES],
+            on_output=lambda line, stream: lines.append((stream, line)),
+        )
+
+        assert stdout == "out 1\nout two words\n"
+        assert stderr == "err 1\n"
+        assert sorted(lines) == [
+            ("stderr", "err 1"),
+            ("stdout", "out 1"),
+            ("stdout", "out two words"),
+        ]
+
+    def test_timeout_kills_command(self):
+        """Test that a command running past its timeout is killed."""
+        started = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            CommandExecutor(timeout=0.2).execute([sys.executable, "-c", SLEEP])
+        assert time.monotonic() - started < 10
+
+    def test_cancel_event_kills_command(self):
+        """Test that setting the cancel event stops the command."""
+        cancel = threading.Event()
+        threading.Timer(0.2, cancel.set).start()
+
+        with pytest.raises(CommandCancelledError):
+            CommandExecutor().execute(
+                [sys.executable, "-c", SLEEP], cancel_event=cancel
+            )
+
+    def test_failing_command_raises(self):
+        """Test that a non-zero exit code raises CalledProcessError."""
+        with pytest.raises(subprocess.CalledProcessError):
+            CommandExecutor().execute([sys.executable, "-c", "raise SystemExit(3)"])
+
+
+class TestCommandExecutorAsync:
+    """Test cases for CommandExecutor.execute_async."""
+
+    def test_commands_run_concurrently(self):
+        """Test that awaited commands overlap instead of running one after another."""
+        executor = CommandExecutor()
+        command = [sys.executable, "-c", "import time; time.sleep(0.5); print('done')"]
+
+        async def run_all():
+            return await asyncio.gather(
+                *(executor.execute_async(command) for _ in range(4))
+            )
+
+        started = time.monotonic()
+        results = asyncio.run(run_all())
+
+        assert [stdout for stdout, _ in results] == ["done\n"] * 4
+        assert time.monotonic() - started < 2
+
+    def test_streams_and_times_out(self):
+        """Test output streaming and timeouts of the asyncio variant."""
+        executor = CommandExecutor()
+        lines = []
+
+        stdout, _ = asyncio.run(
+            executor.execute_async(
+                [sys.executable, "-c", PRINT_LINES],
+                on_output=lambda line, stream: lines.append((stream, line)),
+            )
+        )
+
+        assert stdout == "out 1\nout two words\n"
+        assert ("stderr", "err 1") in lines
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(
+                executor.execute_async([sys.executable, "-c", SLEEP], timeout=0.2)
+            )
+
+    def test_services_run_commands_concurrently(self):
+        """Test the async GitService and GitHubWorkflowService methods."""
+
+        class RecordingExecutor(CommandExecutor):
+            def __init__(self):
+                super().__init__()
+                self.commands = []
+
+            def execute(self, command, working_dir=None, **kwargs):
+                return "gh version", ""
+
+            async def execute_async(
+                self, command, working_dir=None, timeout=None, on_output=None
+            ):
+                self.commands.append(command)
+                await asyncio.sleep(0.2)
+                return "git@github.com:org/repo.git\n", ""
+
+        executor = RecordingExecutor()
+        service = GitHubWorkflowService(
+            executor, GitService(executor, read_git_files=False)
+        )
+
+        async def run_all():
+            return await asyncio.gather(
+                service.git_service.get_repository_url_async(),
+                service._dispatch_async(
+                    "deploy.yml", {"flows-to-deploy": "a b"}, "main"
+                ),
+            )
+
+        started = time.monotonic()
+        repository_url, _ = asyncio.run(run_all())
+
+        assert time.monotonic() - started < 0.4
+        assert repository_url == "https://github.com/org/repo"
+        assert executor.commands[1] == [
+            "gh",
+            "workflow",
+            "run",
+            "deploy.yml",
+            "-r",
+            "main",
+            "-f",
+            "flows-to-deploy=a b",
+        ]
@@ -0,0 +1,99 @@
+"""Tests for compact record variants and string interning."""
+
+from dataclasses import fields, replace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from acme_portal_sdk.airflow.deployment_finder import AirflowDeploymentFinder
+from acme_portal_sdk.compact import (
+    CompactDeploymentDetails,
+    CompactFlowDetails,
+    StringInterner,
+)
+from acme_portal_sdk.deployment_finder import DeploymentDetails
+from acme_portal_sdk.flow_finder import FlowDetails
+
+
+def _dag(dag_id, commit_hash="abc123"):
+    return {
+        "dag_id": dag_id,
+        "tags": ["PROJECT_NAME=project", f"COMMIT_HASH={commit_hash}"],
+        "created_at": "2024-01-01T00:00:00Z",
+    }
+
+
+class TestStringInterner:
+    """Test cases for StringInterner."""
+
+    def test_equal_strings_share_one_object(self):
+        """Test that equal strings are replaced by the first instance seen."""
+        intern = StringInterner()
+        first = "".join(["pro", "ject"])
+        second = "".join(["proj", "ect"])
+
+        assert first is not second
+        assert intern(first) is first
+        assert intern(second) is first
+        assert intern(None) is None
+        assert intern.intern_all([second, "other"])[0] is first
+        assert len(intern) == 2
+
+
+class TestCompactDetails:
+    """Test cases for the slotted record variants."""
+
+    def test_slotted_variant_with_same_fields_and_methods(self):
+        """Test that compact variants are slotted records behaving like the regular ones."""
+        flow = CompactFlowDetails(
+            name="flow",
+            original_name="flow",
+            description="",
+            id="id",
+            source_path="/flow.py",
+            source_relative="flow.py",
+        )
+
+        assert [f.name for f in fields(CompactFlowDetails)] == [
+            f.name for f in fields(FlowDetails)
+        ]
+        assert isinstance(flow, FlowDetails)
+        assert CompactFlowDetails.__slots__ == tuple(
+            f.name for f in fields(FlowDetails)
+        )
+        assert issubclass(CompactDeploymentDetails, DeploymentDetails)
+        assert FlowDetails not in CompactFlowDetails.__mro__
+        assert not hasattr(flow, "__dict__")
+        with pytest.raises(AttributeError):
+            flow.extra = "value"
+        assert flow.line_number is None and flow.grouping == []
+        assert flow.to_dict() == FlowDetails(**flow.to_dict()).to_dict()
+        assert CompactFlowDetails.from_dict(flow.to_dict()) == flow
+        assert replace(flow, name="other").name == "other"
+        assert not hasattr(flow, "__dict__")
+
+    @patch("requests.request")
+    def test_airflow_finder_returns_interned_compact_records(self, mock_request):
+        """Test that the finder builds compact records sharing repeated strings."""
+        response = MagicMock(status_code=200)
+        response.json.return_value = {
+            "dags": [
+                _dag("project--main--flow-a--dev"),
+                _dag("project--main--flow-b--dev"),
+            ]
+        }
+        mock_request.return_value = response
+
+        finder = AirflowDeploymentFinder(
+            airflow_url="http://localhost:8080",
+            username="admin",
+            password="password",
+            compact=True,
+        )
+        first, second = finder.get_deployments()
+
+        assert isinstance(first, CompactDeploymentDetails)
+        assert first.project_name is second.project_name
+        assert first.tags[0] is second.tags[0]
+        assert first.to_dict()["commit_hash"] == "abc123"
+        assert DeploymentDetails.from_dict(first.to_dict()).env == "dev"
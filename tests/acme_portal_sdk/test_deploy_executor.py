@@ -0,0 +1,86 @@
+"""Tests for DeploymentExecutor."""
+
+import threading
+import time
+
+import pytest
+
+from acme_portal_sdk.deploy_executor import DeploymentExecutor
+from acme_portal_sdk.flow_deploy import DeployInfo, FlowDeployer
+
+
+class _RecordingDeployer(FlowDeployer):
+    """Deployer that records peak concurrency and fails for selected deployments."""
+
+    def __init__(self, fail_names=(), delay: float = 0.02):
+        self.fail_names = set(fail_names)
+        self.delay = delay
+        self.deployed = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def deploy(self, flow_deploy_info: DeployInfo) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if flow_deploy_info.name in self.fail_names:
+                raise RuntimeError("boom")
+            with self._lock:
+                self.deployed.append(flow_deploy_info.name)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _infos(count: int):
+    return [
+        DeployInfo(name=f"deployment-{i}", flow_name=f"flow_{i}") for i in range(count)
+    ]
+
+
+class TestDeploymentExecutor:
+    """Test cases for DeploymentExecutor."""
+
+    def test_runs_concurrently_within_limit(self):
+        """Test that deployments overlap but never exceed max_parallel."""
+        deployer = _RecordingDeployer()
+        result = DeploymentExecutor(deployer, max_parallel=3).execute(_infos(9))
+
+        assert deployer.peak == 3
+        assert len(result.succeeded) == 9
+        assert [r.name for r in result.results] == [f"deployment-{i}" for i in range(9)]
+
+    def test_sequential_when_max_parallel_is_one(self):
+        """Test that max_parallel=1 deploys one flow at a time."""
+        deployer = _RecordingDeployer(delay=0)
+        DeploymentExecutor(deployer, max_parallel=1).execute(_infos(3))
+
+        assert deployer.peak == 1
+        assert deployer.deployed == ["deployment-0", "deployment-1", "deployment-2"]
+
+    def test_failures_do_not_abort_batch(self):
+        """Test that a failing deployment is recorded and the rest still run."""
+        deployer = _RecordingDeployer(fail_names={"deployment-1"})
+        result = DeploymentExecutor(deployer, max_parallel=2).execute(_infos(4))
+
+        assert sorted(deployer.deployed) == [
+            "deployment-0",
+            "deployment-2",
+            "deployment-3",
+        ]
+        assert [r.name for r in result.failed] == ["deployment-1"]
+        assert result.failed[0].flow_name == "flow_1"
+        assert result.failed[0].error == "boom"
+
+        with pytest.raises(
+            RuntimeError, match="1 of 4 deployments failed: deployment-1: boom"
+        ):
+            result.raise_for_failures()
+
+    def test_invalid_max_parallel(self):
+        """Test that max_parallel must be positive."""
+        with pytest.raises(ValueError, match="max_parallel must be at least 1"):
+            DeploymentExecutor(_RecordingDeployer(), max_parallel=0)
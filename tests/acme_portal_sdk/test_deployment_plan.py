@@ -0,0 +1,119 @@
+"""Tests for PrefectDeploymentPlanner."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from acme_portal_sdk.prefect.deployment_plan import (
+    FINGERPRINT_TAG,
+    PrefectDeploymentPlanner,
+)
+from acme_portal_sdk.prefect.flow_deploy import PrefectDeployInfo
+
+
+def _info(name: str, image_uri: str = "image:abc123") -> PrefectDeployInfo:
+    return PrefectDeployInfo(
+        name=name,
+        flow_name=name.split("--")[2].replace("-", "_"),
+        work_pool_name="pool",
+        cron="0 12 * * *",
+        tags=["PROJECT_NAME=project", "COMMIT_HASH=abc123"],
+        image_uri=image_uri,
+        version="main-abc123",
+        flow_function=object(),
+    )
+
+
+class TestPrefectDeploymentPlanner:
+    """Test cases for PrefectDeploymentPlanner."""
+
+    def setup_method(self):
+        self.deployer = Mock()
+        self.planner = PrefectDeploymentPlanner(self.deployer, max_parallel=2)
+
+    def test_fingerprint_ignores_flow_function_and_fingerprint_tag(self):
+        """Test that the fingerprint depends only on deployment configuration."""
+        first = _info("project--main--flow-a--dev")
+        second = _info("project--main--flow-a--dev")
+        second.tags = second.tags + [f"{FINGERPRINT_TAG}=stale"]
+
+        assert self.planner.fingerprint(first) == self.planner.fingerprint(second)
+        assert self.planner.fingerprint(first) != self.planner.fingerprint(
+            _info("project--main--flow-a--dev", image_uri="image:def456")
+        )
+
+    @patch("acme_portal_sdk.prefect.deployment_plan.get_client")
+    def test_plan_and_apply_skip_unchanged(self, mock_get_client):
+        """Test that only new and changed deployments are applied."""
+        unchanged = _info("project--main--flow-a--dev")
+        changed = _info("project--main--flow-b--dev")
+        new = _info("project--main--flow-c--dev")
+
+        client = mock_get_client.return_value
+        client.read_deployments.return_value = [
+            SimpleNamespace(
+                name=unchanged.name,
+                tags=[f"{FINGERPRINT_TAG}={self.planner.fingerprint(unchanged)}"],
+            ),
+            SimpleNamespace(name=changed.name, tags=[f"{FINGERPRINT_TAG}=outdated"]),
+        ]
+
+        plan = self.planner.plan([unchanged, changed, new])
+
+        client.read_deployments.assert_called_once()
+        assert [item.action for item in plan.items] == ["unchanged", "update", "create"]
+        assert plan.items[1].existing_fingerprint == "outdated"
+        assert f"{FINGERPRINT_TAG}={plan.items[2].fingerprint}" in (
+            plan.items[2].deploy_info.tags
+        )
+        assert new.tags == ["PROJECT_NAME=project", "COMMIT_HASH=abc123"]
+        assert plan.summary().splitlines()[-1] == (
+            "Plan: 1 to create, 1 to update, 1 unchanged"
+        )
+
+        result = self.planner.apply(plan)
+
+        deployed = sorted(c.args[0].name for c in self.deployer.deploy.call_args_list)
+        assert deployed == [changed.name, new.name]
+        assert len(result.succeeded) == 2
+
+    @patch("acme_portal_sdk.prefect.deployment_plan.get_client")
+    def test_forced_plan_updates_and_tags_unchanged(self, mock_get_client):
+        """Test that repeated plans tag copies, leaving the caller's deploy info as it was."""
+        unchanged = _info("project--main--flow-a--dev")
+        fingerprint = self.planner.fingerprint(unchanged)
+        mock_get_client.return_value.read_deployments.return_value = [
+            SimpleNamespace(
+                name=unchanged.name, tags=[f"{FINGERPRINT_TAG}={fingerprint}"]
+            )
+        ]
+
+        self.planner.plan([unchanged])
+        plan = self.planner.plan([unchanged], force=True)
+
+        assert [item.action for item in plan.items] == ["update"]
+        assert plan.items[0].deploy_info.tags == [
+            "PROJECT_NAME=project",
+            "COMMIT_HASH=abc123",
+            f"{FINGERPRINT_TAG}={fingerprint}",
+        ]
+        assert FINGERPRINT_TAG not in " ".join(unchanged.tags)
+
+    @patch("acme_portal_sdk.prefect.deployment_plan.get_client")
+    def test_plan_pages_through_existing_deployments(self, mock_get_client):
+        """Test that deployments beyond Prefect's page limit are compared too."""
+        infos = [_info(f"project--main--flow-{index}--dev") for index in range(201)]
+        registered = [
+            SimpleNamespace(
+                name=info.name,
+                tags=[f"{FINGERPRINT_TAG}={self.planner.fingerprint(info)}"],
+            )
+            for info in infos
+        ]
+        mock_get_client.return_value.read_deployments.side_effect = (
+            lambda deployment_filter, limit, offset: registered[offset : offset + limit]
+        )
+
+        plan = self.planner.plan(infos)
+
+        assert mock_get_client.return_value.read_deployments.call_count == 2
+        assert plan.to_apply == []
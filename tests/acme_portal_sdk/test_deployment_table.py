@@ -0,0 +1,151 @@
+"""Tests for the columnar DeploymentTable."""
+
+import pytest
+from conftest import make_deployment
+
+from acme_portal_sdk.deployment_table import DeploymentTable
+
+
+@pytest.fixture
+def deployments():
+    return [
+        make_deployment("etl", "dev", "aaa", "2024-01-02"),
+        make_deployment("etl", "prod", "bbb", "2024-01-03"),
+        make_deployment("etl", "prod", "ccc", "2024-01-05", branch="release"),
+        make_deployment("report", "dev", "ddd", "2024-01-04"),
+    ]
+
+
+class TestDeploymentTable:
+    """Test cases for DeploymentTable."""
+
+    def test_round_trip_preserves_records(self, deployments):
+        """Test that rows convert back to the original deployments."""
+        table = DeploymentTable.from_deployments(deployments)
+
+        assert len(table) == 4
+        assert table.to_deployments() == deployments
+        assert table.to_records() == [d.to_dict() for d in deployments]
+
+    def test_accepts_dictionaries(self, deployments):
+        """Test building from the dictionary form returned by DeploymentFinder.__call__."""
+        table = DeploymentTable.from_deployments(d.to_dict() for d in deployments)
+
+        assert table.column("commit_hash") == ["aaa", "bbb", "ccc", "ddd"]
+
+    def test_dictionaries_without_optional_fields(self, deployments):
+        """Test that dictionaries missing categorical or value columns get their defaults."""
+        record = deployments[0].to_dict()
+        del record["package_version"], record["child_attributes"]
+
+        table = DeploymentTable.from_deployments([record])
+
+        assert table.column("package_version") == [None]
+        assert table.column("child_attributes") == [{}]
+
+    def test_filter_by_value_collection_and_predicate(self, deployments):
+        """Test filtering on categorical and value columns."""
+        table = DeploymentTable.from_deployments(deployments)
+
+        assert table.filter(env="prod").column("id") == ["etl-prod-bbb", "etl-prod-ccc"]
+        assert len(table.filter(flow_name=["etl", "report"], env="dev")) == 2
+        assert table.filter(updated_at=lambda value: value >= "2024-01-04").column(
+            "commit_hash"
+        ) == ["ccc", "ddd"]
+        assert len(table.filter(env="staging")) == 0
+        assert table.filter(
+            env=lambda value: value != "dev", updated_at="2024-01-05"
+        ).column("branch") == ["release"]
+        with pytest.raises(KeyError):
+            table.filter(unknown="value")
+
+    def test_distinct_only_reports_present_values(self, deployments):
+        """Test that filtered tables do not report values of removed rows."""
+        table = DeploymentTable.from_deployments(deployments).filter(env="prod")
+
+        assert table.distinct("flow_name") == ["etl"]
+        assert table.distinct("branch") == ["main", "release"]
+
+    def test_count_and_group_by(self, deployments):
+        """Test grouping by one and several columns."""
+        table = DeploymentTable.from_deployments(deployments)
+
+        assert table.count_by("env") == {"dev": 2, "prod": 2}
+        assert table.count_by("flow_name", "env") == {
+            ("etl", "dev"): 1,
+            ("etl", "prod"): 2,
+            ("report", "dev"): 1,
+        }
+        groups = table.group_by("flow_name")
+        assert list(groups) == ["etl", "report"]
+        assert groups["report"].column("commit_hash") == ["ddd"]
+
+    def test_pivot_uses_latest_update(self, deployments):
+        """Test that the pivot keeps the most recently updated deployment per cell."""
+        table = DeploymentTable.from_deployments(deployments)
+
+        assert table.pivot() == {
+            "etl": {"dev": "aaa", "prod": "ccc"},
+            "report": {"dev": "ddd"},
+        }
+        assert table.pivot(values="branch")["etl"]["prod"] == "release"
+
+    def test_missing(self, deployments):
+        """Test finding flows without a deployment in an environment."""
+        table = DeploymentTable.from_deployments(deployments)
+
+        assert table.missing(value="prod") == ["report"]
+        assert table.missing(value="dev") == []
+
+    def test_empty_table(self):
+        """Test that an empty table supports all queries."""
+        table = DeploymentTable.from_deployments([])
+
+        assert len(table) == 0
+        assert table.pivot() == {}
+        assert table.count_by("env") == {}
+        assert table.to_records() == []
+
+
+class TestDeploymentTableArrow:
+    """Test cases for the Arrow and Parquet export."""
+
+    def test_to_arrow(self, deployments):
+        """Test that categorical columns are exported as dictionary arrays."""
+        pa = pytest.importorskip("pyarrow")
+        table = DeploymentTable.from_deployments(deployments).to_arrow()
+
+        assert table.num_rows == 4
+        assert pa.types.is_dictionary(table.schema.field("env").type)
+        assert table.column("env").to_pylist() == ["dev", "prod", "prod", "dev"]
+        assert table.column("tags").to_pylist()[0] == ["COMMIT_HASH=aaa"]
+
+    def test_to_parquet(self, deployments, tmp_path):
+        """Test writing and reading back a Parquet file."""
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "deployments.parquet"
+        DeploymentTable.from_deployments(deployments).to_parquet(str(path))
+
+        assert pq.read_table(str(path)).column("commit_hash").to_pylist() == [
+            "aaa",
+            "bbb",
+            "ccc",
+            "ddd",
+        ]
+
+    def test_missing_pyarrow_raises_import_error(self, deployments, monkeypatch):
+        """Test that the export explains how to install pyarrow."""
+        import builtins
+
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name.startswith("pyarrow"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        with pytest.raises(ImportError, match=r"acme_portal_sdk\[arrow\]"):
+            DeploymentTable.from_deployments(deployments).to_arrow()
@@ -0,0 +1,144 @@
+"""Tests for FlowCatalog and its use by deployment preparation."""
+
+import importlib
+from unittest.mock import Mock, patch
+
+import pytest
+from conftest import make_flow
+
+from acme_portal_sdk.flow_catalog import FlowCatalog
+from acme_portal_sdk.prefect.flow_deploy import PrefectDeployInfoPrep
+
+
+def _importable_flow(name: str):
+    return make_flow(
+        name, child_attributes={"import_path": "json", "obj_name": "dumps"}
+    )
+
+
+class TestFlowCatalog:
+    """Test cases for FlowCatalog."""
+
+    def setup_method(self):
+        self.finder = Mock()
+        self.finder.find_flows.return_value = [
+            _importable_flow("flow_a"),
+            _importable_flow("flow_b"),
+        ]
+        self.catalog = FlowCatalog(self.finder)
+
+    def test_scans_once(self):
+        """Test that repeated reads use a single scan of the project."""
+        assert self.catalog.get_flow_names() == ["flow_a", "flow_b"]
+        assert [f.name for f in self.catalog.get_flows_by_name(["flow_b"])] == [
+            "flow_b"
+        ]
+        self.catalog.get_flows()
+
+        self.finder.find_flows.assert_called_once_with()
+
+    def test_refresh_rescans(self):
+        """Test that refresh drops the cached scan."""
+        self.catalog.get_flows()
+        self.catalog.refresh()
+        self.catalog.get_flows()
+
+        assert self.finder.find_flows.call_count == 2
+
+    def test_import_flow_is_memoized(self):
+        """Test that a flow object is imported once per (import_path, obj_name)."""
+        with patch(
+            "acme_portal_sdk.flow_catalog.importlib.import_module",
+            wraps=importlib.import_module,
+        ) as mock_import:
+            first = self.catalog.import_flow("json", "dumps")
+            second = self.catalog.import_flow("json", "dumps")
+
+        assert first is second
+        mock_import.assert_called_once_with("json")
+
+    def test_import_flow_missing_object(self):
+        """Test that a missing object raises AttributeError."""
+        with pytest.raises(AttributeError):
+            self.catalog.import_flow("json", "not_a_flow")
+
+
+class TestPrefectDeployInfoPrepCatalog:
+    """Test that PrefectDeployInfoPrep reads flows through a shared catalog."""
+
+    def test_prep_deploy_info_scans_once(self, tmp_path):
+        """Test that preparing several flows one call at a time scans the project once."""
+        config_path = tmp_path / "static_flow_deploy_config.yaml"
+        config_path.write_text("flow_a:\n  cron: '0 12 * * *'\n")
+        finder = Mock()
+        finder.find_flows.return_value = [
+            _importable_flow("flow_a"),
+            _importable_flow("flow_b"),
+        ]
+        catalog = FlowCatalog(finder)
+
+        prep = PrefectDeployInfoPrep(
+            static_flow_deploy_config=config_path,
+            default_work_pool="pool",
+            prefect_flow_finder=finder,
+            flow_catalog=catalog,
+        )
+
+        infos = []
+        for flow_name in catalog.get_flow_names():
+            infos.extend(
+                prep.prep_deploy_info(
+                    project_name="project",
+                    branch_name="main",
+                    commit_hash="abc123",
+                    image_uri="image:abc123",
+                    package_version="1.0.0",
+                    env="dev",
+                    flows_to_deploy=[flow_name],
+                )
+            )
+
+        finder.find_flows.assert_called_once_with()
+        assert [info.name for info in infos] == [
+            "project--main--flow-a--dev",
+            "project--main--flow-b--dev",
+        ]
+        assert infos[0].cron == "0 12 * * *"
+
+    def test_prep_deploy_info_does_not_mutate_shared_flow(self, tmp_path):
+        """Test that flow name standardization works on a copy of the imported flow."""
+
+        class _Flow:
+            def __init__(self, name):
+                self.name = name
+
+            def with_options(self, name):
+                return _Flow(name)
+
+        config_path = tmp_path / "static_flow_deploy_config.yaml"
+        config_path.write_text("{}\n")
+        finder = Mock()
+        finder.find_flows.return_value = [_importable_flow("flow_a")]
+        catalog = FlowCatalog(finder)
+        shared_flow = _Flow("flow-a")
+
+        prep = PrefectDeployInfoPrep(
+            static_flow_deploy_config=config_path,
+            default_work_pool="pool",
+            prefect_flow_finder=finder,
+            flow_catalog=catalog,
+        )
+        with patch.object(catalog, "import_flow", return_value=shared_flow):
+            (info,) = prep.prep_deploy_info(
+                project_name="project",
+                branch_name="main",
+                commit_hash="abc123",
+                image_uri="image:abc123",
+                package_version="1.0.0",
+                env="dev",
+                flows_to_deploy=["flow_a"],
+            )
+
+        assert info.flow_function.name == "flow_a"
+        assert info.flow_function is not shared_flow
+        assert shared_flow.name == "flow-a"
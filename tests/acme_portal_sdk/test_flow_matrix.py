@@ -0,0 +1,73 @@
+"""Tests for joining flows with their deployments."""
+
+import json
+
+from conftest import make_deployment, make_flow
+
+from acme_portal_sdk.flow_matrix import FlowDeploymentMatrix, join_flows_and_deployments
+
+
+class TestJoinFlowsAndDeployments:
+    """Test cases for join_flows_and_deployments."""
+
+    def test_latest_deployment_per_flow_and_env(self):
+        """Test that each cell holds the most recently updated deployment."""
+        flows = [make_flow("etl"), make_flow("report")]
+        deployments = [
+            make_deployment("etl", "dev", "aaa", "2024-01-02"),
+            make_deployment("etl", "prod", "ccc", "2024-01-05"),
+            make_deployment("etl", "prod", "bbb", "2024-01-03"),
+        ]
+
+        matrix = join_flows_and_deployments(flows, deployments)
+
+        assert matrix.environments == ["dev", "prod"]
+        etl, report = matrix.flows
+        assert etl.flow is flows[0]
+        assert {env: d.commit_hash for env, d in etl.deployments.items()} == {
+            "dev": "aaa",
+            "prod": "ccc",
+        }
+        assert report.deployments == {}
+        assert matrix.orphaned_deployments == []
+
+    def test_orphaned_deployments(self):
+        """Test that deployments of unknown flows are reported, all of them and in order."""
+        deployments = [
+            make_deployment("removed", "dev", "aaa", "2024-01-01"),
+            make_deployment("etl", "dev", "bbb", "2024-01-01"),
+            make_deployment("removed", "dev", "ccc", "2024-01-02"),
+        ]
+
+        matrix = join_flows_and_deployments([make_flow("etl")], deployments)
+
+        assert [d.commit_hash for d in matrix.orphaned_deployments] == ["aaa", "ccc"]
+
+    def test_hyphenated_flow_names_match(self):
+        """Test that flow names are compared after standardizing hyphens."""
+        matrix = join_flows_and_deployments(
+            [make_flow("my-flow")],
+            [make_deployment("my_flow", "dev", "aaa", "2024-01-01")],
+        )
+
+        assert list(matrix.flows[0].deployments) == ["dev"]
+
+    def test_serialization_round_trip(self):
+        """Test that the matrix converts to JSON and back."""
+        matrix = join_flows_and_deployments(
+            [make_flow("etl")],
+            [
+                make_deployment("etl", "dev", "aaa", "2024-01-01"),
+                make_deployment("other", "dev", "bbb", "2024-01-01"),
+            ],
+        )
+
+        data = json.loads(json.dumps(matrix.to_dict()))
+
+        assert data["flows"][0]["deployments"]["dev"]["commit_hash"] == "aaa"
+        assert FlowDeploymentMatrix.from_dict(data) == matrix
+        assert matrix.to_reference_dict() == {
+            "environments": ["dev"],
+            "flows": [{"flow": "etl", "deployments": {"dev": "etl-dev-aaa"}}],
+            "orphaned_deployments": ["other-dev-bbb"],
+        }
@@ -0,0 +1,158 @@
+"""Tests for reading git metadata without running git."""
+
+import os
+from argparse import Namespace
+from unittest.mock import Mock
+
+import pytest
+
+from acme_portal_sdk.git_metadata import GitMetadataProvider, parse_git_config
+from acme_portal_sdk.github.github_workflow import GitService
+from acme_portal_sdk.prefect.prefect_deploy import _fill_git_metadata
+
+COMMIT = "a" * 40
+PACKED_COMMIT = "b" * 40
+
+CONFIG = """[core]
+\trepositoryformatversion = 0
+[remote "origin"]
+\turl = git@github.com:org/repo.git
+\tfetch = +refs/heads/*:refs/remotes/origin/*
+[branch "main"]
+\tremote = origin
+"""
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git_dir = tmp_path / "repo" / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "config").write_text(CONFIG)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs" / "heads" / "main").write_text(COMMIT + "\n")
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{PACKED_COMMIT} refs/heads/release\n"
+        f"^{'c' * 40}\n"
+    )
+    (tmp_path / "repo" / "src").mkdir()
+    return tmp_path / "repo"
+
+
+class TestGitMetadataProvider:
+    """Test cases for GitMetadataProvider."""
+
+    def test_reads_remote_branch_and_commit(self, repo):
+        """Test reading metadata from a subdirectory of the repository."""
+        provider = GitMetadataProvider(str(repo / "src"))
+
+        assert provider.get_remote_url() == "git@github.com:org/repo.git"
+        assert provider.get_remote_url("upstream") is None
+        assert provider.get_branch() == "main"
+        assert provider.get_commit_hash() == COMMIT
+
+    def test_packed_refs_detached_head_and_cache(self, repo):
+        """Test packed refs, detached HEAD, and that changed files are read again."""
+        provider = GitMetadataProvider(str(repo))
+        head = repo / ".git" / "HEAD"
+        head.write_text("ref: refs/heads/release\n")
+
+        assert provider.get_branch() == "release"
+        assert provider.is_detached() is False
+        assert provider.get_commit_hash() == PACKED_COMMIT
+
+        head.write_text(COMMIT + "\n")
+        stat = os.stat(head)
+        os.utime(head, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert provider.get_branch() is None
+        assert provider.is_detached() is True
+        assert provider.get_commit_hash() == COMMIT
+
+    def test_worktree(self, repo, tmp_path):
+        """Test that worktrees read HEAD from their own git directory and refs from the common one."""
+        worktree_git_dir = repo / ".git" / "worktrees" / "feature"
+        worktree_git_dir.mkdir(parents=True)
+        (worktree_git_dir / "HEAD").write_text("ref: refs/heads/feature\n")
+        (worktree_git_dir / "commondir").write_text("../..\n")
+        (repo / ".git" / "refs" / "heads" / "feature").write_text("d" * 40 + "\n")
+        worktree = tmp_path / "feature"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {worktree_git_dir}\n")
+
+        provider = GitMetadataProvider(str(worktree))
+
+        assert provider.get_branch() == "feature"
+        assert provider.get_commit_hash() == "d" * 40
+        assert provider.get_remote_url() == "git@github.com:org/repo.git"
+
+    def test_outside_repository(self, tmp_path):
+        """Test that None is returned outside of a repository."""
+        provider = GitMetadataProvider(str(tmp_path))
+
+        assert provider.get_remote_url() is None
+        assert provider.get_commit_hash() is None
+        assert provider.is_detached() is None
+
+    def test_parse_git_config(self):
+        """Test parsing sections, subsections and quoted values."""
+        config = parse_git_config(
+            '[Remote "origin"]\n\turl = "https://x/y"\n; comment\n'
+        )
+
+        assert config == {("remote", "origin"): {"url": "https://x/y"}}
+
+
+class TestGitServiceMetadata:
+    """Test that GitService reads files before running git."""
+
+    def test_reads_files_without_commands(self, repo):
+        """Test that no git command runs when the files can be read."""
+        executor = Mock()
+        service = GitService(executor)
+
+        assert service.get_repository_url(str(repo)) == "https://github.com/org/repo"
+        assert service.get_branch_name(str(repo)) == "main"
+        assert service.get_commit_hash(str(repo)) == COMMIT
+        executor.execute.assert_not_called()
+
+    def test_detached_head_without_commands(self, repo):
+        """Test that a detached HEAD, as in CI checkouts, is not looked up with git."""
+        (repo / ".git" / "HEAD").write_text(COMMIT + "\n")
+        executor = Mock()
+        service = GitService(executor)
+
+        assert service.get_branch_name(str(repo)) is None
+        assert service.get_commit_hash(str(repo)) == COMMIT
+        executor.execute.assert_not_called()
+
+    def test_falls_back_to_git_commands(self, tmp_path):
+        """Test that git commands run when the directory is not a readable repository."""
+        executor = Mock()
+        executor.execute.side_effect = lambda command, working_dir=None: {
+            "git remote get-url origin": ("https://github.com/org/other\n", ""),
+            "git rev-parse --abbrev-ref HEAD": ("HEAD\n", ""),
+        }[" ".join(command)]
+        service = GitService(executor)
+
+        assert (
+            service.get_repository_url(str(tmp_path)) == "https://github.com/org/other"
+        )
+        assert service.get_branch_name(str(tmp_path)) is None
+
+    def test_fill_git_metadata_for_cli(self, repo):
+        """Test that missing CLI arguments are read from the repository."""
+        args = Namespace(branch_name=None, commit_hash=None)
+        (repo / ".git" / "HEAD").write_text("ref: refs/heads/feature_x\n")
+        (repo / ".git" / "refs" / "heads" / "feature_x").write_text(COMMIT + "\n")
+        git_service = GitService(Mock())
+        git_service._metadata_providers["."] = GitMetadataProvider(str(repo))
+
+        _fill_git_metadata(args, git_service)
+
+        assert args.branch_name == "feature-x"
+        assert args.commit_hash == COMMIT
+
+        given = Namespace(branch_name="given", commit_hash="abc")
+        _fill_git_metadata(given, Mock())
+        assert (given.branch_name, given.commit_hash) == ("given", "abc")
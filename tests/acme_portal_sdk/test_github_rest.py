@@ -0,0 +1,325 @@
+"""Tests for the GitHub REST client and workflow run watcher against a local stand-in API server."""
+
+import hashlib
+import json
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from acme_portal_sdk.github.github_workflow import GitHubRestWorkflowService, GitService
+from acme_portal_sdk.github.rest_client import (
+    GitHubConnectionError,
+    GitHubRestClient,
+    repository_from_url,
+)
+from acme_portal_sdk.github.run_watcher import WorkflowRunWatcher
+
+
+class _FakeGitHub:
+    """In-memory state of the stand-in GitHub API."""
+
+    def __init__(self):
+        self.runs = {}
+        self.requests = []
+        self.not_modified = 0
+        self.dispatches = []
+        self.dispatch_status = 204
+        self.drop_dispatch = False
+
+
+def _make_handler(state: _FakeGitHub):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status, payload, headers=None):
+            body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            state.requests.append(("POST", self.path, dict(self.headers)))
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length))
+            state.dispatches.append((self.path, body))
+            if state.drop_dispatch:
+                # Accept the dispatch but lose the response
+                self.close_connection = True
+                return
+            if state.dispatch_status >= 400:
+                self._send_json(
+                    state.dispatch_status, {"message": "Resource not accessible"}
+                )
+                return
+            # Every dispatch creates a run titled with its inputs
+            run_id = len(state.runs) + 1
+            state.runs[run_id] = dict(
+                _run(run_id, "queued"),
+                display_title=" ".join(body["inputs"].values()),
+                created_at=datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                head_branch=body["ref"],
+            )
+            self._send_json(204, None)
+
+        def do_GET(self):
+            state.requests.append(("GET", self.path, dict(self.headers)))
+            if "/workflows/" in self.path:
+                runs = sorted(state.runs.values(), key=lambda run: -run["id"])
+                self._send_json(200, {"total_count": len(runs), "workflow_runs": runs})
+                return
+            run_id = int(self.path.rsplit("/", 1)[1])
+            run = state.runs.get(run_id)
+            if run is None:
+                self._send_json(404, {"message": "Not Found"})
+                return
+            etag = '"' + hashlib.sha1(json.dumps(run).encode()).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                state.not_modified += 1
+                self._send_json(304, None, {"ETag": etag})
+                return
+            self._send_json(200, run, {"ETag": etag})
+
+    return Handler
+
+
+@pytest.fixture
+def fake_github():
+    state = _FakeGitHub()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.api_url = f"http://127.0.0.1:{server.server_address[1]}"
+    state.server = server
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def _run(run_id, status, conclusion=None):
+    return {
+        "id": run_id,
+        "status": status,
+        "conclusion": conclusion,
+        "html_url": f"https://github.com/owner/repo/actions/runs/{run_id}",
+    }
+
+
+class TestGitHubRestClient:
+    """Test cases for GitHubRestClient."""
+
+    def test_repository_from_url(self):
+        """Test that HTTPS and SSH URLs are converted to owner/name."""
+        assert repository_from_url("https://github.com/owner/repo") == "owner/repo"
+        assert repository_from_url("git@github.com:owner/repo.git") == "owner/repo"
+        with pytest.raises(ValueError):
+            repository_from_url("https://github.com/owner")
+
+    def test_request_sends_token_and_raises_on_error(self, fake_github):
+        """Test that the token is sent and error statuses raise RuntimeError."""
+        fake_github.runs[1] = _run(1, "queued")
+        client = GitHubRestClient(token="secret", api_url=fake_github.api_url)
+
+        response = client.request("GET", "/repos/owner/repo/actions/runs/1")
+
+        assert response.status == 200
+        assert response.data["status"] == "queued"
+        assert fake_github.requests[0][2]["Authorization"] == "Bearer secret"
+        with pytest.raises(RuntimeError, match="HTTP 404"):
+            client.request("GET", "/repos/owner/repo/actions/runs/2")
+
+    def test_post_is_not_sent_again_when_its_response_is_lost(self, fake_github):
+        """Test that a POST whose response is lost is not retried, unlike a GET."""
+        fake_github.runs[1] = _run(1, "queued")
+        fake_github.drop_dispatch = True
+        client = GitHubRestClient(token="secret", api_url=fake_github.api_url)
+
+        with pytest.raises(GitHubConnectionError) as raised:
+            client.request(
+                "POST",
+                "/repos/owner/repo/actions/workflows/deploy.yml/dispatches",
+                body={"ref": "main", "inputs": {}},
+            )
+
+        assert raised.value.sent is True
+        assert len(fake_github.dispatches) == 1
+        assert client.request("GET", "/repos/owner/repo/actions/runs/1").status == 200
+
+
+class TestWorkflowRunWatcher:
+    """Test cases for WorkflowRunWatcher."""
+
+    def test_conditional_polling_and_callbacks(self, fake_github):
+        """Test that unchanged runs are answered with 304 and changes trigger callbacks."""
+        fake_github.runs[1] = _run(1, "queued")
+        fake_github.runs[2] = _run(2, "in_progress")
+        changes = []
+        watcher = WorkflowRunWatcher(
+            GitHubRestClient(token="secret", api_url=fake_github.api_url),
+            "owner/repo",
+            on_status_change=changes.append,
+        )
+        watcher.watch(1)
+        watcher.watch("https://github.com/owner/repo/actions/runs/2")
+
+        watcher.poll()
+        assert [(c.run_id, c.status) for c in changes] == [
+            (1, "queued"),
+            (2, "in_progress"),
+        ]
+
+        fake_github.runs[2] = _run(2, "completed", "success")
+        for run in watcher._runs.values():
+            run.next_poll_at = 0
+        changed = watcher.poll()
+
+        assert [(c.run_id, c.conclusion) for c in changed] == [(2, "success")]
+        assert fake_github.not_modified == 1
+        assert fake_github.requests[-2][2]["If-None-Match"].startswith('"')
+        assert watcher.pending() == [1]
+
+        fake_github.runs[1] = _run(1, "completed", "failure")
+        watcher._runs[1].next_poll_at = 0
+        statuses = watcher.wait(timeout=5)
+
+        assert statuses[1].conclusion == "failure"
+        assert watcher.pending() == []
+
+
+class _FailingExecutor:
+    """Command executor recording commands and failing like a missing GitHub CLI."""
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, command, working_dir=None):
+        self.commands.append(command)
+        raise FileNotFoundError("gh")
+
+
+class TestGitHubRestWorkflowService:
+    """Test cases for GitHubRestWorkflowService."""
+
+    def test_dispatch_and_find_run_without_subprocesses(self, fake_github, monkeypatch):
+        """Test that dispatch and run lookup use the REST API over one connection."""
+        monkeypatch.setattr(
+            "acme_portal_sdk.github.github_workflow.time.sleep", lambda seconds: None
+        )
+        executor = _FailingExecutor()
+        service = GitHubRestWorkflowService(
+            executor,
+            GitService(executor),
+            correlation_input="correlation-id",
+            client=GitHubRestClient(token="secret", api_url=fake_github.api_url),
+            repository="owner/repo",
+        )
+
+        run_url = service.trigger_workflow(
+            ".github/workflows/deploy.yml", {"flows-to-deploy": "flow1"}, "main"
+        )
+
+        assert run_url == "https://github.com/owner/repo/actions/runs/1"
+        path, body = fake_github.dispatches[0]
+        assert path == "/repos/owner/repo/actions/workflows/deploy.yml/dispatches"
+        assert body["ref"] == "main"
+        assert body["inputs"]["flows-to-deploy"] == "flow1"
+        assert len(body["inputs"]["correlation-id"]) == 12
+        assert executor.commands == []
+
+        watcher = service.create_run_watcher()
+        watcher.watch(run_url)
+        assert watcher.poll()[0].status == "queued"
+        assert watcher.client is service._client
+
+    def test_dispatch_error_falls_back_to_github_cli(self, fake_github, monkeypatch):
+        """Test that a dispatch GitHub rejects is sent with the GitHub CLI."""
+        monkeypatch.setattr(
+            "acme_portal_sdk.github.github_workflow.time.sleep", lambda seconds: None
+        )
+        fake_github.dispatch_status = 403
+        executor = Mock()
+        executor.execute.return_value = ("gh version", "")
+        service = GitHubRestWorkflowService(
+            executor,
+            GitService(executor, read_git_files=False),
+            client=GitHubRestClient(token="secret", api_url=fake_github.api_url),
+            repository="owner/repo",
+        )
+
+        service._dispatch("deploy.yml", {"flows-to-deploy": "flow1"}, "main")
+
+        assert len(fake_github.dispatches) == 1
+        commands = [c.args[0] for c in executor.execute.call_args_list]
+        assert commands == [
+            ["gh", "--version"],
+            [
+                "gh",
+                "workflow",
+                "run",
+                "deploy.yml",
+                "-r",
+                "main",
+                "-f",
+                "flows-to-deploy=flow1",
+            ],
+        ]
+
+    def test_falls_back_to_github_cli_without_token(self, monkeypatch, capsys):
+        """Test that the GitHub CLI is used when no token is available."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        executor = _FailingExecutor()
+        service = GitHubRestWorkflowService(
+            executor, GitService(executor), repository="owner/repo"
+        )
+
+        assert service.dispatch_workflow("deploy.yml", {}, "main") is None
+        assert service.dispatch_workflow("deploy.yml", {}, "main") is None
+        assert executor.commands.count(["gh", "auth", "token"]) == 1
+        assert executor.commands[1] == ["gh", "--version"]
+        assert capsys.readouterr().out.count("GitHub REST API unavailable") == 1
+
+    def test_dispatch_with_lost_response_is_not_sent_again(self, fake_github):
+        """Test that a dispatch GitHub may have accepted is not sent again with gh."""
+        fake_github.drop_dispatch = True
+        executor = Mock()
+        service = GitHubRestWorkflowService(
+            executor,
+            GitService(executor, read_git_files=False),
+            client=GitHubRestClient(token="secret", api_url=fake_github.api_url),
+            repository="owner/repo",
+        )
+
+        with pytest.raises(GitHubConnectionError):
+            service._dispatch("deploy.yml", {"flows-to-deploy": "flow1"}, "main")
+
+        assert len(fake_github.dispatches) == 1
+        executor.execute.assert_not_called()
+
+    def test_unreachable_api_falls_back_to_github_cli(self, fake_github):
+        """Test that a dispatch that could not be sent is sent with the GitHub CLI."""
+        api_url = fake_github.api_url
+        executor = Mock()
+        executor.execute.return_value = ("gh version", "")
+        service = GitHubRestWorkflowService(
+            executor,
+            GitService(executor, read_git_files=False),
+            client=GitHubRestClient(token="secret", api_url=api_url, timeout=1),
+            repository="owner/repo",
+        )
+        fake_github.server.shutdown()
+        fake_github.server.server_close()
+
+        service._dispatch("deploy.yml", {"flows-to-deploy": "flow1"}, "main")
+
+        assert fake_github.dispatches == []
+        commands = [c.args[0] for c in executor.execute.call_args_list]
+        assert commands[-1][:4] == ["gh", "workflow", "run", "deploy.yml"]
@@ -1,11 +1,21 @@
 """Tests for GitHub Actions workflow implementations."""
 
+import asyncio
+import json
+from datetime import datetime, timezone
+
 import pytest
 from unittest.mock import Mock, patch
 
 from acme_portal_sdk.github.github_workflow import (
+    AsyncGithubActionsDeployWorkflow,
+    AsyncGithubActionsPromoteWorkflow,
     GithubActionsDeployWorkflow,
-    GithubActionsPromoteWorkflow
+    GithubActionsPromoteWorkflow,
+    GitHubWorkflowService,
+    GitService,
+    WorkflowRunHandle,
+    shard_flows,
 )
 
 
@@ -152,4 +162,241 @@ class TestGithubActionsWorkflows:
             
             # Test missing required parameters
             with pytest.raises(ValueError, match="source_env, target_env, and ref are required"):
-                workflow.run(flows_to_deploy=["flow1"])
\ No newline at end of file
+                workflow.run(flows_to_deploy=["flow1"])
+
+class _FakeGhExecutor:
+    """Command executor answering gh commands from a queue of run list responses."""
+
+    def __init__(self, run_lists):
+        self.run_lists = list(run_lists)
+        self.commands = []
+
+    def execute(self, command, working_dir=None):
+        self.commands.append(command)
+        if command[:3] == ["gh", "run", "list"]:
+            runs = self.run_lists.pop(0) if len(self.run_lists) > 1 else self.run_lists[0]
+            return json.dumps(runs), ""
+        return "", ""
+
+
+def _run(run_id, title, created_at, branch="main"):
+    return {
+        "databaseId": run_id,
+        "url": f"https://github.com/org/repo/actions/runs/{run_id}",
+        "displayTitle": title,
+        "createdAt": created_at,
+        "headBranch": branch,
+    }
+
+
+class TestGitHubWorkflowServiceRunLookup:
+    """Test dispatching workflows and finding their runs."""
+
+    def _service(self, executor, **kwargs):
+        return GitHubWorkflowService(executor, GitService(executor), **kwargs)
+
+    @patch("acme_portal_sdk.github.github_workflow.time.sleep")
+    def test_correlation_id_selects_matching_run(self, mock_sleep):
+        """Test that the run carrying the correlation id is returned, not the latest run."""
+        with patch("acme_portal_sdk.github.github_workflow.uuid.uuid4") as mock_uuid:
+            mock_uuid.return_value.hex = "abc123def456ffff"
+            executor = _FakeGhExecutor(
+                [
+                    [],
+                    [
+                        _run(2, "Deploy someone-else", "2099-01-01T00:00:02Z"),
+                        _run(1, "Deploy abc123def456", "2099-01-01T00:00:01Z"),
+                    ],
+                ]
+            )
+            service = self._service(executor, correlation_input="correlation-id")
+
+            run_url = service.trigger_workflow(
+                "deploy.yml", {"flows-to-deploy": "flow1"}, "main"
+            )
+
+        assert run_url == "https://github.com/org/repo/actions/runs/1"
+        assert executor.commands[1][-2:] == ["-f", "correlation-id=abc123def456"]
+        assert sum(c[:3] == ["gh", "run", "list"] for c in executor.commands) == 2
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays[1] > delays[0]
+
+    @patch("acme_portal_sdk.github.github_workflow.time.sleep")
+    def test_without_correlation_ignores_runs_before_dispatch(self, mock_sleep):
+        """Test that runs created before the dispatch are not returned."""
+        executor = _FakeGhExecutor(
+            [
+                [
+                    _run(3, "Deploy", "2099-01-01T00:00:05Z", branch="other"),
+                    _run(2, "Deploy", "2099-01-01T00:00:01Z"),
+                    _run(1, "Deploy", "2000-01-01T00:00:00Z"),
+                ]
+            ]
+        )
+        service = self._service(executor)
+
+        handle = service.dispatch_workflow("deploy.yml", {"flows-to-deploy": "f"}, "main")
+
+        assert handle.result(timeout=5) == "https://github.com/org/repo/actions/runs/2"
+        assert "correlation" not in executor.commands[1]
+
+    def test_without_correlation_prefers_runs_after_dispatch(self):
+        """Test that a run created just before the dispatch only matches if no later run exists."""
+        service = self._service(_FakeGhExecutor([[]]))
+        dispatched_at = datetime(2024, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+        earlier = _run(1, "Deploy", "2024-01-01T00:00:05Z")
+        later = _run(2, "Deploy", "2024-01-01T00:00:12Z")
+        too_early = _run(3, "Deploy", "2023-12-31T23:59:59Z")
+
+        assert service._match_run([later, earlier], "main", dispatched_at, None) is later
+        assert service._match_run([earlier, too_early], "main", dispatched_at, None) is earlier
+        assert service._match_run([too_early], "main", dispatched_at, None) is None
+
+    @patch("acme_portal_sdk.github.github_workflow.time.sleep")
+    def test_lookup_times_out(self, mock_sleep):
+        """Test that None is returned when no run appears before the timeout."""
+        executor = _FakeGhExecutor([[]])
+        service = self._service(executor, run_lookup_timeout=0)
+
+        assert service.trigger_workflow("deploy.yml", {}, "main") is None
+
+    def test_deploy_workflow_dispatch_returns_handle(self):
+        """Test that dispatch returns the pending handle from the workflow service."""
+        with patch('acme_portal_sdk.github.github_workflow.CommandExecutor') as mock_executor_class:
+            mock_executor_class.return_value.execute.return_value = ("gh version", "")
+            workflow = GithubActionsDeployWorkflow(correlation_input="correlation-id")
+
+            assert workflow.workflow_service.correlation_input == "correlation-id"
+            with patch.object(workflow.workflow_service, 'dispatch_workflow') as mock_dispatch:
+                handle = workflow.dispatch(flows_to_deploy=["flow1", "flow2"])
+
+            assert handle is mock_dispatch.return_value
+            mock_dispatch.assert_called_once_with(
+                "deploy.yml", {"flows-to-deploy": "flow1,flow2"}, "main"
+            )
+
+
+class TestShardedDispatch:
+    """Test splitting deployments into parallel workflow runs."""
+
+    def test_shard_flows_balances_by_duration(self):
+        """Test that shards are balanced by known durations and keep flow order."""
+        durations = {"a": 10.0, "b": 6.0, "c": 5.0, "d": 1.0}
+        shards = shard_flows(["a", "b", "c", "d"], 2, durations)
+
+        assert shards == [["a", "d"], ["b", "c"]]
+        assert shard_flows(["a", "b", "c", "d", "e"], 2) == [["a", "c", "e"], ["b", "d"]]
+        assert shard_flows(["a"], 3) == [["a"]]
+        with pytest.raises(ValueError):
+            shard_flows(["a"], 0)
+
+    def test_dispatch_sharded_returns_group_with_all_urls(self):
+        """Test that every shard is dispatched and the group resolves all run URLs."""
+        with patch('acme_portal_sdk.github.github_workflow.CommandExecutor'):
+            workflow = GithubActionsDeployWorkflow(
+                correlation_input="correlation-id", shard_count=2
+            )
+
+        handles = []
+
+        def dispatch(workflow_file, inputs, ref):
+            handle = WorkflowRunHandle(workflow_file, str(len(handles)))
+            handle.set_result(f"https://github.com/org/repo/actions/runs/{len(handles)}")
+            handles.append(inputs["flows-to-deploy"])
+            return handle
+
+        with patch.object(workflow.workflow_service, 'dispatch_workflow', side_effect=dispatch):
+            group = workflow.dispatch_sharded(["flow1", "flow2", "flow3"])
+            run_url = workflow.run(["flow1", "flow2", "flow3"])
+
+        assert handles[:2] == ["flow1,flow3", "flow2"]
+        assert group.done()
+        assert group.result() == [
+            "https://github.com/org/repo/actions/runs/0",
+            "https://github.com/org/repo/actions/runs/1",
+        ]
+        assert run_url == "https://github.com/org/repo/actions/runs/2"
+
+    def test_sharding_requires_correlation_input(self):
+        """Test that sharding without a correlation input is rejected."""
+        with patch('acme_portal_sdk.github.github_workflow.CommandExecutor'):
+            with pytest.raises(ValueError, match="correlation_input"):
+                GithubActionsDeployWorkflow(shard_count=2)
+
+
+def _resolved_handle(workflow_file, run_url):
+    handle = WorkflowRunHandle(workflow_file, "correlation")
+    handle.set_result(run_url)
+    return handle
+
+
+class TestAsyncWorkflows:
+    """Test the asyncio variants of the GitHub Actions workflows."""
+
+    def test_handle_is_awaitable(self):
+        """Test that awaiting a handle waits for the run URL lookup."""
+        handle = WorkflowRunHandle("deploy.yml", "correlation")
+
+        async def wait():
+            asyncio.get_running_loop().call_later(
+                0.01, handle.set_result, "https://github.com/org/repo/actions/runs/1"
+            )
+            return await handle
+
+        assert asyncio.run(wait()) == "https://github.com/org/repo/actions/runs/1"
+
+    def test_sharded_deploy_dispatches_concurrently(self):
+        """Test that every shard is dispatched with the async service methods."""
+        with patch('acme_portal_sdk.github.github_workflow.CommandExecutor'):
+            workflow = AsyncGithubActionsDeployWorkflow(
+                correlation_input="correlation-id", shard_count=2
+            )
+        dispatched = []
+
+        async def dispatch(workflow_file, inputs, ref):
+            dispatched.append((inputs["flows-to-deploy"], ref))
+            return _resolved_handle(
+                workflow_file, f"https://github.com/org/repo/actions/runs/{len(dispatched)}"
+            )
+
+        service = workflow.workflow.workflow_service
+        with patch.object(service, 'dispatch_workflow_async', side_effect=dispatch), \
+                patch.object(service, 'dispatch_workflow') as sync_dispatch:
+            run_url = asyncio.run(workflow.run(["flow1", "flow2", "flow3"]))
+
+        assert sorted(dispatched) == [("flow1,flow3", "main"), ("flow2", "main")]
+        assert run_url == "https://github.com/org/repo/actions/runs/1"
+        sync_dispatch.assert_not_called()
+
+    def test_sharded_deploy_requires_correlation_input(self):
+        """Test that sharded runs are refused when runs cannot be told apart, like the sync class."""
+        with patch('acme_portal_sdk.github.github_workflow.CommandExecutor'):
+            workflow = AsyncGithubActionsDeployWorkflow(
+                correlation_input="correlation-id", shard_count=2
+            )
+        service = workflow.workflow.workflow_service
+        service.correlation_input = None
+
+        with patch.object(service, 'dispatch_workflow_async') as dispatch:
+            with pytest.raises(ValueError, match="correlation_input"):
+                asyncio.run(workflow.run(["flow1", "flow2"]))
+        dispatch.assert_not_called()
+
+    def test_promote_reports_failed_dispatch(self):
+        """Test that a failed dispatch returns None and required inputs are validated."""
+        with patch('acme_portal_sdk.github.github_workflow.CommandExecutor'):
+            workflow = AsyncGithubActionsPromoteWorkflow()
+
+        async def dispatch(workflow_file, inputs, ref):
+            assert inputs == {
+                "flows-to-deploy": "flow1",
+                "source-env": "dev",
+                "target-env": "prod",
+            }
+            return None
+
+        service = workflow.workflow.workflow_service
+        with patch.object(service, 'dispatch_workflow_async', side_effect=dispatch):
+            assert asyncio.run(workflow.run(["flow1"], "dev", "prod", "main")) is None
+            with pytest.raises(ValueError, match="required"):
+                asyncio.run(workflow.run(["flow1"], "dev"))
@@ -0,0 +1,270 @@
+"""Tests for import based discovery of flows and DAGs."""
+
+import sys
+import textwrap
+from unittest.mock import patch
+
+import pytest
+
+from acme_portal_sdk.airflow.flow_finder import AirflowFlowFinder
+from acme_portal_sdk.import_discovery import (
+    DiscoveredObject,
+    ImportDiscovery,
+    import_root,
+    module_import_path,
+)
+from acme_portal_sdk.prefect.flow_finder import PrefectFlowFinder
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(content))
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project whose DAGs and flows are built by factories, with stand-in airflow and prefect."""
+    _write(
+        tmp_path / "airflow" / "__init__.py",
+        """
+        class DAG:
+            def __init__(self, dag_id, description=""):
+                self.dag_id = dag_id
+                self.description = description
+        """,
+    )
+    _write(
+        tmp_path / "prefect" / "__init__.py",
+        """
+        class Flow:
+            def __init__(self, fn, name=None):
+                self.fn = fn
+                self.name = name or fn.__name__.replace("_", "-")
+                self.description = fn.__doc__
+        """,
+    )
+    root = tmp_path / "pipelines"
+    _write(root / "__init__.py", "")
+    _write(
+        root / "factory.py",
+        """
+        from airflow import DAG
+
+        def build(name):
+            return DAG(dag_id=name, description=f"Load {name}")
+        """,
+    )
+    _write(
+        root / "teams" / "generated.py",
+        """
+        from pipelines.factory import build
+
+        for team in ("sales", "ops"):
+            globals()[f"{team}_dag"] = build(f"{team}-load")
+        """,
+    )
+    _write(
+        root / "static.py",
+        """
+        from airflow import DAG
+
+        static = DAG(dag_id="static")
+        """,
+    )
+    _write(
+        root / "flows.py",
+        """
+        from prefect import Flow
+
+        def _make(name):
+            def run():
+                \"\"\"Run a report.\"\"\"
+            run.__name__ = name
+            return Flow(run)
+
+        for name in ("daily_report", "weekly_report"):
+            globals()[name] = _make(name)
+        """,
+    )
+    _write(root / "util.py", "VALUE = 1\n")
+    return root
+
+
+def _discovery(tmp_path, **kwargs):
+    return ImportDiscovery(cache_path=tmp_path / "cache" / "discovery.json", **kwargs)
+
+
+class TestImportDiscovery:
+    """Test cases for ImportDiscovery."""
+
+    def test_module_import_path(self, tmp_path):
+        """Test that import paths use the root directory name as package."""
+        root = tmp_path / "pipelines"
+
+        assert (
+            module_import_path(str(root), str(root / "a" / "b.py")) == "pipelines.a.b"
+        )
+        assert (
+            module_import_path(str(root), str(root / "a" / "__init__.py"))
+            == "pipelines.a"
+        )
+
+    def test_import_root(self, tmp_path):
+        """Test that dotted package names are imported from the matching ancestor directory."""
+        root = tmp_path / "company" / "pipelines"
+
+        assert import_root(str(root), "pipelines") == str(tmp_path / "company")
+        assert import_root(str(root), "company.pipelines") == str(tmp_path)
+        with pytest.raises(ValueError, match="renamed"):
+            import_root(str(root), "renamed")
+
+    def test_dotted_package_name(self, tmp_path, project):
+        """Test that modules of a package nested in a namespace package are imported."""
+        nested = tmp_path / "company" / "pipelines"
+        nested.parent.mkdir()
+        project.rename(nested)
+        (nested / "teams" / "generated.py").write_text(
+            (nested / "teams" / "generated.py")
+            .read_text()
+            .replace("from pipelines.factory", "from company.pipelines.factory")
+        )
+        generated = str(nested / "teams" / "generated.py")
+
+        result = _discovery(tmp_path).discover(
+            "airflow", str(nested), [generated], package_name="company.pipelines"
+        )
+
+        assert [obj.name for obj in result[generated]] == ["sales-load", "ops-load"]
+        with pytest.raises(ValueError, match="renamed"):
+            _discovery(tmp_path).discover(
+                "airflow", str(nested), [generated], "renamed"
+            )
+
+    def test_finds_objects_built_at_runtime(self, tmp_path, project):
+        """Test that DAGs built by factories are found in the module that builds them."""
+        files = [str(path) for path in sorted(project.rglob("*.py"))]
+
+        result = _discovery(tmp_path).discover("airflow", str(project), files)
+
+        assert result[str(project / "teams" / "generated.py")] == [
+            DiscoveredObject("sales-load", "sales_dag", "Load sales-load"),
+            DiscoveredObject("ops-load", "ops_dag", "Load ops-load"),
+        ]
+        assert result[str(project / "static.py")] == [
+            DiscoveredObject("static", "static")
+        ]
+        assert result[str(project / "factory.py")] == []
+        # Modules not mentioning DAGs are not imported
+        assert str(project / "util.py") not in result
+
+    def test_cached_until_module_or_dependency_changes(self, tmp_path, project):
+        """Test that only modules whose content or project imports changed are imported again."""
+        files = [str(project / "teams" / "generated.py"), str(project / "static.py")]
+        _discovery(tmp_path).discover("airflow", str(project), files)
+
+        discovery = _discovery(tmp_path)
+        with patch.object(
+            ImportDiscovery, "_import_module", wraps=discovery._import_module
+        ) as import_module:
+            cached = discovery.discover("airflow", str(project), files)
+            assert import_module.call_count == 0
+            assert [obj.name for obj in cached[files[0]]] == ["sales-load", "ops-load"]
+
+            # generated.py imports the factory, static.py does not
+            (project / "factory.py").write_text(
+                (project / "factory.py").read_text() + "\n# changed\n"
+            )
+            changed = _discovery(tmp_path)
+            with patch.object(
+                ImportDiscovery, "_import_module", wraps=changed._import_module
+            ) as import_changed:
+                changed.discover("airflow", str(project), files)
+            assert [call.args[3] for call in import_changed.call_args_list] == [
+                files[0]
+            ]
+
+    def test_timeout_is_reported_and_retried(self, tmp_path, project, capsys):
+        """Test that a module that hangs is killed and imported again on the next run."""
+        slow = project / "slow_dag.py"
+        _write(slow, "import time\n\ntime.sleep(60)\ndag = None\n")
+        discovery = _discovery(tmp_path, timeout=1)
+
+        assert discovery.discover("airflow", str(project), [str(slow)]) == {
+            str(slow): []
+        }
+        assert "Import timed out after 1 seconds" in capsys.readouterr().err
+
+        with patch.object(
+            ImportDiscovery, "_import_module", return_value=([], None, True)
+        ) as import_module:
+            _discovery(tmp_path).discover("airflow", str(project), [str(slow)])
+        import_module.assert_called_once()
+
+    def test_import_errors_are_cached(self, tmp_path, project, capsys):
+        """Test that a module raising on import is not imported again until it changes."""
+        broken = project / "broken_dag.py"
+        _write(broken, "raise RuntimeError('no dag today')\n")
+
+        assert _discovery(tmp_path).discover(
+            "airflow", str(project), [str(broken)]
+        ) == {str(broken): []}
+        assert "RuntimeError: no dag today" in capsys.readouterr().err
+
+        with patch("subprocess.run") as run:
+            _discovery(tmp_path).discover("airflow", str(project), [str(broken)])
+        run.assert_not_called()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="memory limits need resource")
+    def test_memory_limit(self, tmp_path, project, capsys):
+        """Test that a module allocating more than the memory limit fails."""
+        hog = project / "hog_dag.py"
+        _write(hog, "dag_data = bytearray(2 * 1024 ** 3)\n")
+
+        result = _discovery(tmp_path, memory_limit_mb=512).discover(
+            "airflow", str(project), [str(hog)]
+        )
+
+        assert result == {str(hog): []}
+        assert "MemoryError" in capsys.readouterr().err
+
+    def test_unknown_kind(self, tmp_path, project):
+        """Test that only airflow and prefect objects can be discovered."""
+        with pytest.raises(ValueError, match="dagster"):
+            _discovery(tmp_path).discover("dagster", str(project), [])
+
+
+class TestFinderImportDiscovery:
+    """Test cases for the finders' opt-in import discovery."""
+
+    def test_airflow_finder_adds_runtime_dags(self, tmp_path, project):
+        """Test that runtime DAGs are added once, next to the DAGs found in the source."""
+        finder = AirflowFlowFinder(str(project), import_discovery=_discovery(tmp_path))
+
+        flows = {flow.name: flow for flow in finder.find_flows()}
+
+        assert sorted(flows) == ["ops_load", "sales_load", "static"]
+        sales = flows["sales_load"]
+        assert sales.original_name == "sales-load"
+        assert sales.grouping == ["teams"]
+        assert sales.child_attributes["obj_name"] == "sales_dag"
+        assert sales.child_attributes["import_path"] == "pipelines.teams.generated"
+
+    def test_airflow_finder_without_import_discovery(self, project):
+        """Test that the AST scan alone misses DAGs built by factories."""
+        flows = AirflowFlowFinder(str(project)).find_flows()
+
+        assert [flow.name for flow in flows] == ["static"]
+
+    def test_prefect_finder_adds_runtime_flows(self, tmp_path, project):
+        """Test that flows built in a loop are found with their global names."""
+        finder = PrefectFlowFinder(str(project), import_discovery=_discovery(tmp_path))
+
+        flows = {flow.name: flow for flow in finder.find_flows()}
+
+        assert sorted(flows) == ["daily_report", "weekly_report"]
+        assert flows["daily_report"].child_attributes == {
+            "obj_name": "daily_report",
+            "module": "flows",
+            "import_path": "pipelines.flows",
+        }
+        assert flows["daily_report"].description == "Run a report."
@@ -0,0 +1,154 @@
+"""Tests for MultiRootFlowFinder."""
+
+import textwrap
+from unittest.mock import patch
+
+import pytest
+
+from acme_portal_sdk.flow_finder import FlowFinder
+from acme_portal_sdk.multi_root import FlowRoot, MultiRootFlowFinder
+from acme_portal_sdk.prefect.flow_finder import PrefectFlowFinder
+
+FLOW_SOURCE = textwrap.dedent(
+    """
+    from prefect import flow
+
+    @flow(name="{name}")
+    def {name}():
+        pass
+    """
+)
+
+
+def _write_flow(directory, name):
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{name}.py").write_text(FLOW_SOURCE.format(name=name))
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    """Two flow packages, one installed under a dotted package name."""
+    _write_flow(tmp_path / "sales" / "flows" / "daily", "sales_etl")
+    _write_flow(tmp_path / "sales" / "flows" / "weekly", "sales_report")
+    _write_flow(tmp_path / "ops" / "src" / "ops_flows" / "daily", "ops_cleanup")
+    return [
+        FlowRoot(
+            str(tmp_path / "sales" / "flows"), package_name="acme.sales", name="sales"
+        ),
+        FlowRoot(str(tmp_path / "ops" / "src" / "ops_flows")),
+    ]
+
+
+def _finder(roots, **kwargs):
+    return MultiRootFlowFinder(
+        roots,
+        lambda root: PrefectFlowFinder(root.root_dir, package_name=root.package_name),
+        **kwargs,
+    )
+
+
+class TestMultiRootFlowFinder:
+    """Test cases for MultiRootFlowFinder."""
+
+    def test_flow_root_defaults(self, tmp_path):
+        """Test that the package and shard names default to the directory name."""
+        root = FlowRoot(str(tmp_path / "team" / "team_flows") + "/")
+
+        assert root.package_name == "team_flows"
+        assert root.name == "team_flows"
+
+    def test_merges_roots_with_per_root_grouping(self, monorepo):
+        """Test that flows of all roots are returned with the root name as first group."""
+        flows = {flow.name: flow for flow in _finder(monorepo).find_flows()}
+
+        assert sorted(flows) == ["ops_cleanup", "sales_etl", "sales_report"]
+        assert flows["sales_etl"].grouping == ["sales", "daily"]
+        assert (
+            flows["sales_etl"].child_attributes["import_path"]
+            == "acme.sales.daily.sales_etl"
+        )
+        assert flows["ops_cleanup"].grouping == ["ops_flows", "daily"]
+        assert (
+            flows["ops_cleanup"].child_attributes["import_path"]
+            == "ops_flows.daily.ops_cleanup"
+        )
+
+    def test_without_root_grouping(self, monorepo):
+        """Test that groupings can be kept as the finders return them."""
+        flows = _finder(monorepo, group_by_root=False).find_flows()
+
+        assert sorted(flow.grouping[0] for flow in flows) == [
+            "daily",
+            "daily",
+            "weekly",
+        ]
+
+    def test_selective_refetch_scans_one_shard(self, monorepo):
+        """Test that re-fetching a flow only scans the root it was found in."""
+        finder = _finder(monorepo)
+        flows = {flow.name: flow for flow in finder.find_flows()}
+
+        with (
+            patch.object(
+                finder.finders["ops_flows"],
+                "find_flows",
+                wraps=finder.finders["ops_flows"].find_flows,
+            ) as ops_scan,
+            patch.object(
+                finder.finders["sales"],
+                "find_flows",
+                wraps=finder.finders["sales"].find_flows,
+            ) as sales_scan,
+        ):
+            result = finder.find_flows(flows_to_fetch=[flows["sales_etl"]])
+
+        assert [flow.name for flow in result] == ["sales_etl"]
+        assert result[0].grouping == ["sales", "daily"]
+        ops_scan.assert_not_called()
+        # The finder gets the flow back with its own grouping
+        assert sales_scan.call_args.kwargs["flows_to_fetch"][0].grouping == ["daily"]
+
+    def test_group_refetch(self, monorepo):
+        """Test that a shard name re-fetches the shard and other groups only known shards."""
+        finder = _finder(monorepo)
+        finder.find_flows()
+
+        with patch.object(
+            finder.finders["ops_flows"],
+            "find_flows",
+            wraps=finder.finders["ops_flows"].find_flows,
+        ) as ops_scan:
+            weekly = finder.find_flows(flow_groups=["weekly"])
+            ops_scan.assert_not_called()
+            whole = finder.find_flows(flow_groups=["ops_flows"])
+            ops_scan.assert_called_once_with()
+
+        assert [flow.name for flow in weekly] == ["sales_report"]
+        assert [flow.name for flow in whole] == ["ops_cleanup"]
+
+    def test_failing_shard_is_skipped(self, monorepo, capsys):
+        """Test that the flows of other roots are returned when one root fails."""
+
+        class BrokenFinder(FlowFinder):
+            def find_flows(self, *, flows_to_fetch=None, flow_groups=None):
+                raise OSError("unreadable")
+
+        finder = MultiRootFlowFinder(
+            monorepo,
+            lambda root: BrokenFinder()
+            if root.name == "sales"
+            else PrefectFlowFinder(root.root_dir, package_name=root.package_name),
+        )
+
+        assert [flow.name for flow in finder.find_flows()] == ["ops_cleanup"]
+        assert "unreadable" in capsys.readouterr().err
+
+    def test_duplicate_root_names(self, tmp_path):
+        """Test that roots must have distinct names."""
+        roots = [
+            FlowRoot(str(tmp_path / "a" / "flows")),
+            FlowRoot(str(tmp_path / "b" / "flows")),
+        ]
+
+        with pytest.raises(ValueError, match="flows"):
+            _finder(roots)
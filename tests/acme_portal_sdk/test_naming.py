@@ -0,0 +1,134 @@
+"""Tests for the deployment name and tag codec."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from acme_portal_sdk.naming import (
+    DEFAULT_NAME_CODEC,
+    DeploymentName,
+    DeploymentNameCodec,
+)
+
+
+class TestDeploymentNameCodec:
+    """Test cases for DeploymentNameCodec."""
+
+    def test_default_round_trip(self):
+        """Test encoding and decoding the default naming scheme."""
+        name = DEFAULT_NAME_CODEC.encode("project", "main", "my_flow", "dev")
+
+        assert name == "project--main--my-flow--dev"
+        assert DEFAULT_NAME_CODEC.decode(name) == DeploymentName(
+            project_name="project", branch="main", flow_name="my_flow", env="dev"
+        )
+
+    def test_decode_reads_trailing_fields_from_the_end(self):
+        """Test that extra parts in the middle of a name do not shift flow and environment."""
+        decoded = DEFAULT_NAME_CODEC.decode("project--main--extra--my-flow--prod")
+
+        assert decoded == ("project", "main", "my_flow", "prod")
+
+    def test_decode_short_name_returns_none(self):
+        """Test that names with fewer parts than the template are rejected."""
+        assert DEFAULT_NAME_CODEC.decode("project--my-flow--dev") is None
+        assert DEFAULT_NAME_CODEC.decode("standalone") is None
+
+    def test_custom_template(self):
+        """Test a naming scheme with another separator and without project and branch."""
+        codec = DeploymentNameCodec(
+            template="{env}.{flow_name}", hyphenate_flow_name=False
+        )
+
+        assert codec.encode(None, None, "my_flow", "prod") == "prod.my_flow"
+        assert codec.decode("prod.my_flow") == DeploymentName(
+            None, None, "my_flow", "prod"
+        )
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "{project_name}--{branch}",
+            "{flow_name}--{env}--{flow_name}",
+            "{flow_name}--{unknown}--{env}",
+            "{flow_name}--{branch}__{env}",
+            "{flow_name}{env}",
+        ],
+    )
+    def test_invalid_templates(self, template):
+        """Test that unsupported templates are rejected when the codec is created."""
+        with pytest.raises(ValueError):
+            DeploymentNameCodec(template=template)
+
+    def test_parse_tags_in_one_pass(self):
+        """Test that tags are matched by exact key, keep '=' in values and the first duplicate."""
+        tags = [
+            "OLD_COMMIT_HASH=stale",
+            "COMMIT_HASH=abc123",
+            "COMMIT_HASH=ignored",
+            "QUERY=a=b",
+            "no-value",
+        ]
+
+        assert DeploymentNameCodec.parse_tags(tags) == {
+            "OLD_COMMIT_HASH": "stale",
+            "COMMIT_HASH": "abc123",
+            "QUERY": "a=b",
+        }
+
+    def test_encode_tags_with_custom_keys(self):
+        """Test that configured tag keys are used for encoding and can be parsed back."""
+        codec = DeploymentNameCodec(commit_hash_tag="GIT_SHA")
+        tags = codec.encode_tags("project", "main", "abc123", "1.0.0")
+
+        assert tags == [
+            "PROJECT_NAME=project",
+            "BRANCH_NAME=main",
+            "GIT_SHA=abc123",
+            "PACKAGE_VERSION=1.0.0",
+        ]
+        assert codec.parse_tags(tags)[codec.commit_hash_tag] == "abc123"
+
+
+class TestFinderNaming:
+    """Test cases for deployment finders using the codec."""
+
+    @patch("acme_portal_sdk.prefect.deployment_finder.get_client")
+    def test_prefect_finder_uses_codec(self, mock_get_client):
+        """Test that the Prefect finder decodes names and tags with the configured codec."""
+        from acme_portal_sdk.prefect.deployment_finder import PrefectDeploymentFinder
+
+        deployment = Mock()
+        deployment.name = "dev.my-flow"
+        deployment.tags = [
+            "PREVIOUS_COMMIT_HASH=old",
+            "PROJECT_NAME=project",
+            "BRANCH_NAME=main",
+            "COMMIT_HASH=abc123",
+            "PACKAGE_VERSION=1.0.0",
+        ]
+        deployment.id = "deployment-id"
+        deployment.created = "2024-01-01"
+        deployment.updated = "2024-01-02"
+        deployment.flow_id = "flow-id"
+        mock_get_client.return_value.read_deployments.return_value = [deployment]
+
+        finder = PrefectDeploymentFinder(
+            name_codec=DeploymentNameCodec(template="{env}.{flow_name}")
+        )
+        with patch.dict(
+            "os.environ",
+            {
+                "PREFECT_API_URL": "https://api.prefect.cloud/api/accounts/a/workspaces/w"
+            },
+        ):
+            (result,) = finder.get_deployments()
+
+        assert (result.project_name, result.branch, result.flow_name, result.env) == (
+            "project",
+            "main",
+            "my_flow",
+            "dev",
+        )
+        assert result.commit_hash == "abc123"
+        assert result.package_version == "1.0.0"
@@ -0,0 +1,234 @@
+"""Tests for portal snapshots of flows and deployments."""
+
+import argparse
+import asyncio
+import json
+import sys
+import textwrap
+import time
+from typing import List, Optional
+
+import pytest
+from conftest import make_deployment, make_flow
+
+from acme_portal_sdk._main import main_logic
+from acme_portal_sdk.async_api import AsyncDeploymentFinder
+from acme_portal_sdk.deployment_finder import DeploymentDetails, DeploymentFinder
+from acme_portal_sdk.flow_finder import FlowDetails, FlowFinder
+from acme_portal_sdk.portal_snapshot import (
+    ERROR,
+    OK,
+    SKIPPED,
+    TIMEOUT,
+    take_portal_snapshot,
+    take_portal_snapshot_async,
+)
+
+
+class SlowFlowFinder(FlowFinder):
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def find_flows(
+        self,
+        *,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+        flow_groups: Optional[List[str]] = None,
+    ) -> List[FlowDetails]:
+        time.sleep(self.delay)
+        return [make_flow("etl"), make_flow("report")]
+
+
+class SlowDeploymentFinder(DeploymentFinder):
+    def __init__(self, delay: float = 0.0, error: Optional[Exception] = None):
+        self.delay = delay
+        self.error = error
+
+    def get_deployments(
+        self,
+        *,
+        deployments_to_fetch: Optional[List[DeploymentDetails]] = None,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+    ) -> List[DeploymentDetails]:
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return [make_deployment("etl", "dev"), make_deployment("etl", "prod")]
+
+
+class NativeAsyncDeploymentFinder(AsyncDeploymentFinder):
+    async def get_deployments(
+        self,
+        *,
+        deployments_to_fetch: Optional[List[DeploymentDetails]] = None,
+        flows_to_fetch: Optional[List[FlowDetails]] = None,
+    ) -> List[DeploymentDetails]:
+        await asyncio.sleep(0.2)
+        return [make_deployment("report", "dev")]
+
+
+class TestPortalSnapshot:
+    """Test cases for take_portal_snapshot."""
+
+    def test_joins_flows_and_deployments(self):
+        """Test that both reads are returned with their join and timings."""
+        snapshot = take_portal_snapshot(SlowFlowFinder(), SlowDeploymentFinder())
+
+        assert snapshot.complete
+        assert [part.status for part in snapshot.parts.values()] == [OK, OK, OK]
+        assert snapshot.parts["flows"].count == 2
+        assert snapshot.parts["deployments"].count == 2
+        assert snapshot.matrix.environments == ["dev", "prod"]
+        assert sorted(snapshot.matrix.flows[0].deployments) == ["dev", "prod"]
+        payload = json.loads(snapshot.to_json())
+        assert payload["complete"] is True
+        assert payload["matrix"]["flows"][0] == {
+            "flow": "etl",
+            "deployments": {"dev": "etl-dev-abc123", "prod": "etl-prod-abc123"},
+        }
+        assert [d["id"] for d in payload["deployments"]] == [
+            "etl-dev-abc123",
+            "etl-prod-abc123",
+        ]
+        assert set(payload["parts"]) == {"flows", "deployments", "join"}
+
+    def test_reads_run_concurrently(self):
+        """Test that the total time is close to the slower read, not their sum."""
+        snapshot = take_portal_snapshot(SlowFlowFinder(0.3), SlowDeploymentFinder(0.3))
+
+        assert snapshot.parts["flows"].seconds >= 0.3
+        assert snapshot.parts["deployments"].seconds >= 0.3
+        assert snapshot.seconds < 0.55
+
+    def test_failed_read_returns_partial_result(self, capsys):
+        """Test that flows are returned when the deployment read fails."""
+        snapshot = take_portal_snapshot(
+            SlowFlowFinder(), SlowDeploymentFinder(error=ConnectionError("unreachable"))
+        )
+
+        assert not snapshot.complete
+        assert len(snapshot.flows) == 2
+        assert snapshot.deployments == []
+        assert snapshot.matrix is None
+        assert snapshot.parts["deployments"].status == ERROR
+        assert snapshot.parts["deployments"].error == "ConnectionError: unreachable"
+        assert snapshot.parts["join"].status == SKIPPED
+        assert "Error reading deployments: unreachable" in capsys.readouterr().out
+
+    def test_deadline_returns_without_waiting(self):
+        """Test that a read exceeding its deadline is abandoned."""
+        snapshot = take_portal_snapshot(
+            SlowFlowFinder(), SlowDeploymentFinder(delay=5), deployment_deadline=0.1
+        )
+
+        assert snapshot.seconds < 1
+        assert snapshot.parts["flows"].status == OK
+        assert snapshot.parts["deployments"].status == TIMEOUT
+        assert snapshot.parts["deployments"].error == "No result within 0.1 seconds"
+
+    def test_async_finder_and_missing_finder(self):
+        """Test that async finders run on the event loop and a missing finder fails its part."""
+        snapshot = asyncio.run(
+            take_portal_snapshot_async(
+                SlowFlowFinder(0.2), NativeAsyncDeploymentFinder()
+            )
+        )
+        assert snapshot.complete
+        assert snapshot.seconds < 0.35
+        assert snapshot.matrix.flows[1].deployments["dev"].id == "report-dev-abc123"
+
+        snapshot = take_portal_snapshot(None, NativeAsyncDeploymentFinder())
+        assert snapshot.parts["flows"].status == ERROR
+        assert snapshot.parts["flows"].error == "No flows finder configured"
+        assert snapshot.parts["deployments"].status == OK
+
+
+class TestSnapshotCommand:
+    """Test cases for `aps snapshot`."""
+
+    def test_prints_payload(self, tmp_path, monkeypatch, capsys):
+        """Test that the payload is the only output on stdout."""
+        sdk_dir = tmp_path / ".acme_portal_sdk"
+        sdk_dir.mkdir()
+        (sdk_dir / "flow_finder.py").write_text(
+            textwrap.dedent(
+                """
+                from acme_portal_sdk.flow_finder import FlowDetails, FlowFinder
+
+                class StaticFlowFinder(FlowFinder):
+                    def find_flows(self, *, flows_to_fetch=None, flow_groups=None):
+                        print("Scanning")
+                        return [FlowDetails("etl", "etl", "", "1", "etl.py", "etl.py")]
+
+                flow_finder = StaticFlowFinder()
+                """
+            )
+        )
+        monkeypatch.chdir(tmp_path)
+
+        main_logic(
+            argparse.Namespace(
+                command="snapshot", flow_deadline=None, deployment_deadline=1.0
+            )
+        )
+
+        output = capsys.readouterr()
+        payload = json.loads(output.out)
+        assert [flow["name"] for flow in payload["flows"]] == ["etl"]
+        assert payload["parts"]["deployments"]["status"] == "error"
+        assert payload["matrix"] is None
+        assert "Scanning" in output.err
+        assert "Error loading deployment_finder.py" in output.err
+
+    def test_late_finder_output_follows_payload(self, tmp_path, monkeypatch, capsys):
+        """Test that a finder printing after its deadline leaves the payload intact."""
+        sdk_dir = tmp_path / ".acme_portal_sdk"
+        sdk_dir.mkdir()
+        (sdk_dir / "deployment_finder.py").write_text(
+            textwrap.dedent(
+                """
+                import time
+
+                from acme_portal_sdk.deployment_finder import DeploymentFinder
+
+                class LateDeploymentFinder(DeploymentFinder):
+                    def get_deployments(self, *, deployments_to_fetch=None, flows_to_fetch=None):
+                        time.sleep(0.3)
+                        print("Finished late")
+                        return []
+
+                deployment_finder = LateDeploymentFinder()
+                """
+            )
+        )
+        monkeypatch.chdir(tmp_path)
+        stdout = sys.stdout
+
+        with pytest.raises(SystemExit):
+            main_logic(
+                argparse.Namespace(
+                    command="snapshot", flow_deadline=None, deployment_deadline=0.1
+                )
+            )
+        assert sys.stdout is stdout
+        time.sleep(0.5)
+
+        output = capsys.readouterr()
+        payload_line, late_output = output.out.split("\n", 1)
+        assert json.loads(payload_line)["parts"]["deployments"]["status"] == "timeout"
+        assert "Finished late" in late_output
+
+    def test_fails_without_any_result(self, tmp_path, monkeypatch, capsys):
+        """Test that the command exits with an error when neither read succeeds."""
+        (tmp_path / ".acme_portal_sdk").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        with pytest.raises(SystemExit) as exit_info:
+            main_logic(
+                argparse.Namespace(
+                    command="snapshot", flow_deadline=None, deployment_deadline=None
+                )
+            )
+
+        assert exit_info.value.code == 1
+        assert json.loads(capsys.readouterr().out)["complete"] is False
@@ -0,0 +1,155 @@
+"""Tests for PrefectDeploymentPromote."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from acme_portal_sdk.flow_deploy import DeployInfo
+from acme_portal_sdk.prefect.deployment_promote import PrefectDeploymentPromote
+
+
+class _FakeDeployment:
+    """Minimal stand-in for a Prefect deployment model, iterable into a dict."""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+    def __iter__(self):
+        return iter(self.__dict__.items())
+
+
+def _source_deployment(name: str) -> _FakeDeployment:
+    return _FakeDeployment(
+        name=name,
+        job_variables={"image": "registry/image:abc123"},
+        tags=[
+            "PROJECT_NAME=project",
+            "BRANCH_NAME=main",
+            "COMMIT_HASH=abc123",
+            "PACKAGE_VERSION=1.0.0",
+        ],
+    )
+
+
+class TestPrefectDeploymentPromote:
+    """Test cases for PrefectDeploymentPromote."""
+
+    def setup_method(self):
+        self.deployer = Mock()
+        self.deploy_info_prep = Mock()
+        self.deploy_info_prep.prep_deploy_info.side_effect = (
+            lambda flows_to_deploy, **kwargs: [
+                DeployInfo(
+                    name=f"info-{flows_to_deploy[0]}", flow_name=flows_to_deploy[0]
+                )
+            ]
+        )
+        self.promoter = PrefectDeploymentPromote(
+            deployer=self.deployer, flow_deploy_info_prep=self.deploy_info_prep
+        )
+
+    @patch("acme_portal_sdk.prefect.deployment_promote.get_client")
+    def test_promote_reads_source_deployments_in_one_call(self, mock_get_client):
+        """Test that all source deployments are read with a single filtered call."""
+        client = mock_get_client.return_value
+        client.read_deployments.return_value = [
+            _source_deployment("project--main--flow-a--dev"),
+            _source_deployment("project--main--flow-b--dev"),
+        ]
+
+        self.promoter.promote(
+            project_name="project",
+            branch_name="main",
+            source_env="dev",
+            target_env="prod",
+            flows_to_deploy=["flow-a", "flow_b"],
+        )
+
+        mock_get_client.assert_called_once()
+        client.read_deployments.assert_called_once()
+        deployment_filter = client.read_deployments.call_args.kwargs[
+            "deployment_filter"
+        ]
+        assert set(deployment_filter.name.any_) == {
+            "project--main--flow-a--dev",
+            "project--main--flow-b--dev",
+        }
+        client.read_deployment_by_name.assert_not_called()
+        assert sorted(c.args[0].name for c in self.deployer.deploy.call_args_list) == [
+            "info-flow_a",
+            "info-flow_b",
+        ]
+
+    @patch("acme_portal_sdk.prefect.deployment_promote.get_client")
+    def test_promote_pages_through_source_deployments(self, mock_get_client):
+        """Test that source deployments beyond Prefect's page limit are read too."""
+        flows = [f"flow-{index}" for index in range(250)]
+        deployments = [
+            _source_deployment(f"project--main--{flow}--dev") for flow in flows
+        ]
+        client = mock_get_client.return_value
+        client.read_deployments.side_effect = lambda deployment_filter, limit, offset: (
+            deployments[offset : offset + limit]
+        )
+
+        self.promoter.promote(
+            project_name="project",
+            branch_name="main",
+            source_env="dev",
+            target_env="prod",
+            flows_to_deploy=flows,
+        )
+
+        assert [c.kwargs["offset"] for c in client.read_deployments.call_args_list] == [
+            0,
+            200,
+        ]
+        assert self.deployer.deploy.call_count == 250
+
+    @patch("acme_portal_sdk.prefect.deployment_promote.get_client")
+    def test_promote_reports_all_missing_sources(self, mock_get_client):
+        """Test that missing source deployments are reported together before deploying."""
+        client = mock_get_client.return_value
+        client.read_deployments.return_value = [
+            _source_deployment("project--main--flow-a--dev"),
+        ]
+
+        with pytest.raises(ValueError) as exc_info:
+            self.promoter.promote(
+                project_name="project",
+                branch_name="main",
+                source_env="dev",
+                target_env="prod",
+                flows_to_deploy=["flow_a", "flow_b", "flow_c"],
+            )
+
+        message = str(exc_info.value)
+        assert "flow_b/project--main--flow-b--dev" in message
+        assert "flow_c/project--main--flow-c--dev" in message
+        assert "flow-a" not in message
+        self.deployer.deploy.assert_not_called()
+
+    @patch("acme_portal_sdk.prefect.deployment_promote.get_client")
+    def test_promote_deploys_all_flows_before_reporting_failures(self, mock_get_client):
+        """Test that a failing target deployment does not stop the other promotions."""
+        mock_get_client.return_value.read_deployments.return_value = [
+            _source_deployment("project--main--flow-a--dev"),
+            _source_deployment("project--main--flow-b--dev"),
+        ]
+
+        def deploy(info):
+            if info.flow_name == "flow_a":
+                raise RuntimeError("boom")
+
+        self.deployer.deploy.side_effect = deploy
+
+        with pytest.raises(RuntimeError, match="1 of 2 deployments failed"):
+            self.promoter.promote(
+                project_name="project",
+                branch_name="main",
+                source_env="dev",
+                target_env="prod",
+                flows_to_deploy=["flow_a", "flow_b"],
+            )
+
+        assert self.deployer.deploy.call_count == 2
@@ -0,0 +1,168 @@
+"""Tests for the read path profiler and the `aps profile` command."""
+
+import argparse
+import json
+import textwrap
+
+import pytest
+
+from acme_portal_sdk._main import main_logic
+from acme_portal_sdk.profiling import (
+    PathProfile,
+    check_budgets,
+    format_report,
+    load_budgets,
+    percentile,
+    profile_call,
+)
+
+
+class TestProfiling:
+    """Test cases for the profiling helpers."""
+
+    def test_percentile_nearest_rank(self):
+        """Test the nearest-rank percentile."""
+        values = [5.0, 1.0, 4.0, 2.0, 3.0]
+
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 95) == 5.0
+        assert percentile(values, 0) == 1.0
+        assert percentile([], 50) is None
+
+    def test_profile_call_measures_cold_and_warm(self):
+        """Test that the first call is cold, the others warm, and output is discarded."""
+        calls = []
+
+        def read():
+            print("noise")
+            calls.append(1)
+            return [bytearray(1024 * 1024)]
+
+        profile, result = profile_call("read", read, runs=4, top=3)
+
+        assert len(result) == 1
+        # 4 timed calls, one under tracemalloc and one under cProfile
+        assert len(calls) == 6
+        assert profile.cold is not None
+        assert len(profile.warm) == 3
+        assert profile.peak_memory >= 1024 * 1024
+        assert 0 < len(profile.hot_functions) <= 3
+        assert profile.error is None
+
+    def test_profile_call_records_errors(self):
+        """Test that a failing read path is reported instead of raised."""
+
+        def read():
+            raise ConnectionError("unreachable")
+
+        profile, result = profile_call("read", read)
+
+        assert result is None
+        assert profile.error == "ConnectionError: unreachable"
+        assert "❌ ConnectionError: unreachable" in format_report([profile])
+
+    def test_check_budgets(self, tmp_path):
+        """Test that exceeded, failed and missing budgeted read paths are reported."""
+        path = tmp_path / "budgets.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "fast": {"warm_p95_ms": 100, "peak_memory_mb": 1},
+                    "slow": {"cold_ms": 100},
+                    "broken": {"cold_ms": 100},
+                    "missing": {"cold_ms": 100},
+                }
+            )
+        )
+        profiles = [
+            PathProfile("fast", cold=0.01, warm=[0.01, 0.02], peak_memory=1024),
+            PathProfile("slow", cold=0.5),
+            PathProfile("broken", error="RuntimeError: failed"),
+        ]
+
+        violations = check_budgets(profiles, load_budgets(path))
+
+        assert violations == [
+            "slow: cold_ms 500.0 exceeds budget 100",
+            "broken: RuntimeError: failed",
+            "missing: not measured",
+        ]
+
+    def test_unknown_budget_metric(self, tmp_path):
+        """Test that typos in the budgets file are rejected."""
+        path = tmp_path / "budgets.json"
+        path.write_text(json.dumps({"find_flows": {"p95": 100}}))
+
+        with pytest.raises(ValueError, match="p95"):
+            load_budgets(path)
+
+
+class TestProfileCommand:
+    """Test cases for `aps profile`."""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        sdk_dir = tmp_path / ".acme_portal_sdk"
+        sdk_dir.mkdir()
+        (sdk_dir / "flow_finder.py").write_text(
+            textwrap.dedent(
+                """
+                from acme_portal_sdk.flow_finder import FlowDetails, FlowFinder
+
+                class StaticFlowFinder(FlowFinder):
+                    def find_flows(self, *, flows_to_fetch=None, flow_groups=None):
+                        flows = [FlowDetails("etl", "etl", "", "1", "etl.py", "etl.py")]
+                        return flows_to_fetch or flows
+
+                flow_finder = StaticFlowFinder()
+                """
+            )
+        )
+        (sdk_dir / "deployment_finder.py").write_text(
+            textwrap.dedent(
+                """
+                from acme_portal_sdk.deployment_finder import DeploymentFinder
+
+                class UnreachableDeploymentFinder(DeploymentFinder):
+                    def get_deployments(self, *, deployments_to_fetch=None, flows_to_fetch=None):
+                        raise ConnectionError("unreachable")
+
+                deployment_finder = UnreachableDeploymentFinder()
+                """
+            )
+        )
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def _args(self, **kwargs):
+        defaults = dict(command="profile", runs=3, top=5, budgets=None, json=True)
+        defaults.update(kwargs)
+        return argparse.Namespace(**defaults)
+
+    def test_json_report(self, project, capsys):
+        """Test that all read paths of the configured objects are reported."""
+        main_logic(self._args())
+
+        report = json.loads(capsys.readouterr().out)
+        profiles = {profile["name"]: profile for profile in report["profiles"]}
+        assert list(profiles) == [
+            "find_flows",
+            "find_flows (selective)",
+            "get_deployments",
+        ]
+        assert len(profiles["find_flows"]["warm_ms"]) == 2
+        assert profiles["get_deployments"]["error"] == "ConnectionError: unreachable"
+        assert report["budget_violations"] == []
+
+    def test_exceeded_budget_fails(self, project, capsys):
+        """Test that the command exits with an error when a budget is exceeded."""
+        budgets = project / "budgets.json"
+        budgets.write_text(json.dumps({"get_deployments": {"cold_ms": 1000}}))
+
+        with pytest.raises(SystemExit) as exit_info:
+            main_logic(self._args(budgets=str(budgets), json=False))
+
+        assert exit_info.value.code == 1
+        output = capsys.readouterr().out
+        assert "Hot functions in find_flows" in output
+        assert "❌ get_deployments: ConnectionError: unreachable" in output
@@ -272,6 +272,33 @@ class TestDeploymentFinderSelectiveRefetch:
         assert "project1--main--flow1--dev" in deploy_names
         assert "project1--main--flow2--dev" in deploy_names
 
+    @pytest.mark.skipif(not PREFECT_AVAILABLE, reason="Prefect not available")
+    @patch('acme_portal_sdk.prefect.deployment_finder.get_client')
+    def test_prefect_deployment_finder_reads_every_page(self, mock_get_client):
+        """Test that deployments beyond Prefect's page limit are returned too."""
+        deployments = []
+        for index in range(250):
+            deployment = Mock()
+            deployment.name = f"project1--main--flow{index}--dev"
+            deployment.tags = []
+            deployment.id = f"deploy{index}"
+            deployments.append(deployment)
+        mock_client = mock_get_client.return_value
+        mock_client.read_deployments.side_effect = (
+            lambda deployment_filter=None, limit=None, offset=0: (
+                deployments[offset : offset + limit]
+            )
+        )
+
+        finder = PrefectDeploymentFinder()
+        mock_client.read_deployments.reset_mock()
+
+        with patch.dict('os.environ', {'PREFECT_API_URL': 'https://api.prefect.cloud/api/accounts/test/workspaces/test'}):
+            result = finder.get_deployments(flows_to_fetch=[self.flow2])
+
+        assert mock_client.read_deployments.call_count == 2
+        assert [d.name for d in result] == ["project1--main--flow2--dev"]
+
     @pytest.mark.skipif(not PREFECT_AVAILABLE, reason="Prefect not available")
     @patch('acme_portal_sdk.prefect.deployment_finder.get_client')
     def test_prefect_deployment_finder_deployments_to_fetch(self, mock_get_client):
@@ -0,0 +1,88 @@
+"""Tests for record serialization helpers."""
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional
+
+import pytest
+from conftest import make_deployment
+
+from acme_portal_sdk import serialization
+from acme_portal_sdk.deployment_finder import DeploymentDetails, DeploymentFinder
+from acme_portal_sdk.flow_finder import FlowDetails
+
+
+class TestRecordToDict:
+    """Test cases for record_to_dict."""
+
+    def test_matches_asdict_and_copies_top_level_containers(self):
+        """Test that the result equals asdict and can be changed without changing the record."""
+        deployment = make_deployment(child_attributes={"nested": {"key": "value"}})
+
+        data = deployment.to_dict()
+        data["tags"].append("extra")
+        data["child_attributes"]["added"] = True
+
+        assert deployment.to_dict() == asdict(deployment)
+        assert deployment.tags == ["COMMIT_HASH=abc123"]
+        assert "added" not in deployment.child_attributes
+        assert DeploymentDetails.from_dict(deployment.to_dict()) == deployment
+
+    def test_subclass_fields_and_instance_attributes(self):
+        """Test dataclass subclasses with extra fields and records with extra attributes."""
+
+        @dataclass
+        class RankedFlow(FlowDetails):
+            rank: int = 0
+            labels: List[str] = field(default_factory=list)
+            owner: Optional[str] = None
+
+        flow = RankedFlow(
+            name="flow",
+            original_name="flow",
+            description="",
+            id="id",
+            source_path="/flow.py",
+            source_relative="flow.py",
+            rank=3,
+            labels=["a"],
+        )
+        flow.cached = "not a field"
+
+        assert flow.to_dict() == asdict(flow)
+        assert "cached" not in flow.to_dict()
+
+
+class TestEncoders:
+    """Test cases for the JSON and msgpack encoders."""
+
+    def test_dumps_round_trip(self):
+        """Test that dumps produces JSON readable by the standard library."""
+        data = [make_deployment().to_dict()]
+
+        assert json.loads(serialization.dumps(data)) == data
+        assert serialization.loads(serialization.dumps(data)) == data
+
+    def test_dumps_without_orjson(self, monkeypatch):
+        """Test the standard library fallback."""
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert serialization.dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'
+
+    def test_packb_requires_msgpack(self, monkeypatch):
+        """Test that msgpack encoding explains how to install msgpack."""
+        monkeypatch.setattr(serialization, "msgpack", None)
+
+        with pytest.raises(ImportError, match="fast"):
+            serialization.packb({})
+
+    def test_finder_to_json(self):
+        """Test that finders return JSON of their serialized records."""
+
+        class Finder(DeploymentFinder):
+            def get_deployments(
+                self, *, deployments_to_fetch=None, flows_to_fetch=None
+            ):
+                return [make_deployment()]
+
+        assert json.loads(Finder().to_json()) == [make_deployment().to_dict()]
@@ -0,0 +1,249 @@
+"""Tests for the snapshot store and the stale-while-revalidate finders."""
+
+import threading
+from typing import List
+
+import pytest
+from conftest import CountingFlowFinder, make_deployment, make_flow
+
+from acme_portal_sdk.deployment_finder import DeploymentDetails, DeploymentFinder
+from acme_portal_sdk.snapshot_store import (
+    DEPLOYMENTS,
+    FLOWS,
+    SnapshotDeploymentFinder,
+    SnapshotFlowFinder,
+    SnapshotStore,
+    StaleWhileRevalidate,
+)
+
+
+class StaticDeploymentFinder(DeploymentFinder):
+    def __init__(self, deployments: List[DeploymentDetails]):
+        self.deployments = deployments
+        self.calls = 0
+
+    def get_deployments(self, *, deployments_to_fetch=None, flows_to_fetch=None):
+        self.calls += 1
+        return list(deployments_to_fetch or self.deployments)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(tmp_path / "cache" / "snapshots.sqlite3")
+
+
+class TestSnapshotStore:
+    """Test cases for SnapshotStore."""
+
+    def test_round_trip_per_project(self, store):
+        """Test that records are stored per project and kind."""
+        store.save("a", FLOWS, [{"name": "etl"}], saved_at=10.0)
+        store.save("b", FLOWS, [{"name": "report"}], saved_at=20.0)
+
+        assert store.load("a", FLOWS) == ([{"name": "etl"}], 10.0)
+        assert store.load("b", FLOWS) == ([{"name": "report"}], 20.0)
+        assert store.load("a", DEPLOYMENTS) is None
+
+    def test_save_replaces_and_delete_removes(self, store):
+        """Test that saving replaces the previous records and delete removes them."""
+        store.save("a", FLOWS, [{"name": "etl"}])
+        store.save("a", FLOWS, [])
+        store.save("a", DEPLOYMENTS, [{"name": "d"}])
+        assert store.load("a", FLOWS)[0] == []
+
+        store.delete("a", FLOWS)
+        assert store.load("a", FLOWS) is None
+        assert store.load("a", DEPLOYMENTS) is not None
+
+        store.delete("a")
+        assert store.load("a", DEPLOYMENTS) is None
+
+
+class TestSnapshotFlowFinder:
+    """Test cases for SnapshotFlowFinder."""
+
+    def test_first_call_fetches_and_stores(self, store):
+        """Test that without a snapshot the wrapped finder is called before returning."""
+        inner = CountingFlowFinder()
+        finder = SnapshotFlowFinder(inner, project="p", store=store)
+
+        snapshot = finder.read_snapshot()
+
+        assert [flow.name for flow in snapshot.items] == ["etl"]
+        assert snapshot.stale is False
+        assert len(inner.calls) == 1
+        assert store.load("p", FLOWS)[0] == [make_flow("etl").to_dict()]
+
+    def test_stored_snapshot_returned_stale_then_revalidated(self, store):
+        """Test that a stored snapshot is returned at once and replaced in the background."""
+        SnapshotFlowFinder(CountingFlowFinder(), project="p", store=store).find_flows()
+        inner = CountingFlowFinder()
+        inner.names = ["etl", "report"]
+        inner.release.clear()
+        updates = []
+        finder = SnapshotFlowFinder(
+            inner, project="p", store=store, on_update=updates.append
+        )
+
+        snapshot = finder.read_snapshot()
+
+        # Returned while the revalidation is still blocked in the wrapped finder
+        assert snapshot.stale is True
+        assert [flow.name for flow in snapshot.items] == ["etl"]
+        inner.release.set()
+        fresh = finder.snapshots.revalidate().result(5)
+        assert [flow.name for flow in fresh.items] == ["etl", "report"]
+        assert updates == [fresh]
+        assert [flow.name for flow in finder.find_flows()] == ["etl", "report"]
+
+    def test_revalidation_does_not_delay_exit(self, store):
+        """Test that a running revalidation does not keep the process alive."""
+        SnapshotFlowFinder(CountingFlowFinder(), project="p", store=store).find_flows()
+        inner = CountingFlowFinder()
+        inner.release.clear()
+        finder = SnapshotFlowFinder(inner, project="p", store=store)
+
+        finder.find_flows()
+        try:
+            blocking = [
+                thread
+                for thread in threading.enumerate()
+                if not thread.daemon and thread is not threading.main_thread()
+            ]
+            assert blocking == []
+        finally:
+            inner.release.set()
+        finder.snapshots.revalidate().result(5)
+
+    def test_failed_revalidation_keeps_snapshot(self, store):
+        """Test that an error while revalidating leaves the stored snapshot in place."""
+        SnapshotFlowFinder(CountingFlowFinder(), project="p", store=store).find_flows()
+        inner = CountingFlowFinder()
+        inner.fail = True
+        finder = SnapshotFlowFinder(inner, project="p", store=store)
+
+        assert [flow.name for flow in finder.find_flows()] == ["etl"]
+        with pytest.raises(RuntimeError):
+            finder.snapshots.revalidate().result(5)
+        assert store.load("p", FLOWS)[0] == [make_flow("etl").to_dict()]
+
+    def test_max_age_skips_revalidation(self, store):
+        """Test that a snapshot younger than max_age is served as fresh."""
+        SnapshotFlowFinder(CountingFlowFinder(), project="p", store=store).find_flows()
+        inner = CountingFlowFinder()
+        finder = SnapshotFlowFinder(inner, project="p", store=store, max_age=3600)
+
+        assert finder.read_snapshot().stale is False
+        assert inner.calls == []
+
+    def test_selective_refetch_passes_through(self, store):
+        """Test that selective refetches bypass the snapshot."""
+        inner = CountingFlowFinder()
+        inner.names = ["etl", "report"]
+        finder = SnapshotFlowFinder(inner, project="p", store=store)
+
+        result = finder.find_flows(flows_to_fetch=[make_flow("report")])
+
+        assert [flow.name for flow in result] == ["report"]
+        assert store.load("p", FLOWS) is None
+
+    def test_periodic_revalidation(self, store):
+        """Test that start() revalidates until stop()."""
+        inner = CountingFlowFinder()
+        updated = threading.Event()
+        finder = SnapshotFlowFinder(
+            inner,
+            project="p",
+            store=store,
+            refresh_interval=0.01,
+            on_update=lambda snapshot: updated.set(),
+        )
+
+        finder.start()
+        try:
+            assert updated.wait(5)
+        finally:
+            finder.stop()
+        assert store.load("p", FLOWS) is not None
+
+
+class TestSnapshotDeploymentFinder:
+    """Test cases for SnapshotDeploymentFinder."""
+
+    def test_deployments_round_trip(self, store):
+        """Test that stored deployments are restored as DeploymentDetails."""
+        deployment = make_deployment("etl")
+        SnapshotDeploymentFinder(
+            StaticDeploymentFinder([deployment]), project="p", store=store
+        ).get_deployments()
+        inner = StaticDeploymentFinder([])
+        finder = SnapshotDeploymentFinder(inner, project="p", store=store)
+
+        snapshot = finder.read_snapshot()
+        finder.snapshots.revalidate().result(5)
+
+        assert snapshot.stale is True
+        assert snapshot.items == [deployment]
+        assert snapshot.to_dict()["items"] == [deployment.to_dict()]
+        assert finder.read_snapshot().items == []
+
+
+def test_default_project_identifies_finder(store, tmp_path, monkeypatch):
+    """Test that finders of different classes or directories do not share stored results."""
+    monkeypatch.chdir(tmp_path)
+    for directory, name in (("a", "etl"), ("b", "report")):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / f"{name}.py").write_text("")
+    first = CountingFlowFinder(str(tmp_path / "a"))
+    second = CountingFlowFinder(str(tmp_path / "b"))
+    deployment_finder = StaticDeploymentFinder([])
+
+    flows_a = SnapshotFlowFinder(first, store=store).find_flows()
+    flows_b = SnapshotFlowFinder(second, store=store).find_flows()
+    projects = {
+        SnapshotFlowFinder(first, store=store).snapshots.project,
+        SnapshotFlowFinder(second, store=store).snapshots.project,
+        SnapshotDeploymentFinder(deployment_finder, store=store).snapshots.project,
+    }
+
+    assert [flow.name for flow in flows_a] == ["etl"]
+    assert [flow.name for flow in flows_b] == ["report"]
+    assert len(projects) == 3
+    assert all(project.startswith(str(tmp_path.resolve())) for project in projects)
+
+
+def test_default_project_identifies_backend(store, tmp_path, monkeypatch):
+    """Test that deployments read from different APIs do not share stored results."""
+    monkeypatch.chdir(tmp_path)
+    finder = StaticDeploymentFinder([])
+
+    def project():
+        return SnapshotDeploymentFinder(finder, store=store).snapshots.project
+
+    monkeypatch.setenv("PREFECT_API_URL", "https://prefect.example.com/a/api")
+    first = project()
+    monkeypatch.setenv("PREFECT_API_URL", "https://prefect.example.com/b/api")
+    second = project()
+    finder.airflow_url = "https://airflow.example.com"
+    third = project()
+
+    assert len({first, second, third}) == 3
+    assert third.endswith("|https://airflow.example.com")
+
+
+def test_jittered_interval():
+    """Test that refresh intervals stay within the jitter fraction."""
+    revalidator = StaleWhileRevalidate(
+        store=None,
+        project="p",
+        kind=FLOWS,
+        fetch=list,
+        decode=dict,
+        refresh_interval=100.0,
+        jitter=0.2,
+    )
+
+    intervals = [revalidator.next_interval() for _ in range(200)]
+
+    assert all(80.0 <= interval <= 120.0 for interval in intervals)
+    assert len(set(intervals)) > 1
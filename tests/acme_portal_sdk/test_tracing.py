@@ -0,0 +1,220 @@
+"""Tests for tracing and metrics instrumentation."""
+
+import io
+import json
+import subprocess
+from typing import List
+
+import pytest
+
+from acme_portal_sdk import tracing
+from acme_portal_sdk.flow_finder import FlowDetails, FlowFinder
+from acme_portal_sdk.github.github_workflow import CommandExecutor
+
+
+class _RecordingExporter(tracing.SpanExporter):
+    def __init__(self):
+        self.started: List[str] = []
+        self.spans: List[tracing.Span] = []
+
+    def on_start(self, span):
+        self.started.append(span.name)
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+class _ListFinder(FlowFinder):
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def find_flows(self, *, flows_to_fetch=None, flow_groups=None):
+        with tracing.span("inner", flows=1):
+            if self.fail:
+                raise RuntimeError("scan failed")
+        return [FlowDetails("a", "a", "", "1", "a.py", "a.py")]
+
+
+@pytest.fixture
+def exporter():
+    exporter = tracing.add_exporter(_RecordingExporter())
+    yield exporter
+    tracing.clear_exporters()
+
+
+class TestTracing:
+    """Test cases for span recording."""
+
+    def test_disabled_tracing_records_nothing(self):
+        """Test that instrumented code runs without creating spans when no exporter is registered."""
+        assert not tracing.is_enabled()
+        with tracing.span("ignored") as current:
+            current.set_attribute("key", "value")
+        assert _ListFinder().find_flows()[0].name == "a"
+
+    def test_subclass_methods_are_traced(self, exporter):
+        """Test that finder implementations are recorded with nested spans."""
+        _ListFinder().find_flows()
+
+        inner, outer = exporter.spans
+        assert exporter.started == ["_ListFinder.find_flows", "inner"]
+        assert outer.name == "_ListFinder.find_flows"
+        assert inner.parent_id == outer.span_id
+        assert inner.trace_id == outer.trace_id
+        assert inner.attributes == {"flows": 1}
+        assert outer.duration >= inner.duration >= 0
+
+    def test_errors_are_recorded(self, exporter):
+        """Test that exceptions are recorded on the span and re-raised."""
+        with pytest.raises(RuntimeError):
+            _ListFinder(fail=True).find_flows()
+
+        assert [span.error for span in exporter.spans] == [
+            "RuntimeError: scan failed",
+            "RuntimeError: scan failed",
+        ]
+
+    def test_failing_exporter_does_not_break_operations(self, exporter):
+        """Test that exporter errors are logged instead of raised."""
+
+        class _Broken(tracing.SpanExporter):
+            def export(self, span):
+                raise ValueError("broken")
+
+        tracing.add_exporter(_Broken())
+
+        assert len(_ListFinder().find_flows()) == 1
+        assert len(exporter.spans) == 2
+
+    def test_command_executor_records_program_name(self, exporter):
+        """Test that commands are traced with the program name but not their arguments."""
+        CommandExecutor().execute(["python", "-c", "print('secret')"])
+        with pytest.raises(subprocess.CalledProcessError):
+            CommandExecutor().execute("exit 3")
+
+        ok, failed = exporter.spans
+        assert ok.name == "CommandExecutor.execute"
+        assert ok.attributes == {"command": "python"}
+        assert failed.attributes == {"command": "exit"}
+        assert failed.error.startswith("CalledProcessError")
+
+    def test_async_functions_are_traced(self, exporter):
+        """Test that coroutine functions are recorded around the awaited call."""
+        import asyncio
+
+        @tracing.traced("async.operation")
+        async def operation():
+            return 42
+
+        assert asyncio.run(operation()) == 42
+        assert [span.name for span in exporter.spans] == ["async.operation"]
+
+
+class TestExporters:
+    """Test cases for the span exporters."""
+
+    def test_json_lines_exporter(self):
+        """Test that each span is written as one JSON line."""
+        stream = io.StringIO()
+        tracing.add_exporter(tracing.JsonLinesExporter(stream=stream))
+        try:
+            _ListFinder().find_flows()
+        finally:
+            tracing.clear_exporters()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line["name"] for line in lines] == ["inner", "_ListFinder.find_flows"]
+        assert lines[0]["parent_id"] == lines[1]["span_id"]
+
+    def test_prometheus_textfile_exporter(self, tmp_path):
+        """Test the histogram and error counter written to the textfile."""
+        path = tmp_path / "acme.prom"
+        exporter = tracing.PrometheusTextfileExporter(
+            path, buckets=(0.1, 1.0), write_interval=3600
+        )
+        start = dict(trace_id="t", span_id="s", parent_id=None, start_time=0.0)
+        exporter.export(tracing.Span(name="op", duration=0.05, **start))
+        exporter.export(tracing.Span(name="op", duration=0.5, error="E: x", **start))
+        exporter.export(tracing.Span(name='q"uote', duration=2.0, **start))
+        exporter.shutdown()
+
+        content = path.read_text()
+        assert (
+            'acme_portal_sdk_span_duration_seconds_bucket{span="op",le="0.1"} 1'
+            in content
+        )
+        assert (
+            'acme_portal_sdk_span_duration_seconds_bucket{span="op",le="1"} 2'
+            in content
+        )
+        assert (
+            'acme_portal_sdk_span_duration_seconds_bucket{span="op",le="+Inf"} 2'
+            in content
+        )
+        assert 'acme_portal_sdk_span_duration_seconds_count{span="op"} 2' in content
+        assert 'acme_portal_sdk_span_duration_seconds_sum{span="op"} 0.55' in content
+        assert 'acme_portal_sdk_span_errors_total{span="op"} 1' in content
+        assert 'span="q\\"uote"' in content
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_opentelemetry_exporter_nests_spans(self):
+        """Test that spans are forwarded to a tracer with their parent context."""
+
+        class _FakeOtelSpan:
+            def __init__(self, name, context):
+                self.name = name
+                self.context = context
+                self.attributes = {}
+                self.end_time = None
+
+            def set_attribute(self, key, value):
+                self.attributes[key] = value
+
+            def set_status(self, status):
+                self.status = status
+
+            def end(self, end_time=None):
+                self.end_time = end_time
+
+        class _FakeTracer:
+            def __init__(self):
+                self.spans = []
+
+            def start_span(self, name, context=None, attributes=None, start_time=None):
+                otel_span = _FakeOtelSpan(name, context)
+                otel_span.attributes.update(attributes or {})
+                self.spans.append(otel_span)
+                return otel_span
+
+        tracer = _FakeTracer()
+        tracing.add_exporter(tracing.OpenTelemetryExporter(tracer=tracer))
+        try:
+            _ListFinder().find_flows()
+        finally:
+            tracing.clear_exporters()
+
+        outer, inner = tracer.spans
+        assert (outer.name, inner.name) == ("_ListFinder.find_flows", "inner")
+        assert inner.attributes == {"flows": 1}
+        assert outer.end_time >= inner.end_time
+
+    def test_configure_from_env(self, tmp_path):
+        """Test that exporters are registered from environment variables."""
+        exporters = tracing.configure_from_env(
+            {
+                tracing.TRACE_JSONL_ENV: str(tmp_path / "spans.jsonl"),
+                tracing.PROMETHEUS_TEXTFILE_ENV: str(tmp_path / "acme.prom"),
+            }
+        )
+        try:
+            assert [type(exporter) for exporter in exporters] == [
+                tracing.JsonLinesExporter,
+                tracing.PrometheusTextfileExporter,
+            ]
+            _ListFinder().find_flows()
+        finally:
+            tracing.clear_exporters()
+
+        assert len((tmp_path / "spans.jsonl").read_text().splitlines()) == 2
+        assert "_ListFinder.find_flows" in (tmp_path / "acme.prom").read_text()
+        assert tracing.configure_from_env({}) == []